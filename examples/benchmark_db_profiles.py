@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+SQLite 성능 프로필 벤치마크
+
+임시 DB에 가상의 일별 주가를 종목 단위로 저장(종목마다 커밋)하여
+프로필별 쓰기 처리량을 비교하고, 저장된 데이터를 반복 조회하여 읽기 속도를 비교합니다.
+실제 데이터베이스(data/stocks.db)와 KRX API는 사용하지 않습니다.
+
+사용법:
+  python examples/benchmark_db_profiles.py                  # 200종목 x 250일
+  python examples/benchmark_db_profiles.py --tickers 500 --days 60
+"""
+
+import sys
+import os
+import time
+import argparse
+import logging
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database.connection import Database, dispose_engines
+from database.queries import StockQueries
+from krx.saver import DataSaver
+from models import Base
+
+logging.basicConfig(level=logging.WARNING)
+
+
+def make_ohlcv(days: int, seed: int) -> pd.DataFrame:
+    """가상의 일별 OHLCV DataFrame 생성"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end='2025-12-05', periods=days)
+    close = (rng.random(days) * 10000 + 10000).astype(int)
+    return pd.DataFrame({
+        '시가': close - 100,
+        '고가': close + 200,
+        '저가': close - 200,
+        '종가': close,
+        '거래량': rng.integers(1000, 1000000, days),
+    }, index=index)
+
+
+def run_writes(session_factory, tickers: int, days: int) -> float:
+    """종목마다 저장/커밋하며 걸린 시간(초) 반환"""
+    frames = [make_ohlcv(days, seed) for seed in range(tickers)]
+
+    started = time.perf_counter()
+    with session_factory() as session:
+        saver = DataSaver(session)
+        saver.save_stocks([(f"{i:06d}", f"종목{i}", 'KOSPI') for i in range(tickers)])
+        for i, df in enumerate(frames):
+            saver.save_daily_prices(f"{i:06d}", df)
+    return time.perf_counter() - started
+
+
+def run_reads(session_factory, tickers: int, rounds: int = 3) -> float:
+    """종목별 전체 주가 + 최근 주가를 반복 조회하며 걸린 시간(초) 반환"""
+    started = time.perf_counter()
+    with session_factory() as session:
+        for _ in range(rounds):
+            for i in range(tickers):
+                StockQueries.get_daily_prices(session, f"{i:06d}")
+                StockQueries.get_latest_price(session, f"{i:06d}")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQLite 성능 프로필 벤치마크')
+    parser.add_argument('--tickers', type=int, default=200, help='종목 수 (종목마다 커밋)')
+    parser.add_argument('--days', type=int, default=250, help='종목당 일수')
+    args = parser.parse_args()
+
+    rows = args.tickers * args.days
+    print(f"쓰기: {args.tickers}종목 x {args.days}일 = {rows:,}행 (종목마다 커밋)\n")
+    print(f"{'프로필':<12} {'쓰기(초)':>10} {'행/초':>12} {'읽기(초)':>10}")
+    print('-' * 48)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 기준: PRAGMA를 적용하지 않은 SQLite 기본 설정 (rollback journal, synchronous=FULL)
+        url = f"sqlite:///{tmp_dir}/default.db"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        write_secs = run_writes(session_factory, args.tickers, args.days)
+        read_secs = run_reads(session_factory, args.tickers)
+        engine.dispose()
+        print(f"{'(기본값)':<12} {write_secs:>10.2f} {rows / write_secs:>12,.0f} {read_secs:>10.2f}")
+
+        for profile in ('balanced', 'bulk_load'):
+            url = f"sqlite:///{tmp_dir}/{profile}.db"
+            db = Database(db_url=url, profile=profile)
+            db.create_tables()
+            write_secs = run_writes(db.SessionLocal, args.tickers, args.days)
+
+            # 같은 파일을 조회 전용 프로필로 다시 읽기
+            reader = Database(db_url=url, profile='read_only')
+            read_secs = run_reads(reader.SessionLocal, args.tickers)
+            print(f"{profile:<12} {write_secs:>10.2f} {rows / write_secs:>12,.0f} {read_secs:>10.2f}")
+
+        dispose_engines()
+
+    print("\n읽기는 balanced/bulk_load 행에서 read_only 프로필로 측정")
+
+
+if __name__ == '__main__':
+    main()
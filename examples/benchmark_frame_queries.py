@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+DataFrame 조회 벤치마크
+
+임시 DB에 가상의 일별 주가를 저장한 뒤 전 종목 이력을 DataFrame으로 읽는 두 방식을 비교합니다.
+두 방식 모두 같은 조건(ticker IN (...), 종목/일자 순)의 조회 한 번입니다.
+- ORM: session.query(DailyPrice)로 DailyPrice 객체를 받아 DataFrame으로 변환
+- FrameQueries: Core select 결과를 컬럼별 NumPy 배열로 바로 변환
+실제 데이터베이스(data/stocks.db)와 KRX API는 사용하지 않습니다.
+
+사용법:
+  python examples/benchmark_frame_queries.py                   # 500종목 x 10년
+  python examples/benchmark_frame_queries.py --tickers 2500 --years 10
+"""
+
+import sys
+import os
+import time
+import argparse
+import logging
+import sqlite3
+import tempfile
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database.connection import Database, dispose_engines
+from database.frames import FrameQueries
+from models import DailyPrice
+
+logging.basicConfig(level=logging.WARNING)
+
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+def build_db(path: str, tickers: int, years: int) -> int:
+    """(ticker, date) 레이아웃 DB를 채우고 행 수 반환"""
+    db = Database(db_url=f"sqlite:///{path}")
+    db.create_tables()
+    db.dispose()
+
+    days = [day.strftime('%Y-%m-%d') for day in pd.bdate_range(end='2025-12-05', periods=years * 250)]
+    rng = np.random.default_rng(0)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO stocks (ticker, name, market) VALUES (?, ?, 'KOSPI')",
+        [(f"{i:06d}", f"종목{i}") for i in range(tickers)]
+    )
+    for i in range(tickers):
+        close = rng.integers(1000, 500000, len(days))
+        volume = rng.integers(1000, 10000000, len(days))
+        conn.executemany(
+            "INSERT INTO daily_price (ticker, date, open, high, low, close, volume) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (f"{i:06d}", day, int(c) - 100, int(c) + 200, int(c) - 200, int(c), int(v))
+                for day, c, v in zip(days, close, volume)
+            ]
+        )
+    conn.commit()
+    conn.close()
+    return tickers * len(days)
+
+
+def load_orm(db: Database, tickers: list) -> pd.DataFrame:
+    """ORM 객체로 한 번에 조회한 뒤 DataFrame으로 변환 (기존 방식)"""
+    with db.get_session() as session:
+        prices = (
+            session.query(DailyPrice)
+            .filter(DailyPrice.ticker.in_(tickers))
+            .order_by(DailyPrice.ticker, DailyPrice.date)
+            .all()
+        )
+        return pd.DataFrame(
+            [[getattr(p, column) for column in PRICE_COLUMNS] for p in prices],
+            index=pd.MultiIndex.from_arrays(
+                [[p.ticker for p in prices], pd.DatetimeIndex([p.date for p in prices])],
+                names=['ticker', 'date']
+            ),
+            columns=PRICE_COLUMNS
+        )
+
+
+def load_frame(db: Database, tickers: list) -> pd.DataFrame:
+    """FrameQueries로 같은 종목 목록을 조회"""
+    with db.get_session() as session:
+        return FrameQueries.get_daily_prices(session, tickers)
+
+
+def measure(func, *args):
+    """(결과, 걸린 시간(초), 최대 메모리(MB)) - 메모리는 추적 부담이 시간에 섞이지 않도록 따로 한 번 더 실행"""
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    del result
+
+    tracemalloc.start()
+    result = func(*args)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='DataFrame 조회 벤치마크')
+    parser.add_argument('--tickers', type=int, default=500, help='종목 수')
+    parser.add_argument('--years', type=int, default=10, help='기간 (년, 연 250거래일)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.db')
+        started = time.perf_counter()
+        rows = build_db(path, args.tickers, args.years)
+        print(f"데이터: {args.tickers}종목 x {args.years}년 = {rows:,}행 "
+              f"(생성 {time.perf_counter() - started:.1f}초)\n")
+
+        db = Database(db_url=f"sqlite:///{path}", profile='read_only')
+        print(f"{'방식':<14} {'시간(초)':>10} {'최대 메모리(MB)':>16} {'결과(MB)':>10}")
+        print('-' * 54)
+        tickers = [f"{i:06d}" for i in range(args.tickers)]
+        base = None
+        for label, func in (('ORM', load_orm), ('FrameQueries', load_frame)):
+            df, elapsed, peak = measure(func, db, tickers)
+            size = df.memory_usage(deep=True).sum() / 1024 / 1024
+            base = base or elapsed
+            print(f"{label:<14} {elapsed:>10.2f} {peak:>16.1f} {size:>10.1f}   (x{base / elapsed:.1f})")
+            del df
+
+        dispose_engines()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+저장 레이아웃 벤치마크
+
+임시 DB에 가상의 전 종목 일별 주가를 날짜 순서(실제 수집 순서)로 기존 레이아웃에 저장한 뒤,
+같은 파일을 스키마 마이그레이션으로 (ticker, date) WITHOUT ROWID 레이아웃과 정수 일자
+레이아웃으로 바꿔(변환 후 VACUUM) 파일 크기와 종목 구간 조회 속도를 비교합니다.
+실제 데이터베이스(data/stocks.db)와 KRX API는 사용하지 않습니다.
+
+사용법:
+  python examples/benchmark_storage_layout.py                   # 2000종목 x 3년
+  python examples/benchmark_storage_layout.py --tickers 500 --years 5
+"""
+
+import sys
+import os
+import time
+import shutil
+import argparse
+import logging
+import sqlite3
+import tempfile
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database.connection import Database, dispose_engines
+from models import DailyPrice
+
+logging.basicConfig(level=logging.WARNING)
+
+# 기존 레이아웃 (id 대리키 + UNIQUE + 같은 컬럼 인덱스 + created_at)
+LEGACY_SCHEMA = """
+CREATE TABLE stocks (
+    ticker VARCHAR(10) PRIMARY KEY, name VARCHAR(100) NOT NULL, market VARCHAR(20) NOT NULL,
+    created_at DATETIME, updated_at DATETIME, delisted_at DATETIME
+);
+CREATE TABLE daily_price (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker VARCHAR(10) NOT NULL REFERENCES stocks (ticker),
+    date DATE NOT NULL,
+    open INTEGER NOT NULL, high INTEGER NOT NULL, low INTEGER NOT NULL, close INTEGER NOT NULL,
+    volume BIGINT NOT NULL,
+    created_at DATETIME,
+    updated_at DATETIME,
+    CONSTRAINT uq_ticker_date UNIQUE (ticker, date)
+);
+CREATE INDEX idx_ticker_date ON daily_price (ticker, date);
+CREATE INDEX idx_date ON daily_price (date);
+"""
+
+
+def build_legacy_db(path: str, tickers: int, years: int) -> int:
+    """기존 레이아웃 DB를 날짜 순서로 채우고 행 수 반환"""
+    days = pd.bdate_range(end='2025-12-05', periods=years * 250)
+    rng = np.random.default_rng(0)
+    created_at = '2025-12-05 18:00:00.000000'
+
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executemany(
+        "INSERT INTO stocks (ticker, name, market) VALUES (?, ?, 'KOSPI')",
+        [(f"{i:06d}", f"종목{i}") for i in range(tickers)]
+    )
+    for day in days:
+        close = rng.integers(1000, 500000, tickers)
+        volume = rng.integers(1000, 10000000, tickers)
+        day_str = day.strftime('%Y-%m-%d')
+        conn.executemany(
+            "INSERT INTO daily_price (ticker, date, open, high, low, close, volume, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (f"{i:06d}", day_str, int(c) - 100, int(c) + 200, int(c) - 200, int(c), int(v), created_at)
+                for i, (c, v) in enumerate(zip(close, volume))
+            ]
+        )
+    conn.commit()
+    conn.execute('VACUUM')
+    conn.close()
+    return tickers * len(days)
+
+
+def run_range_scans(url: str, tickers: int, queries: int) -> float:
+    """무작위 종목의 최근 1년 주가를 조회하며 걸린 시간(초) 반환"""
+    db = Database(db_url=url, profile='read_only')
+    rng = np.random.default_rng(1)
+    sample = [f"{i:06d}" for i in rng.integers(0, tickers, queries)]
+    end = pd.Timestamp('2025-12-05').date()
+    start = end - timedelta(days=365)
+
+    stmt = select(DailyPrice.date, DailyPrice.open, DailyPrice.high, DailyPrice.low,
+                  DailyPrice.close, DailyPrice.volume)
+    started = time.perf_counter()
+    with db.get_session() as session:
+        for ticker in sample:
+            session.execute(
+                stmt.where(DailyPrice.ticker == ticker, DailyPrice.date.between(start, end))
+                .order_by(DailyPrice.date)
+            ).all()
+    elapsed = time.perf_counter() - started
+    db.dispose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장 레이아웃 벤치마크')
+    parser.add_argument('--tickers', type=int, default=2000, help='종목 수')
+    parser.add_argument('--years', type=int, default=3, help='기간 (년, 연 250거래일)')
+    parser.add_argument('--queries', type=int, default=500, help='구간 조회 횟수')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, 'legacy.db')
+        started = time.perf_counter()
+        rows = build_legacy_db(legacy_path, args.tickers, args.years)
+        print(f"데이터: {args.tickers}종목 x {args.years}년 = {rows:,}행 "
+              f"(생성 {time.perf_counter() - started:.1f}초)\n")
+
+        layouts = [('기존 (id + UNIQUE + 인덱스)', legacy_path, None)]
+        for label, name, integer_dates in (
+            ('WITHOUT ROWID', 'compact.db', False),
+            ('WITHOUT ROWID + 정수 일자', 'compact_int.db', True),
+        ):
+            path = os.path.join(tmp_dir, name)
+            shutil.copy(legacy_path, path)
+            db = Database(db_url=f"sqlite:///{path}")
+            db.create_tables()
+            started = time.perf_counter()
+            db.migrate(integer_dates=integer_dates, progress=lambda *args: None)
+            db.dispose()
+            conn = sqlite3.connect(path)
+            conn.execute('VACUUM')
+            conn.close()
+            layouts.append((label, path, time.perf_counter() - started))
+
+        print(f"{'레이아웃':<28} {'크기(MB)':>10} {'구간 조회(초)':>14} {'변환(초)':>10}")
+        print('-' * 66)
+        base_size = base_scan = None
+        for label, path, migrate_secs in layouts:
+            size = os.path.getsize(path) / 1024 / 1024
+            scan = run_range_scans(f"sqlite:///{path}", args.tickers, args.queries)
+            base_size, base_scan = base_size or size, base_scan or scan
+            migrate_col = f"{migrate_secs:>10.1f}" if migrate_secs is not None else f"{'-':>10}"
+            print(f"{label:<28} {size:>10.1f} {scan:>14.3f} {migrate_col}"
+                  f"   (크기 {size / base_size:.0%}, 조회 x{base_scan / scan:.2f})")
+
+        dispose_engines()
+
+    print(f"\n구간 조회: 무작위 종목 {args.queries}개의 최근 1년 OHLCV (read_only 프로필)")
+
+
+if __name__ == '__main__':
+    main()
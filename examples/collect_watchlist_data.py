@@ -11,16 +11,25 @@
   python examples/collect_watchlist_data.py --today      # 오늘 데이터만 수집
   python examples/collect_watchlist_data.py --month      # 최근 30일 데이터 수집
   python examples/collect_watchlist_data.py --force      # 강제 재수집
+  python examples/collect_watchlist_data.py --market     # KOSPI/KOSDAQ 전 종목 수집 (날짜 기준)
+  python examples/collect_watchlist_data.py --no-cache   # 응답 캐시 사용 안 함
+  python examples/collect_watchlist_data.py --async --concurrency 16  # asyncio 파이프라인으로 수집
+  python examples/collect_watchlist_data.py --market --db-profile bulk_load  # 대량 적재 프로필
 """
 
 import sys
 import os
+import asyncio
 import argparse
 import logging
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from data_fetcher import fetch_watchlist_data
+from data_fetcher import fetch_watchlist_data, fetch_watchlist_data_async, fetch_market_data
+from krx.async_client import AsyncKRXClient
+from krx.cache import set_cache_enabled
+from krx.negative_cache import set_negative_cache_enabled
+from database.connection import dispose_engines, set_default_profile, PROFILES
 from datetime import datetime
 
 # 로깅 설정
@@ -31,6 +40,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def print_api_stats(api_stats: dict):
+    """재시도/실패가 있었던 KRX 엔드포인트 통계 출력"""
+    troubled = {
+        endpoint: stats for endpoint, stats in api_stats.items()
+        if stats['retries'] or stats['failures'] or stats['permanent'] or stats['short_circuited']
+    }
+    if not troubled:
+        return
+
+    print("KRX 호출 통계 (재시도/실패 발생):")
+    for endpoint, stats in sorted(troubled.items()):
+        print(f"  {endpoint}: 호출 {stats['calls']}, 성공 {stats['success']}, "
+              f"재시도 {stats['retries']}, 실패 {stats['failures']}, "
+              f"데이터 없음 {stats['permanent']}, 차단 {stats['short_circuited']}")
+
+
+def print_write_stats(write_stats: dict):
+    """배치 저장 통계 출력"""
+    if not write_stats or not write_stats['batches']:
+        return
+
+    print(f"저장: 배치 {write_stats['batches']}회, 요청 {write_stats['items']}건, "
+          f"{write_stats['rows']}행 (배치 평균 {write_stats['avg_ms']:.0f}ms, "
+          f"최대 {write_stats['max_ms']:.0f}ms, 실패 {write_stats['failed']}건)")
+    print(f"행: 신규 {write_stats.get('inserted', 0)}건, 수정 {write_stats.get('updated', 0)}건, "
+          f"동일 {write_stats.get('unchanged', 0)}건")
+
+
 def main():
     """메인 실행 함수"""
     parser = argparse.ArgumentParser(description='관심 종목 데이터 수집')
@@ -61,23 +98,91 @@ def main():
     parser.add_argument(
         '--force',
         action='store_true',
-        help='강제 재수집 (기존 데이터가 있어도 재수집)'
+        help='강제 재수집 (기존 데이터가 있어도 재수집, 값이 바뀐 행은 덮어씀)'
+    )
+
+    parser.add_argument(
+        '--market',
+        action='store_true',
+        help='관심 종목 대신 KOSPI/KOSDAQ 전 종목을 날짜 기준으로 수집'
+    )
+
+    parser.add_argument(
+        '--async',
+        action='store_true',
+        dest='use_async',
+        help='asyncio 파이프라인으로 수집 (조회는 동시에, 저장은 단일 writer)'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=AsyncKRXClient.MAX_CONCURRENCY,
+        help=f'--async 사용 시 동시에 진행할 KRX 호출 수 (기본값: {AsyncKRXClient.MAX_CONCURRENCY})'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='KRX 응답 디스크 캐시와 빈 결과 캐시를 사용하지 않음'
+    )
+
+    parser.add_argument(
+        '--db-profile',
+        choices=list(PROFILES),
+        default=None,
+        help='SQLite 성능 프로필 (기본값: .env의 DB_PROFILE 또는 balanced)'
     )
 
     parser.set_defaults(mode='recent')  # 기본값: 최근 5일
 
     args = parser.parse_args()
 
+    if args.no_cache:
+        set_cache_enabled(False)
+        set_negative_cache_enabled(False)
+    if args.db_profile:
+        set_default_profile(args.db_profile)
+
     # 날짜 설정
     date_str = args.date if args.date else datetime.now().strftime('%Y%m%d')
 
     # 데이터 수집 실행
     try:
-        result = fetch_watchlist_data(
-            date_str=date_str,
-            fetch_mode=args.mode,
-            force=args.force
-        )
+        if args.market:
+            result = fetch_market_data(date_str=date_str, force=args.force)
+
+            print(f"\n{'='*60}")
+            print(f"📊 전체 시장 수집 완료 요약")
+            print(f"{'='*60}")
+            print(f"날짜: {result['date']}")
+            for market_result in result['markets']:
+                if market_result['holiday']:
+                    print(f"{market_result['market']}: 휴장일")
+                    continue
+                counts = ', '.join(f"{k} {v}건" for k, v in market_result['counts'].items())
+                print(f"{market_result['market']}: {counts}")
+            print_api_stats(result.get('api_stats', {}))
+            print(f"{'='*60}\n")
+
+            if result['total_failed'] > 0:
+                print("⚠️  일부 시장 데이터 수집에 실패했습니다. 로그를 확인하세요.")
+                sys.exit(1)
+            return
+
+        if args.use_async:
+            result = asyncio.run(fetch_watchlist_data_async(
+                date_str=date_str,
+                fetch_mode=args.mode,
+                force=args.force,
+                max_concurrency=args.concurrency
+            ))
+        else:
+            result = fetch_watchlist_data(
+                date_str=date_str,
+                fetch_mode=args.mode,
+                force=args.force
+            )
 
         # 결과 요약
         print(f"\n{'='*60}")
@@ -88,6 +193,8 @@ def main():
         print(f"성공: {result['total_success']}개")
         print(f"실패: {result['total_failed']}개")
         print(f"스킵: {result['skipped']}개")
+        print_write_stats(result.get('write_stats'))
+        print_api_stats(result.get('api_stats', {}))
         print(f"{'='*60}\n")
 
         if result['total_failed'] > 0:
@@ -100,6 +207,8 @@ def main():
     except Exception as e:
         logger.error(f"데이터 수집 실패: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        dispose_engines()
 
 
 if __name__ == "__main__":
@@ -9,19 +9,25 @@
   python examples/generate_daily_report.py --no-fetch      # 데이터 수집 없이 리포트만 생성
   python examples/generate_daily_report.py --fetch         # 강제로 최신 데이터 재수집
   python examples/generate_daily_report.py 20251203 --fetch  # 특정 날짜 + 강제 재수집
+  python examples/generate_daily_report.py --no-cache      # 응답 캐시 사용 안 함
+  python examples/generate_daily_report.py --db-profile bulk_load  # 수집 시 SQLite 프로필 지정
 """
 
 import logging
 import sys
 import os
 import argparse
-from datetime import datetime, timedelta
+from datetime import datetime
 
 # src 디렉토리를 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from report.daily_report import DailyReport
 from data_fetcher import fetch_watchlist_data
+from krx.cache import set_cache_enabled
+from krx.negative_cache import set_negative_cache_enabled
+from database.connection import dispose_engines, set_default_profile, PROFILES
+from krx.trading_calendar import get_trading_calendar
 
 # 로깅 설정
 logging.basicConfig(
@@ -42,6 +48,8 @@ def parse_arguments():
   %(prog)s --no-fetch         # 데이터 수집 없이 리포트만 생성
   %(prog)s --fetch            # 강제로 최신 데이터 재수집
   %(prog)s 20251203 --fetch   # 특정 날짜 + 강제 재수집
+  %(prog)s --no-cache         # KRX 응답 캐시 사용 안 함
+  %(prog)s --db-profile bulk_load  # 수집 시 SQLite 대량 적재 프로필 사용
         """
     )
 
@@ -71,12 +79,31 @@ def parse_arguments():
         help='데이터 수집 범위 (today: 당일만, recent: 최근 5일, month: 최근 30일)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='KRX 응답 디스크 캐시와 빈 결과 캐시를 사용하지 않음 (항상 새로 조회)'
+    )
+
+    parser.add_argument(
+        '--db-profile',
+        choices=list(PROFILES),
+        default=None,
+        help='데이터 수집 시 SQLite 성능 프로필 (기본값: .env의 DB_PROFILE 또는 balanced)'
+    )
+
     return parser.parse_args()
 
 def main():
     """메인 실행 함수"""
     args = parse_arguments()
 
+    if args.no_cache:
+        set_cache_enabled(False)
+        set_negative_cache_enabled(False)
+    if args.db_profile:
+        set_default_profile(args.db_profile)
+
     # 날짜 설정
     if args.date:
         date_str = args.date
@@ -126,12 +153,12 @@ def main():
             actual_date = date_str
         except ValueError as e:
             if "데이터 없음" in str(e):
-                # 어제 날짜로 재시도
-                yesterday = datetime.strptime(date_str, '%Y%m%d') - timedelta(days=1)
-                yesterday_str = yesterday.strftime('%Y%m%d')
-                logger.warning(f"⚠️  {date_str} 데이터가 없습니다. {yesterday_str}로 리포트를 생성합니다.")
-                report = report_generator.generate_report(yesterday_str)
-                actual_date = yesterday_str
+                # 직전 거래일로 재시도 (주말/연휴는 거래일 달력으로 건너뜀)
+                prev_day = get_trading_calendar().previous_trading_day(date_str)
+                prev_day_str = prev_day.strftime('%Y%m%d')
+                logger.warning(f"⚠️  {date_str} 데이터가 없습니다. 직전 거래일 {prev_day_str}로 리포트를 생성합니다.")
+                report = report_generator.generate_report(prev_day_str)
+                actual_date = prev_day_str
             else:
                 raise
 
@@ -149,6 +176,8 @@ def main():
     except Exception as e:
         logger.error(f"\n❌ 리포트 생성 실패: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        dispose_engines()
 
 if __name__ == '__main__':
     main()
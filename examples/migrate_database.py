@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+데이터베이스 스키마 마이그레이션 스크립트
+
+schema_version 테이블 기준으로 적용되지 않은 마이그레이션을 번호 순서대로 실행합니다.
+큰 테이블은 배치 단위 트랜잭션으로 새 테이블에 복사한 뒤 교체하므로,
+실행 중에도 수집을 계속할 수 있고 중단 후 다시 실행하면 남은 단계부터 이어서 진행합니다.
+
+사용법:
+  python examples/migrate_database.py                    # 남은 마이그레이션 전체 적용
+  python examples/migrate_database.py --status           # 현재 버전과 남은 마이그레이션만 출력
+  python examples/migrate_database.py --target 1         # 1번까지만 적용
+  python examples/migrate_database.py --batch-size 20000 # 트랜잭션당 복사 행 수
+  python examples/migrate_database.py --integer-dates    # 일자를 YYYYMMDD 정수로 저장 (선택 단계)
+"""
+
+import sys
+import os
+import argparse
+import logging
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from database.connection import Database, dispose_engines
+from database.migrations import MigrationRunner, MIGRATIONS, INTEGER_DATES_MIGRATION, BATCH_SIZE
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터베이스 스키마 마이그레이션')
+    parser.add_argument(
+        '--status',
+        action='store_true',
+        help='실행하지 않고 현재 버전과 남은 마이그레이션만 출력'
+    )
+    parser.add_argument(
+        '--target',
+        type=int,
+        default=None,
+        help='이 번호까지만 적용 (기본값: 최신)'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=BATCH_SIZE,
+        help=f'테이블 재작성 시 트랜잭션당 복사할 행 수 (기본값: {BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--integer-dates',
+        action='store_true',
+        help=f'일자를 YYYYMMDD 정수로 바꾸는 선택 단계({INTEGER_DATES_MIGRATION.version}번)도 적용'
+    )
+    args = parser.parse_args()
+
+    db = Database()
+    db.create_tables()
+    migrations = MIGRATIONS + ([INTEGER_DATES_MIGRATION] if args.integer_dates else [])
+    runner = MigrationRunner(db, migrations=migrations, batch_size=args.batch_size)
+
+    try:
+        pending = runner.pending(args.target)
+        print(f"현재 스키마 버전: {runner.current_version()} (최신: {runner.head})")
+        for migration in pending:
+            print(f"  - {migration.version}: {migration.name}")
+
+        if args.status:
+            return
+        if not pending:
+            print("적용할 마이그레이션이 없습니다.")
+            return
+
+        applied = runner.upgrade(args.target)
+        print(f"✓ 마이그레이션 {len(applied)}개 적용 완료 (스키마 버전: {runner.current_version()})")
+    finally:
+        dispose_engines()
+
+
+if __name__ == '__main__':
+    main()
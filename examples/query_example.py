@@ -12,6 +12,27 @@ from database.queries import StockQueries
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def print_coverage_status(session):
+    """데이터셋별 수집 현황 (data_coverage 조회 1회)"""
+    index = StockQueries.get_coverage_index(session)
+    if not index:
+        logger.info("수집된 데이터 없음")
+        return
+
+    logger.info("수집 현황:")
+    for dataset, coverages in index.items():
+        latest = max(c.max_date for c in coverages.values())
+        stale = sum(1 for c in coverages.values() if c.max_date < latest)
+        rows = sum(c.row_count for c in coverages.values())
+        ingested = max(c.last_ingested_at for c in coverages.values())
+        logger.info(
+            f"  {dataset:<14} 종목 {len(coverages):>5}개  "
+            f"{min(c.min_date for c in coverages.values())} ~ {latest}  "
+            f"{rows:>10,}행  최근일 미달 {stale}개  (마지막 저장 {ingested:%Y-%m-%d %H:%M})"
+        )
+    logger.info("")
+
+
 def main():
     """데이터 조회 예제"""
 
@@ -19,6 +40,9 @@ def main():
     db = Database()
 
     with db.get_session() as session:
+        # 0. 전체 수집 현황
+        print_coverage_status(session)
+
         # HD현대일렉트릭 데이터 조회
         ticker = '267260'
 
@@ -80,5 +104,7 @@ def main():
                 logger.info(f"  종가: {latest_price2.close:,}원")
                 logger.info(f"  거래량: {latest_price2.volume:,}주")
 
+    db.dispose()
+
 if __name__ == '__main__':
     main()
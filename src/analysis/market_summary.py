@@ -2,101 +2,155 @@ import logging
 import sys
 import os
 from datetime import datetime, timedelta
+from typing import Callable, Dict, Sequence
 import pandas as pd
 from pykrx import stock
 
 # 상대 경로 처리
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
+from krx.cache import ResponseCache, get_default_cache
+from krx.ticker_master import TickerMaster, get_ticker_master
+from krx.trading_calendar import TradingCalendar, get_trading_calendar
+
 logger = logging.getLogger(__name__)
 
+# 순매수 상위 기본 투자자 구분 (pykrx get_market_net_purchases_of_equities 명칭)
+NET_BUY_INVESTORS = ('외국인', '기관합계', '연기금')
+
+class MarketSnapshot:
+    """
+    (날짜, 시장) 전 종목 시세 스냅샷
+
+    전 종목 OHLCV를 한 번 받아 파생 컬럼(등락률, 거래대금)을 한 번만 계산하고,
+    시가총액 표는 처음 필요할 때 한 번만 조회합니다.
+    """
+
+    def __init__(self, date_str: str, market: str, prices: pd.DataFrame, fetch_market_caps: Callable[[], pd.DataFrame]):
+        """
+        Args:
+            date_str: 날짜 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+            prices: get_market_ohlcv_by_ticker 결과 (index: 종목코드)
+            fetch_market_caps: 시가총액 표 조회 함수
+        """
+        self.date_str = date_str
+        self.market = market
+        self.prices = self._add_derived_columns(prices)
+        self._fetch_market_caps = fetch_market_caps
+        self._market_caps = None
+
+    @staticmethod
+    def _add_derived_columns(prices: pd.DataFrame) -> pd.DataFrame:
+        """등락률(시가 대비), 거래대금(종가 x 거래량) 계산"""
+        if prices is None or prices.empty:
+            return pd.DataFrame()
+
+        prices = prices.copy()
+        prices['등락률'] = ((prices['종가'] - prices['시가']) / prices['시가'] * 100).round(2)
+        prices['거래대금'] = prices['종가'] * prices['거래량']
+        return prices
+
+    @property
+    def market_caps(self) -> pd.DataFrame:
+        """시가총액 표 (종가, 시가총액, 거래량, 거래대금 등)"""
+        if self._market_caps is None:
+            caps = self._fetch_market_caps()
+            self._market_caps = caps if caps is not None else pd.DataFrame()
+        return self._market_caps
+
+
 class MarketSummary:
     """시장 전체 동향 분석"""
 
-    def __init__(self):
-        pass
+    # 인스턴스당 보관할 스냅샷 수 (최근 사용 순)
+    MAX_SNAPSHOTS = 8
+
+    def __init__(
+        self,
+        cache: ResponseCache = None,
+        ticker_master: TickerMaster = None,
+        calendar: TradingCalendar = None
+    ):
+        """
+        Args:
+            cache: 응답 캐시 (기본값: 프로세스 공유 디스크 캐시)
+            ticker_master: 종목명 조회용 마스터 (기본값: 프로세스 공유 마스터)
+            calendar: 거래일 달력 (기본값: 프로세스 공유 달력)
+        """
+        self.cache = cache or get_default_cache()
+        self.ticker_master = ticker_master if ticker_master is not None else get_ticker_master()
+        self.calendar = calendar or get_trading_calendar()
+        self._snapshots = {}
+
+    def _fetch(self, func, *args, **kwargs):
+        """pykrx 조회 (디스크 캐시 경유)"""
+        return self.cache.call(func, lambda: func(*args, **kwargs), *args, **kwargs)
+
+    def _index_change(self, index_code: str, prev_date_str: str, date_str: str) -> dict:
+        """
+        지수의 당일 종가/거래량과 전 거래일 대비 변동 (전 거래일 ~ 당일 1회 조회)
+
+        Raises:
+            ValueError: 당일 데이터 없음
+        """
+        try:
+            df = self._fetch(stock.get_index_ohlcv, prev_date_str, date_str, index_code)
+        except KeyError as e:
+            logger.warning(f"{date_str} 날짜의 지수 데이터가 없습니다 (KeyError): {e}")
+            raise ValueError(f"데이터 없음: {date_str}") from e
+
+        target = pd.Timestamp(datetime.strptime(date_str, '%Y%m%d'))
+        if df.empty or target not in df.index:
+            logger.warning(f"{date_str} 날짜의 지수 데이터가 비어있습니다")
+            raise ValueError(f"데이터 없음: {date_str}")
+
+        close = df.loc[target, '종가']
+        volume = df.loc[target, '거래량']
+
+        # 전 거래일 대비 계산
+        prev = df[df.index < target]
+        if prev.empty:
+            change = 0
+            change_pct = 0
+        else:
+            prev_close = prev.iloc[-1]['종가']
+            change = close - prev_close
+            change_pct = (change / prev_close) * 100
+
+        return {
+            'close': close,
+            'change': change,
+            'change_pct': change_pct,
+            'volume': volume
+        }
 
     def get_index_info(self, date_str: str) -> dict:
         """
         KOSPI, KOSDAQ 지수 정보 조회
 
+        전 거래일은 거래일 달력에서 구하므로 주말/연휴를 탐색하는 호출이 없습니다.
+
         Args:
             date_str: 날짜 (YYYYMMDD)
 
         Returns:
             지수 정보 딕셔너리
+
+        Raises:
+            ValueError: 휴장일 등 해당 날짜 데이터 없음
         """
         try:
-            # 전일 대비 계산을 위해 전일 날짜도 필요
-            date = datetime.strptime(date_str, '%Y%m%d')
-            prev_date = date - timedelta(days=1)
-
-            # 주말 고려 (최대 3일 전까지 확인)
-            for i in range(1, 4):
-                prev_date_str = (date - timedelta(days=i)).strftime('%Y%m%d')
-                try:
-                    kospi_prev = stock.get_index_ohlcv(prev_date_str, prev_date_str, "1001")
-                    if not kospi_prev.empty:
-                        break
-                except:
-                    continue
-
-            # KOSPI 지수 (데이터 없으면 예외 발생 가능)
-            try:
-                kospi = stock.get_index_ohlcv(date_str, date_str, "1001")
-                kosdaq = stock.get_index_ohlcv(date_str, date_str, "2001")
-            except KeyError as e:
-                logger.warning(f"{date_str} 날짜의 지수 데이터가 없습니다 (KeyError): {e}")
-                raise ValueError(f"데이터 없음: {date_str}") from e
-
-            # DataFrame이 비어있으면 데이터 없음
-            if kospi.empty or kosdaq.empty:
-                logger.warning(f"{date_str} 날짜의 지수 데이터가 비어있습니다")
+            if not self.calendar.is_trading_day(date_str):
+                logger.warning(f"{date_str}은 휴장일입니다")
                 raise ValueError(f"데이터 없음: {date_str}")
 
-            result = {}
-
-            if not kospi.empty:
-                kospi_close = kospi.iloc[0]['종가']
-                kospi_volume = kospi.iloc[0]['거래량']
-
-                # 전일 대비 계산
-                try:
-                    kospi_prev_close = kospi_prev.iloc[0]['종가']
-                    kospi_change = kospi_close - kospi_prev_close
-                    kospi_change_pct = (kospi_change / kospi_prev_close) * 100
-                except:
-                    kospi_change = 0
-                    kospi_change_pct = 0
-
-                result['kospi'] = {
-                    'close': kospi_close,
-                    'change': kospi_change,
-                    'change_pct': kospi_change_pct,
-                    'volume': kospi_volume
-                }
-
-            if not kosdaq.empty:
-                kosdaq_close = kosdaq.iloc[0]['종가']
-                kosdaq_volume = kosdaq.iloc[0]['거래량']
-
-                try:
-                    kosdaq_prev = stock.get_index_ohlcv(prev_date_str, prev_date_str, "2001")
-                    kosdaq_prev_close = kosdaq_prev.iloc[0]['종가']
-                    kosdaq_change = kosdaq_close - kosdaq_prev_close
-                    kosdaq_change_pct = (kosdaq_change / kosdaq_prev_close) * 100
-                except:
-                    kosdaq_change = 0
-                    kosdaq_change_pct = 0
-
-                result['kosdaq'] = {
-                    'close': kosdaq_close,
-                    'change': kosdaq_change,
-                    'change_pct': kosdaq_change_pct,
-                    'volume': kosdaq_volume
-                }
-
-            return result
+            prev_date_str = self.calendar.previous_trading_day(date_str).strftime('%Y%m%d')
+
+            return {
+                'kospi': self._index_change("1001", prev_date_str, date_str),
+                'kosdaq': self._index_change("2001", prev_date_str, date_str),
+            }
 
         except ValueError:
             # 데이터 없음 예외는 그대로 전파
@@ -105,6 +159,38 @@ class MarketSummary:
             logger.error(f"지수 정보 조회 실패: {e}")
             return {}
 
+    def get_snapshot(self, date_str: str, market: str = "KOSPI") -> 'MarketSnapshot':
+        """
+        (날짜, 시장)별 전 종목 스냅샷 조회 (인스턴스 안에서 한 번만 조회)
+
+        Args:
+            date_str: 날짜 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+
+        Returns:
+            MarketSnapshot
+        """
+        key = (date_str, market)
+        snapshot = self._snapshots.pop(key, None)
+        if snapshot is None:
+            prices = self._fetch(stock.get_market_ohlcv_by_ticker, date_str, market=market)
+            snapshot = MarketSnapshot(
+                date_str, market, prices,
+                lambda: self._fetch(stock.get_market_cap_by_ticker, date_str, market=market)
+            )
+
+        # 최근 사용 순서 유지 (가장 오래된 스냅샷부터 제거)
+        self._snapshots[key] = snapshot
+        while len(self._snapshots) > self.MAX_SNAPSHOTS:
+            self._snapshots.pop(next(iter(self._snapshots)))
+        return snapshot
+
+    def _with_names(self, df: pd.DataFrame, date_str: str) -> pd.DataFrame:
+        """종목명 컬럼을 맨 앞에 추가 (종목 마스터 메모리 조회)"""
+        self.ticker_master.ensure(date_str)
+        df.insert(0, '종목명', df.index.map(self.ticker_master.get_name))
+        return df
+
     def get_top_gainers(self, date_str: str, market: str = "KOSPI", n: int = 5) -> pd.DataFrame:
         """
         등락률 상위 종목 조회
@@ -118,32 +204,12 @@ class MarketSummary:
             상위 종목 데이터프레임
         """
         try:
-            df = stock.get_market_ohlcv_by_ticker(date_str, market=market)
-            if df.empty:
+            prices = self.get_snapshot(date_str, market).prices
+            if prices.empty:
                 return pd.DataFrame()
 
-            # 등락률 계산
-            df['등락률'] = ((df['종가'] - df['시가']) / df['시가'] * 100).round(2)
-
-            # 거래대금 계산
-            df['거래대금'] = df['종가'] * df['거래량']
-
-            # 상위 N개 선택
-            top = df.nlargest(n, '등락률')[['종가', '등락률', '거래량', '거래대금']]
-
-            # 종목명 추가
-            tickers = stock.get_market_ticker_list(date_str, market=market)
-            ticker_names = {}
-            for ticker in top.index:
-                try:
-                    name = stock.get_market_ticker_name(ticker)
-                    ticker_names[ticker] = name
-                except:
-                    ticker_names[ticker] = ticker
-
-            top.insert(0, '종목명', top.index.map(ticker_names))
-
-            return top
+            top = prices.nlargest(n, '등락률')[['종가', '등락률', '거래량', '거래대금']]
+            return self._with_names(top, date_str)
 
         except Exception as e:
             logger.error(f"급등 종목 조회 실패: {e}")
@@ -162,31 +228,12 @@ class MarketSummary:
             하위 종목 데이터프레임
         """
         try:
-            df = stock.get_market_ohlcv_by_ticker(date_str, market=market)
-            if df.empty:
+            prices = self.get_snapshot(date_str, market).prices
+            if prices.empty:
                 return pd.DataFrame()
 
-            # 등락률 계산
-            df['등락률'] = ((df['종가'] - df['시가']) / df['시가'] * 100).round(2)
-
-            # 거래대금 계산
-            df['거래대금'] = df['종가'] * df['거래량']
-
-            # 하위 N개 선택
-            bottom = df.nsmallest(n, '등락률')[['종가', '등락률', '거래량', '거래대금']]
-
-            # 종목명 추가
-            ticker_names = {}
-            for ticker in bottom.index:
-                try:
-                    name = stock.get_market_ticker_name(ticker)
-                    ticker_names[ticker] = name
-                except:
-                    ticker_names[ticker] = ticker
-
-            bottom.insert(0, '종목명', bottom.index.map(ticker_names))
-
-            return bottom
+            bottom = prices.nsmallest(n, '등락률')[['종가', '등락률', '거래량', '거래대금']]
+            return self._with_names(bottom, date_str)
 
         except Exception as e:
             logger.error(f"급락 종목 조회 실패: {e}")
@@ -205,87 +252,95 @@ class MarketSummary:
             거래대금 상위 종목 데이터프레임
         """
         try:
-            df = stock.get_market_cap_by_ticker(date_str, market=market)
-            if df.empty:
+            snapshot = self.get_snapshot(date_str, market)
+            caps = snapshot.market_caps
+            if caps.empty:
                 return pd.DataFrame()
 
             # 거래대금 상위 N개
-            top = df.nlargest(n, '거래대금')[['종가', '거래량', '거래대금', '시가총액']]
+            top = caps.nlargest(n, '거래대금')[['종가', '거래량', '거래대금', '시가총액']]
 
             # 등락률 추가
-            ohlcv = stock.get_market_ohlcv_by_ticker(date_str, market=market)
-            if not ohlcv.empty:
-                top['등락률'] = ((ohlcv.loc[top.index, '종가'] - ohlcv.loc[top.index, '시가']) / ohlcv.loc[top.index, '시가'] * 100).round(2)
+            if not snapshot.prices.empty:
+                top['등락률'] = snapshot.prices['등락률'].reindex(top.index)
 
-            # 종목명 추가
-            ticker_names = {}
-            for ticker in top.index:
-                try:
-                    name = stock.get_market_ticker_name(ticker)
-                    ticker_names[ticker] = name
-                except:
-                    ticker_names[ticker] = ticker
-
-            top.insert(0, '종목명', top.index.map(ticker_names))
-
-            return top
+            return self._with_names(top, date_str)
 
         except Exception as e:
             logger.error(f"거래대금 상위 종목 조회 실패: {e}")
             return pd.DataFrame()
 
-    def get_foreign_net_buy_top(self, date_str: str, market: str = "KOSPI", n: int = 5) -> pd.DataFrame:
+    def get_net_buy_top(
+        self,
+        date_str: str,
+        market: str = "KOSPI",
+        investors: Sequence[str] = NET_BUY_INVESTORS,
+        n: int = 5
+    ) -> Dict[str, pd.DataFrame]:
         """
-        외국인 순매수 상위 종목 조회
+        투자자별 순매수 상위 종목 조회
+
+        투자자당 시장 전체 순매수 표를 한 번 받아 스냅샷 종가와 합칩니다.
 
         Args:
             date_str: 날짜 (YYYYMMDD)
             market: 시장 (KOSPI/KOSDAQ)
+            investors: 투자자 구분 (pykrx 명칭: 외국인, 기관합계, 연기금, 개인 등)
             n: 조회할 종목 수
 
         Returns:
-            외국인 순매수 상위 종목 데이터프레임
+            투자자 -> 순매수 상위 종목 데이터프레임
+            (index: 종목코드, columns: 종목명, 순매수거래대금, 순매수거래량, 종가)
         """
+        # 종가는 (날짜, 시장) 스냅샷에서 한 번만 조회
         try:
-            df = stock.get_market_trading_value_by_date(date_str, date_str, market=market)
-            if df.empty:
-                return pd.DataFrame()
+            closes = self.get_snapshot(date_str, market).prices.get('종가')
+        except Exception as e:
+            logger.warning(f"종가 조회 실패 (순매수 상위는 종가 없이 반환): {e}")
+            closes = None
 
-            # 종목별로 재구성
-            result = []
-            for ticker in stock.get_market_ticker_list(date_str, market=market):
-                try:
-                    trading = stock.get_market_trading_value_by_date(date_str, date_str, ticker)
-                    if not trading.empty and '외국인합계' in trading.columns:
-                        foreign_net = trading.iloc[0]['외국인합계']
-                        name = stock.get_market_ticker_name(ticker)
-
-                        # 주가 정보
-                        ohlcv = stock.get_market_ohlcv(date_str, date_str, ticker)
-                        if not ohlcv.empty:
-                            close = ohlcv.iloc[0]['종가']
-                            result.append({
-                                '종목코드': ticker,
-                                '종목명': name,
-                                '외국인순매수': foreign_net,
-                                '종가': close
-                            })
-                except:
+        result = {}
+        for investor in investors:
+            try:
+                df = self._fetch(
+                    stock.get_market_net_purchases_of_equities,
+                    date_str, date_str, market, investor
+                )
+                if df is None or df.empty:
+                    result[investor] = pd.DataFrame()
                     continue
 
-            if not result:
-                return pd.DataFrame()
+                top = df[df['순매수거래대금'] > 0].nlargest(n, '순매수거래대금')
+                top = top[['종목명', '순매수거래대금', '순매수거래량']].copy()
+                top['종가'] = closes.reindex(top.index) if closes is not None else None
+                top.index.name = '종목코드'
+                result[investor] = top
 
-            df_result = pd.DataFrame(result)
-            df_result = df_result.nlargest(n, '외국인순매수')
-            df_result = df_result.set_index('종목코드')
+            except Exception as e:
+                logger.error(f"{investor} 순매수 조회 실패: {e}")
+                result[investor] = pd.DataFrame()
 
-            return df_result
+        return result
 
-        except Exception as e:
-            logger.error(f"외국인 순매수 조회 실패: {e}")
+    def get_foreign_net_buy_top(self, date_str: str, market: str = "KOSPI", n: int = 5) -> pd.DataFrame:
+        """
+        외국인 순매수 상위 종목 조회
+
+        Args:
+            date_str: 날짜 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+            n: 조회할 종목 수
+
+        Returns:
+            외국인 순매수 상위 종목 데이터프레임 (columns: 종목명, 외국인순매수, 종가)
+        """
+        top = self.get_net_buy_top(date_str, market, ['외국인'], n)['외국인']
+        if top.empty:
             return pd.DataFrame()
 
+        top = top.rename(columns={'순매수거래대금': '외국인순매수'})
+        return top[['종목명', '외국인순매수', '종가']]
+
     def get_market_summary(self, date_str: str) -> dict:
         """
         전체 시장 요약 정보
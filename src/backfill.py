@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+체크포인트 기반 장기 구간 백필 모듈
+
+긴 조회 구간을 일정 크기의 구간(chunk)으로 나눠 종목/데이터셋별로 수집하고,
+저장이 끝난 구간을 backfill_checkpoints 테이블에 데이터와 같은 트랜잭션으로 기록합니다.
+오류나 Ctrl-C로 중단된 뒤 같은 명령을 다시 실행하면 기록된 구간은 건너뛰고
+남은 구간부터 이어서 수집합니다.
+"""
+
+import sys
+import os
+import time
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from database.connection import Database
+from krx.client import KRXClient
+from krx.saver import DataSaver
+from krx.writer import WriteBehindWriter
+from krx.ticker_master import get_ticker_master
+from data_fetcher import DATASETS, MARKETS
+from models import BackfillCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 조회할 구간 길이 (일). 실패 시 다시 받는 양과 호출 횟수의 절충
+CHUNK_DAYS = 180
+
+# 동시에 조회할 구간 수 (전체 호출 속도는 KRXClient의 공유 호출 제한기가 제어)
+MAX_WORKERS = 4
+
+# 종료일이 최근 N일 이내인 구간은 체크포인트를 남기지 않음 (공매도 잔고 등 늦게 공시되는 데이터)
+SETTLE_DAYS = 3
+
+# 진행률 로그 간격 (초)
+PROGRESS_INTERVAL = 5.0
+
+
+class BackfillChunk(NamedTuple):
+    """백필 구간 하나 (종목 + 데이터셋 + 조회 구간)"""
+    ticker: str
+    dataset: str
+    start_date: date
+    end_date: date
+
+
+def split_range(start_date: date, end_date: date, chunk_days: int = CHUNK_DAYS) -> List[Tuple[date, date]]:
+    """
+    조회 구간을 chunk_days 길이의 구간으로 분할 (양 끝 포함)
+
+    Args:
+        start_date: 시작일
+        end_date: 종료일
+        chunk_days: 구간 길이 (일)
+
+    Returns:
+        (시작일, 종료일) 목록 (시작일 순)
+    """
+    if chunk_days < 1:
+        raise ValueError(f"chunk_days는 1 이상이어야 합니다: {chunk_days}")
+
+    chunks = []
+    current = start_date
+    while current <= end_date:
+        chunk_end = min(end_date, current + timedelta(days=chunk_days - 1))
+        chunks.append((current, chunk_end))
+        current = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def _format_duration(seconds: Optional[float]) -> str:
+    """남은 시간 표시 (예: 1h 02m, 3m 05s)"""
+    if seconds is None:
+        return '--'
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+class BackfillProgress:
+    """
+    백필 진행률 (스레드 안전)
+
+    이번 실행에서 처리한 구간 수와 경과 시간으로 처리량을 측정하여 남은 시간을 계산합니다.
+    """
+
+    BAR_WIDTH = 30
+
+    def __init__(
+        self,
+        total: int,
+        interval: float = PROGRESS_INTERVAL,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            total: 이번 실행에서 처리할 구간 수
+            interval: 진행률 로그 간격 (초)
+            clock: 단조 시계 (테스트용)
+        """
+        self.total = total
+        self.interval = interval
+        self.clock = clock
+        self.done = 0
+        self.failed = 0
+        self.rows = 0
+        self._started = clock()
+        self._last_log = self._started
+        self._lock = threading.Lock()
+
+    def advance(self, rows: int = 0, failed: bool = False):
+        """구간 하나 처리 완료 (interval마다 진행률 로그)"""
+        with self._lock:
+            self.done += 1
+            self.rows += rows
+            if failed:
+                self.failed += 1
+            now = self.clock()
+            if now - self._last_log < self.interval and self.done < self.total:
+                return
+            self._last_log = now
+        logger.info(self.render())
+
+    @property
+    def rate(self) -> float:
+        """처리량 (구간/초)"""
+        elapsed = self.clock() - self._started
+        return self.done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """남은 시간 (초), 아직 측정값이 없으면 None"""
+        rate = self.rate
+        if rate <= 0:
+            return None
+        return (self.total - self.done) / rate
+
+    def render(self) -> str:
+        """진행률 표시 문자열"""
+        ratio = self.done / self.total if self.total else 1.0
+        filled = int(self.BAR_WIDTH * ratio)
+        bar = '#' * filled + '-' * (self.BAR_WIDTH - filled)
+        return (
+            f"백필 [{bar}] {ratio * 100:5.1f}% {self.done}/{self.total} 구간 "
+            f"({self.rate:.2f} 구간/초, {self.rows}행, 실패 {self.failed}) "
+            f"남은 시간 {_format_duration(self.eta_seconds)}"
+        )
+
+
+def list_market_stocks(date_str: str, client: KRXClient = None) -> List[Tuple[str, str, str]]:
+    """
+    기준일의 KOSPI/KOSDAQ 전 종목 (전체 시장 백필 대상)
+
+    Args:
+        date_str: 기준일 (YYYYMMDD)
+        client: KRX 클라이언트 (기본값: 새 KRXClient)
+
+    Returns:
+        (종목코드, 종목명, 시장) 목록
+    """
+    client = client or KRXClient()
+    master = get_ticker_master()
+    master.ensure(date_str)
+    return [
+        (ticker, master.get_name(ticker), market)
+        for market in MARKETS
+        for ticker in client.get_ticker_list(date_str, market)
+    ]
+
+
+class BackfillEngine:
+    """
+    체크포인트 기반 백필 실행기
+
+    - 종목/데이터셋별로 조회 구간을 chunk_days 단위로 나눔
+    - 이미 완료된 구간(체크포인트가 구간을 포함)은 조회하지 않음
+    - 조회는 작업자 풀에서 동시에, 저장은 WriteBehindWriter 스레드가 배치로 처리
+    - 구간 데이터와 체크포인트는 한 트랜잭션으로 저장 (저장되지 않은 구간은 완료로 기록되지 않음)
+    - Ctrl-C로 중단하면 진행 중인 구간의 저장까지 마치고 종료
+    """
+
+    def __init__(
+        self,
+        db: Database = None,
+        client: KRXClient = None,
+        chunk_days: int = CHUNK_DAYS,
+        max_workers: int = MAX_WORKERS,
+        datasets: List[str] = None,
+        settle_days: int = SETTLE_DAYS
+    ):
+        """
+        Args:
+            db: 데이터베이스 (기본값: 기본 SQLite DB)
+            client: KRX 클라이언트 (기본값: 새 KRXClient)
+            chunk_days: 한 번에 조회할 구간 길이 (일)
+            max_workers: 동시에 조회할 구간 수
+            datasets: 수집할 데이터셋 키 목록 (기본값: 전체)
+            settle_days: 종료일이 최근 N일 이내인 구간은 체크포인트를 남기지 않음
+        """
+        if chunk_days < 1:
+            raise ValueError(f"chunk_days는 1 이상이어야 합니다: {chunk_days}")
+
+        self.db = db
+        self.client = client
+        self.chunk_days = chunk_days
+        self.max_workers = max(1, max_workers)
+        self.settle_days = settle_days
+        self.datasets = [
+            dataset for dataset in DATASETS
+            if datasets is None or dataset[0] in datasets
+        ]
+
+    def _database(self) -> Database:
+        return self.db or Database()
+
+    def _ensure_table(self, session):
+        BackfillCheckpoint.__table__.create(bind=session.get_bind(), checkfirst=True)
+
+    def _completed(self, tickers: List[str], start_date: date, end_date: date) -> Dict[Tuple[str, str], List[Tuple[date, date]]]:
+        """(종목코드, 데이터셋) -> 조회 구간과 겹치는 완료 구간 목록"""
+        wanted: Set[str] = set(tickers)
+        completed: Dict[Tuple[str, str], List[Tuple[date, date]]] = {}
+
+        with self._database().get_session() as session:
+            self._ensure_table(session)
+            rows = session.query(
+                BackfillCheckpoint.ticker, BackfillCheckpoint.dataset,
+                BackfillCheckpoint.start_date, BackfillCheckpoint.end_date
+            ).filter(
+                BackfillCheckpoint.start_date <= end_date,
+                BackfillCheckpoint.end_date >= start_date
+            )
+            for ticker, dataset, chunk_start, chunk_end in rows:
+                if ticker in wanted:
+                    completed.setdefault((ticker, dataset), []).append((chunk_start, chunk_end))
+        return completed
+
+    def pending_chunks(self, tickers: List[str], start_date: date, end_date: date) -> List[BackfillChunk]:
+        """
+        아직 완료되지 않은 구간 목록
+
+        구간 경계가 이전 실행과 달라도 완료된 체크포인트 하나가 구간 전체를 포함하면 건너뜁니다.
+
+        Args:
+            tickers: 종목코드 목록
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            종목 → 데이터셋 → 날짜 순 구간 목록
+        """
+        completed = self._completed(tickers, start_date, end_date)
+        ranges = split_range(start_date, end_date, self.chunk_days)
+
+        chunks = []
+        for ticker in tickers:
+            for dataset in self.datasets:
+                done = completed.get((ticker, dataset[0]), [])
+                for chunk_start, chunk_end in ranges:
+                    if any(s <= chunk_start and chunk_end <= e for s, e in done):
+                        continue
+                    chunks.append(BackfillChunk(ticker, dataset[0], chunk_start, chunk_end))
+        return chunks
+
+    def reset(self, tickers: List[str] = None) -> int:
+        """
+        체크포인트 삭제 (다음 실행에서 전체 재수집)
+
+        Args:
+            tickers: 삭제할 종목코드 목록 (None이면 전체)
+
+        Returns:
+            삭제된 체크포인트 수
+        """
+        with self._database().get_session() as session:
+            self._ensure_table(session)
+            query = session.query(BackfillCheckpoint)
+            if tickers is not None:
+                query = query.filter(BackfillCheckpoint.ticker.in_(tickers))
+            deleted = query.delete(synchronize_session=False)
+            session.commit()
+        logger.info(f"백필 체크포인트 삭제: {deleted}건")
+        return deleted
+
+    def _fetch_chunk(self, client: KRXClient, writer: WriteBehindWriter, chunk: BackfillChunk,
+                     settled_before: date) -> Tuple[Future, int]:
+        """
+        구간 하나를 조회하여 writer에 저장 요청 (데이터 + 체크포인트)
+
+        Returns:
+            (저장 결과 Future, 조회된 행 수)
+        """
+        _, _, fetch_method, save_method, _ = next(d for d in self.datasets if d[0] == chunk.dataset)
+        df = getattr(client, fetch_method)(
+            chunk.ticker,
+            chunk.start_date.strftime('%Y%m%d'),
+            chunk.end_date.strftime('%Y%m%d')
+        )
+        future = writer.submit(
+            'save_backfill_chunk', chunk.ticker, chunk.dataset,
+            chunk.start_date, chunk.end_date, save_method, df,
+            chunk.end_date < settled_before
+        )
+        return future, len(df)
+
+    def run(self, stocks: List[Tuple[str, str, str]], start_date: date, end_date: date) -> dict:
+        """
+        백필 실행
+
+        Args:
+            stocks: (종목코드, 종목명, 시장) 목록
+            start_date: 시작일
+            end_date: 종료일
+
+        Returns:
+            결과 딕셔너리 (total: 전체 구간 수, skipped: 이미 완료된 구간 수,
+            completed/failed: 이번 실행에서 저장/실패한 구간 수, rows: 조회된 행 수,
+            interrupted: Ctrl-C로 중단 여부, errors: 오류 메시지 목록,
+            write_stats: 배치 저장 통계)
+        """
+        tickers = [ticker for ticker, _, _ in stocks]
+        chunks = self.pending_chunks(tickers, start_date, end_date)
+        total = len(tickers) * len(self.datasets) * len(split_range(start_date, end_date, self.chunk_days))
+
+        result = {
+            'total': total,
+            'skipped': total - len(chunks),
+            'completed': 0,
+            'failed': 0,
+            'rows': 0,
+            'interrupted': False,
+            'errors': []
+        }
+
+        logger.info(f"{'=' * 60}")
+        logger.info(f"백필: {len(stocks)}개 종목, {start_date} ~ {end_date} "
+                    f"({self.chunk_days}일 단위, 전체 {total}구간)")
+        logger.info(f"이미 완료: {result['skipped']}구간, 남은 구간: {len(chunks)}")
+        logger.info(f"{'=' * 60}")
+
+        client = self.client or KRXClient()
+        progress = BackfillProgress(len(chunks))
+        settled_before = datetime.now().date() - timedelta(days=self.settle_days)
+        lock = threading.Lock()
+
+        def on_saved(chunk: BackfillChunk, rows: int, future: Future):
+            error = future.exception()
+            with lock:
+                if error is None:
+                    result['completed'] += 1
+                    result['rows'] += rows
+                else:
+                    result['failed'] += 1
+                    result['errors'].append(f"{chunk.ticker} {chunk.dataset} {chunk.start_date}~{chunk.end_date}: {error}")
+            progress.advance(rows, failed=error is not None)
+
+        def on_fetched(chunk: BackfillChunk, future: Future):
+            if future.cancelled():
+                return
+            try:
+                save_future, rows = future.result()
+            except Exception as e:
+                logger.warning(f"백필 조회 실패: {chunk.ticker} {chunk.dataset} "
+                               f"({chunk.start_date} ~ {chunk.end_date}): {e}")
+                with lock:
+                    result['failed'] += 1
+                    result['errors'].append(f"{chunk.ticker} {chunk.dataset} {chunk.start_date}~{chunk.end_date}: {e}")
+                progress.advance(failed=True)
+                return
+            save_future.add_done_callback(partial(on_saved, chunk, rows))
+
+        saver_factory = lambda: DataSaver(self._database().get_new_session())
+        with WriteBehindWriter(saver_factory) as writer:
+            for ticker, name, market in stocks:
+                writer.submit('save_stock', ticker, name, market)
+
+            # 대기 중인 조회는 작업자 수의 2배까지만 유지 (전체 시장 백필에서도 메모리 일정)
+            in_flight: Dict[Future, BackfillChunk] = {}
+            pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='backfill')
+            try:
+                for chunk in chunks:
+                    while len(in_flight) >= self.max_workers * 2:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            on_fetched(in_flight.pop(future), future)
+                    in_flight[pool.submit(self._fetch_chunk, client, writer, chunk, settled_before)] = chunk
+                wait(in_flight)
+            except KeyboardInterrupt:
+                result['interrupted'] = True
+                logger.warning("백필 중단 요청: 진행 중인 구간을 저장하고 종료합니다")
+            finally:
+                # 시작하지 않은 조회는 취소하고, 이미 조회한 구간은 저장까지 마침
+                pool.shutdown(wait=True, cancel_futures=True)
+                for future, chunk in in_flight.items():
+                    on_fetched(chunk, future)
+
+        result['write_stats'] = writer.stats()
+
+        if result['interrupted']:
+            logger.warning(f"백필 중단: {result['completed']}구간 저장됨. "
+                           f"같은 명령으로 다시 실행하면 남은 구간부터 이어서 수집합니다")
+        else:
+            logger.info(f"백필 완료: 저장 {result['completed']}구간, 실패 {result['failed']}구간, "
+                        f"{result['rows']}행")
+        return result
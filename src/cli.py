@@ -19,6 +19,8 @@ def report_command():
         uv run report --fetch
         uv run report --no-fetch
         uv run report --mode month
+        uv run report --no-cache
+        uv run report --db-profile bulk_load
     """
     # examples 디렉토리의 스크립트 임포트
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -58,6 +60,10 @@ def collect_command():
         uv run collect --today
         uv run collect --month
         uv run collect --force
+        uv run collect --market
+        uv run collect --no-cache
+        uv run collect --async --concurrency 16
+        uv run collect --market --db-profile bulk_load
         uv run collect 20251203
     """
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -85,6 +91,26 @@ def query_command():
     main()
 
 
+def migrate_command():
+    """
+    데이터베이스 스키마 마이그레이션 CLI
+
+    사용법:
+        uv run migrate
+        uv run migrate --status
+        uv run migrate --target 1
+        uv run migrate --batch-size 20000
+        uv run migrate --integer-dates
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(current_dir)
+    examples_dir = os.path.join(project_root, 'examples')
+    sys.path.insert(0, examples_dir)
+
+    from migrate_database import main
+    main()
+
+
 # 직접 실행 시 도움말 표시
 if __name__ == '__main__':
     print("""
@@ -96,6 +122,7 @@ my-stocks CLI 명령어
   uv run test-stocks   단위 테스트 실행
   uv run collect       데이터 수집
   uv run query         데이터 조회
+  uv run migrate       스키마 마이그레이션 적용
 
 자세한 사용법:
   uv run report --help
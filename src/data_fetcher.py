@@ -7,8 +7,12 @@
 
 import sys
 import os
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict
 import logging
 
 sys.path.insert(0, os.path.dirname(__file__))
@@ -16,15 +20,60 @@ sys.path.insert(0, os.path.dirname(__file__))
 from database.connection import Database
 from database.queries import StockQueries
 from krx.client import KRXClient
+from krx.async_client import AsyncKRXClient
 from krx.saver import DataSaver
+from krx.writer import WriteBehindWriter
+from krx.trading_calendar import get_trading_calendar
+from fetch_planner import FetchPlanner, group_jobs_by_ticker
 from config import WATCHLIST
+from models import DailyPrice
 
 logger = logging.getLogger(__name__)
 
+# 전체 시장 수집 대상 시장
+MARKETS = ('KOSPI', 'KOSDAQ')
+
+# 동시 수집 설정 (전체 호출 속도는 KRXClient의 공유 호출 제한기가 제어)
+MAX_WORKERS = 4         # 동시에 수집할 종목 수
+DATASET_WORKERS = 2     # 종목별로 동시에 조회할 데이터셋 수
+WRITE_QUEUE_SIZE = 32   # async 수집 시 저장 대기 결과 수 (초과 시 조회 쪽이 대기)
+
+# 종목별 수집 데이터셋: (결과 키, 표시명, 조회 메서드, 저장 메서드, 실패 무시 여부)
+DATASETS = [
+    ('daily_price', '일별 주가', 'get_ohlcv', 'save_daily_prices', False),
+    ('market_cap', '시가총액', 'get_market_cap', 'save_market_caps', False),
+    ('fundamental', '펀더멘탈', 'get_fundamental', 'save_fundamentals', False),
+    ('trading', '투자자별 매매', 'get_trading_by_investor', 'save_trading_by_investor', False),
+    ('short_selling', '공매도', 'get_short_selling_volume', 'save_short_selling', True),
+    ('short_balance', '공매도 잔고', 'get_short_balance', 'save_short_balance', True),
+]
+
+# DB 쓰기 직렬화 (세션 공유 보호 + SQLite 단일 writer)
+_write_lock = threading.Lock()
+
+
+def _fetch_window(date_str: str, fetch_mode: str) -> Tuple[str, str]:
+    """
+    수집 모드에 따른 기본 조회 구간 계산
+
+    Returns:
+        (시작일, 종료일) (YYYYMMDD)
+    """
+    end_date = datetime.strptime(date_str, '%Y%m%d')
+
+    if fetch_mode == 'today':
+        start_date = end_date
+    elif fetch_mode == 'recent':
+        start_date = end_date - timedelta(days=5)
+    else:  # 'month'
+        start_date = end_date - timedelta(days=30)
+
+    return start_date.strftime("%Y%m%d"), end_date.strftime("%Y%m%d")
+
 
 def check_data_exists(ticker: str, date_str: str) -> bool:
     """
-    특정 날짜의 데이터가 DB에 있는지 확인
+    특정 날짜의 데이터가 DB에 있는지 확인 (data_coverage의 일별 주가 최근 일자 기준)
 
     Args:
         ticker: 종목 코드
@@ -36,18 +85,78 @@ def check_data_exists(ticker: str, date_str: str) -> bool:
     target_date = datetime.strptime(date_str, '%Y%m%d').date()
 
     with Database().get_session() as session:
-        latest = StockQueries.get_latest_price(session, ticker)
-        if latest and latest.date == target_date:
+        coverage = StockQueries.get_coverage(session, DailyPrice, [ticker]).get(ticker)
+        if coverage and coverage[1] == target_date:
             return True
     return False
 
 
+def _fetch_dataset(
+    client: KRXClient,
+    saver: DataSaver,
+    dataset: tuple,
+    ticker: str,
+    start_date: str,
+    end_date: str,
+    writer: Optional[WriteBehindWriter] = None
+):
+    """
+    데이터셋 하나를 조회하여 저장
+
+    결과가 비어 있어도 조회 시작일은 기록하므로(DataSaver.save_fetched) 데이터가 없는
+    앞쪽 구간(상장 전 등)은 다음 실행에서 다시 조회하지 않습니다.
+
+    Returns:
+        저장된 레코드 수 (조회 결과가 비어 있으면 None),
+        writer를 지정하면 저장 결과를 받을 Future
+    """
+    key, _, fetch_method, save_method, _ = dataset
+
+    df = getattr(client, fetch_method)(ticker, start_date, end_date)
+    checked_from = datetime.strptime(start_date, '%Y%m%d').date()
+
+    if writer is not None:
+        future = writer.submit('save_fetched', ticker, key, checked_from, save_method, df)
+        return None if df.empty else future
+
+    with _write_lock:
+        count = saver.save_fetched(ticker, key, checked_from, save_method, df)
+    return None if df.empty else count
+
+
+def _record_save(result: dict, key: str, label: str, optional: bool, future: Future):
+    """writer 저장 완료 콜백: 결과 딕셔너리에 저장 건수/오류 반영 (writer 스레드에서 실행)"""
+    try:
+        count = future.result()
+    except Exception as e:
+        logger.warning(f"  ✗ {result['name']} {label} 저장 실패: {e}")
+        result['errors'].append(f"{label} 저장: {e}")
+        return
+
+    result['counts'][key] = count
+    if not optional:
+        logger.info(f"  ✓ {result['name']} {label}: {count}건")
+
+
+def _record_stock_saved(result: dict, future: Future):
+    """writer 종목 등록 완료 콜백: 실패하면 종목 전체를 실패로 표시"""
+    try:
+        future.result()
+    except Exception as e:
+        logger.error(f"  ✗ {result['name']} 종목 등록 실패: {e}")
+        result['success'] = False
+        result['errors'].append(f"전체 수집 실패: {e}")
+
+
 def fetch_stock_data(
     ticker: str,
     name: str,
     market: str,
     date_str: str,
-    fetch_mode: str = 'today'
+    fetch_mode: str = 'today',
+    ranges: Optional[Dict[str, Tuple[str, str]]] = None,
+    writer: Optional[WriteBehindWriter] = None,
+    refresh: bool = False
 ) -> dict:
     """
     특정 종목의 데이터 수집
@@ -61,22 +170,22 @@ def fetch_stock_data(
             - 'today': 당일 데이터만
             - 'recent': 최근 5일
             - 'month': 최근 30일
+        ranges: 데이터셋 키 -> (시작일, 종료일). 지정하면 해당 데이터셋만
+            각자의 구간으로 수집 (FetchPlanner 결과), None이면 전체 데이터셋을
+            fetch_mode 구간으로 수집
+        writer: 지정하면 저장을 writer 스레드에 맡기고 조회가 끝나는 즉시 반환
+            (counts/errors는 writer.close() 이후 채워짐)
+        refresh: True면 응답 캐시를 읽지 않고 KRX에서 다시 조회 (강제 수집)
 
     Returns:
         수집 결과 딕셔너리
     """
     # 날짜 범위 계산
-    end_date = datetime.strptime(date_str, '%Y%m%d')
-
-    if fetch_mode == 'today':
-        start_date = end_date
-    elif fetch_mode == 'recent':
-        start_date = end_date - timedelta(days=5)
-    else:  # 'month'
-        start_date = end_date - timedelta(days=30)
-
-    date_str_start = start_date.strftime("%Y%m%d")
-    date_str_end = end_date.strftime("%Y%m%d")
+    date_str_start, date_str_end = _fetch_window(date_str, fetch_mode)
+    if ranges is None:
+        ranges = {dataset[0]: (date_str_start, date_str_end) for dataset in DATASETS}
+    else:
+        date_str_start = min(start for start, _ in ranges.values())
 
     result = {
         'ticker': ticker,
@@ -90,72 +199,45 @@ def fetch_stock_data(
 
     try:
         with Database().get_session() as session:
-            client = KRXClient(session)
+            client = KRXClient(session, refresh_cache=refresh)
             saver = DataSaver(session)
 
-            # 1. 종목 정보 저장
-            saver.save_stock(ticker, name, market)
-
-            # 2. 일별 주가 데이터
-            try:
-                ohlcv = client.get_ohlcv(ticker, date_str_start, date_str_end)
-                if not ohlcv.empty:
-                    count = saver.save_daily_prices(ticker, ohlcv)
-                    result['counts']['daily_price'] = count
-                    logger.info(f"  ✓ 일별 주가: {count}건")
-            except Exception as e:
-                logger.warning(f"  ✗ 일별 주가 실패: {e}")
-                result['errors'].append(f"일별 주가: {e}")
-
-            # 3. 시가총액 데이터
-            try:
-                market_cap = client.get_market_cap(ticker, date_str_start, date_str_end)
-                if not market_cap.empty:
-                    count = saver.save_market_caps(ticker, market_cap)
-                    result['counts']['market_cap'] = count
-                    logger.info(f"  ✓ 시가총액: {count}건")
-            except Exception as e:
-                logger.warning(f"  ✗ 시가총액 실패: {e}")
-                result['errors'].append(f"시가총액: {e}")
-
-            # 4. 펀더멘탈 데이터
-            try:
-                fundamental = client.get_fundamental(ticker, date_str_start, date_str_end)
-                if not fundamental.empty:
-                    count = saver.save_fundamentals(ticker, fundamental)
-                    result['counts']['fundamental'] = count
-                    logger.info(f"  ✓ 펀더멘탈: {count}건")
-            except Exception as e:
-                logger.warning(f"  ✗ 펀더멘탈 실패: {e}")
-                result['errors'].append(f"펀더멘탈: {e}")
-
-            # 5. 투자자별 매매 데이터
-            try:
-                trading = client.get_trading_by_investor(ticker, date_str_start, date_str_end)
-                if not trading.empty:
-                    count = saver.save_trading_by_investor(ticker, trading)
-                    result['counts']['trading'] = count
-                    logger.info(f"  ✓ 투자자별 매매: {count}건")
-            except Exception as e:
-                logger.warning(f"  ✗ 투자자별 매매 실패: {e}")
-                result['errors'].append(f"투자자별 매매: {e}")
-
-            # 6. 공매도 데이터 (선택적)
-            try:
-                short_selling = client.get_short_selling_volume(ticker, date_str_start, date_str_end)
-                if not short_selling.empty:
-                    count = saver.save_short_selling(ticker, short_selling)
-                    result['counts']['short_selling'] = count
-            except Exception:
-                pass  # 공매도는 실패해도 무시
-
-            try:
-                short_balance = client.get_short_balance(ticker, date_str_start, date_str_end)
-                if not short_balance.empty:
-                    count = saver.save_short_balance(ticker, short_balance)
-                    result['counts']['short_balance'] = count
-            except Exception:
-                pass  # 공매도는 실패해도 무시
+            # 1. 종목 정보 저장 (writer 큐는 순서대로 저장하므로 데이터보다 먼저 등록됨)
+            if writer is not None:
+                writer.submit('save_stock', ticker, name, market).add_done_callback(
+                    partial(_record_stock_saved, result)
+                )
+            else:
+                with _write_lock:
+                    saver.save_stock(ticker, name, market)
+
+            # 2. 데이터셋별 조회/저장 (조회는 병렬, 저장은 직렬)
+            with ThreadPoolExecutor(max_workers=DATASET_WORKERS) as pool:
+                futures = [
+                    (dataset, pool.submit(
+                        _fetch_dataset, client, saver, dataset,
+                        ticker, *ranges[dataset[0]], writer
+                    ))
+                    for dataset in DATASETS
+                    if dataset[0] in ranges
+                ]
+
+                for (key, label, _, _, optional), future in futures:
+                    try:
+                        count = future.result()
+                    except Exception as e:
+                        if optional:
+                            continue  # 공매도는 실패해도 무시
+                        logger.warning(f"  ✗ {label} 실패: {e}")
+                        result['errors'].append(f"{label}: {e}")
+                        continue
+
+                    if isinstance(count, Future):
+                        count.add_done_callback(partial(_record_save, result, key, label, optional))
+                    elif count is not None:
+                        result['counts'][key] = count
+                        if not optional:
+                            logger.info(f"  ✓ {label}: {count}건")
 
     except Exception as e:
         logger.error(f"  ✗ {name} 수집 중 오류: {e}")
@@ -165,21 +247,66 @@ def fetch_stock_data(
     return result
 
 
+def _new_saver(upsert: bool = False) -> DataSaver:
+    """writer 스레드 전용 세션의 DataSaver 생성"""
+    return DataSaver(Database().get_new_session(), upsert=upsert)
+
+
+def _plan_targets(date_str: str, fetch_mode: str, force: bool, results: dict) -> list:
+    """
+    관심 종목별 수집 대상 구간 계획 (스킵한 종목 수는 results['skipped']에 누적)
+
+    Returns:
+        (종목코드, 종목명, 시장, 데이터셋별 구간 또는 None) 목록 (WATCHLIST 순서)
+    """
+    # 스마트 모드: 종목/테이블별로 빠진 구간만 수집
+    plans = {}
+    if not force:
+        window_start, _ = _fetch_window(date_str, fetch_mode)
+        with Database().get_session() as session:
+            jobs = FetchPlanner(session).plan(
+                [ticker for ticker, _, _ in WATCHLIST],
+                end_date=datetime.strptime(date_str, '%Y%m%d').date(),
+                start_date=datetime.strptime(window_start, '%Y%m%d').date()
+            )
+        plans = group_jobs_by_ticker(jobs)
+
+    targets = []
+    for ticker, name, market in WATCHLIST:
+        if not force and ticker not in plans:
+            logger.info(f"⏭️  {name} ({ticker}): 데이터 이미 존재 (스킵)")
+            results['skipped'] += 1
+            continue
+        targets.append((ticker, name, market, plans.get(ticker)))
+    return targets
+
+
 def fetch_watchlist_data(
     date_str: Optional[str] = None,
     fetch_mode: str = 'today',
-    force: bool = False
+    force: bool = False,
+    max_workers: int = MAX_WORKERS
 ) -> dict:
     """
     관심 종목 리스트의 데이터 수집
 
+    FetchPlanner가 DB에 저장된 종목별/테이블별 구간을 확인하여
+    빠진 날짜만 수집합니다. 종목들은 제한된 크기의 작업자 풀에서 동시에
+    수집하며, KRX 호출 속도는 모든 작업자가 공유하는 호출 제한기가 제어합니다.
+    저장은 WriteBehindWriter 스레드 하나가 여러 종목의 결과를 모아 배치로 처리하므로
+    조회와 DB 쓰기가 서로를 기다리지 않습니다.
+
     Args:
         date_str: 기준 날짜 (YYYYMMDD), None이면 오늘
         fetch_mode: 수집 모드 ('today', 'recent', 'month')
-        force: True면 기존 데이터가 있어도 재수집
+            - DB에 데이터가 없는 종목/테이블의 수집 시작 구간
+        force: True면 기존 데이터와 관계없이 fetch_mode 구간 전체 재수집
+            (응답 캐시를 읽지 않고 다시 조회, 기존 행은 값이 바뀐 경우에만 덮어씀)
+        max_workers: 동시에 수집할 종목 수
 
     Returns:
-        전체 수집 결과 딕셔너리
+        전체 수집 결과 딕셔너리 (api_stats: 엔드포인트별 호출/재시도 통계,
+        write_stats: 배치 저장 통계)
     """
     if date_str is None:
         date_str = datetime.now().strftime('%Y%m%d')
@@ -198,17 +325,177 @@ def fetch_watchlist_data(
         'skipped': 0
     }
 
-    for ticker, name, market in WATCHLIST:
-        # 스마트 모드: 데이터가 있으면 스킵
-        if not force and check_data_exists(ticker, date_str):
-            logger.info(f"⏭️  {name} ({ticker}): 데이터 이미 존재 (스킵)")
-            results['skipped'] += 1
+    targets = _plan_targets(date_str, fetch_mode, force, results)
+
+    # 데이터 수집 (결과는 WATCHLIST 순서 유지)
+    # 조회 작업자들은 저장을 writer 스레드에 넘기고 바로 다음 조회로 진행
+    # 강제 수집은 기존 행도 새 값으로 갱신 (KRX 정정 데이터 반영)
+    with WriteBehindWriter(partial(_new_saver, force)) as writer:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            futures = [
+                pool.submit(
+                    fetch_stock_data, ticker, name, market, date_str, fetch_mode, ranges,
+                    writer=writer, refresh=force
+                )
+                for ticker, name, market, ranges in targets
+            ]
+            results['stocks'] = [future.result() for future in futures]
+
+    # writer 종료(남은 저장 완료) 후 집계
+    for stock_result in results['stocks']:
+        if stock_result['success']:
+            results['total_success'] += 1
+        else:
+            results['total_failed'] += 1
+    results['write_stats'] = writer.stats()
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"✅ 수집 완료: 성공 {results['total_success']}개, "
+               f"실패 {results['total_failed']}개, "
+               f"스킵 {results['skipped']}개")
+    logger.info(f"{'='*60}\n")
+
+    results['api_stats'] = KRXClient.retry_stats()
+    return results
+
+
+async def _write_results(queue: asyncio.Queue, saver: DataSaver, run_db):
+    """
+    단일 writer 태스크: 큐로 들어오는 조회 결과를 순서대로 저장 (None이면 종료)
+
+    저장은 run_db(전용 DB 스레드)에서 실행되므로 세션은 한 스레드에서만 사용됩니다.
+    """
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+
+        stock_result, (key, label, _, save_method, optional), start_date, df = item
+        checked_from = datetime.strptime(start_date, '%Y%m%d').date()
+        try:
+            count = await run_db(saver.save_fetched, stock_result['ticker'], key, checked_from, save_method, df)
+        except Exception as e:
+            await run_db(saver.session.rollback)
+            # 동기 수집(_record_save)과 같이 오류만 기록 (종목 실패로 집계하지 않음)
+            logger.warning(f"  ✗ {stock_result['name']} {label} 저장 실패: {e}")
+            stock_result['errors'].append(f"{label} 저장: {e}")
             continue
 
-        # 데이터 수집
-        stock_result = fetch_stock_data(ticker, name, market, date_str, fetch_mode)
-        results['stocks'].append(stock_result)
+        if df.empty:
+            continue  # 조회 시작일만 기록
+        stock_result['counts'][key] = count
+        if not optional:
+            logger.info(f"  ✓ {stock_result['name']} {label}: {count}건")
+
 
+async def fetch_watchlist_data_async(
+    date_str: Optional[str] = None,
+    fetch_mode: str = 'today',
+    force: bool = False,
+    max_concurrency: int = AsyncKRXClient.MAX_CONCURRENCY,
+    client: Optional[AsyncKRXClient] = None
+) -> dict:
+    """
+    관심 종목 리스트의 데이터 수집 (asyncio 버전)
+
+    fetch_watchlist_data와 같은 계획/결과 형식이며, 모든 종목 x 데이터셋 조회를
+    한꺼번에 코루틴으로 띄우고 결과는 큐를 통해 단일 writer 태스크가 저장합니다.
+    동시에 진행 중인 pykrx 호출 수는 max_concurrency로, 호출 속도는 공유 호출
+    제한기로 제한되므로 대기 중인 요청이 많아도 스레드는 늘어나지 않습니다.
+
+    Args:
+        date_str: 기준 날짜 (YYYYMMDD), None이면 오늘
+        fetch_mode: 수집 모드 ('today', 'recent', 'month')
+        force: True면 기존 데이터와 관계없이 fetch_mode 구간 전체 재수집
+            (응답 캐시를 읽지 않고 다시 조회, 기존 행은 값이 바뀐 경우에만 덮어씀)
+        max_concurrency: 동시에 진행할 pykrx 호출 수
+        client: 비동기 KRX 클라이언트 (기본값: max_concurrency로 생성)
+
+    Returns:
+        전체 수집 결과 딕셔너리 (api_stats: 엔드포인트별 호출/재시도 통계)
+    """
+    if date_str is None:
+        date_str = datetime.now().strftime('%Y%m%d')
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"📈 관심 종목 데이터 수집 시작 (async): {date_str}")
+    logger.info(f"   모드: {fetch_mode}, 강제수집: {force}, 동시 호출: {max_concurrency}")
+    logger.info(f"{'='*60}")
+
+    results = {
+        'date': date_str,
+        'mode': fetch_mode,
+        'stocks': [],
+        'total_success': 0,
+        'total_failed': 0,
+        'skipped': 0
+    }
+
+    targets = _plan_targets(date_str, fetch_mode, force, results)
+    window = _fetch_window(date_str, fetch_mode)
+
+    loop = asyncio.get_running_loop()
+    db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db-writer')
+
+    async def run_db(func, *args):
+        return await loop.run_in_executor(db_executor, partial(func, *args))
+
+    own_client = client is None
+    client = client or AsyncKRXClient(max_concurrency=max_concurrency, refresh_cache=force)
+    session = await run_db(Database().get_new_session)
+    try:
+        saver = DataSaver(session, upsert=force)
+        queue = asyncio.Queue(maxsize=WRITE_QUEUE_SIZE)
+
+        # 1. 종목 정보 저장 (조회 결과보다 먼저)
+        for ticker, name, market, _ in targets:
+            results['stocks'].append({
+                'ticker': ticker,
+                'name': name,
+                'success': True,
+                'counts': {},
+                'errors': []
+            })
+            try:
+                await run_db(saver.save_stock, ticker, name, market)
+            except Exception as e:
+                await run_db(session.rollback)
+                logger.error(f"  ✗ {name} 종목 등록 실패: {e}")
+                results['stocks'][-1]['success'] = False
+                results['stocks'][-1]['errors'].append(f"전체 수집 실패: {e}")
+
+        async def fetch_one(stock_result: dict, dataset: tuple, start_date: str, end_date: str):
+            _, label, fetch_method, _, optional = dataset
+            try:
+                df = await getattr(client, fetch_method)(stock_result['ticker'], start_date, end_date)
+            except Exception as e:
+                if not optional:  # 공매도는 실패해도 무시
+                    logger.warning(f"  ✗ {stock_result['name']} {label} 실패: {e}")
+                    stock_result['errors'].append(f"{label}: {e}")
+                return
+            await queue.put((stock_result, dataset, start_date, df))
+
+        # 2. 전 종목 x 데이터셋 조회 (동시), 저장은 writer 태스크 하나가 직렬로
+        writer = asyncio.create_task(_write_results(queue, saver, run_db))
+        fetches = [
+            fetch_one(stock_result, dataset, *(ranges or {}).get(dataset[0], window))
+            for stock_result, (_, _, _, ranges) in zip(results['stocks'], targets)
+            if stock_result['success']
+            for dataset in DATASETS
+            if ranges is None or dataset[0] in ranges
+        ]
+        try:
+            await asyncio.gather(*fetches)
+        finally:
+            await queue.put(None)
+            await writer
+    finally:
+        await run_db(session.close)
+        db_executor.shutdown(wait=True)
+        if own_client:
+            client.close()
+
+    for stock_result in results['stocks']:
         if stock_result['success']:
             results['total_success'] += 1
         else:
@@ -220,4 +507,153 @@ def fetch_watchlist_data(
                f"스킵 {results['skipped']}개")
     logger.info(f"{'='*60}\n")
 
+    results['api_stats'] = KRXClient.retry_stats()
+    return results
+
+
+def fetch_market_snapshot(client: KRXClient, saver: DataSaver, date_str: str, market: str) -> dict:
+    """
+    특정 일자의 한 시장 전체 종목 데이터 수집
+
+    종목별 기간 조회 대신 날짜별 전체 종목 조회 API를 사용하므로
+    종목 수와 관계없이 시장당 3회의 API 호출로 수집합니다.
+
+    Args:
+        client: KRX 클라이언트
+        saver: 데이터 저장 객체
+        date_str: 거래일자 (YYYYMMDD)
+        market: 시장 (KOSPI/KOSDAQ)
+
+    Returns:
+        시장별 수집 결과 딕셔너리
+    """
+    result = {
+        'market': market,
+        'success': True,
+        'holiday': False,
+        'counts': {},
+        'errors': []
+    }
+
+    logger.info(f"📊 {market} 전체 종목 수집 중... ({date_str})")
+
+    # 1. 전체 종목 주가 (휴장일 판별 겸용)
+    try:
+        ohlcv = client.get_market_ohlcv_by_ticker(date_str, market)
+    except Exception as e:
+        logger.error(f"  ✗ {market} 주가 조회 실패: {e}")
+        result['success'] = False
+        result['errors'].append(f"일별 주가: {e}")
+        return result
+
+    if ohlcv.empty or ohlcv['거래량'].sum() == 0:
+        logger.info(f"  ⏭️  {market} {date_str}: 거래 데이터 없음 (휴장일)")
+        result['holiday'] = True
+        return result
+
+    # 2. 종목 정보 일괄 등록
+    try:
+        records = [(ticker, client.get_ticker_name(ticker), market) for ticker in ohlcv.index]
+        result['counts']['stocks'] = saver.save_stocks(records)
+    except Exception as e:
+        logger.warning(f"  ✗ 종목 등록 실패: {e}")
+        result['errors'].append(f"종목 등록: {e}")
+
+    # batch() 안에서 저장해야 실패가 0건으로 삼켜지지 않고 예외로 전파됨
+    # (0건은 이미 저장된 날짜를 다시 수집한 정상 결과일 수 있음)
+    try:
+        with saver.batch():
+            count = saver.save_daily_prices_by_date(date_str, ohlcv)
+        result['counts']['daily_price'] = count
+        logger.info(f"  ✓ 일별 주가: {count}건")
+    except Exception as e:
+        logger.error(f"  ✗ {market} 주가 저장 실패: {e}")
+        result['success'] = False
+        result['errors'].append(f"일별 주가: {e}")
+
+    # 3. 시가총액
+    try:
+        market_cap = client.get_market_cap_by_ticker(date_str, market)
+        with saver.batch():
+            count = saver.save_market_caps_by_date(date_str, market_cap)
+        result['counts']['market_cap'] = count
+        logger.info(f"  ✓ 시가총액: {count}건")
+    except Exception as e:
+        logger.warning(f"  ✗ 시가총액 실패: {e}")
+        result['errors'].append(f"시가총액: {e}")
+
+    # 4. 펀더멘탈
+    try:
+        fundamental = client.get_market_fundamental_by_ticker(date_str, market)
+        with saver.batch():
+            count = saver.save_fundamentals_by_date(date_str, fundamental)
+        result['counts']['fundamental'] = count
+        logger.info(f"  ✓ 펀더멘탈: {count}건")
+    except Exception as e:
+        logger.warning(f"  ✗ 펀더멘탈 실패: {e}")
+        result['errors'].append(f"펀더멘탈: {e}")
+
+    return result
+
+
+def fetch_market_data(
+    date_str: Optional[str] = None,
+    markets: Tuple[str, ...] = MARKETS,
+    force: bool = False
+) -> dict:
+    """
+    KOSPI/KOSDAQ 전체 종목의 특정 일자 데이터 수집
+
+    Args:
+        date_str: 거래일자 (YYYYMMDD), None이면 오늘
+        markets: 수집할 시장 목록
+        force: True면 응답 캐시를 읽지 않고 다시 조회하고, 이미 저장된 행도 값이 바뀐 경우
+            덮어씀 (KRX 정정 데이터 반영)
+
+    Returns:
+        전체 수집 결과 딕셔너리 (api_stats: 엔드포인트별 호출/재시도 통계)
+    """
+    if date_str is None:
+        date_str = datetime.now().strftime('%Y%m%d')
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"📈 전체 시장 데이터 수집 시작: {date_str} ({', '.join(markets)})")
+    logger.info(f"{'='*60}")
+
+    results = {
+        'date': date_str,
+        'markets': [],
+        'total_success': 0,
+        'total_failed': 0
+    }
+
+    # 휴장일은 API 호출 없이 종료
+    if not get_trading_calendar().is_trading_day(date_str):
+        logger.info(f"⏭️  {date_str}: 휴장일 (거래일 달력)")
+        for market in markets:
+            results['markets'].append({
+                'market': market, 'success': True, 'holiday': True, 'counts': {}, 'errors': []
+            })
+            results['total_success'] += 1
+        return results
+
+    with Database().get_session() as session:
+        client = KRXClient(session, refresh_cache=force)
+        saver = DataSaver(session, upsert=force)
+
+        for market in markets:
+            market_result = fetch_market_snapshot(client, saver, date_str, market)
+            results['markets'].append(market_result)
+
+            if market_result['success']:
+                results['total_success'] += 1
+            else:
+                results['total_failed'] += 1
+
+    logger.info(f"\n{'='*60}")
+    logger.info(f"✅ 전체 시장 수집 완료: 성공 {results['total_success']}개 시장, "
+               f"실패 {results['total_failed']}개 시장")
+    logger.info(f"{'='*60}\n")
+
+    results['api_stats'] = KRXClient.retry_stats()
     return results
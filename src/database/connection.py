@@ -1,49 +1,269 @@
 import os
 import sys
-from sqlalchemy import create_engine
+import threading
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+from typing import Dict, Tuple
+from dotenv import load_dotenv
 import logging
 
 # 상대 경로 처리
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from models import Base
+from models import Base, DataCoverage
+from database.coverage import rebuild_coverage
+from database.migrations import MigrationRunner, MIGRATIONS, INTEGER_DATES_MIGRATION, BATCH_SIZE
 
 logger = logging.getLogger(__name__)
 
+# .env의 DB_PROFILE 등 읽기 (이미 설정된 환경 변수는 유지)
+load_dotenv()
+
+# 기본 SQLite 경로
+DEFAULT_DB_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../data'))
+DEFAULT_DB_URL = f'sqlite:///{DEFAULT_DB_DIR}/stocks.db'
+
+# SQLite 성능 프로필 (연결마다 적용할 PRAGMA, 순서대로 실행)
+# - bulk_load: 대량 적재용. 커밋 시 fsync 생략 (전원 장애 시 마지막 트랜잭션 유실 가능)
+# - balanced: 기본값. WAL로 수집(쓰기)과 리포트(읽기)가 서로 막지 않음
+# - read_only: 리포트/조회용. 쓰기 금지, 큰 캐시와 mmap 사용
+PROFILES = {
+    'bulk_load': {
+        'journal_mode': 'WAL',
+        'synchronous': 'OFF',
+        'cache_size': -262144,       # 256MB (음수는 KB 단위)
+        'mmap_size': 268435456,      # 256MB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 30000,       # ms
+    },
+    'balanced': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -65536,        # 64MB
+        'mmap_size': 268435456,      # 256MB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    },
+    'read_only': {
+        'cache_size': -131072,       # 128MB
+        'mmap_size': 1073741824,     # 1GB
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+        'query_only': 'ON',
+    },
+}
+DEFAULT_PROFILE = 'balanced'
+
+# 프로필 미지정 시 사용할 값 (--db-profile 옵션으로 변경, None이면 DB_PROFILE 환경 변수)
+_default_profile = None
+
+# (URL, 프로필) -> (엔진, 세션 팩토리). 프로세스 안에서 조합당 엔진/커넥션 풀은 하나만 생성
+_engines: Dict[Tuple[str, str], Tuple[Engine, sessionmaker]] = {}
+_engines_lock = threading.Lock()
+
+
+def set_default_profile(profile: str):
+    """기본 SQLite 성능 프로필 설정 (--db-profile 옵션)"""
+    global _default_profile
+    resolve_profile(profile)  # 이름 검증
+    _default_profile = profile
+    logger.info(f"데이터베이스 프로필: {profile}")
+
+
+def resolve_profile(profile: str = None) -> str:
+    """
+    사용할 프로필 이름 결정 (인자 > set_default_profile > DB_PROFILE 환경 변수 > 기본값)
+
+    Raises:
+        ValueError: 알 수 없는 프로필
+    """
+    profile = profile or _default_profile or os.getenv('DB_PROFILE') or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(f"알 수 없는 DB 프로필: {profile} (사용 가능: {', '.join(PROFILES)})")
+    return profile
+
+
+def _is_memory_url(db_url: str) -> bool:
+    """인메모리 SQLite 여부 (연결마다 별도 DB이므로 공유하지 않음)"""
+    return db_url.startswith('sqlite') and (':memory:' in db_url or db_url.rstrip('/') == 'sqlite:')
+
+
+def _apply_pragmas(engine: Engine, pragmas: Dict[str, object]):
+    """새 SQLite 연결마다 PRAGMA 실행"""
+
+    @event.listens_for(engine, 'connect')
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _detect_date_storage(engine: Engine):
+    """
+    첫 연결 시 일자 저장 형식 감지 (daily_price.date가 INTEGER면 YYYYMMDD 정수)
+
+    models.types.TradeDate가 dialect.integer_dates를 보고 값을 변환합니다.
+    """
+    engine.dialect.integer_dates = False
+
+    @event.listens_for(engine, 'first_connect')
+    def detect_integer_dates(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            columns = {row[1]: row[2] for row in cursor.execute("PRAGMA table_info(daily_price)")}
+        finally:
+            cursor.close()
+        engine.dialect.integer_dates = columns.get('date', '').upper() == 'INTEGER'
+
+
+def _create_engine(db_url: str, profile: str) -> Tuple[Engine, sessionmaker]:
+    """엔진과 세션 팩토리 생성"""
+    if db_url == DEFAULT_DB_URL:
+        os.makedirs(DEFAULT_DB_DIR, exist_ok=True)
+
+    engine = create_engine(
+        db_url,
+        echo=False,  # SQL 로그 출력 여부
+        pool_pre_ping=True,  # 연결 유효성 검사
+    )
+    if engine.dialect.name == 'sqlite':
+        _apply_pragmas(engine, PROFILES[profile])
+        _detect_date_storage(engine)
+
+    session_factory = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=engine
+    )
+
+    logger.info(f"데이터베이스 연결: {db_url} (프로필: {profile})")
+    return engine, session_factory
+
+
+def get_engine(db_url: str = None, profile: str = None) -> Tuple[Engine, sessionmaker]:
+    """
+    URL/프로필별 공유 엔진/세션 팩토리 반환 (없으면 생성)
+
+    Args:
+        db_url: 데이터베이스 URL (기본값: SQLite)
+        profile: SQLite 성능 프로필 (기본값: resolve_profile 참고)
+
+    Returns:
+        (엔진, 세션 팩토리)
+    """
+    db_url = db_url or DEFAULT_DB_URL
+    profile = resolve_profile(profile)
+    if _is_memory_url(db_url):
+        return _create_engine(db_url, profile)
+
+    key = (db_url, profile)
+    with _engines_lock:
+        if key not in _engines:
+            _engines[key] = _create_engine(db_url, profile)
+        return _engines[key]
+
+
+def dispose_engines():
+    """공유 엔진 전체 종료 (프로세스 종료 시 호출)"""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+
+    for engine, _ in engines:
+        engine.dispose()
+
+    if engines:
+        logger.info(f"데이터베이스 연결 종료: {len(engines)}개")
+
+
 class Database:
-    """데이터베이스 연결 및 세션 관리"""
+    """
+    데이터베이스 연결 및 세션 관리
+
+    같은 URL/프로필의 Database는 엔진과 커넥션 풀을 공유하므로
+    반복문 안에서 생성해도 연결 비용이 들지 않습니다.
+    """
 
-    def __init__(self, db_url: str = None):
+    def __init__(self, db_url: str = None, profile: str = None):
         """
         Args:
             db_url: 데이터베이스 URL (기본값: SQLite)
+            profile: SQLite 성능 프로필 ('bulk_load', 'balanced', 'read_only')
+                None이면 --db-profile 옵션, DB_PROFILE 환경 변수, 'balanced' 순
         """
-        if db_url is None:
-            # 기본 SQLite 경로
-            db_dir = os.path.join(os.path.dirname(__file__), '../../data')
-            os.makedirs(db_dir, exist_ok=True)
-            db_url = f'sqlite:///{db_dir}/stocks.db'
-
-        self.engine = create_engine(
-            db_url,
-            echo=False,  # SQL 로그 출력 여부
-            pool_pre_ping=True,  # 연결 유효성 검사
-        )
-        self.SessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=self.engine
-        )
-
-        logger.info(f"데이터베이스 연결: {db_url}")
+        self.db_url = db_url or DEFAULT_DB_URL
+        self.profile = resolve_profile(profile)
+        self.engine, self.SessionLocal = get_engine(self.db_url, self.profile)
 
     def create_tables(self):
-        """모든 테이블 생성"""
+        """
+        모든 테이블 생성
+
+        - 기존 테이블에 없는 NULL 허용 컬럼(예: updated_at)은 ALTER TABLE로 추가
+        - data_coverage가 새로 생기면 기존 데이터로 채움
+        - 새 DB는 최신 스키마이므로 마이그레이션 전체를 적용된 것으로 기록하고,
+          기존 DB에 남은 마이그레이션이 있으면 경고 (실행은 migrate())
+        """
+        existing = set(inspect(self.engine).get_table_names())
         Base.metadata.create_all(bind=self.engine)
+        self._add_missing_columns()
         logger.info("데이터베이스 테이블 생성 완료")
 
+        runner = MigrationRunner(self)
+        if not existing:
+            runner.stamp()
+        elif runner.pending():
+            logger.warning(
+                f"적용되지 않은 스키마 마이그레이션 {len(runner.pending())}개 "
+                f"(uv run migrate 또는 Database.migrate()로 적용)"
+            )
+
+        had_coverage = DataCoverage.__tablename__ in existing
+
+        if not had_coverage:
+            with self.get_session() as session:
+                rebuild_coverage(session)
+                session.commit()
+
+    def migrate(self, target: int = None, batch_size: int = BATCH_SIZE, progress=None,
+                integer_dates: bool = False) -> list:
+        """
+        남은 스키마 마이그레이션 실행 (database.migrations.MigrationRunner 참고)
+
+        Args:
+            target: 이 번호까지만 실행 (기본값: 최신)
+            batch_size: 테이블 재작성 시 트랜잭션당 복사할 행 수
+            progress: 진행률 콜백 (테이블 이름, 복사한 행 수, 전체 행 수)
+            integer_dates: True면 일자를 YYYYMMDD 정수로 바꾸는 선택 단계도 적용
+                (적용 후 이 Database의 엔진은 닫히므로 Database를 새로 만들어 사용)
+
+        Returns:
+            이번에 적용한 Migration 목록
+        """
+        migrations = MIGRATIONS + ([INTEGER_DATES_MIGRATION] if integer_dates else [])
+        runner = MigrationRunner(self, migrations=migrations, batch_size=batch_size, progress=progress)
+        return runner.upgrade(target)
+
+    def _add_missing_columns(self):
+        """모델에 추가된 NULL 허용 컬럼을 기존 테이블에 추가 (create_all은 기존 테이블을 바꾸지 않음)"""
+        inspector = inspect(self.engine)
+        with self.engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {column['name'] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing or not column.nullable or column.primary_key:
+                        continue
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    conn.execute(text(
+                        f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'
+                    ))
+                    logger.info(f"컬럼 추가: {table.name}.{column.name}")
+
     def drop_tables(self):
         """모든 테이블 삭제 (주의!)"""
         Base.metadata.drop_all(bind=self.engine)
@@ -61,3 +281,11 @@ class Database:
     def get_new_session(self) -> Session:
         """새 세션 생성"""
         return self.SessionLocal()
+
+    def dispose(self):
+        """엔진 종료 및 공유 목록에서 제거 (다음 생성 시 새로 연결)"""
+        key = (self.db_url, self.profile)
+        with _engines_lock:
+            if _engines.get(key, (None,))[0] is self.engine:
+                del _engines[key]
+        self.engine.dispose()
@@ -0,0 +1,177 @@
+from sqlalchemy import func, literal, or_, select, delete, update
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import sqlite, postgresql
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import sys
+import os
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from models import DataCoverage, DATASET_MODELS
+
+logger = logging.getLogger(__name__)
+
+# ON CONFLICT(DO NOTHING / DO UPDATE) INSERT를 지원하는 방언별 insert 생성자
+_DIALECT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+# 테이블 이름 -> 데이터셋 키
+_DATASET_KEYS = {model.__tablename__: key for key, model in DATASET_MODELS.items()}
+
+
+def dataset_key(model) -> Optional[str]:
+    """모델의 데이터셋 키 (보유 구간을 관리하지 않는 테이블이면 None)"""
+    return _DATASET_KEYS.get(model.__tablename__)
+
+
+def dialect_insert(session: Session):
+    """
+    세션 방언의 insert 생성자 (ON CONFLICT 지원)
+
+    Raises:
+        NotImplementedError: SQLite/PostgreSQL이 아닌 데이터베이스
+    """
+    dialect = session.get_bind().dialect.name
+    insert = _DIALECT_INSERTS.get(dialect)
+    if insert is None:
+        raise NotImplementedError(f"지원하지 않는 데이터베이스: {dialect}")
+    return insert
+
+
+def _bounds(dialect: str):
+    """두 값 중 작은 값/큰 값 함수 (SQLite는 인자 2개 min/max, PostgreSQL은 least/greatest)"""
+    if dialect == 'postgresql':
+        return func.least, func.greatest
+    return func.min, func.max
+
+
+def update_coverage(session: Session, model, rows: Iterable[Tuple[str, date]],
+                    now: datetime = None) -> int:
+    """
+    새로 저장된 행으로 종목별 보유 구간 갱신
+
+    저장과 같은 트랜잭션에서 호출하며 commit은 호출자가 합니다.
+
+    Args:
+        session: DB 세션
+        model: 저장한 모델 (DailyPrice 등)
+        rows: 새로 저장된 (종목코드, 일자) 목록
+        now: 저장일시 (기본값: 현재 시각)
+
+    Returns:
+        갱신된 (종목, 데이터셋) 수
+    """
+    dataset = dataset_key(model)
+    if dataset is None:
+        return 0
+
+    summary: Dict[str, List] = {}
+    for ticker, day in rows:
+        entry = summary.get(ticker)
+        if entry is None:
+            summary[ticker] = [day, day, 1]
+        else:
+            entry[0] = min(entry[0], day)
+            entry[1] = max(entry[1], day)
+            entry[2] += 1
+    if not summary:
+        return 0
+
+    now = now or datetime.now()
+    records = [
+        {'ticker': ticker, 'dataset': dataset, 'min_date': min_date,
+         'max_date': max_date, 'row_count': count, 'last_ingested_at': now}
+        for ticker, (min_date, max_date, count) in summary.items()
+    ]
+
+    insert = dialect_insert(session)
+    table = DataCoverage.__table__
+    least, greatest = _bounds(session.get_bind().dialect.name)
+    stmt = insert(table)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.ticker, table.c.dataset],
+        set_={
+            'min_date': least(table.c.min_date, stmt.excluded.min_date),
+            'max_date': greatest(table.c.max_date, stmt.excluded.max_date),
+            'row_count': table.c.row_count + stmt.excluded.row_count,
+            'last_ingested_at': stmt.excluded.last_ingested_at,
+        }
+    )
+    session.connection().execute(stmt, records)
+    return len(records)
+
+
+def mark_checked(session: Session, ticker: str, dataset: str, start_date: date) -> int:
+    """
+    start_date부터 조회를 마쳤음을 기록 (checked_from을 더 이른 날짜로만 갱신)
+
+    조회 결과가 비어 있던 앞쪽 구간(상장 전 등)을 다음 실행에서 다시 계획하지 않도록
+    FetchPlanner가 사용합니다. 보유 구간이 없는 (종목, 데이터셋)은 기록하지 않으며,
+    commit은 호출자가 합니다.
+
+    Args:
+        session: DB 세션
+        ticker: 종목코드
+        dataset: 데이터셋 키
+        start_date: 조회 시작일
+
+    Returns:
+        갱신된 행 수 (0 또는 1)
+    """
+    table = DataCoverage.__table__
+    result = session.execute(
+        update(table)
+        .where(table.c.ticker == ticker, table.c.dataset == dataset)
+        .where(or_(table.c.checked_from.is_(None), table.c.checked_from > start_date))
+        .values(checked_from=start_date)
+    )
+    return max(result.rowcount, 0)
+
+
+def rebuild_coverage(session: Session, tickers: List[str] = None, datasets: List[str] = None) -> int:
+    """
+    원본 테이블에서 보유 구간 다시 계산 (기존 DB 최초 적용, 데이터 삭제 후 보정)
+
+    데이터셋마다 INSERT ... SELECT 한 번으로 처리하며 commit은 호출자가 합니다.
+
+    Args:
+        session: DB 세션
+        tickers: 대상 종목코드 목록 (None이면 전체)
+        datasets: 대상 데이터셋 키 목록 (None이면 전체)
+
+    Returns:
+        기록된 (종목, 데이터셋) 수
+    """
+    datasets = datasets or list(DATASET_MODELS)
+    table = DataCoverage.__table__
+    now = datetime.now()
+
+    total = 0
+    for dataset in datasets:
+        model = DATASET_MODELS[dataset]
+
+        cleanup = delete(table).where(table.c.dataset == dataset)
+        if tickers is not None:
+            cleanup = cleanup.where(table.c.ticker.in_(tickers))
+        session.execute(cleanup)
+
+        query = select(
+            model.ticker, literal(dataset), func.min(model.date), func.max(model.date),
+            func.count(), literal(now)
+        )
+        if tickers is not None:
+            query = query.where(model.ticker.in_(tickers))
+        query = query.group_by(model.ticker)
+
+        result = session.execute(table.insert().from_select(
+            ['ticker', 'dataset', 'min_date', 'max_date', 'row_count', 'last_ingested_at'], query
+        ))
+        total += max(result.rowcount, 0)
+
+    logger.info(f"보유 구간 재계산: {total}건")
+    return total
@@ -0,0 +1,189 @@
+from sqlalchemy import BigInteger, Float, Integer, String, select, type_coerce
+from sqlalchemy.orm import Session
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from models import DailyPrice, MarketCap, Fundamental, TradingByInvestor
+
+# 조회하지 않는 관리용 컬럼
+_SKIP_COLUMNS = {'ticker', 'date', 'updated_at', 'created_at'}
+
+# 한 번에 가져와 배열로 바꿀 행 수
+FETCH_ROWS = 10000
+
+# 종목코드 하나(str), 여러 개(목록), 전체(None)
+Tickers = Optional[Union[str, Iterable[str]]]
+
+
+def _column_dtype(column) -> np.dtype:
+    """
+    모델 컬럼 -> NumPy dtype
+
+    NOT NULL 정수는 int32/int64 그대로, NULL 허용 정수는 NaN을 담기 위해 float64
+    (2^53 미만 정수는 손실 없음), 실수는 float32 (PER/PBR/배당수익률 등 유효숫자 7자리)
+    """
+    if isinstance(column.type, Float):
+        return np.dtype('float32')
+    if column.nullable:
+        return np.dtype('float64')
+    if isinstance(column.type, BigInteger):
+        return np.dtype('int64')
+    if isinstance(column.type, Integer):
+        return np.dtype('int32')
+    return np.dtype('object')
+
+
+def _to_datetime64(values: tuple, integer_dates: bool) -> np.ndarray:
+    """저장된 일자('YYYY-MM-DD' 문자열, YYYYMMDD 정수, date) -> datetime64[D] (벡터 연산)"""
+    if not integer_dates:
+        return np.array(values, dtype='datetime64[D]')
+
+    numbers = np.array(values, dtype=np.int64)
+    months = (numbers // 10000 - 1970) * 12 + numbers // 100 % 100 - 1
+    return months.astype('datetime64[M]').astype('datetime64[D]') + (numbers % 100 - 1)
+
+
+def _fetch(session: Session, model, tickers: Tickers, start_date: date, end_date: date,
+           columns: Optional[List[str]]) -> Tuple[List[str], Optional[np.ndarray], Dict[str, np.ndarray]]:
+    """
+    조회 결과를 컬럼별 배열로 변환
+
+    Returns:
+        (종목코드 목록, 행별 종목 번호(int32, 종목 하나면 None), {'date': ..., 값 컬럼: ...})
+    """
+    table = model.__table__
+    names = columns or [c.name for c in table.columns if c.name not in _SKIP_COLUMNS]
+    single = isinstance(tickers, str)
+    # 저장 형식은 첫 연결 시 감지되므로 연결을 먼저 얻은 뒤 확인
+    integer_dates = getattr(session.connection().dialect, 'integer_dates', False)
+
+    # 일자는 변환 없이 저장 형식 그대로 읽음 (TradeDate의 행 단위 변환 생략)
+    raw_date = type_coerce(table.c.date, Integer() if integer_dates else String())
+    selected = ([] if single else [table.c.ticker]) + [raw_date] + [table.c[name] for name in names]
+    stmt = select(*selected)
+    if single:
+        stmt = stmt.where(table.c.ticker == tickers)
+    elif tickers is not None:
+        stmt = stmt.where(table.c.ticker.in_(list(tickers)))
+    if start_date:
+        stmt = stmt.where(table.c.date >= start_date)
+    if end_date:
+        stmt = stmt.where(table.c.date <= end_date)
+    stmt = stmt.order_by(table.c.date) if single else stmt.order_by(table.c.ticker, table.c.date)
+
+    # 종목코드는 행마다 문자열로 두지 않고 번호로 바꿔 저장
+    ticker_codes: Dict[str, int] = {} if not single else {tickers: 0}
+    converters = [
+        lambda v: np.array([ticker_codes.setdefault(t, len(ticker_codes)) for t in v], dtype=np.int32)
+    ] * (not single) + [lambda v: _to_datetime64(v, integer_dates)] + [
+        lambda v, dtype=_column_dtype(table.c[name]): np.array(v, dtype=dtype) for name in names
+    ]
+
+    # 결과를 FETCH_ROWS행씩 받아 배열로 바꾸므로 파이썬 객체는 한 묶음만 메모리에 남음
+    chunks: List[List[np.ndarray]] = [[] for _ in selected]
+    for rows in session.execute(stmt).partitions(FETCH_ROWS):
+        for chunk, convert, column_values in zip(chunks, converters, zip(*rows)):
+            chunk.append(convert(column_values))
+    values = [
+        np.concatenate(chunk) if chunk else convert(())
+        for chunk, convert in zip(chunks, converters)
+    ]
+
+    codes = None if single else values.pop(0)
+    arrays = {'date': values.pop(0)}
+    arrays.update(zip(names, values))
+    return list(ticker_codes), codes, arrays
+
+
+class FrameQueries:
+    """
+    pandas/NumPy로 바로 받는 시계열 조회 (StockQueries의 ORM 조회와 같은 조건)
+
+    ORM 객체를 만들지 않고 Core select 결과를 컬럼 단위로 NumPy 배열에 담습니다.
+    일자는 DB 저장 형식 그대로 읽어 묶음 단위로 변환하므로 행마다 date 객체를 만들지 않고,
+    값 컬럼은 모델 정의에 맞춘 작은 dtype(int32 등)을 사용합니다.
+    """
+
+    @staticmethod
+    def load_arrays(
+        session: Session,
+        model,
+        tickers: Tickers = None,
+        start_date: date = None,
+        end_date: date = None,
+        columns: List[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        종목별 데이터 테이블 조회 -> 컬럼별 NumPy 배열
+
+        Args:
+            session: DB 세션
+            model: 조회할 모델 (DailyPrice 등 ticker/date 컬럼 보유)
+            tickers: 종목코드, 종목코드 목록 또는 None(전체)
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            columns: 조회할 값 컬럼 (기본값: 관리용 컬럼을 뺀 전체)
+
+        Returns:
+            {'ticker': object, 'date': datetime64[D], 값 컬럼: 모델별 dtype}
+            (ticker, date) 순서로 정렬, 종목코드를 하나만 지정하면 'ticker' 없음
+        """
+        names, codes, arrays = _fetch(session, model, tickers, start_date, end_date, columns)
+        if codes is None:
+            return arrays
+        # 같은 종목의 행은 같은 문자열 객체를 가리킴
+        return {'ticker': np.array(names, dtype=object)[codes], **arrays}
+
+    @staticmethod
+    def load_frame(
+        session: Session,
+        model,
+        tickers: Tickers = None,
+        start_date: date = None,
+        end_date: date = None,
+        columns: List[str] = None
+    ) -> pd.DataFrame:
+        """
+        종목별 데이터 테이블 조회 -> DataFrame
+
+        종목코드를 하나만 지정하면 date 인덱스, 아니면 (ticker, date) MultiIndex
+        (ticker는 category)입니다. 인자는 load_arrays와 같습니다.
+        """
+        names, codes, arrays = _fetch(session, model, tickers, start_date, end_date, columns)
+        index = pd.DatetimeIndex(arrays.pop('date').astype('datetime64[ns]'), name='date')
+        if codes is not None:
+            index = pd.MultiIndex.from_arrays(
+                [pd.Categorical.from_codes(codes, categories=names), index], names=['ticker', 'date']
+            )
+        return pd.DataFrame(arrays, index=index)
+
+    @staticmethod
+    def get_daily_prices(session: Session, tickers: Tickers, start_date: date = None,
+                         end_date: date = None) -> pd.DataFrame:
+        """일별 주가 (open, high, low, close: int32, volume: int64)"""
+        return FrameQueries.load_frame(session, DailyPrice, tickers, start_date, end_date)
+
+    @staticmethod
+    def get_market_caps(session: Session, tickers: Tickers, start_date: date = None,
+                        end_date: date = None) -> pd.DataFrame:
+        """시가총액 데이터 (전 컬럼 int64)"""
+        return FrameQueries.load_frame(session, MarketCap, tickers, start_date, end_date)
+
+    @staticmethod
+    def get_fundamentals(session: Session, tickers: Tickers, start_date: date = None,
+                         end_date: date = None) -> pd.DataFrame:
+        """펀더멘탈 데이터 (bps/eps/dps: float64, per/pbr/div: float32, 없는 값은 NaN)"""
+        return FrameQueries.load_frame(session, Fundamental, tickers, start_date, end_date)
+
+    @staticmethod
+    def get_trading_by_investor(session: Session, tickers: Tickers, start_date: date = None,
+                                end_date: date = None) -> pd.DataFrame:
+        """투자자별 매매 데이터 (순매수 금액 float64, 없는 값은 NaN)"""
+        return FrameQueries.load_frame(session, TradingByInvestor, tickers, start_date, end_date)
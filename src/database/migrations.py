@@ -0,0 +1,426 @@
+from sqlalchemy import Date, Integer, MetaData, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from typing import Callable, Dict, List, NamedTuple, Optional
+import logging
+import sys
+import os
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from models import Stock, DataCoverage, SchemaVersion, DATASET_MODELS
+
+logger = logging.getLogger(__name__)
+
+# 재작성 시 한 트랜잭션에서 복사할 행 수 (쓰기 잠금 시간과 저널 크기의 상한)
+BATCH_SIZE = 50000
+
+# 진행률 콜백: (테이블 이름, 복사한 행 수, 전체 행 수)
+ProgressCallback = Callable[[str, int, int], None]
+
+# 일자 형식 변환 SQL (SQLite)
+_ISO_TO_INT = "CAST(strftime('%Y%m%d', {column}) AS INTEGER)"
+_INT_TO_ISO = "printf('%04d-%02d-%02d', {column} / 10000, {column} / 100 % 100, {column} % 100)"
+
+
+class MigrationContext(NamedTuple):
+    """마이그레이션 단계에 전달되는 실행 옵션"""
+    batch_size: int
+    progress: ProgressCallback
+
+
+class Migration(NamedTuple):
+    """
+    마이그레이션 단계
+
+    upgrade는 트랜잭션을 직접 나눠 실행하므로(대용량 재작성) 단계 전체가 원자적이지 않습니다.
+    중간에 중단된 뒤 다시 실행해도 같은 결과가 되도록(멱등) 작성해야 합니다.
+    """
+    version: int
+    name: str
+    upgrade: Callable[[Connection, MigrationContext], None]
+
+
+def describe_table(conn: Connection, table_name: str) -> Dict[str, bool]:
+    """
+    SQLite 테이블의 현재 저장 레이아웃
+
+    Returns:
+        {without_rowid: PK 순서로 묶어 저장 여부, integer_dates: date 컬럼이 INTEGER인지}
+    """
+    sql = conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+    ).scalar()
+    columns = {row[1]: row[2] for row in conn.exec_driver_sql(f"PRAGMA table_info({table_name})")}
+    return {
+        'without_rowid': 'WITHOUT ROWID' in (sql or '').upper(),
+        'integer_dates': columns.get('date', '').upper() == 'INTEGER',
+    }
+
+
+def log_progress(table_name: str, copied: int, total: int):
+    """기본 진행률 출력 (배치마다 로그)"""
+    percent = copied / total * 100 if total else 100.0
+    logger.info(f"  {table_name}: {copied:,}/{total:,}행 ({percent:.1f}%)")
+
+
+@contextmanager
+def write_transaction(conn: Connection):
+    """
+    쓰기 잠금을 바로 잡는 트랜잭션 (BEGIN IMMEDIATE, DDL 포함)
+
+    conn은 AUTOCOMMIT 연결이어야 합니다 (드라이버 자동 트랜잭션 대신 직접 BEGIN).
+    """
+    conn.exec_driver_sql('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.exec_driver_sql('COMMIT')
+    except BaseException:
+        conn.exec_driver_sql('ROLLBACK')
+        raise
+
+
+def create_index(conn: Connection, name: str, table_name: str, columns: List[str], unique: bool = False):
+    """인덱스 추가 (이미 있으면 무시, 문장 하나라 잠금은 생성 시간 동안만)"""
+    with write_transaction(conn):
+        conn.exec_driver_sql(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} "
+            f"ON {table_name} ({', '.join(columns)})"
+        )
+
+
+def drop_index(conn: Connection, name: str):
+    """인덱스 삭제 (없으면 무시)"""
+    with write_transaction(conn):
+        conn.exec_driver_sql(f'DROP INDEX IF EXISTS {name}')
+
+
+def _date_expression(column: str, source_integer: bool, integer_dates: bool) -> str:
+    """복사할 때 일자 형식을 바꾸는 SQL 식"""
+    if source_integer == integer_dates:
+        return column
+    return (_ISO_TO_INT if integer_dates else _INT_TO_ISO).format(column=column)
+
+
+def _convert_coverage_dates(conn: Connection, integer_dates: bool):
+    """data_coverage의 일자도 원본 테이블과 같은 형식으로 변환 (이미 변환된 행은 그대로)"""
+    source_type = 'text' if integer_dates else 'integer'
+    convert = _ISO_TO_INT if integer_dates else _INT_TO_ISO
+    conn.exec_driver_sql(
+        f"UPDATE {DataCoverage.__tablename__} "
+        f"SET min_date = {convert.format(column='min_date')}, max_date = {convert.format(column='max_date')} "
+        f"WHERE typeof(min_date) = '{source_type}'"
+    )
+    # checked_from은 NULL일 수 있으므로 따로 변환
+    columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({DataCoverage.__tablename__})")}
+    if 'checked_from' in columns:
+        conn.exec_driver_sql(
+            f"UPDATE {DataCoverage.__tablename__} "
+            f"SET checked_from = {convert.format(column='checked_from')} "
+            f"WHERE typeof(checked_from) = '{source_type}'"
+        )
+
+
+def _copy_in_batches(conn: Connection, table, batch_size: int, progress: ProgressCallback,
+                     integer_dates: Optional[bool]) -> int:
+    """새 테이블과 동기화 트리거를 준비하고 (ticker, date) 순서로 배치 복사 (교체는 하지 않음)"""
+    name = table.name
+    temp_name = f'{name}__new'
+    source_integer = describe_table(conn, name)['integer_dates']
+    target_integer = source_integer if integer_dates is None else integer_dates
+    old_columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({name})")}
+    # 기존 테이블에 있는 컬럼만 복사 (id, created_at 등 모델에 없는 컬럼은 버림)
+    names = [column.name for column in table.columns if column.name in old_columns]
+    columns = ', '.join(names)
+
+    def values(prefix: str) -> str:
+        return ', '.join(
+            _date_expression(f'{prefix}{column}', source_integer, target_integer) if column == 'date'
+            else f'{prefix}{column}'
+            for column in names
+        )
+
+    old_date = _date_expression('OLD.date', source_integer, target_integer)
+
+    with write_transaction(conn):
+        # 이전 실행이 다른 일자 형식으로 만든 새 테이블은 버리고 다시 만듦
+        if inspect(conn).has_table(temp_name) and describe_table(conn, temp_name)['integer_dates'] != target_integer:
+            conn.exec_driver_sql(f'DROP TABLE {temp_name}')
+        if not inspect(conn).has_table(temp_name):
+            metadata = MetaData()
+            Stock.__table__.to_metadata(metadata)  # 외래키 대상
+            new_table = table.to_metadata(metadata, name=temp_name)
+            new_table.c.date.type = Integer() if target_integer else Date()
+            conn.execute(CreateTable(new_table))
+        for suffix in ('insert', 'update', 'delete'):
+            conn.exec_driver_sql(f'DROP TRIGGER IF EXISTS {name}__sync_{suffix}')
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER {name}__sync_insert AFTER INSERT ON {name} BEGIN "
+            f"INSERT OR REPLACE INTO {temp_name} ({columns}) VALUES ({values('NEW.')}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER {name}__sync_update AFTER UPDATE ON {name} BEGIN "
+            f"DELETE FROM {temp_name} WHERE ticker = OLD.ticker AND date = {old_date}; "
+            f"INSERT OR REPLACE INTO {temp_name} ({columns}) VALUES ({values('NEW.')}); END"
+        )
+        conn.exec_driver_sql(
+            f"CREATE TRIGGER {name}__sync_delete AFTER DELETE ON {name} BEGIN "
+            f"DELETE FROM {temp_name} WHERE ticker = OLD.ticker AND date = {old_date}; END"
+        )
+        total = conn.exec_driver_sql(f'SELECT COUNT(*) FROM {name}').scalar()
+
+    # (ticker, date) 키 순서로 배치 복사 (UNIQUE/PK 인덱스를 따라 읽음)
+    copied = 0
+    cursor = None
+    while True:
+        after = '' if cursor is None else 'WHERE (ticker, date) > (?, ?)'
+        params = () if cursor is None else cursor
+        with write_transaction(conn):
+            last = conn.exec_driver_sql(
+                f"SELECT ticker, date FROM {name} {after} "
+                f"ORDER BY ticker, date LIMIT 1 OFFSET {batch_size - 1}", params
+            ).first()
+            upto = '' if last is None else ('WHERE' if cursor is None else 'AND') + ' (ticker, date) <= (?, ?)'
+            result = conn.exec_driver_sql(
+                f"INSERT OR IGNORE INTO {temp_name} ({columns}) "
+                f"SELECT {values('')} FROM {name} {after} {upto} ORDER BY ticker, date",
+                params + (tuple(last) if last is not None else ())
+            )
+        copied = min(copied + max(result.rowcount, 0), total)
+        progress(name, copied, total)
+        if last is None:
+            return copied
+        cursor = tuple(last)
+
+
+def rebuild_tables(conn: Connection, tables: list, batch_size: int = BATCH_SIZE,
+                   progress: ProgressCallback = log_progress, integer_dates: Optional[bool] = None,
+                   on_swap: Callable[[Connection], None] = None) -> Dict[str, int]:
+    """
+    모델 정의대로 새 테이블을 만들어 배치 단위로 복사한 뒤 기존 테이블과 교체 (SQLite 전용)
+
+    (ticker, date) 순서로 batch_size행씩 나눠 커밋하므로 수 GB 테이블도 저널/메모리 사용량이
+    배치 크기로 제한되고, 배치 사이에는 수집 프로세스가 기존 테이블에 계속 쓸 수 있습니다.
+    복사 중 기존 테이블의 INSERT/UPDATE/DELETE는 트리거로 새 테이블에 반영되며,
+    모든 테이블의 복사가 끝나면 마지막 트랜잭션 하나에서 트리거를 지우고 이름을 바꿉니다.
+    따라서 일자 형식을 바꿀 때도 테이블마다 형식이 섞인 상태로 커밋되지 않습니다.
+
+    중단되면 새 테이블과 트리거가 남아 계속 동기화되므로, 다시 실행하면 처음부터 훑되
+    이미 있는 행은 건너뜁니다 (INSERT OR IGNORE).
+
+    Args:
+        conn: AUTOCOMMIT 연결
+        tables: 목표 테이블 정의 목록 (모델의 __table__, ticker/date 컬럼 필수)
+        batch_size: 트랜잭션당 복사할 행 수
+        progress: 배치마다 호출할 진행률 콜백
+        integer_dates: 새 테이블의 일자 형식 (True: YYYYMMDD 정수, False: 'YYYY-MM-DD',
+            None: 기존 테이블을 따름)
+        on_swap: 교체 트랜잭션 안에서 함께 실행할 작업 (예: data_coverage 일자 변환)
+
+    Returns:
+        테이블 이름 -> 복사한 행 수
+    """
+    copied = {
+        table.name: _copy_in_batches(conn, table, batch_size, progress, integer_dates)
+        for table in tables
+    }
+
+    with write_transaction(conn):
+        for table in tables:
+            for suffix in ('insert', 'update', 'delete'):
+                conn.exec_driver_sql(f'DROP TRIGGER IF EXISTS {table.name}__sync_{suffix}')
+            conn.exec_driver_sql(f'DROP TABLE {table.name}')
+            conn.exec_driver_sql(f'ALTER TABLE {table.name}__new RENAME TO {table.name}')
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+        if on_swap is not None:
+            on_swap(conn)
+
+    for name, rows in copied.items():
+        logger.info(f"테이블 재작성: {name} ({rows:,}행)")
+    return copied
+
+
+def rebuild_table(conn: Connection, table, batch_size: int = BATCH_SIZE,
+                  progress: ProgressCallback = log_progress, integer_dates: Optional[bool] = None) -> int:
+    """
+    테이블 하나를 배치 단위로 재작성 (rebuild_tables 참고)
+
+    Returns:
+        복사한 행 수
+    """
+    return rebuild_tables(conn, [table], batch_size, progress, integer_dates)[table.name]
+
+
+# ============================================================================
+# 마이그레이션 단계 (번호 순서대로 실행, 한 번 배포한 단계는 수정하지 말고 새 번호로 추가)
+# ============================================================================
+
+# 기존 레이아웃에서 UNIQUE(ticker, date) 자동 인덱스와 중복되던 인덱스
+_LEGACY_TICKER_DATE_INDEXES = [
+    'idx_ticker_date',
+    'idx_ticker_date_cap',
+    'idx_ticker_date_fund',
+    'idx_ticker_date_trading',
+    'idx_ticker_date_short',
+    'idx_ticker_date_balance',
+]
+
+
+def _drop_redundant_indexes(conn: Connection, context: MigrationContext):
+    """UNIQUE 제약과 같은 (ticker, date) 인덱스 삭제 (쓰기마다 갱신하던 B-tree 하나 제거)"""
+    for name in _LEGACY_TICKER_DATE_INDEXES:
+        drop_index(conn, name)
+
+
+def _fact_tables(conn: Connection, needs_rebuild: Callable[[Dict[str, bool]], bool]) -> list:
+    """재작성이 필요한 종목별 데이터 테이블 (needs_rebuild: describe_table 결과로 판정)"""
+    existing = set(inspect(conn).get_table_names())
+    return [
+        model.__table__ for model in DATASET_MODELS.values()
+        if model.__tablename__ in existing and needs_rebuild(describe_table(conn, model.__tablename__))
+    ]
+
+
+def _cluster_fact_tables(conn: Connection, context: MigrationContext):
+    """
+    종목별 데이터 테이블을 (ticker, date) PK WITHOUT ROWID 레이아웃으로 배치 재작성
+
+    기존 레이아웃(id 대리키 + UNIQUE(ticker, date) + 같은 컬럼의 인덱스 + 행마다 created_at)은
+    테이블 하나에 B-tree가 셋입니다. 재작성하면 PK B-tree 하나에 행이 종목/일자 순으로 모이고,
+    종목 구간 조회는 연속된 페이지만 읽습니다.
+    """
+    tables = _fact_tables(conn, lambda layout: not layout['without_rowid'])
+    if tables:
+        rebuild_tables(conn, tables, context.batch_size, context.progress)
+
+
+def _integer_trade_dates(conn: Connection, context: MigrationContext):
+    """
+    종목별 데이터 테이블과 data_coverage의 일자를 YYYYMMDD 정수로 변환 (선택 단계)
+
+    'YYYY-MM-DD' 문자열(10바이트) 대신 정수(4바이트)로 저장해 PK와 파일이 작아지고
+    비교/정렬이 정수 연산이 됩니다. 파이썬에서는 그대로 date로 읽고 씁니다 (models.types.TradeDate).
+    """
+    tables = _fact_tables(conn, lambda layout: not layout['integer_dates'])
+    if not tables:
+        return
+    convert_coverage = None
+    if inspect(conn).has_table(DataCoverage.__tablename__):
+        convert_coverage = partial(_convert_coverage_dates, integer_dates=True)
+    rebuild_tables(conn, tables, context.batch_size, context.progress,
+                   integer_dates=True, on_swap=convert_coverage)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'drop_redundant_ticker_date_indexes', _drop_redundant_indexes),
+    Migration(2, 'cluster_fact_tables', _cluster_fact_tables),
+]
+
+# 선택 단계: Database.migrate(integer_dates=True) 또는 uv run migrate --integer-dates로만 적용
+# (기본 목록에 없으므로 새 DB에도 기록되지 않고, 나중에 추가된 단계 뒤에도 적용 가능)
+INTEGER_DATES_MIGRATION = Migration(3, 'integer_trade_dates', _integer_trade_dates)
+
+
+class MigrationRunner:
+    """
+    schema_version 테이블 기준으로 남은 마이그레이션을 순서대로 실행
+
+    단계마다 완료 후 schema_version에 기록하므로, 중단되면 다음 실행은 끝나지 않은 단계부터
+    다시 시작합니다. create_tables로 새로 만든 DB는 최신 스키마이므로 stamp()로 전체를 적용 처리합니다.
+    """
+
+    def __init__(self, db, migrations: List[Migration] = None, batch_size: int = BATCH_SIZE,
+                 progress: ProgressCallback = None):
+        """
+        Args:
+            db: 대상 Database (create_tables로 schema_version 테이블이 만들어진 상태)
+            migrations: 마이그레이션 목록 (기본값: MIGRATIONS)
+            batch_size: 재작성 시 트랜잭션당 복사할 행 수
+            progress: 진행률 콜백 (기본값: 로그 출력)
+        """
+        self.db = db
+        self.migrations = sorted(MIGRATIONS if migrations is None else migrations,
+                                 key=lambda migration: migration.version)
+        self.context = MigrationContext(batch_size, progress or log_progress)
+
+    @property
+    def head(self) -> int:
+        """최신 마이그레이션 번호 (없으면 0)"""
+        return self.migrations[-1].version if self.migrations else 0
+
+    def applied_versions(self) -> set:
+        """적용된 마이그레이션 번호 집합"""
+        with self.db.engine.connect() as conn:
+            return set(conn.execute(select(SchemaVersion.version)).scalars())
+
+    def current_version(self) -> int:
+        """적용된 마지막 마이그레이션 번호 (없으면 0)"""
+        return max(self.applied_versions(), default=0)
+
+    def pending(self, target: int = None) -> List[Migration]:
+        """
+        적용할 마이그레이션 목록 (target 이하)
+
+        번호가 아니라 적용 여부로 판정하므로, 선택 단계는 이후 번호의 단계가 적용된 뒤에도 실행됩니다.
+        """
+        applied = self.applied_versions()
+        target = self.head if target is None else target
+        return [m for m in self.migrations if m.version not in applied and m.version <= target]
+
+    def stamp(self, version: int = None):
+        """실행하지 않고 version까지 적용된 것으로 기록 (새 DB용, 기본값: 최신)"""
+        version = self.head if version is None else version
+        applied = self.applied_versions()
+        with self.db.engine.begin() as conn:
+            for migration in self.migrations:
+                if migration.version not in applied and migration.version <= version:
+                    conn.execute(SchemaVersion.__table__.insert().values(
+                        version=migration.version, name=migration.name, applied_at=datetime.now()
+                    ))
+
+    def upgrade(self, target: int = None) -> List[Migration]:
+        """
+        남은 마이그레이션을 번호 순서대로 실행
+
+        Args:
+            target: 이 번호까지만 실행 (기본값: 최신)
+
+        Returns:
+            이번에 적용한 마이그레이션 목록
+
+        Raises:
+            NotImplementedError: SQLite가 아닌 데이터베이스
+        """
+        pending = self.pending(target)
+        if not pending:
+            return []
+
+        engine = self.db.engine
+        if engine.dialect.name != 'sqlite':
+            raise NotImplementedError(f"지원하지 않는 데이터베이스: {engine.dialect.name}")
+
+        with engine.connect() as conn:
+            conn = conn.execution_options(isolation_level='AUTOCOMMIT')
+            for migration in pending:
+                logger.info(f"마이그레이션 {migration.version}: {migration.name}")
+                migration.upgrade(conn, self.context)
+                with write_transaction(conn):
+                    conn.execute(SchemaVersion.__table__.insert().values(
+                        version=migration.version, name=migration.name, applied_at=datetime.now()
+                    ))
+            date_format_changed = (
+                inspect(conn).has_table('daily_price')
+                and describe_table(conn, 'daily_price')['integer_dates'] != getattr(engine.dialect, 'integer_dates', False)
+            )
+
+        if date_format_changed:
+            # 일자 형식은 엔진 생성 시 감지되므로 공유 엔진을 닫아 다음 Database부터 새 형식 사용
+            self.db.dispose()
+            logger.info("일자 저장 형식 변경: Database를 새로 만들어 사용하세요")
+        logger.info(f"스키마 버전: {pending[-1].version}")
+        return pending
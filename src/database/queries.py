@@ -1,7 +1,7 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, desc, func, select
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Optional, Dict, Tuple
 import sys
 import os
 
@@ -10,8 +10,24 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from models import (
     Stock, DailyPrice, MarketCap, Fundamental,
-    TradingByInvestor, ShortSelling, ShortBalance
+    TradingByInvestor, ShortSelling, ShortBalance,
+    DataCoverage
 )
+from database.coverage import dataset_key, rebuild_coverage
+
+def _nth_date_as_of(model, as_of: date = None, offset: int = 0):
+    """
+    종목(stocks.ticker)별 기준일 이전(포함) offset번째 최근 일자 - 상관 서브쿼리
+
+    (ticker, date) PK 인덱스를 기준일에서 거꾸로 offset + 1개만 읽으므로
+    보유 이력 길이와 관계없이 종목당 인덱스 탐색 1회입니다.
+    """
+    inner = aliased(model)
+    stmt = select(inner.date).where(inner.ticker == Stock.ticker)
+    if as_of:
+        stmt = stmt.where(inner.date <= as_of)
+    return stmt.order_by(desc(inner.date)).limit(1).offset(offset).correlate(Stock).scalar_subquery()
+
 
 class StockQueries:
     """주식 데이터 조회 쿼리"""
@@ -49,6 +65,16 @@ class StockQueries:
         return session.query(DailyPrice).filter_by(ticker=ticker)\
             .order_by(desc(DailyPrice.date)).first()
 
+    @staticmethod
+    def get_latest_prices(session: Session, tickers: List[str]) -> Dict[str, DailyPrice]:
+        """
+        여러 종목의 최근 주가 (쿼리 1회)
+
+        Returns:
+            종목코드 -> 최근 DailyPrice (데이터 없는 종목은 제외)
+        """
+        return StockQueries.get_as_of_many(session, DailyPrice, tickers)
+
     @staticmethod
     def get_market_caps(
         session: Session,
@@ -110,6 +136,160 @@ class StockQueries:
         return session.query(TradingByInvestor).filter_by(ticker=ticker)\
             .order_by(desc(TradingByInvestor.date)).limit(days).all()
 
+    @staticmethod
+    def get_recent_investor_flows(
+        session: Session,
+        tickers: List[str],
+        days: int = 5,
+        end_date: date = None
+    ) -> Dict[str, List[TradingByInvestor]]:
+        """
+        여러 종목의 최근 N일 투자자별 매매 (쿼리 1회)
+
+        Args:
+            session: DB 세션
+            tickers: 종목코드 목록
+            days: 종목당 행 수
+            end_date: 이 날짜 이전(포함)만 (None이면 전체)
+
+        Returns:
+            종목코드 -> 최근 일자부터의 TradingByInvestor 목록 (데이터 없는 종목은 제외)
+        """
+        return StockQueries.get_recent_as_of(session, TradingByInvestor, tickers, days, end_date)
+
+    @staticmethod
+    def get_latest_fundamentals_as_of(
+        session: Session,
+        tickers: List[str],
+        as_of: date
+    ) -> Dict[str, Fundamental]:
+        """
+        여러 종목의 기준일 이전(포함) 최근 펀더멘탈 (쿼리 1회)
+
+        Returns:
+            종목코드 -> Fundamental (데이터 없는 종목은 제외)
+        """
+        return StockQueries.get_as_of_many(session, Fundamental, tickers, as_of)
+
+    @staticmethod
+    def get_as_of(session: Session, model, ticker: str, as_of: date = None):
+        """
+        기준일 이전(포함) 최근 행 하나 (ORDER BY date DESC LIMIT 1, PK 인덱스 탐색 1회)
+
+        Args:
+            session: DB 세션
+            model: 조회할 모델 (DailyPrice, Fundamental 등 ticker/date 컬럼 보유)
+            ticker: 종목코드
+            as_of: 기준일 (None이면 최근 행)
+
+        Returns:
+            모델 인스턴스 (없으면 None)
+        """
+        query = session.query(model).filter(model.ticker == ticker)
+        if as_of:
+            query = query.filter(model.date <= as_of)
+        return query.order_by(desc(model.date)).first()
+
+    @staticmethod
+    def get_as_of_many(session: Session, model, tickers: List[str], as_of: date = None) -> Dict:
+        """
+        여러 종목의 기준일 이전(포함) 최근 행 (쿼리 1회, 종목당 인덱스 탐색 2회)
+
+        종목마다 상관 서브쿼리로 기준일 직전 일자를 찾고 그 (ticker, date)를 PK로 읽습니다.
+        종목은 stocks 테이블에서 찾으므로 stocks에 없는 종목코드는 결과에서 빠집니다.
+
+        Returns:
+            종목코드 -> 모델 인스턴스 (데이터 없는 종목은 제외)
+        """
+        query = session.query(model).select_from(Stock).join(
+            model, and_(model.ticker == Stock.ticker, model.date == _nth_date_as_of(model, as_of))
+        ).filter(Stock.ticker.in_(tickers))
+        return {row.ticker: row for row in query}
+
+    @staticmethod
+    def get_recent_as_of(
+        session: Session,
+        model,
+        tickers: List[str],
+        days: int,
+        as_of: date = None
+    ) -> Dict[str, List]:
+        """
+        여러 종목의 기준일 이전(포함) 최근 N행 (쿼리 1회)
+
+        종목마다 N번째 최근 일자를 인덱스에서 찾아 그 일자~기준일 구간만 읽습니다
+        (행이 N개보다 적은 종목은 첫 일자부터).
+
+        Returns:
+            종목코드 -> 최근 일자부터의 모델 인스턴스 목록 (데이터 없는 종목은 제외)
+        """
+        inner = aliased(model)
+        first = select(func.min(inner.date)).where(inner.ticker == Stock.ticker).correlate(Stock).scalar_subquery()
+        since = func.coalesce(_nth_date_as_of(model, as_of, days - 1), first)
+        conditions = [model.ticker == Stock.ticker, model.date >= since]
+        if as_of:
+            conditions.append(model.date <= as_of)
+        query = session.query(model).select_from(Stock).join(model, and_(*conditions))\
+            .filter(Stock.ticker.in_(tickers))\
+            .order_by(model.ticker, desc(model.date))
+
+        recent: Dict[str, List] = {}
+        for row in query:
+            recent.setdefault(row.ticker, []).append(row)
+        return recent
+
+    @staticmethod
+    def get_coverage(
+        session: Session,
+        model,
+        tickers: List[str] = None
+    ) -> Dict[str, Tuple[date, date]]:
+        """
+        종목별 보유 데이터 구간 조회 (data_coverage 인덱스 조회 1회)
+
+        Args:
+            session: DB 세션
+            model: 조회할 모델 (DailyPrice, MarketCap 등 ticker/date 컬럼 보유)
+            tickers: 종목코드 목록 (None이면 전체)
+
+        Returns:
+            종목코드 -> (최초 일자, 최근 일자)
+        """
+        query = session.query(DataCoverage.ticker, DataCoverage.min_date, DataCoverage.max_date)\
+            .filter(DataCoverage.dataset == dataset_key(model))
+        if tickers is not None:
+            query = query.filter(DataCoverage.ticker.in_(tickers))
+
+        return {ticker: (min_date, max_date) for ticker, min_date, max_date in query}
+
+    @staticmethod
+    def get_coverage_index(
+        session: Session,
+        tickers: List[str] = None,
+        datasets: List[str] = None
+    ) -> Dict[str, Dict[str, DataCoverage]]:
+        """
+        전체 데이터셋의 종목별 보유 구간 조회 (쿼리 1회)
+
+        Args:
+            session: DB 세션
+            tickers: 종목코드 목록 (None이면 전체)
+            datasets: 데이터셋 키 목록 (None이면 전체)
+
+        Returns:
+            데이터셋 키 -> 종목코드 -> DataCoverage
+        """
+        query = session.query(DataCoverage)
+        if tickers is not None:
+            query = query.filter(DataCoverage.ticker.in_(tickers))
+        if datasets is not None:
+            query = query.filter(DataCoverage.dataset.in_(datasets))
+
+        index: Dict[str, Dict[str, DataCoverage]] = {}
+        for coverage in query:
+            index.setdefault(coverage.dataset, {})[coverage.ticker] = coverage
+        return index
+
     @staticmethod
     def delete_old_data(session: Session, ticker: str, before_date: date) -> int:
         """특정 날짜 이전 데이터 삭제"""
@@ -120,5 +300,6 @@ class StockQueries:
         count = count + session.query(MarketCap).filter(
             and_(MarketCap.ticker == ticker, MarketCap.date < before_date)
         ).delete()
+        rebuild_coverage(session, [ticker], ['daily_price', 'market_cap'])
         session.commit()
         return count
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+증분 수집 계획 모듈
+
+data_coverage 테이블에서 종목별/테이블별 보유 구간을 한 번에 읽어
+비어 있는 구간만 조회하는 최소한의 수집 작업 목록을 만듭니다.
+"""
+
+import sys
+import os
+import logging
+from datetime import date, timedelta
+from typing import List, NamedTuple, Dict, Tuple
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from sqlalchemy.orm import Session
+from database.queries import StockQueries
+from krx.trading_calendar import TradingCalendar, get_trading_calendar
+from models import DATASET_MODELS
+
+logger = logging.getLogger(__name__)
+
+# 종목에 따라 데이터가 아예 없을 수 있는 데이터셋 (공매도 등)
+# 저장된 행이 없으면 일별 주가 보유 구간을 기준으로 계획 (매번 전체 재조회 방지)
+OPTIONAL_DATASETS = ('short_selling', 'short_balance')
+
+
+class FetchJob(NamedTuple):
+    """수집 작업 하나 (종목 + 데이터셋 + 조회 구간)"""
+    ticker: str
+    dataset: str
+    start_date: date
+    end_date: date
+
+
+class FetchPlanner:
+    """DB 보유 구간 기반 수집 계획 생성기"""
+
+    def __init__(self, session: Session, calendar: TradingCalendar = None):
+        """
+        Args:
+            session: SQLAlchemy 세션
+            calendar: 거래일 달력 (기본값: 프로세스 공유 달력)
+        """
+        self.session = session
+        self.calendar = calendar or get_trading_calendar()
+
+    def plan(
+        self,
+        tickers: List[str],
+        end_date: date,
+        start_date: date,
+        datasets: List[str] = None
+    ) -> List[FetchJob]:
+        """
+        누락 구간 수집 작업 목록 생성
+
+        - 데이터가 없는 종목: start_date ~ end_date 전체
+        - 데이터가 있는 종목: 마지막 저장일 다음 날 ~ end_date
+          (장기간 중단 후에도 start_date와 관계없이 빠진 날짜만 정확히 수집)
+        - start_date가 최초 저장일보다 앞서면 start_date ~ 최초 저장일 전날도 수집
+          (이미 조회를 마친 시작일(checked_from)이 더 이르면 그 전날까지만, 상장 전처럼
+          데이터가 없는 앞쪽 구간은 한 번만 조회)
+        - 선택 데이터셋(공매도)에 행이 없으면 일별 주가의 보유 구간 기준
+        - 남은 구간이 주말/휴장일뿐이면 작업을 만들지 않음 (거래일 달력 기준)
+
+        보유 구간은 최초/마지막 저장일만 기록하므로 그 사이의 빈 날짜(중간 누락)는
+        찾지 않습니다.
+
+        Args:
+            tickers: 종목코드 목록
+            end_date: 수집 기준일 (포함)
+            start_date: 수집 시작일
+            datasets: 대상 데이터셋 키 목록 (None이면 전체)
+
+        Returns:
+            수집 작업 목록 (종목, 데이터셋 순)
+        """
+        datasets = datasets or list(DATASET_MODELS)
+        index = StockQueries.get_coverage_index(
+            self.session, tickers, sorted(set(datasets) | {'daily_price'})
+        )
+        # 앞쪽 경계는 최초 저장일과 조회를 마친 시작일 중 이른 날짜
+        coverage = {
+            dataset: {
+                ticker: (min(c.min_date, c.checked_from or c.min_date), c.max_date)
+                for ticker, c in index.get(dataset, {}).items()
+            }
+            for dataset in set(datasets) | {'daily_price'}
+        }
+
+        jobs = []
+        for ticker in tickers:
+            for dataset in datasets:
+                covered = coverage[dataset].get(ticker)
+                if covered is None and dataset in OPTIONAL_DATASETS:
+                    covered = coverage['daily_price'].get(ticker)
+                if covered is None:
+                    gaps = [(start_date, end_date)]
+                else:
+                    gaps = [(covered[1] + timedelta(days=1), end_date)]
+                    if start_date < covered[0]:
+                        gaps.insert(0, (start_date, covered[0] - timedelta(days=1)))
+
+                for gap_start, gap_end in gaps:
+                    gap_start = self.calendar.next_trading_day(gap_start)
+                    if gap_start > gap_end:
+                        continue
+                    jobs.append(FetchJob(ticker, dataset, gap_start, gap_end))
+
+        logger.info(f"수집 계획: {len(tickers)}개 종목, {len(jobs)}개 작업")
+        return jobs
+
+
+def group_jobs_by_ticker(jobs: List[FetchJob]) -> Dict[str, Dict[str, Tuple[str, str]]]:
+    """
+    작업 목록을 종목별 {데이터셋: (시작일, 종료일)} (YYYYMMDD)로 묶기
+
+    같은 데이터셋의 작업이 여러 개면 (앞쪽 + 뒤쪽 누락 구간) 전체를 덮는 한 구간으로
+    합칩니다. 사이의 이미 저장된 날짜도 다시 조회됩니다.
+
+    Args:
+        jobs: 수집 작업 목록
+
+    Returns:
+        종목코드 -> 데이터셋 키 -> (시작일, 종료일)
+    """
+    spans = {}
+    for job in jobs:
+        ranges = spans.setdefault(job.ticker, {})
+        start, end = ranges.get(job.dataset, (job.start_date, job.end_date))
+        ranges[job.dataset] = (min(start, job.start_date), max(end, job.end_date))
+
+    return {
+        ticker: {
+            dataset: (start.strftime('%Y%m%d'), end.strftime('%Y%m%d'))
+            for dataset, (start, end) in ranges.items()
+        }
+        for ticker, ranges in spans.items()
+    }
@@ -0,0 +1,270 @@
+import asyncio
+import time
+import logging
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+import pandas as pd
+from pykrx import stock
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from krx.client import KRXClient
+from krx.rate_limiter import TokenBucket
+from krx.cache import ResponseCache
+from krx.retry import Retrier
+from krx.negative_cache import NegativeCache
+
+logger = logging.getLogger(__name__)
+
+class AsyncKRXClient:
+    """
+    asyncio용 KRX 클라이언트
+
+    종목별 조회 메서드(get_ohlcv, get_market_cap, ...)는 KRXClient와 이름/인자가 같고,
+    모두 await 해야 합니다. KRXClient를 상속하지 않고 동기 클라이언트(sync_client)를 두어
+    호출 제한기/응답 캐시/재시도기/빈 결과 캐시 설정만 공유하며, 호출 대기/재시도 대기는
+    이벤트 루프에서 하고 blocking pykrx 호출만 스레드 풀에서 실행합니다.
+    - 동시에 진행 중인 pykrx 호출은 max_concurrency개 이하 (asyncio.Semaphore)
+    - 호출 속도는 KRXClient와 같은 프로세스 공유 호출 제한기로 제어 (동기/비동기 합산)
+    - 대기 중인 요청은 코루틴이므로 요청 수만큼 스레드가 늘어나지 않음
+    """
+
+    # 동시에 진행할 pykrx 호출 수 (= 스레드 풀 크기)
+    MAX_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        db_session=None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+        retrier: Optional[Retrier] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        executor: Optional[ThreadPoolExecutor] = None,
+        refresh_cache: bool = False
+    ):
+        """
+        Args:
+            db_session: SQLAlchemy 세션 (조회에는 사용하지 않음)
+            rate_limiter: 호출 제한기 (기본값: 프로세스 공유 제한기)
+            cache: 응답 캐시 (기본값: 프로세스 공유 디스크 캐시)
+            retrier: 재시도기 (기본값: 프로세스 공유 재시도기)
+            negative_cache: 빈 결과 캐시 (기본값: 프로세스 공유 빈 결과 캐시)
+            max_concurrency: 동시에 진행할 pykrx 호출 수
+            executor: pykrx 호출을 실행할 스레드 풀 (기본값: max_concurrency 크기로 생성)
+            refresh_cache: True면 응답 캐시를 읽지 않고 다시 조회 (결과는 캐시에 저장, 강제 수집용)
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}")
+
+        # 기본값 결정은 KRXClient와 같게 (프로세스 공유 제한기/캐시/재시도기)
+        self.sync_client = KRXClient(db_session, rate_limiter, cache, retrier, negative_cache, refresh_cache)
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='krx-async'
+        )
+        self.last_api_call = None
+
+    async def __aenter__(self) -> 'AsyncKRXClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """직접 만든 스레드 풀 종료"""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """호출 제한기 (동기 클라이언트와 공유)"""
+        return self.sync_client.rate_limiter
+
+    @property
+    def retrier(self) -> Retrier:
+        """재시도기 (동기 클라이언트와 공유)"""
+        return self.sync_client.retrier
+
+    async def _run(self, func, *args, **kwargs):
+        """blocking 함수를 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def _retry_on_error(self, func, *args, **kwargs):
+        """에러 발생 시 재시도 로직 (캐시에 있으면 호출 생략)"""
+        return await self.sync_client.cache.call_async(
+            func,
+            lambda: self._call_with_retry(func, *args, **kwargs),
+            *args, refresh=self.sync_client.refresh_cache, **kwargs
+        )
+
+    async def _call_with_retry(self, func, *args, **kwargs):
+        """호출 제한을 지키며 재시도 정책에 따라 호출 (엔드포인트 = 함수 이름)"""
+        async def attempt():
+            async with self.semaphore:
+                await self.rate_limiter.acquire_async()
+                self.last_api_call = time.time()
+                return await self._run(func, *args, **kwargs)
+
+        endpoint = getattr(func, '__name__', None) or repr(func)
+        return await self.retrier.call_async(endpoint, attempt)
+
+    async def _fetch_optional(self, label: str, func, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        데이터가 없을 수 있는 종목 조회 (데이터가 없으면 빈 DataFrame, 일시 오류는 전파)
+
+        KRXClient._fetch_optional과 같으며, 빈 결과 캐시 입출력은 스레드에서 실행합니다.
+        """
+        negative_cache = self.sync_client.negative_cache
+        endpoint = getattr(func, '__name__', None) or repr(func)
+        key = (endpoint, ticker, start_date, end_date)
+        if await asyncio.to_thread(negative_cache.is_empty, *key):
+            logger.debug(f"{label} 빈 결과 캐시 적중: {ticker} ({start_date} ~ {end_date})")
+            return pd.DataFrame()
+
+        try:
+            df = await self._retry_on_error(func, start_date, end_date, ticker)
+        except Exception as e:
+            logger.warning(f"{label} 조회 실패: {e}")
+            if self.retrier.policy.is_retryable(e):
+                raise
+            await asyncio.to_thread(negative_cache.record, *key)
+            return pd.DataFrame()
+
+        if df is None or df.empty:
+            await asyncio.to_thread(negative_cache.record, *key)
+            return pd.DataFrame()
+        return df
+
+    async def get_ohlcv(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        일별 OHLCV 데이터 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            OHLCV 데이터프레임
+        """
+        logger.info(f"OHLCV 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._retry_on_error(
+            stock.get_market_ohlcv,
+            start_date, end_date, ticker
+        )
+
+    async def get_market_cap(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        시가총액 및 거래 정보 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            시가총액 데이터프레임
+        """
+        logger.info(f"시가총액 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._retry_on_error(
+            stock.get_market_cap,
+            start_date, end_date, ticker
+        )
+
+    async def get_fundamental(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        펀더멘탈 지표 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            펀더멘탈 데이터프레임
+        """
+        logger.info(f"펀더멘탈 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._retry_on_error(
+            stock.get_market_fundamental,
+            start_date, end_date, ticker
+        )
+
+    async def get_trading_by_investor(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        투자자별 매매 동향 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            투자자별 매매 데이터프레임
+        """
+        logger.info(f"투자자별 매매 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._retry_on_error(
+            stock.get_market_trading_value_by_date,
+            start_date, end_date, ticker
+        )
+
+    async def get_short_selling_volume(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        공매도 거래량 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            공매도 거래량 데이터프레임 (데이터가 없으면 빈 DataFrame)
+
+        Raises:
+            Exception: 일시 오류 (재시도 소진, 차단기 열림 시 CircuitOpenError)
+        """
+        logger.info(f"공매도 거래량 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._fetch_optional(
+            "공매도 거래량", stock.get_shorting_volume_by_date,
+            ticker, start_date, end_date
+        )
+
+    async def get_short_balance(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        공매도 잔고 조회
+
+        Args:
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            공매도 잔고 데이터프레임 (데이터가 없으면 빈 DataFrame)
+
+        Raises:
+            Exception: 일시 오류 (재시도 소진, 차단기 열림 시 CircuitOpenError)
+        """
+        logger.info(f"공매도 잔고 조회: {ticker} ({start_date} ~ {end_date})")
+        return await self._fetch_optional(
+            "공매도 잔고", stock.get_shorting_balance_by_date,
+            ticker, start_date, end_date
+        )
+
+    async def get_ticker_name(self, ticker: str) -> str:
+        """
+        종목명 조회 (첫 호출 시 pykrx가 전체 목록을 내려받으므로 스레드에서 실행)
+
+        Args:
+            ticker: 종목코드
+
+        Returns:
+            종목명
+        """
+        return await self._run(stock.get_market_ticker_name, ticker)
@@ -0,0 +1,279 @@
+import os
+import re
+import time
+import asyncio
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Callable, Awaitable, Any
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 인자 중 날짜(YYYYMMDD)로 취급할 문자열 패턴
+_DATE_PATTERN = re.compile(r'^\d{8}$')
+
+class ResponseCache:
+    """
+    KRX 응답 디스크 캐시
+
+    함수 이름과 인자로 키를 만들고 결과를 gzip 압축 pickle 파일로 저장합니다.
+    - 조회 구간이 모두 지난 날짜면 영구 보관 (이미 확정된 데이터)
+    - 오늘 이후 날짜가 포함되면 TODAY_TTL 동안만 보관
+    - 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제
+    """
+
+    # 오늘 날짜가 포함된 응답의 보관 시간 (초)
+    TODAY_TTL = 600
+
+    # 캐시 최대 크기 (바이트)
+    MAX_BYTES = 512 * 1024 * 1024
+
+    FILE_SUFFIX = '.pkl.gz'
+
+    def __init__(
+        self,
+        cache_dir: str = None,
+        max_bytes: int = MAX_BYTES,
+        today_ttl: float = TODAY_TTL,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (기본값: data/cache)
+            max_bytes: 캐시 최대 크기 (바이트)
+            today_ttl: 오늘 데이터 보관 시간 (초)
+            enabled: False면 조회/저장 모두 하지 않음
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(__file__), '../../data/cache')
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.today_ttl = today_ttl
+        self.enabled = enabled
+        self._size = None  # 첫 저장 시 계산
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(func: Callable, args: tuple, kwargs: dict) -> str:
+        """함수 이름 + 인자로 캐시 키 생성"""
+        name = getattr(func, '__qualname__', None) or getattr(func, '__name__', repr(func))
+        raw = f"{name}|{args!r}|{sorted(kwargs.items())!r}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def ttl_for(self, args: tuple, kwargs: dict) -> Optional[float]:
+        """
+        인자에 포함된 날짜로 보관 시간 결정
+
+        Returns:
+            보관 시간 (초), None이면 영구 보관
+        """
+        dates = [
+            value for value in list(args) + list(kwargs.values())
+            if isinstance(value, str) and _DATE_PATTERN.match(value)
+        ]
+        today = datetime.now().strftime('%Y%m%d')
+        if dates and max(dates) < today:
+            return None
+        return self.today_ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.FILE_SUFFIX)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Returns:
+            저장된 값 (없거나 만료되었으면 None)
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(key)
+        try:
+            expires_at, value = pd.read_pickle(path, compression='gzip')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"캐시 파일 손상, 삭제: {path} - {e}")
+            self._remove(path)
+            return None
+
+        if expires_at is not None and expires_at < time.time():
+            self._remove(path)
+            return None
+
+        # LRU 판단을 위해 사용 시각 갱신
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float]):
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값 (DataFrame 등)
+            ttl: 보관 시간 (초), None이면 영구 보관
+        """
+        if not self.enabled:
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        expires_at = None if ttl is None else time.time() + ttl
+
+        pd.to_pickle((expires_at, value), tmp_path, compression='gzip')
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += os.path.getsize(path)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def call(self, func: Callable, fetch: Callable[[], Any], *args, refresh: bool = False, **kwargs) -> Any:
+        """
+        캐시에 있으면 반환하고, 없으면 fetch()로 조회 후 저장
+
+        빈 결과는 저장하지 않습니다 (지연 공시 데이터가 나중에 채워질 수 있음).
+
+        Args:
+            func: 키 생성에 사용할 원본 함수
+            fetch: 실제 조회 함수 (인자 없음)
+            *args, **kwargs: func에 전달되는 인자 (키 생성용)
+            refresh: True면 캐시를 읽지 않고 조회한 결과로 덮어씀 (KRX 정정 데이터 반영)
+        """
+        if not self.enabled:
+            return fetch()
+
+        key = self.make_key(func, args, kwargs)
+        cached = None if refresh else self.get(key)
+        if cached is not None:
+            logger.debug(f"캐시 적중: {getattr(func, '__name__', func)} {args}")
+            return cached
+
+        result = fetch()
+        if not _is_empty(result):
+            try:
+                self.set(key, result, self.ttl_for(args, kwargs))
+            except Exception as e:
+                logger.warning(f"캐시 저장 실패: {e}")
+        return result
+
+    async def call_async(
+        self, func: Callable, fetch: Callable[[], Awaitable[Any]], *args, refresh: bool = False, **kwargs
+    ) -> Any:
+        """
+        call()의 코루틴 버전 (파일 입출력은 스레드에서 실행)
+
+        Args:
+            func: 키 생성에 사용할 원본 함수
+            fetch: 실제 조회 코루틴 함수 (인자 없음)
+            *args, **kwargs: func에 전달되는 인자 (키 생성용)
+            refresh: True면 캐시를 읽지 않고 조회한 결과로 덮어씀
+        """
+        if not self.enabled:
+            return await fetch()
+
+        key = self.make_key(func, args, kwargs)
+        cached = None if refresh else await asyncio.to_thread(self.get, key)
+        if cached is not None:
+            logger.debug(f"캐시 적중: {getattr(func, '__name__', func)} {args}")
+            return cached
+
+        result = await fetch()
+        if not _is_empty(result):
+            try:
+                await asyncio.to_thread(self.set, key, result, self.ttl_for(args, kwargs))
+            except Exception as e:
+                logger.warning(f"캐시 저장 실패: {e}")
+        return result
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(self.FILE_SUFFIX):
+                self._remove(os.path.join(self.cache_dir, name))
+        self._size = 0
+
+    def _entries(self):
+        """(경로, 크기, 사용 시각) 목록"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(self.FILE_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """최대 크기의 90% 이하가 될 때까지 오래된 파일부터 삭제"""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+
+        removed = 0
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+
+        self._size = total
+        logger.info(f"캐시 정리: {removed}개 파일 삭제 (현재 {total / 1024 / 1024:.1f}MB)")
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _is_empty(value: Any) -> bool:
+    """캐시하지 않을 빈 결과 여부"""
+    if value is None:
+        return True
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.empty
+    if isinstance(value, (list, tuple, dict)):
+        return len(value) == 0
+    return False
+
+
+# 프로세스 공유 기본 캐시
+_default_cache = ResponseCache()
+
+
+def get_default_cache() -> ResponseCache:
+    """프로세스 공유 기본 캐시 반환"""
+    return _default_cache
+
+
+def set_cache_enabled(enabled: bool):
+    """기본 캐시 사용 여부 설정 (--no-cache 옵션)"""
+    _default_cache.enabled = enabled
+    if not enabled:
+        logger.info("응답 캐시 비활성화")
@@ -1,5 +1,7 @@
 import time
 import logging
+import sys
+import os
 from datetime import datetime, timedelta
 from typing import Optional, List
 import pandas as pd
@@ -7,6 +9,14 @@ from pykrx import stock
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from krx.rate_limiter import TokenBucket
+from krx.cache import ResponseCache, get_default_cache
+from krx.retry import Retrier, RetryPolicy
+from krx.negative_cache import NegativeCache, get_negative_cache
+
 logger = logging.getLogger(__name__)
 
 class KRXClient:
@@ -15,40 +25,107 @@ class KRXClient:
     # API 호출 간격 (초) - KRX 서버 차단 방지
     API_DELAY = 1.0
 
-    # 재시도 설정
+    # 프로세스 전체가 공유하는 호출 제한기 (모든 인스턴스/스레드의 호출 합산)
+    shared_rate_limiter = TokenBucket(rate=1.0 / API_DELAY)
+
+    # 재시도 설정 (지수 백오프: RETRY_DELAY, 2배, 4배 ... 최대 RETRY_MAX_DELAY)
     MAX_RETRIES = 3
-    RETRY_DELAY = 5.0
+    RETRY_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
 
-    def __init__(self, db_session: Session):
+    # 엔드포인트별 연속 실패 허용 횟수 (초과 시 실행이 끝날 때까지 즉시 실패)
+    CIRCUIT_FAILURE_THRESHOLD = 5
+
+    # 프로세스 전체가 공유하는 재시도기 (엔드포인트별 차단기/통계)
+    shared_retrier = Retrier(
+        RetryPolicy(max_attempts=MAX_RETRIES, base_delay=RETRY_DELAY, max_delay=RETRY_MAX_DELAY),
+        failure_threshold=CIRCUIT_FAILURE_THRESHOLD
+    )
+
+    def __init__(
+        self,
+        db_session: Optional[Session] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+        retrier: Optional[Retrier] = None,
+        negative_cache: Optional[NegativeCache] = None,
+        refresh_cache: bool = False
+    ):
         """
         Args:
-            db_session: SQLAlchemy 세션
+            db_session: SQLAlchemy 세션 (조회에는 사용하지 않음)
+            rate_limiter: 호출 제한기 (기본값: 프로세스 공유 제한기)
+            cache: 응답 캐시 (기본값: 프로세스 공유 디스크 캐시)
+            retrier: 재시도기 (기본값: 프로세스 공유 재시도기)
+            negative_cache: 빈 결과 캐시 (기본값: 프로세스 공유 빈 결과 캐시)
+            refresh_cache: True면 응답 캐시를 읽지 않고 다시 조회 (결과는 캐시에 저장, 강제 수집용)
         """
         self.session = db_session
+        self.rate_limiter = rate_limiter or self.shared_rate_limiter
+        self.cache = cache or get_default_cache()
+        self.refresh_cache = refresh_cache
+        self.retrier = retrier or self.shared_retrier
+        self.negative_cache = negative_cache if negative_cache is not None else get_negative_cache()
         self.last_api_call = None
 
     def _wait_for_rate_limit(self):
-        """API 호출 제한을 위한 대기"""
-        if self.last_api_call:
-            elapsed = time.time() - self.last_api_call
-            if elapsed < self.API_DELAY:
-                time.sleep(self.API_DELAY - elapsed)
+        """API 호출 제한을 위한 대기 (공유 토큰 버킷)"""
+        self.rate_limiter.acquire()
         self.last_api_call = time.time()
 
     def _retry_on_error(self, func, *args, **kwargs):
-        """에러 발생 시 재시도 로직"""
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                self._wait_for_rate_limit()
-                result = func(*args, **kwargs)
-                return result
-            except Exception as e:
-                logger.warning(f"API 호출 실패 (시도 {attempt + 1}/{self.MAX_RETRIES}): {e}")
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(self.RETRY_DELAY)
-                else:
-                    logger.error(f"최대 재시도 횟수 초과: {func.__name__}")
-                    raise
+        """에러 발생 시 재시도 로직 (캐시에 있으면 호출 생략)"""
+        return self.cache.call(
+            func,
+            lambda: self._call_with_retry(func, *args, **kwargs),
+            *args, refresh=self.refresh_cache, **kwargs
+        )
+
+    def _call_with_retry(self, func, *args, **kwargs):
+        """호출 제한을 지키며 재시도 정책에 따라 호출 (엔드포인트 = 함수 이름)"""
+        def attempt():
+            self._wait_for_rate_limit()
+            return func(*args, **kwargs)
+
+        endpoint = getattr(func, '__name__', None) or repr(func)
+        return self.retrier.call(endpoint, attempt)
+
+    def _fetch_optional(self, label: str, func, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        데이터가 없을 수 있는 종목 조회 (데이터가 없으면 빈 DataFrame)
+
+        빈 결과와 영구 오류는 빈 결과 캐시에 기록하여 만료 전까지 다시 조회하지 않습니다.
+        일시 오류(재시도 소진, 차단기 열림)는 기록하지 않고 예외를 그대로 전파하므로
+        호출 측에서 '데이터 없음'과 구분할 수 있습니다 (백필 체크포인트 미기록 등).
+        """
+        endpoint = getattr(func, '__name__', None) or repr(func)
+        if self.negative_cache.is_empty(endpoint, ticker, start_date, end_date):
+            logger.debug(f"{label} 빈 결과 캐시 적중: {ticker} ({start_date} ~ {end_date})")
+            return pd.DataFrame()
+
+        try:
+            df = self._retry_on_error(func, start_date, end_date, ticker)
+        except Exception as e:
+            logger.warning(f"{label} 조회 실패: {e}")
+            if self.retrier.policy.is_retryable(e):
+                raise
+            self.negative_cache.record(endpoint, ticker, start_date, end_date)
+            return pd.DataFrame()
+
+        if df is None or df.empty:
+            self.negative_cache.record(endpoint, ticker, start_date, end_date)
+            return pd.DataFrame()
+        return df
+
+    @classmethod
+    def retry_stats(cls) -> dict:
+        """
+        프로세스 공유 재시도기의 엔드포인트별 통계
+
+        Returns:
+            엔드포인트 -> {calls, success, retries, failures, permanent, short_circuited}
+        """
+        return cls.shared_retrier.stats.snapshot()
 
     def get_ohlcv(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -132,18 +209,16 @@ class KRXClient:
             end_date: 종료일 (YYYYMMDD)
 
         Returns:
-            공매도 거래량 데이터프레임
+            공매도 거래량 데이터프레임 (데이터가 없으면 빈 DataFrame)
+
+        Raises:
+            Exception: 일시 오류 (재시도 소진, 차단기 열림 시 CircuitOpenError)
         """
         logger.info(f"공매도 거래량 조회: {ticker} ({start_date} ~ {end_date})")
-        try:
-            df = self._retry_on_error(
-                stock.get_shorting_volume_by_date,
-                start_date, end_date, ticker
-            )
-            return df
-        except Exception as e:
-            logger.warning(f"공매도 거래량 조회 실패: {e}")
-            return pd.DataFrame()
+        return self._fetch_optional(
+            "공매도 거래량", stock.get_shorting_volume_by_date,
+            ticker, start_date, end_date
+        )
 
     def get_short_balance(self, ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
         """
@@ -155,15 +230,114 @@ class KRXClient:
             end_date: 종료일 (YYYYMMDD)
 
         Returns:
-            공매도 잔고 데이터프레임
+            공매도 잔고 데이터프레임 (데이터가 없으면 빈 DataFrame)
+
+        Raises:
+            Exception: 일시 오류 (재시도 소진, 차단기 열림 시 CircuitOpenError)
         """
         logger.info(f"공매도 잔고 조회: {ticker} ({start_date} ~ {end_date})")
-        try:
-            df = self._retry_on_error(
-                stock.get_shorting_balance_by_date,
-                start_date, end_date, ticker
-            )
-            return df
-        except Exception as e:
-            logger.warning(f"공매도 잔고 조회 실패: {e}")
-            return pd.DataFrame()
+        return self._fetch_optional(
+            "공매도 잔고", stock.get_shorting_balance_by_date,
+            ticker, start_date, end_date
+        )
+
+    def get_ticker_list(self, date_str: str, market: str = "KOSPI") -> List[str]:
+        """
+        특정 일자의 상장 종목코드 목록 조회
+
+        Args:
+            date_str: 기준일 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+
+        Returns:
+            종목코드 목록
+        """
+        logger.info(f"종목 목록 조회: {market} ({date_str})")
+        return self._retry_on_error(
+            stock.get_market_ticker_list,
+            date_str, market=market
+        )
+
+    def get_ticker_name(self, ticker: str) -> str:
+        """
+        종목명 조회
+
+        pykrx가 전체 종목 목록을 한 번 내려받아 캐시하므로
+        첫 호출 이후에는 네트워크 요청 없이 조회됩니다.
+
+        Args:
+            ticker: 종목코드
+
+        Returns:
+            종목명
+        """
+        return stock.get_market_ticker_name(ticker)
+
+    def get_market_ohlcv_by_ticker(self, date_str: str, market: str = "KOSPI") -> pd.DataFrame:
+        """
+        특정 일자의 전체 종목 OHLCV 조회
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+
+        Returns:
+            종목코드 인덱스 OHLCV 데이터프레임
+        """
+        logger.info(f"전체 시장 OHLCV 조회: {market} ({date_str})")
+        return self._retry_on_error(
+            stock.get_market_ohlcv_by_ticker,
+            date_str, market=market
+        )
+
+    def get_market_cap_by_ticker(self, date_str: str, market: str = "KOSPI") -> pd.DataFrame:
+        """
+        특정 일자의 전체 종목 시가총액 조회
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+
+        Returns:
+            종목코드 인덱스 시가총액 데이터프레임
+        """
+        logger.info(f"전체 시장 시가총액 조회: {market} ({date_str})")
+        return self._retry_on_error(
+            stock.get_market_cap_by_ticker,
+            date_str, market=market
+        )
+
+    def get_index_ohlcv(self, start_date: str, end_date: str, index_code: str = "1001") -> pd.DataFrame:
+        """
+        지수 일별 OHLCV 조회
+
+        Args:
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+            index_code: 지수 코드 (1001: KOSPI, 2001: KOSDAQ)
+
+        Returns:
+            일자 인덱스 지수 OHLCV 데이터프레임
+        """
+        logger.info(f"지수 OHLCV 조회: {index_code} ({start_date} ~ {end_date})")
+        return self._retry_on_error(
+            stock.get_index_ohlcv,
+            start_date, end_date, index_code
+        )
+
+    def get_market_fundamental_by_ticker(self, date_str: str, market: str = "KOSPI") -> pd.DataFrame:
+        """
+        특정 일자의 전체 종목 펀더멘탈 조회
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            market: 시장 (KOSPI/KOSDAQ)
+
+        Returns:
+            종목코드 인덱스 펀더멘탈 데이터프레임
+        """
+        logger.info(f"전체 시장 펀더멘탈 조회: {market} ({date_str})")
+        return self._retry_on_error(
+            stock.get_market_fundamental_by_ticker,
+            date_str, market=market
+        )
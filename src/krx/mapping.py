@@ -0,0 +1,138 @@
+import logging
+import sys
+import os
+from typing import Dict, NamedTuple, Tuple
+import numpy as np
+import pandas as pd
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from models import (
+    DailyPrice, MarketCap, Fundamental,
+    TradingByInvestor, ShortSelling, ShortBalance
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnSpec(NamedTuple):
+    """
+    원본 컬럼 하나의 변환 규칙
+
+    - dtype: 'int'(소수점 이하 버림) 또는 'float'
+    - nullable: False면 값이 없는 행은 저장에서 제외하고, 원본에 컬럼이 없으면 KeyError
+      True면 값이 없거나 원본에 컬럼이 없으면 NULL로 저장
+    """
+    source: str
+    target: str
+    dtype: str
+    nullable: bool = True
+
+
+class TableMapping(NamedTuple):
+    """pykrx 데이터프레임 -> 모델 변환 규칙"""
+    model: type
+    label: str
+    columns: Tuple[ColumnSpec, ...]
+
+    @property
+    def required(self) -> list:
+        """NULL을 허용하지 않는 모델 컬럼 목록"""
+        return [spec.target for spec in self.columns if not spec.nullable]
+
+
+# 데이터셋 키 -> 변환 규칙 (새 데이터셋은 여기에 항목 추가)
+MAPPINGS: Dict[str, TableMapping] = {
+    'daily_price': TableMapping(DailyPrice, '일별 주가', (
+        ColumnSpec('시가', 'open', 'int', nullable=False),
+        ColumnSpec('고가', 'high', 'int', nullable=False),
+        ColumnSpec('저가', 'low', 'int', nullable=False),
+        ColumnSpec('종가', 'close', 'int', nullable=False),
+        ColumnSpec('거래량', 'volume', 'int', nullable=False),
+    )),
+    'market_cap': TableMapping(MarketCap, '시가총액', (
+        ColumnSpec('시가총액', 'market_cap', 'int', nullable=False),
+        ColumnSpec('거래량', 'trading_volume', 'int', nullable=False),
+        ColumnSpec('거래대금', 'trading_value', 'int', nullable=False),
+        ColumnSpec('상장주식수', 'outstanding_shares', 'int', nullable=False),
+    )),
+    'fundamental': TableMapping(Fundamental, '펀더멘탈', (
+        ColumnSpec('BPS', 'bps', 'int'),
+        ColumnSpec('PER', 'per', 'float'),
+        ColumnSpec('PBR', 'pbr', 'float'),
+        ColumnSpec('EPS', 'eps', 'int'),
+        ColumnSpec('DIV', 'div', 'float'),
+        ColumnSpec('DPS', 'dps', 'int'),
+    )),
+    'trading': TableMapping(TradingByInvestor, '투자자별 매매', (
+        ColumnSpec('기관합계', 'institution_net', 'int'),
+        ColumnSpec('외국인합계', 'foreigner_net', 'int'),
+        ColumnSpec('개인', 'individual_net', 'int'),
+        ColumnSpec('금융투자', 'financial_net', 'int'),
+        ColumnSpec('보험', 'insurance_net', 'int'),
+        ColumnSpec('투신', 'trust_net', 'int'),
+        ColumnSpec('사모', 'private_equity_net', 'int'),
+        ColumnSpec('연기금', 'pension_net', 'int'),
+    )),
+    'short_selling': TableMapping(ShortSelling, '공매도', (
+        ColumnSpec('거래량', 'short_volume', 'int'),
+        ColumnSpec('거래대금', 'short_value', 'int'),
+    )),
+    'short_balance': TableMapping(ShortBalance, '공매도 잔고', (
+        ColumnSpec('잔고수량', 'balance_quantity', 'int'),
+        ColumnSpec('잔고금액', 'balance_value', 'int'),
+        ColumnSpec('잔고비율', 'balance_ratio', 'float'),
+    )),
+}
+
+# dtype -> pandas 확장 타입 (NULL 허용)
+_DTYPES = {
+    'int': 'Int64',
+    'float': 'Float64',
+}
+
+
+def _convert_column(values: pd.Series, dtype: str) -> pd.Series:
+    """숫자로 변환 (변환 불가 값은 NULL, 정수는 소수점 이하 버림)"""
+    numeric = pd.to_numeric(values, errors='coerce')
+    if dtype == 'int':
+        numeric = np.trunc(numeric.astype(float))
+    return numeric.astype(_DTYPES[dtype])
+
+
+def convert_frame(df: pd.DataFrame, mapping: TableMapping, key=None) -> pd.DataFrame:
+    """
+    변환 규칙에 따라 원본 데이터프레임을 모델 컬럼 데이터프레임으로 변환 (컬럼 단위 연산)
+
+    Args:
+        df: pykrx 원본 데이터프레임
+        mapping: 변환 규칙
+        key: 로그용 식별자 (종목코드 또는 날짜)
+
+    Returns:
+        모델 컬럼명 데이터프레임 (df와 같은 인덱스, 필수값이 없는 행은 제외)
+
+    Raises:
+        KeyError: 필수 컬럼이 원본에 없음
+    """
+    missing = [spec.source for spec in mapping.columns
+               if not spec.nullable and spec.source not in df.columns]
+    if missing:
+        raise KeyError(f"{mapping.label} 필수 컬럼 없음: {', '.join(missing)}")
+
+    converted = pd.DataFrame({
+        spec.target: (
+            _convert_column(df[spec.source], spec.dtype) if spec.source in df.columns
+            else pd.Series(pd.NA, index=df.index, dtype=_DTYPES[spec.dtype])
+        )
+        for spec in mapping.columns
+    }, index=df.index)
+
+    required = mapping.required
+    if required:
+        invalid = converted[required].isna().any(axis=1)
+        if invalid.any():
+            logger.error(f"필수값 누락으로 저장 제외: {key} ({int(invalid.sum())}건)")
+            converted = converted[~invalid]
+    return converted
@@ -0,0 +1,193 @@
+import logging
+import sys
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from database.connection import Database
+from models import EmptyResponse
+
+logger = logging.getLogger(__name__)
+
+# (endpoint, ticker, start_date, end_date) - 날짜는 YYYYMMDD
+Key = Tuple[str, str, str, str]
+
+
+def _to_date(date_str: str) -> date:
+    return datetime.strptime(date_str, '%Y%m%d').date()
+
+
+class NegativeCache:
+    """
+    빈 결과 캐시
+
+    공매도처럼 데이터가 없거나 늦게 공시되는 조회의 빈 결과를 empty_responses
+    테이블에 기록하고, 만료 전까지는 같은 조회를 KRX에 보내지 않습니다.
+    만료 시간은 조회 종료일이 오래될수록 길어집니다 (최근 날짜는 곧 공시될 수 있음).
+    - 처음 사용할 때 만료되지 않은 항목을 한 번에 메모리로 읽고, 만료된 항목은 삭제
+    - DB 기록에 실패해도 이번 프로세스 동안은 메모리에서 동작
+    """
+
+    # 조회 종료일 경과 일수 상한 -> 보관 시간 (공매도 잔고는 T+2 영업일에 공시)
+    AGE_TTLS = (
+        (3, timedelta(hours=6)),
+        (14, timedelta(days=1)),
+        (90, timedelta(days=7)),
+    )
+
+    # 그보다 오래된 날짜의 보관 시간 (사실상 확정된 빈 결과)
+    MAX_TTL = timedelta(days=90)
+
+    def __init__(
+        self,
+        db: Database = None,
+        enabled: bool = True,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Args:
+            db: 데이터베이스 (기본값: 기본 SQLite DB)
+            enabled: False면 조회/기록 모두 하지 않음
+            clock: 현재 시각 함수 (테스트용)
+        """
+        self.db = db
+        self.enabled = enabled
+        self.clock = clock
+        self._entries: Dict[Key, datetime] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def ttl_for(self, end_date: str, now: datetime = None) -> timedelta:
+        """
+        조회 종료일 경과 일수에 따른 보관 시간
+
+        Args:
+            end_date: 조회 종료일 (YYYYMMDD)
+            now: 기준 시각 (기본값: 현재 시각)
+        """
+        now = now or self.clock()
+        age = (now.date() - _to_date(end_date)).days
+        for max_age, ttl in self.AGE_TTLS:
+            if age <= max_age:
+                return ttl
+        return self.MAX_TTL
+
+    def is_empty(self, endpoint: str, ticker: str, start_date: str, end_date: str) -> bool:
+        """
+        만료되지 않은 빈 결과 기록이 있는지 확인
+
+        Args:
+            endpoint: 조회 함수 이름
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+        """
+        if not self.enabled:
+            return False
+
+        self._ensure_loaded()
+        expires_at = self._entries.get((endpoint, ticker, start_date, end_date))
+        return expires_at is not None and expires_at > self.clock()
+
+    def record(self, endpoint: str, ticker: str, start_date: str, end_date: str) -> Optional[datetime]:
+        """
+        빈 결과 기록
+
+        Args:
+            endpoint: 조회 함수 이름
+            ticker: 종목코드
+            start_date: 시작일 (YYYYMMDD)
+            end_date: 종료일 (YYYYMMDD)
+
+        Returns:
+            만료일시 (비활성화 상태면 None)
+        """
+        if not self.enabled:
+            return None
+
+        self._ensure_loaded()
+        now = self.clock()
+        expires_at = now + self.ttl_for(end_date, now)
+
+        with self._lock:
+            self._entries[(endpoint, ticker, start_date, end_date)] = expires_at
+            try:
+                with (self.db or Database()).get_session() as session:
+                    session.merge(EmptyResponse(
+                        endpoint=endpoint,
+                        ticker=ticker,
+                        start_date=_to_date(start_date),
+                        end_date=_to_date(end_date),
+                        checked_at=now,
+                        expires_at=expires_at
+                    ))
+                    session.commit()
+            except Exception as e:
+                logger.warning(f"빈 결과 기록 실패 (메모리에만 보관): {e}")
+
+        logger.debug(f"빈 결과 기록: {endpoint} {ticker} ({start_date} ~ {end_date}) ~ {expires_at:%Y-%m-%d %H:%M}")
+        return expires_at
+
+    def _ensure_loaded(self):
+        """만료되지 않은 기록 읽기 (테이블이 없으면 생성, 만료된 기록은 삭제)"""
+        if self._loaded:
+            return
+
+        with self._lock:
+            if self._loaded:
+                return
+
+            now = self.clock()
+            try:
+                with (self.db or Database()).get_session() as session:
+                    EmptyResponse.__table__.create(bind=session.get_bind(), checkfirst=True)
+
+                    session.query(EmptyResponse).filter(EmptyResponse.expires_at <= now).delete()
+                    session.commit()
+
+                    rows = session.query(
+                        EmptyResponse.endpoint, EmptyResponse.ticker,
+                        EmptyResponse.start_date, EmptyResponse.end_date,
+                        EmptyResponse.expires_at
+                    )
+                    for endpoint, ticker, start, end, expires_at in rows:
+                        key = (endpoint, ticker, start.strftime('%Y%m%d'), end.strftime('%Y%m%d'))
+                        self._entries[key] = expires_at
+            except Exception as e:
+                logger.warning(f"빈 결과 캐시 로드 실패 (메모리에서만 동작): {e}")
+
+            self._loaded = True
+
+    def clear(self):
+        """기록 전체 삭제"""
+        with self._lock:
+            self._entries.clear()
+            try:
+                with (self.db or Database()).get_session() as session:
+                    session.query(EmptyResponse).delete()
+                    session.commit()
+            except Exception as e:
+                logger.warning(f"빈 결과 캐시 삭제 실패: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 공유 기본 빈 결과 캐시
+_default_negative_cache = NegativeCache()
+
+
+def get_negative_cache() -> NegativeCache:
+    """프로세스 공유 기본 빈 결과 캐시 반환"""
+    return _default_negative_cache
+
+
+def set_negative_cache_enabled(enabled: bool):
+    """기본 빈 결과 캐시 사용 여부 설정 (--no-cache 옵션)"""
+    _default_negative_cache.enabled = enabled
+    if not enabled:
+        logger.info("빈 결과 캐시 비활성화")
@@ -0,0 +1,73 @@
+import time
+import asyncio
+import threading
+import logging
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 호출 제한기
+
+    여러 스레드가 하나의 인스턴스를 공유하면 전체 호출 속도가 rate 이하로 유지됩니다.
+    토큰을 먼저 예약하고 락 밖에서 대기하므로 대기 중인 스레드가 다른 스레드를 막지 않습니다.
+    스레드(acquire)와 코루틴(acquire_async)이 같은 인스턴스를 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: 초당 허용 호출 수
+            capacity: 연속 호출 허용량 (버스트 크기)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """토큰을 예약하고 필요한 대기 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        호출 허가를 받을 때까지 대기
+
+        Args:
+            tokens: 사용할 토큰 수
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        호출 허가를 받을 때까지 대기 (이벤트 루프를 막지 않는 코루틴 버전)
+
+        Args:
+            tokens: 사용할 토큰 수
+
+        Returns:
+            실제 대기한 시간 (초)
+        """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
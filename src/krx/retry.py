@@ -0,0 +1,277 @@
+import json
+import time
+import asyncio
+import random
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Type, Any
+
+logger = logging.getLogger(__name__)
+
+class CircuitOpenError(Exception):
+    """연속 실패로 차단된 엔드포인트 호출"""
+
+
+class RetryPolicy:
+    """
+    재시도 정책
+
+    - 영구 오류(데이터 없음 등 같은 입력이면 항상 실패)는 재시도하지 않음
+    - 일시 오류는 상한이 있는 지수 백오프 + 지터로 재시도
+    """
+
+    # 재시도해도 결과가 같은 오류 (pykrx는 데이터가 없으면 KeyError/IndexError 등을 발생)
+    PERMANENT_ERRORS: Tuple[Type[BaseException], ...] = (
+        KeyError, IndexError, ValueError, TypeError, AttributeError,
+    )
+
+    # 영구 오류의 하위 클래스지만 서버 응답 이상(차단/점검 페이지 등)이므로 재시도
+    RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (json.JSONDecodeError,)
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        rng: random.Random = None
+    ):
+        """
+        Args:
+            max_attempts: 최대 시도 횟수 (첫 호출 포함)
+            base_delay: 첫 재시도 대기 시간 (초)
+            max_delay: 대기 시간 상한 (초)
+            jitter: 대기 시간 중 무작위로 줄일 비율 (0~1)
+            rng: 난수 생성기 (테스트용)
+        """
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts는 1 이상이어야 합니다: {max_attempts}")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """재시도할 오류인지 판별"""
+        if isinstance(error, self.RETRYABLE_ERRORS):
+            return True
+        return not isinstance(error, self.PERMANENT_ERRORS)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        attempt번째 실패 후 대기 시간 (초)
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터)
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return delay * (1 - self.jitter * self.rng.random())
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 차단기
+
+    연속 failure_threshold회 실패하면 열려서 이후 호출을 즉시 실패시킵니다.
+    reset_timeout이 None이면 실행이 끝날 때까지 열린 상태를 유지하고,
+    값이 있으면 그 시간이 지난 뒤 한 번 시험 호출을 허용합니다.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: Optional[float] = None):
+        """
+        Args:
+            failure_threshold: 차단까지 연속 실패 횟수
+            reset_timeout: 차단 후 시험 호출까지 대기 시간 (초), None이면 계속 차단
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """호출 허용 여부"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self.reset_timeout is not None and time.monotonic() - self._opened_at >= self.reset_timeout:
+                # 시험 호출 1회 허용 (실패하면 다시 열림)
+                self._opened_at = None
+                self._failures = self.failure_threshold - 1
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> bool:
+        """
+        실패 기록
+
+        Returns:
+            이번 실패로 차단기가 열렸으면 True
+        """
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is None and self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+class RetryStats:
+    """엔드포인트별 호출/재시도 통계 (스레드 안전)"""
+
+    FIELDS = ('calls', 'success', 'retries', 'failures', 'permanent', 'short_circuited')
+
+    def __init__(self):
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, endpoint: str, field: str, amount: int = 1):
+        with self._lock:
+            stats = self._stats.setdefault(endpoint, dict.fromkeys(self.FIELDS, 0))
+            stats[field] += amount
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """엔드포인트 -> 통계 딕셔너리 복사본"""
+        with self._lock:
+            return {endpoint: dict(stats) for endpoint, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class Retrier:
+    """재시도 정책 + 엔드포인트별 차단기 + 통계를 묶은 호출기"""
+
+    def __init__(
+        self,
+        policy: RetryPolicy = None,
+        stats: RetryStats = None,
+        failure_threshold: int = 5,
+        reset_timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            policy: 재시도 정책 (기본값: RetryPolicy())
+            stats: 통계 저장소 (기본값: 새 RetryStats)
+            failure_threshold: 차단기를 열 연속 실패 횟수
+            reset_timeout: 차단기 시험 호출 대기 시간 (초), None이면 실행 동안 계속 차단
+        """
+        self.policy = policy or RetryPolicy()
+        self.stats = stats or RetryStats()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """엔드포인트 차단기 (없으면 생성)"""
+        with self._lock:
+            if endpoint not in self._breakers:
+                self._breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[endpoint]
+
+    def call(self, endpoint: str, attempt_fn: Callable[[], Any]) -> Any:
+        """
+        정책에 따라 attempt_fn 호출
+
+        Args:
+            endpoint: 통계/차단기 구분 이름
+            attempt_fn: 한 번의 시도 (인자 없음)
+
+        Raises:
+            CircuitOpenError: 차단기가 열려 있음
+            Exception: 영구 오류이거나 재시도를 모두 소진한 마지막 오류
+        """
+        breaker = self.breaker(endpoint)
+        self.stats.incr(endpoint, 'calls')
+
+        for attempt in range(1, self.policy.max_attempts + 1):
+            self._check_breaker(endpoint, breaker)
+            try:
+                result = attempt_fn()
+            except Exception as e:
+                time.sleep(self._on_failure(endpoint, breaker, attempt, e))
+                continue
+
+            self._on_success(endpoint, breaker)
+            return result
+
+    async def call_async(self, endpoint: str, attempt_fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        call()의 코루틴 버전 (재시도 대기 중 이벤트 루프를 막지 않음)
+
+        Args:
+            endpoint: 통계/차단기 구분 이름
+            attempt_fn: 한 번의 시도 (인자 없는 코루틴 함수)
+
+        Raises:
+            CircuitOpenError: 차단기가 열려 있음
+            Exception: 영구 오류이거나 재시도를 모두 소진한 마지막 오류
+        """
+        breaker = self.breaker(endpoint)
+        self.stats.incr(endpoint, 'calls')
+
+        for attempt in range(1, self.policy.max_attempts + 1):
+            self._check_breaker(endpoint, breaker)
+            try:
+                result = await attempt_fn()
+            except Exception as e:
+                await asyncio.sleep(self._on_failure(endpoint, breaker, attempt, e))
+                continue
+
+            self._on_success(endpoint, breaker)
+            return result
+
+    def _check_breaker(self, endpoint: str, breaker: CircuitBreaker):
+        """차단기가 열려 있으면 CircuitOpenError"""
+        if not breaker.allow():
+            self.stats.incr(endpoint, 'short_circuited')
+            raise CircuitOpenError(f"연속 실패로 호출 차단됨: {endpoint}")
+
+    def _on_success(self, endpoint: str, breaker: CircuitBreaker):
+        breaker.record_success()
+        self.stats.incr(endpoint, 'success')
+
+    def _on_failure(self, endpoint: str, breaker: CircuitBreaker, attempt: int, error: Exception) -> float:
+        """
+        실패 기록 후 재시도 전 대기 시간 반환 (재시도하지 않을 오류면 다시 발생)
+        """
+        if not self.policy.is_retryable(error):
+            # 입력 문제(데이터 없음 등)는 엔드포인트 장애로 보지 않음
+            self.stats.incr(endpoint, 'permanent')
+            logger.warning(f"API 호출 실패 (재시도 안 함): {endpoint} - {type(error).__name__}: {error}")
+            raise error
+
+        if breaker.record_failure():
+            logger.error(f"연속 {breaker.failure_threshold}회 실패로 {endpoint} 호출 차단")
+
+        if attempt >= self.policy.max_attempts:
+            self.stats.incr(endpoint, 'failures')
+            logger.error(f"최대 재시도 횟수 초과: {endpoint}")
+            raise error
+
+        delay = self.policy.backoff(attempt)
+        self.stats.incr(endpoint, 'retries')
+        logger.warning(
+            f"API 호출 실패 (시도 {attempt}/{self.policy.max_attempts}, "
+            f"{delay:.1f}초 후 재시도): {endpoint} - {error}"
+        )
+        return delay
+
+    def reset(self):
+        """차단기/통계 초기화"""
+        with self._lock:
+            self._breakers.clear()
+        self.stats.reset()
@@ -1,31 +1,115 @@
 import logging
 import sys
 import os
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, date
 import pandas as pd
+from sqlalchemy import null, or_, update
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from typing import List
+from sqlalchemy.exc import SQLAlchemyError
+from typing import List, Dict, NamedTuple, Tuple
 
 # 상대 경로 처리
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from models import (
-    Stock, DailyPrice, MarketCap, Fundamental,
-    TradingByInvestor, ShortSelling, ShortBalance
-)
+from krx.mapping import MAPPINGS, convert_frame
+from database.coverage import dataset_key, dialect_insert, update_coverage, rebuild_coverage, mark_checked
+from models import Stock, TradingDay, BackfillCheckpoint
 
 logger = logging.getLogger(__name__)
 
+class WriteCounts(NamedTuple):
+    """일괄 저장 결과 (신규/수정/동일 행 수)"""
+    inserted: int
+    updated: int
+    unchanged: int
+
+
+class StockDiff(NamedTuple):
+    """
+    종목 마스터 동기화 결과
+
+    - new: 신규 (재상장 포함) 종목코드 목록
+    - renamed: (종목코드, 이전 종목명, 새 종목명) 목록
+    - moved: (종목코드, 이전 시장, 새 시장) 목록 (예: KOSDAQ→KOSPI 이전 상장)
+    - delisted: 목록에서 빠진 종목코드 목록
+    """
+    new: List[str]
+    renamed: List[Tuple[str, str, str]]
+    moved: List[Tuple[str, str, str]]
+    delisted: List[str]
+
+    @property
+    def changed(self) -> int:
+        """변경된 종목 수 (종목명과 시장이 함께 바뀐 종목은 한 번만 셈)"""
+        tickers = set(self.new) | set(self.delisted)
+        tickers.update(ticker for ticker, _, _ in self.renamed)
+        tickers.update(ticker for ticker, _, _ in self.moved)
+        return len(tickers)
+
+
 class DataSaver:
-    """수집한 데이터를 데이터베이스에 저장"""
+    """
+    수집한 데이터를 데이터베이스에 저장
 
-    def __init__(self, db_session: Session):
+    기본은 이미 있는 (종목, 일자) 행을 건너뛰고, upsert=True면 값이 달라진 행만
+    덮어씁니다 (KRX 정정 데이터 반영, --force 재수집).
+    """
+
+    def __init__(self, db_session: Session, upsert: bool = False):
+        """
+        Args:
+            db_session: SQLAlchemy 세션
+            upsert: True면 종목별 데이터 테이블의 기존 행을 새 값으로 갱신
+        """
         self.session = db_session
+        self.upsert = upsert
+        self.counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        self._batch_counts = dict.fromkeys(self.counts, 0)  # batch() 안에서 commit 전까지 모은 행 수
+        self._batch_depth = 0
+
+    @property
+    def in_batch(self) -> bool:
+        """batch() 블록 안인지 여부"""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self):
+        """
+        블록 안의 저장을 하나의 트랜잭션으로 묶음 (블록이 끝날 때 한 번 commit)
+
+        블록 안에서는 저장 실패를 0건으로 삼키지 않고 예외를 그대로 전파하며,
+        예외가 발생하면 블록 전체를 rollback합니다. 중첩하면 가장 바깥 블록에서 commit합니다.
+        counts에는 commit된 뒤에만 더하므로 rollback된 행은 집계되지 않습니다.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+            if self._batch_depth == 1:
+                self.session.commit()
+                for field, value in self._batch_counts.items():
+                    self.counts[field] += value
+        except BaseException:
+            if self._batch_depth == 1:
+                self.session.rollback()
+            raise
+        finally:
+            if self._batch_depth == 1:
+                self._batch_counts = dict.fromkeys(self.counts, 0)
+            self._batch_depth -= 1
+
+    def _commit(self):
+        """batch() 블록 밖이면 commit, 안이면 flush만 (블록 끝에서 commit)"""
+        if self.in_batch:
+            self.session.flush()
+        else:
+            self.session.commit()
 
     def save_stock(self, ticker: str, name: str, market: str) -> Stock:
         """
-        종목 정보 저장
+        종목 정보 저장 (이미 등록된 종목은 그대로 둠)
+
+        종목명 변경/시장 이동/상장폐지 반영은 전 종목 목록으로 호출하는 sync_stocks가 담당합니다.
 
         Args:
             ticker: 종목코드
@@ -39,10 +123,239 @@ class DataSaver:
         if not stock:
             stock = Stock(ticker=ticker, name=name, market=market)
             self.session.add(stock)
-            self.session.commit()
+            self._commit()
             logger.info(f"종목 등록: {ticker} ({name})")
         return stock
 
+    def save_stocks(self, records: List[Tuple[str, str, str]]) -> int:
+        """
+        종목 정보 일괄 저장 (이미 등록된 종목은 스킵)
+
+        Args:
+            records: (종목코드, 종목명, 시장) 튜플 목록
+
+        Returns:
+            신규 등록된 종목 수
+        """
+        rows = [
+            {'ticker': ticker, 'name': name, 'market': market}
+            for ticker, name, market in records
+        ]
+        saved_count = self._bulk_insert(Stock, rows).inserted
+        logger.info(f"종목 일괄 등록: {saved_count}건 (전체 {len(rows)}건)")
+        return saved_count
+
+    def sync_stocks(self, records: List[Tuple[str, str, str]], markets: Tuple[str, ...] = None) -> StockDiff:
+        """
+        종목 마스터를 목록과 한 트랜잭션으로 동기화
+
+        기존 종목 전체를 한 번 읽어 메모리에서 비교한 뒤, 신규/변경 종목만 단일 upsert로 저장하고
+        updated_at은 실제로 바뀐 종목만 갱신합니다.
+
+        Args:
+            records: (종목코드, 종목명, 시장) 튜플 목록
+            markets: 목록이 해당 시장의 전 종목일 때 지정. 이 시장의 기존 종목 중 목록에 없는
+                종목을 상장폐지로 표시 (None이면 상장폐지 판정 안 함)
+
+        Returns:
+            StockDiff (신규/종목명 변경/시장 이동/상장폐지)
+        """
+        latest = {ticker: (name, market) for ticker, name, market in records}
+        query = self.session.query(Stock.ticker, Stock.name, Stock.market, Stock.delisted_at)
+        if markets is None:
+            # 상장폐지 판정이 없으면 목록의 종목만 비교
+            query = query.filter(Stock.ticker.in_(list(latest)))
+        existing = {
+            ticker: (name, market, delisted_at)
+            for ticker, name, market, delisted_at in query
+        }
+
+        diff = StockDiff([], [], [], [])
+        for ticker, (name, market) in latest.items():
+            current = existing.get(ticker)
+            if current is None or current[2] is not None:
+                diff.new.append(ticker)
+                continue
+            if current[0] != name:
+                diff.renamed.append((ticker, current[0], name))
+            if current[1] != market:
+                diff.moved.append((ticker, current[1], market))
+        if markets is not None:
+            diff.delisted.extend(
+                ticker for ticker, (_, market, delisted_at) in existing.items()
+                if market in markets and delisted_at is None and ticker not in latest
+            )
+
+        changed = set(diff.new)
+        changed.update(ticker for ticker, _, _ in diff.renamed + diff.moved)
+        if not changed and not diff.delisted:
+            return diff
+
+        now = datetime.now()
+        table = Stock.__table__
+        try:
+            if changed:
+                insert = dialect_insert(self.session)
+                stmt = insert(table)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[table.c.ticker],
+                    set_={'name': stmt.excluded.name, 'market': stmt.excluded.market,
+                          'delisted_at': None, 'updated_at': now},
+                    where=or_(table.c.name != stmt.excluded.name,
+                              table.c.market != stmt.excluded.market,
+                              table.c.delisted_at.isnot(None))
+                )
+                self.session.connection().execute(stmt, [
+                    {'ticker': ticker, 'name': latest[ticker][0], 'market': latest[ticker][1],
+                     'created_at': now, 'updated_at': now}
+                    for ticker in changed
+                ])
+            if diff.delisted:
+                self.session.connection().execute(
+                    update(table).where(table.c.ticker.in_(diff.delisted))
+                    .values(delisted_at=now, updated_at=now)
+                )
+            self._commit()
+        except SQLAlchemyError:
+            if not self.in_batch:
+                self.session.rollback()
+            raise
+
+        logger.info(f"종목 동기화: 신규 {len(diff.new)}건, 종목명 변경 {len(diff.renamed)}건, "
+                    f"시장 이동 {len(diff.moved)}건, 상장폐지 {len(diff.delisted)}건")
+        return diff
+
+    def _bulk_insert(self, model, records: List[Dict], update_columns: List[str] = None) -> WriteCounts:
+        """
+        레코드 목록을 단일 INSERT 문으로 일괄 저장
+
+        - 기본: 이미 있는 행은 건너뜀 (ON CONFLICT DO NOTHING)
+        - upsert: 종목별 데이터 테이블은 값이 하나라도 다른 행만 갱신하고 updated_at 기록
+          (ON CONFLICT (ticker, date) DO UPDATE ... WHERE 값이 다름)
+        종목별 데이터 테이블이면 같은 트랜잭션에서 data_coverage도 갱신합니다.
+
+        Args:
+            model: 저장할 ORM 모델 클래스
+            records: 컬럼명 -> 값 딕셔너리 목록
+            update_columns: upsert 시 비교/갱신할 컬럼 (기본값: ticker/date를 뺀 레코드의 전체 컬럼).
+                원본에 없던 컬럼은 제외해야 저장된 값이 NULL로 덮어써지지 않음
+
+        Returns:
+            WriteCounts (신규, 수정, 동일/중복 행 수)
+        """
+        if not records:
+            return WriteCounts(0, 0, 0)
+
+        insert = dialect_insert(self.session)
+        table = model.__table__
+        track_coverage = dataset_key(model) is not None
+        stmt = insert(table)
+        if update_columns is None:
+            update_columns = [name for name in records[0] if name not in ('ticker', 'date')]
+        if self.upsert and track_coverage and update_columns:
+            # 변경된 행만 갱신되고 반환됨 (신규 행은 updated_at이 NULL)
+            values = update_columns
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.ticker, table.c.date],
+                set_={**{name: stmt.excluded[name] for name in values}, 'updated_at': datetime.now()},
+                where=or_(*[table.c[name].is_distinct_from(stmt.excluded[name]) for name in values])
+            ).returning(table.c.ticker, table.c.date, table.c.updated_at)
+        else:
+            stmt = stmt.on_conflict_do_nothing()
+            if track_coverage:
+                # 실제로 추가된 행만 돌려받아 보유 구간 갱신 (중복 행은 반환되지 않음)
+                stmt = stmt.returning(table.c.ticker, table.c.date, null())
+
+        try:
+            result = self.session.connection().execute(stmt, records)
+            if track_coverage:
+                written = result.all()
+                new_rows = [(ticker, day) for ticker, day, updated_at in written if updated_at is None]
+                inserted, updated = len(new_rows), len(written) - len(new_rows)
+                update_coverage(self.session, model, new_rows)
+            else:
+                inserted, updated = result.rowcount, 0
+            self._commit()
+        except SQLAlchemyError:
+            if not self.in_batch:
+                self.session.rollback()
+            raise
+
+        counts = WriteCounts(inserted, updated, len(records) - inserted - updated)
+        totals = self._batch_counts if self.in_batch else self.counts
+        for field, value in counts._asdict().items():
+            totals[field] += value
+        return counts
+
+    def _frame_to_records(self, values: pd.DataFrame, ticker: str = None, date=None) -> List[Dict]:
+        """
+        변환된 데이터프레임에 종목코드/일자를 붙여 INSERT용 레코드 목록 생성
+
+        ticker를 지정하면 날짜 인덱스(종목별 기간 조회) 데이터프레임으로,
+        date를 지정하면 종목코드 인덱스(날짜별 전체 시장 조회) 데이터프레임으로 처리합니다.
+
+        Args:
+            values: convert_frame 결과 (모델 컬럼명)
+            ticker: 종목코드 (날짜 인덱스인 경우)
+            date: 거래일자 (종목코드 인덱스인 경우)
+
+        Returns:
+            레코드 목록
+        """
+        values = values.copy()
+        if ticker is not None:
+            values.insert(0, 'date', pd.to_datetime(values.index).date)
+            values.insert(0, 'ticker', ticker)
+        else:
+            values.insert(0, 'date', pd.Timestamp(date).date())
+            values.insert(0, 'ticker', values.index.astype(str))
+
+        # pandas NA/확장 타입 값을 DB 드라이버가 받을 수 있는 파이썬 값으로 변환
+        values = values.astype(object).where(values.notna(), None)
+        return values.to_dict('records')
+
+    def _save_mapped(self, dataset: str, df: pd.DataFrame, ticker: str = None, date=None) -> int:
+        """
+        변환 규칙(MAPPINGS)에 따라 변환 + 일괄 저장
+
+        필수 컬럼이 없으면 KeyError를 그대로 전파합니다.
+
+        Args:
+            dataset: 데이터셋 키 (MAPPINGS 참고)
+            df: pykrx 원본 데이터프레임
+            ticker: 종목코드 (날짜 인덱스인 경우)
+            date: 거래일자 (종목코드 인덱스인 경우)
+
+        Returns:
+            저장된 레코드 수 (upsert면 신규 + 수정)
+        """
+        if df.empty:
+            return 0
+
+        mapping = MAPPINGS[dataset]
+        key = ticker if ticker is not None else date
+        values = convert_frame(df, mapping, key)
+        # 원본에 있던 컬럼만 갱신 (없는 컬럼은 신규 행에만 NULL로 저장)
+        present = [spec.target for spec in mapping.columns if spec.source in df.columns]
+
+        try:
+            records = self._frame_to_records(values, ticker=ticker, date=date)
+            counts = self._bulk_insert(mapping.model, records, update_columns=present)
+        except Exception as e:
+            logger.error(f"{mapping.label} 저장 실패: {key} - {e}")
+            if self.in_batch:
+                raise  # 배치 전체를 rollback하도록 전파
+            return 0
+
+        if self.upsert:
+            logger.info(f"{mapping.label} 저장 완료: {key} (신규 {counts.inserted}건, "
+                        f"수정 {counts.updated}건, 동일 {counts.unchanged}건)")
+        else:
+            if counts.unchanged:
+                logger.debug(f"중복 데이터 스킵: {key} ({counts.unchanged}건)")
+            logger.info(f"{mapping.label} 저장 완료: {key} ({counts.inserted}건, 중복 {counts.unchanged}건)")
+        return counts.inserted + counts.updated
+
     def save_daily_prices(self, ticker: str, df: pd.DataFrame) -> int:
         """
         일별 주가 데이터 저장
@@ -57,31 +370,7 @@ class DataSaver:
         if df.empty:
             logger.warning(f"빈 데이터프레임: {ticker}")
             return 0
-
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                price = DailyPrice(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    open=int(row['시가']),
-                    high=int(row['고가']),
-                    low=int(row['저가']),
-                    close=int(row['종가']),
-                    volume=int(row['거래량'])
-                )
-                self.session.add(price)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-                logger.debug(f"중복 데이터 스킵: {ticker} {date}")
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"저장 실패: {ticker} {date} - {e}")
-
-        logger.info(f"일별 주가 저장 완료: {ticker} ({saved_count}건)")
-        return saved_count
+        return self._save_mapped('daily_price', df, ticker=ticker)
 
     def save_market_caps(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -94,31 +383,7 @@ class DataSaver:
         Returns:
             저장된 레코드 수
         """
-        if df.empty:
-            return 0
-
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                cap = MarketCap(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    market_cap=int(row['시가총액']),
-                    trading_volume=int(row['거래량']),
-                    trading_value=int(row['거래대금']),
-                    outstanding_shares=int(row['상장주식수'])
-                )
-                self.session.add(cap)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"시가총액 저장 실패: {ticker} {date} - {e}")
-
-        logger.info(f"시가총액 저장 완료: {ticker} ({saved_count}건)")
-        return saved_count
+        return self._save_mapped('market_cap', df, ticker=ticker)
 
     def save_fundamentals(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -131,33 +396,7 @@ class DataSaver:
         Returns:
             저장된 레코드 수
         """
-        if df.empty:
-            return 0
-
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                fund = Fundamental(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    bps=int(row['BPS']) if pd.notna(row['BPS']) else None,
-                    per=float(row['PER']) if pd.notna(row['PER']) else None,
-                    pbr=float(row['PBR']) if pd.notna(row['PBR']) else None,
-                    eps=int(row['EPS']) if pd.notna(row['EPS']) else None,
-                    div=float(row['DIV']) if pd.notna(row['DIV']) else None,
-                    dps=int(row['DPS']) if pd.notna(row['DPS']) else None
-                )
-                self.session.add(fund)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"펀더멘탈 저장 실패: {ticker} {date} - {e}")
-
-        logger.info(f"펀더멘탈 저장 완료: {ticker} ({saved_count}건)")
-        return saved_count
+        return self._save_mapped('fundamental', df, ticker=ticker)
 
     def save_trading_by_investor(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -170,35 +409,7 @@ class DataSaver:
         Returns:
             저장된 레코드 수
         """
-        if df.empty:
-            return 0
-
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                trading = TradingByInvestor(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    institution_net=int(row['기관합계']) if '기관합계' in row else None,
-                    foreigner_net=int(row['외국인합계']) if '외국인합계' in row else None,
-                    individual_net=int(row['개인']) if '개인' in row else None,
-                    financial_net=int(row['금융투자']) if '금융투자' in row else None,
-                    insurance_net=int(row['보험']) if '보험' in row else None,
-                    trust_net=int(row['투신']) if '투신' in row else None,
-                    private_equity_net=int(row['사모']) if '사모' in row else None,
-                    pension_net=int(row['연기금']) if '연기금' in row else None
-                )
-                self.session.add(trading)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"투자자별 매매 저장 실패: {ticker} {date} - {e}")
-
-        logger.info(f"투자자별 매매 저장 완료: {ticker} ({saved_count}건)")
-        return saved_count
+        return self._save_mapped('trading', df, ticker=ticker)
 
     def save_short_selling(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -211,29 +422,7 @@ class DataSaver:
         Returns:
             저장된 레코드 수
         """
-        if df.empty:
-            return 0
-
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                short = ShortSelling(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    short_volume=int(row['거래량']) if '거래량' in row else None,
-                    short_value=int(row['거래대금']) if '거래대금' in row else None
-                )
-                self.session.add(short)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"공매도 저장 실패: {ticker} {date} - {e}")
-
-        logger.info(f"공매도 저장 완료: {ticker} ({saved_count}건)")
-        return saved_count
+        return self._save_mapped('short_selling', df, ticker=ticker)
 
     def save_short_balance(self, ticker: str, df: pd.DataFrame) -> int:
         """
@@ -246,27 +435,139 @@ class DataSaver:
         Returns:
             저장된 레코드 수
         """
-        if df.empty:
-            return 0
+        return self._save_mapped('short_balance', df, ticker=ticker)
 
-        saved_count = 0
-        for date, row in df.iterrows():
-            try:
-                balance = ShortBalance(
-                    ticker=ticker,
-                    date=date.date() if hasattr(date, 'date') else date,
-                    balance_quantity=int(row['잔고수량']) if '잔고수량' in row else None,
-                    balance_value=int(row['잔고금액']) if '잔고금액' in row else None,
-                    balance_ratio=float(row['잔고비율']) if '잔고비율' in row else None
-                )
-                self.session.add(balance)
-                self.session.commit()
-                saved_count = saved_count + 1
-            except IntegrityError:
-                self.session.rollback()
-            except Exception as e:
-                self.session.rollback()
-                logger.error(f"공매도 잔고 저장 실패: {ticker} {date} - {e}")
+    def save_daily_prices_by_date(self, date_str: str, df: pd.DataFrame) -> int:
+        """
+        특정 일자의 전체 시장 주가 저장
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            df: 종목코드 인덱스 OHLCV 데이터프레임
+
+        Returns:
+            저장된 레코드 수
+        """
+        return self._save_mapped('daily_price', df, date=date_str)
+
+    def save_market_caps_by_date(self, date_str: str, df: pd.DataFrame) -> int:
+        """
+        특정 일자의 전체 시장 시가총액 저장
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            df: 종목코드 인덱스 시가총액 데이터프레임
+
+        Returns:
+            저장된 레코드 수
+        """
+        return self._save_mapped('market_cap', df, date=date_str)
+
+    def save_fundamentals_by_date(self, date_str: str, df: pd.DataFrame) -> int:
+        """
+        특정 일자의 전체 시장 펀더멘탈 저장
+
+        Args:
+            date_str: 거래일자 (YYYYMMDD)
+            df: 종목코드 인덱스 펀더멘탈 데이터프레임
+
+        Returns:
+            저장된 레코드 수
+        """
+        return self._save_mapped('fundamental', df, date=date_str)
+
+    def save_trading_days(self, days: Dict[date, bool]) -> int:
+        """
+        거래일 달력 일괄 저장 (이미 저장된 날짜는 스킵)
 
-        logger.info(f"공매도 잔고 저장 완료: {ticker} ({saved_count}건)")
+        Args:
+            days: 일자 -> 개장 여부
+
+        Returns:
+            저장된 레코드 수
+        """
+        rows = [{'date': day, 'is_open': is_open} for day, is_open in sorted(days.items())]
+        saved_count = self._bulk_insert(TradingDay, rows).inserted
+        logger.info(f"거래일 달력 저장: {saved_count}건")
         return saved_count
+
+    def save_backfill_chunk(
+        self,
+        ticker: str,
+        dataset: str,
+        start_date: date,
+        end_date: date,
+        save_method: str,
+        df: pd.DataFrame,
+        checkpoint: bool = True
+    ) -> int:
+        """
+        백필 구간 데이터와 체크포인트를 한 트랜잭션으로 저장
+
+        데이터 저장이 실패하면 체크포인트도 남지 않으므로 다음 실행에서 같은 구간을 다시 수집합니다.
+
+        Args:
+            ticker: 종목코드
+            dataset: 데이터셋 키 (예: 'daily_price')
+            start_date: 구간 시작일
+            end_date: 구간 종료일
+            save_method: 데이터 저장 메서드 이름 (예: 'save_daily_prices')
+            df: 조회 결과 (비어 있으면 체크포인트만 기록)
+            checkpoint: False면 데이터만 저장 (아직 공시가 끝나지 않은 최근 구간)
+
+        Returns:
+            저장된 레코드 수
+        """
+        with self.batch():
+            count = getattr(self, save_method)(ticker, df) if not df.empty else 0
+            if checkpoint:
+                self.session.merge(BackfillCheckpoint(
+                    ticker=ticker,
+                    dataset=dataset,
+                    start_date=start_date,
+                    end_date=end_date,
+                    rows=len(df),
+                    completed_at=datetime.now()
+                ))
+        return count
+
+    def save_fetched(self, ticker: str, dataset: str, start_date: date, save_method: str, df: pd.DataFrame) -> int:
+        """
+        조회 구간 데이터와 조회 시작일(data_coverage.checked_from)을 한 트랜잭션으로 저장
+
+        데이터 저장이 실패하면 조회 시작일도 남지 않으므로 다음 실행에서 앞쪽 구간을 다시 계획합니다.
+
+        Args:
+            ticker: 종목코드
+            dataset: 데이터셋 키 (예: 'daily_price')
+            start_date: 조회 시작일
+            save_method: 데이터 저장 메서드 이름 (예: 'save_daily_prices')
+            df: 조회 결과 (비어 있으면 조회 시작일만 기록)
+
+        Returns:
+            저장된 레코드 수
+        """
+        with self.batch():
+            count = getattr(self, save_method)(ticker, df) if not df.empty else 0
+            mark_checked(self.session, ticker, dataset, start_date)
+        return count
+
+    def rebuild_coverage(self, tickers: List[str] = None, datasets: List[str] = None) -> int:
+        """
+        원본 테이블에서 data_coverage 다시 계산 (기존 DB 최초 적용, 직접 수정/삭제 후 보정)
+
+        Args:
+            tickers: 대상 종목코드 목록 (None이면 전체)
+            datasets: 대상 데이터셋 키 목록 (None이면 전체)
+
+        Returns:
+            기록된 (종목, 데이터셋) 수
+        """
+        try:
+            count = rebuild_coverage(self.session, tickers, datasets)
+            self._commit()
+        except SQLAlchemyError:
+            if not self.in_batch:
+                self.session.rollback()
+            raise
+        return count
@@ -0,0 +1,156 @@
+import logging
+import sys
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from database.connection import Database
+from krx.client import KRXClient
+from krx.saver import DataSaver, StockDiff
+from models import Stock
+
+logger = logging.getLogger(__name__)
+
+class TickerMaster:
+    """
+    전 종목 코드/종목명/시장 마스터
+
+    기준일의 KOSPI/KOSDAQ 전 종목을 한 번에 받아 stocks 테이블에 한 트랜잭션으로
+    저장하고, 이후 조회는 메모리 dict에서 네트워크 없이 처리합니다.
+    - 더 최근 기준일이 요청될 때만 다시 받음 (신규 상장 반영)
+    - 처음 로드 시 stocks 테이블의 기존 종목(상장폐지 포함)도 함께 읽음
+    - 오늘 이후 기준일이면 종목명 변경/시장 이동/상장폐지를 stocks 테이블에 반영 (last_diff)
+    - 과거 기준일(과거 리포트/백필)은 메모리에만 없는 종목을 채움 (그 이후 상장 종목을
+      상장폐지로 표시하거나 종목명/시장을 옛 값으로 되돌리지 않도록)
+    """
+
+    MARKETS = ('KOSPI', 'KOSDAQ')
+
+    def __init__(self, db: Database = None):
+        """
+        Args:
+            db: 데이터베이스 (기본값: 기본 SQLite DB)
+        """
+        self.db = db
+        self._names: Dict[str, str] = {}
+        self._markets: Dict[str, str] = {}
+        self._version: Optional[str] = None  # 마지막으로 받은 기준일 (YYYYMMDD)
+        self._db_loaded = False
+        self._last_diff: Optional[StockDiff] = None
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        """마지막으로 받은 기준일 (YYYYMMDD)"""
+        return self._version
+
+    @property
+    def last_diff(self) -> Optional[StockDiff]:
+        """마지막 갱신의 종목 변경 내역 (신규/종목명 변경/시장 이동/상장폐지)"""
+        return self._last_diff
+
+    def ensure(self, date_str: str = None):
+        """
+        기준일 이후 데이터가 로드되어 있도록 보장 (필요할 때만 refresh)
+
+        Args:
+            date_str: 기준일 (YYYYMMDD), None이면 오늘
+        """
+        date_str = date_str or datetime.now().strftime('%Y%m%d')
+        if self._version is not None and date_str <= self._version:
+            return
+        self.refresh(date_str)
+
+    def refresh(self, date_str: str) -> int:
+        """
+        기준일의 전 종목을 받아 stocks 테이블과 메모리에 반영
+
+        기준일이 오늘보다 이전이면 stocks 테이블은 건드리지 않고, 메모리에 없는 종목만 추가합니다.
+        KRX 조회에 실패해도 예외를 전파하지 않고 DB에 저장된 종목으로 동작합니다.
+
+        Args:
+            date_str: 기준일 (YYYYMMDD)
+
+        Returns:
+            받은 종목 수
+        """
+        with self._lock:
+            if self._version is not None and date_str <= self._version:
+                return 0
+
+            db = self.db or Database()
+            current = date_str >= datetime.now().strftime('%Y%m%d')
+            records = []
+            try:
+                with db.get_session() as session:
+                    if not self._db_loaded:
+                        self._load_from_db(session)
+
+                    records = self._fetch_records(KRXClient(session), date_str)
+                    if records and current:
+                        # 종목을 받은 시장만 상장폐지 판정 (조회 실패한 시장은 제외)
+                        markets = tuple({market for _, _, market in records})
+                        self._last_diff = DataSaver(session).sync_stocks(records, markets=markets)
+            except Exception as e:
+                logger.warning(f"종목 마스터 갱신 실패 (저장된 종목 정보 사용): {e}")
+
+            for ticker, name, market in records:
+                if current:
+                    self._names[ticker] = name
+                    self._markets[ticker] = market
+                else:
+                    self._names.setdefault(ticker, name)
+                    self._markets.setdefault(ticker, market)
+
+            # 실패해도 같은 기준일은 다시 요청하지 않음 (조회마다 재시도 방지)
+            self._version = date_str
+            logger.info(f"종목 마스터 갱신: {date_str} ({len(records)}개, 전체 {len(self._names)}개)")
+            return len(records)
+
+    def _load_from_db(self, session):
+        """stocks 테이블의 기존 종목 읽기"""
+        for ticker, name, market in session.query(Stock.ticker, Stock.name, Stock.market):
+            self._names.setdefault(ticker, name)
+            self._markets.setdefault(ticker, market)
+        self._db_loaded = True
+
+    def _fetch_records(self, client: KRXClient, date_str: str) -> List[Tuple[str, str, str]]:
+        """시장별 종목 목록 + 종목명 조회 (종목명은 pykrx 로컬 조회)"""
+        records = []
+        for market in self.MARKETS:
+            for ticker in client.get_ticker_list(date_str, market):
+                records.append((ticker, client.get_ticker_name(ticker), market))
+        return records
+
+    def get_name(self, ticker: str, default: str = None) -> str:
+        """
+        종목명 조회 (메모리 조회, 네트워크 없음)
+
+        Args:
+            ticker: 종목코드
+            default: 없을 때 반환값 (기본값: 종목코드)
+        """
+        return self._names.get(ticker, default if default is not None else ticker)
+
+    def get_market(self, ticker: str) -> Optional[str]:
+        """시장 조회 (KOSPI/KOSDAQ), 없으면 None"""
+        return self._markets.get(ticker)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+# 프로세스 공유 기본 종목 마스터
+_default_ticker_master = TickerMaster()
+
+
+def get_ticker_master() -> TickerMaster:
+    """프로세스 공유 기본 종목 마스터 반환"""
+    return _default_ticker_master
@@ -0,0 +1,211 @@
+import logging
+import sys
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Set, Union
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from database.connection import Database
+from krx.client import KRXClient
+from krx.saver import DataSaver
+from models import TradingDay
+
+logger = logging.getLogger(__name__)
+
+DateLike = Union[date, datetime, str]
+
+
+def _to_date(value: DateLike) -> date:
+    """date / datetime / YYYYMMDD 문자열을 date로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, '%Y%m%d').date()
+
+
+class TradingCalendar:
+    """
+    KRX 거래일 달력
+
+    KOSPI 지수 일별 시세에 날짜가 있으면 개장일로 보고, 확인한 구간의 모든 날짜를
+    trading_calendar 테이블에 저장합니다. 처음 한 번 START_DATE부터 만들고 이후에는
+    저장된 마지막 날짜 다음 날부터만 조회하므로, 조회 함수는 대부분 네트워크 없이 답합니다.
+    - 확인하지 못한 날짜(오늘 장 마감 전, 미래, 조회 실패)는 주말만 휴장으로 간주
+    """
+
+    # 달력 시작일
+    START_DATE = date(2010, 1, 1)
+
+    # 기준 지수 (KOSPI)
+    INDEX_CODE = "1001"
+
+    # 연속 휴장 평일 최대 일수 (추석 연휴 + 임시공휴일 등)
+    MAX_HOLIDAY_WEEKDAYS = 7
+
+    def __init__(self, db: Database = None, enabled: bool = True):
+        """
+        Args:
+            db: 데이터베이스 (기본값: 기본 SQLite DB)
+            enabled: False면 DB/KRX 조회 없이 주말만 휴장으로 간주
+        """
+        self.db = db
+        self.enabled = enabled
+        self._open_days: Set[date] = set()
+        self._covered_through: Optional[date] = None  # 저장된 마지막 날짜
+        self._checked_through: Optional[date] = None  # 이번 프로세스에서 조회를 시도한 마지막 날짜
+        self._db_loaded = False
+        self._lock = threading.Lock()
+
+    def ensure(self, through: DateLike):
+        """
+        through까지 달력이 준비되도록 보장 (필요한 구간만 조회)
+
+        Args:
+            through: 기준일
+        """
+        if not self.enabled:
+            return
+
+        through = min(_to_date(through), date.today())
+        if self._checked_through is not None and through <= self._checked_through:
+            return
+
+        with self._lock:
+            if self._checked_through is not None and through <= self._checked_through:
+                return
+
+            db = self.db or Database()
+            try:
+                with db.get_session() as session:
+                    if not self._db_loaded:
+                        self._load_from_db(session)
+
+                    # 확장이 필요하면 조회 1회로 오늘까지 한꺼번에 채움
+                    start = self.START_DATE if self._covered_through is None \
+                        else self._covered_through + timedelta(days=1)
+                    if start <= through:
+                        through = date.today()
+                        self._extend(session, start, through)
+            except Exception as e:
+                logger.warning(f"거래일 달력 갱신 실패 (주말만 휴장으로 간주): {e}")
+
+            self._checked_through = through
+
+    def _load_from_db(self, session):
+        """저장된 달력 읽기 (테이블이 없으면 생성)"""
+        TradingDay.__table__.create(bind=session.get_bind(), checkfirst=True)
+
+        for day, is_open in session.query(TradingDay.date, TradingDay.is_open):
+            if is_open:
+                self._open_days.add(day)
+            if self._covered_through is None or day > self._covered_through:
+                self._covered_through = day
+        self._db_loaded = True
+
+    def _extend(self, session, start: date, through: date):
+        """start ~ through 구간 지수 시세로 개장일 확인 후 저장"""
+        df = KRXClient(session).get_index_ohlcv(
+            start.strftime('%Y%m%d'), through.strftime('%Y%m%d'), self.INDEX_CODE
+        )
+        open_days = {ts.date() for ts in df.index} if df is not None and not df.empty else set()
+
+        # 오늘은 장 마감 전이면 시세가 없을 수 있으므로 개장이 확인된 경우만 저장
+        last_closed = min(through, date.today() - timedelta(days=1))
+        days = {}
+        day = start
+        while day <= last_closed:
+            days[day] = day in open_days
+            day += timedelta(days=1)
+        if through == date.today() and through in open_days:
+            days[through] = True
+
+        if not days:
+            return
+
+        # 긴 구간이 모두 휴장이면 조회 오류로 보고 저장하지 않음 (최장 연휴보다 긴 경우)
+        weekdays = sum(1 for day in days if day.weekday() < 5)
+        if not open_days and weekdays > self.MAX_HOLIDAY_WEEKDAYS:
+            raise ValueError(f"지수 시세 없음: {start} ~ {through}")
+
+        DataSaver(session).save_trading_days(days)
+        self._open_days.update(day for day, is_open in days.items() if is_open)
+        self._covered_through = max(days)
+        logger.info(f"거래일 달력 갱신: {start} ~ {self._covered_through} (개장일 {sum(days.values())}일)")
+
+    def _is_open(self, day: date) -> bool:
+        """메모리 조회 (확인하지 못한 날짜는 평일이면 개장으로 간주)"""
+        if day in self._open_days:
+            return True
+        if self._covered_through is not None and self.START_DATE <= day <= self._covered_through:
+            return False
+        return day.weekday() < 5
+
+    def is_trading_day(self, day: DateLike) -> bool:
+        """
+        개장일 여부
+
+        Args:
+            day: 일자
+        """
+        day = _to_date(day)
+        self.ensure(day)
+        return self._is_open(day)
+
+    def previous_trading_day(self, day: DateLike) -> date:
+        """
+        day 이전(당일 제외) 마지막 개장일
+
+        Args:
+            day: 기준일
+        """
+        day = _to_date(day)
+        self.ensure(day)
+        day -= timedelta(days=1)
+        while not self._is_open(day):
+            day -= timedelta(days=1)
+        return day
+
+    def next_trading_day(self, day: DateLike) -> date:
+        """
+        day 이후(당일 포함) 첫 개장일
+
+        Args:
+            day: 기준일
+        """
+        day = _to_date(day)
+        self.ensure(day)
+        while not self._is_open(day):
+            day += timedelta(days=1)
+        return day
+
+    def trading_days_between(self, start: DateLike, end: DateLike) -> List[date]:
+        """
+        start ~ end(포함) 구간의 개장일 목록
+
+        Args:
+            start: 시작일
+            end: 종료일
+        """
+        start, end = _to_date(start), _to_date(end)
+        self.ensure(end)
+
+        days = []
+        day = start
+        while day <= end:
+            if self._is_open(day):
+                days.append(day)
+            day += timedelta(days=1)
+        return days
+
+
+# 프로세스 공유 기본 거래일 달력
+_default_calendar = TradingCalendar()
+
+
+def get_trading_calendar() -> TradingCalendar:
+    """프로세스 공유 기본 거래일 달력 반환"""
+    return _default_calendar
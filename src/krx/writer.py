@@ -0,0 +1,211 @@
+import logging
+import queue
+import sys
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, NamedTuple, Optional
+import pandas as pd
+
+# 상대 경로 처리
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+from krx.saver import DataSaver
+
+logger = logging.getLogger(__name__)
+
+
+class WriteRequest(NamedTuple):
+    """저장 요청 1건 (DataSaver 메서드 이름 + 인자)"""
+    method: str
+    args: tuple
+    rows: int
+    future: Future
+
+
+def _count_rows(args: tuple) -> int:
+    """인자 중 DataFrame의 행 수 합 (없으면 1)"""
+    rows = sum(len(arg) for arg in args if isinstance(arg, pd.DataFrame))
+    return rows or 1
+
+
+class WriteBehindWriter:
+    """
+    쓰기 지연(write-behind) 저장 스레드
+
+    조회 스레드는 submit()으로 저장 요청을 크기 제한 큐에 넣고 바로 다음 조회로 넘어가며,
+    전용 writer 스레드 하나가 큐를 비우면서 여러 종목의 요청을 모아 한 트랜잭션으로 저장합니다.
+    - 큐가 가득 차면 submit()이 대기 (대량 수집 시 메모리 사용량 제한)
+    - 배치는 batch_rows 행 또는 batch_items 건까지 모음 (큐에 남은 것만, 기다리지 않음)
+    - 배치 저장이 실패하면 요청별로 다시 저장하여 실패한 요청만 격리
+    - 세션은 writer 스레드에서 saver_factory로 만들고 그 스레드에서만 사용
+    """
+
+    # 큐에 대기할 수 있는 저장 요청 수
+    MAX_QUEUE = 64
+
+    # 배치 하나에 모을 최대 행 수 / 요청 수
+    BATCH_ROWS = 50000
+    BATCH_ITEMS = 200
+
+    def __init__(
+        self,
+        saver_factory: Callable[[], DataSaver],
+        max_queue: int = MAX_QUEUE,
+        batch_rows: int = BATCH_ROWS,
+        batch_items: int = BATCH_ITEMS
+    ):
+        """
+        Args:
+            saver_factory: writer 스레드에서 호출하여 DataSaver를 만드는 함수
+            max_queue: 큐에 대기할 수 있는 저장 요청 수
+            batch_rows: 배치 하나의 최대 행 수
+            batch_items: 배치 하나의 최대 요청 수
+        """
+        self.saver_factory = saver_factory
+        self.batch_rows = batch_rows
+        self.batch_items = batch_items
+        self._queue: "queue.Queue[Optional[WriteRequest]]" = queue.Queue(maxsize=max_queue)
+        self._stats = {'batches': 0, 'items': 0, 'rows': 0, 'failed': 0,
+                       'total_seconds': 0.0, 'max_seconds': 0.0}
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        self._saver: Optional[DataSaver] = None
+        self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> 'WriteBehindWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def submit(self, method: str, *args) -> Future:
+        """
+        저장 요청 (큐가 가득 차면 자리가 날 때까지 대기)
+
+        Args:
+            method: DataSaver 메서드 이름 (예: 'save_daily_prices')
+            *args: 메서드 인자
+
+        Returns:
+            저장 결과(메서드 반환값)를 받을 Future
+        """
+        if self._closed:
+            raise RuntimeError("이미 종료된 writer입니다")
+
+        future = Future()
+        self._queue.put(WriteRequest(method, args, _count_rows(args), future))
+        return future
+
+    def close(self):
+        """남은 요청을 모두 저장한 뒤 writer 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+        stats = self.stats()
+        if stats['batches']:
+            logger.info(
+                f"💾 저장 완료: 배치 {stats['batches']}회, 요청 {stats['items']}건, "
+                f"{stats['rows']}행 (배치 평균 {stats['avg_ms']:.0f}ms, 최대 {stats['max_ms']:.0f}ms)"
+            )
+
+    def stats(self) -> Dict[str, float]:
+        """
+        배치 저장 통계
+
+        Returns:
+            {batches, items, rows, failed, avg_ms, max_ms,
+             inserted, updated, unchanged (DataSaver 행 단위 결과)}
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats.update(self._saver.counts if self._saver is not None
+                         else {'inserted': 0, 'updated': 0, 'unchanged': 0})
+        total = stats.pop('total_seconds')
+        stats['avg_ms'] = total / stats['batches'] * 1000 if stats['batches'] else 0.0
+        stats['max_ms'] = stats.pop('max_seconds') * 1000
+        return stats
+
+    def _run(self):
+        """writer 스레드: 큐를 비우며 배치 저장"""
+        saver = None
+        try:
+            saver = self._saver = self.saver_factory()
+        except Exception as e:
+            logger.error(f"저장 세션 생성 실패: {e}")
+
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            if batch[0] is None:
+                break
+            rows = batch[0].rows
+
+            # 이미 쌓여 있는 요청만 모음 (새 요청을 기다리지 않음)
+            while len(batch) < self.batch_items and rows < self.batch_rows:
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                batch.append(request)
+                rows += request.rows
+
+            try:
+                if saver is None:
+                    raise RuntimeError("저장 세션을 만들지 못했습니다")
+                self._write_batch(saver, batch)
+            except Exception as e:
+                # writer 스레드가 죽으면 submit()이 영원히 대기하므로 요청 실패로만 처리
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+
+        if saver is not None:
+            saver.session.close()
+
+    def _write_batch(self, saver: DataSaver, batch: List[WriteRequest]):
+        """배치를 한 트랜잭션으로 저장 (실패하면 요청별로 다시 저장)"""
+        started = time.perf_counter()
+        try:
+            with saver.batch():
+                results = [getattr(saver, request.method)(*request.args) for request in batch]
+        except Exception as e:
+            logger.warning(f"배치 저장 실패, 요청별로 재시도 ({len(batch)}건): {e}")
+            results = None
+
+        if results is None:
+            results = []
+            for request in batch:
+                try:
+                    with saver.batch():
+                        results.append(getattr(saver, request.method)(*request.args))
+                except Exception as e:
+                    results.append(e)
+
+        elapsed = time.perf_counter() - started
+        failed = 0
+        for request, result in zip(batch, results):
+            if isinstance(result, Exception):
+                failed += 1
+                request.future.set_exception(result)
+            else:
+                request.future.set_result(result)
+
+        rows = sum(request.rows for request in batch)
+        with self._stats_lock:
+            self._stats['batches'] += 1
+            self._stats['items'] += len(batch)
+            self._stats['rows'] += rows
+            self._stats['failed'] += failed
+            self._stats['total_seconds'] += elapsed
+            self._stats['max_seconds'] = max(self._stats['max_seconds'], elapsed)
+
+        logger.info(f"배치 저장: 요청 {len(batch)}건, {rows}행, {elapsed * 1000:.0f}ms (실패 {failed}건)")
@@ -1,15 +1,17 @@
+import argparse
 import logging
 import sys
 import os
 from datetime import datetime, timedelta
-from pykrx import stock as pykrx_stock
 
 # src 디렉토리를 경로에 추가
 sys.path.insert(0, os.path.dirname(__file__))
 
-from database.connection import Database
-from krx.client import KRXClient
-from krx.saver import DataSaver
+from database.connection import Database, dispose_engines, set_default_profile, PROFILES
+from krx.cache import set_cache_enabled
+from krx.negative_cache import set_negative_cache_enabled
+from krx.ticker_master import get_ticker_master
+from backfill import BackfillEngine, list_market_stocks, CHUNK_DAYS, MAX_WORKERS
 
 # 로깅 설정
 logging.basicConfig(
@@ -18,110 +20,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def collect_stock_data(ticker: str, name: str, market: str, days: int = 365):
+# 기본 수집 종목
+DEFAULT_STOCKS = [
+    ('267260', 'HD현대일렉트릭', 'KOSPI'),
+    ('064350', '현대로템', 'KOSPI'),
+]
+
+def collect_stock_data(ticker: str, name: str, market: str, days: int = 365,
+                       chunk_days: int = CHUNK_DAYS) -> dict:
     """
-    종목 데이터 수집
+    종목 데이터 수집 (구간 단위 체크포인트, 중단 후 재실행 시 이어서 수집)
 
     Args:
         ticker: 종목코드
         name: 종목명
         market: 시장 (KOSPI/KOSDAQ)
         days: 수집 기간 (일)
+        chunk_days: 한 번에 조회할 구간 길이 (일)
+
+    Returns:
+        백필 결과 딕셔너리 (BackfillEngine.run 참고)
     """
-    # 날짜 계산
-    end_date = datetime.now()
+    end_date = datetime.now().date()
     start_date = end_date - timedelta(days=days)
 
-    start_str = start_date.strftime('%Y%m%d')
-    end_str = end_date.strftime('%Y%m%d')
-
     logger.info(f"{'=' * 60}")
     logger.info(f"종목: {name} ({ticker})")
-    logger.info(f"기간: {start_str} ~ {end_str}")
+    logger.info(f"기간: {start_date:%Y%m%d} ~ {end_date:%Y%m%d}")
     logger.info(f"{'=' * 60}")
 
-    # 데이터베이스 연결
     db = Database()
     db.create_tables()
 
-    with db.get_session() as session:
-        # 클라이언트 및 저장 객체 생성
-        krx_client = KRXClient(session)
-        saver = DataSaver(session)
-
-        # 1. 종목 정보 저장
-        saver.save_stock(ticker, name, market)
-
-        try:
-            # 2. OHLCV 데이터 수집 및 저장
-            logger.info("1/6: OHLCV 데이터 수집 중...")
-            ohlcv_df = krx_client.get_ohlcv(ticker, start_str, end_str)
-            saver.save_daily_prices(ticker, ohlcv_df)
-
-            # 3. 시가총액 데이터 수집 및 저장
-            logger.info("2/6: 시가총액 데이터 수집 중...")
-            cap_df = krx_client.get_market_cap(ticker, start_str, end_str)
-            saver.save_market_caps(ticker, cap_df)
-
-            # 4. 펀더멘탈 데이터 수집 및 저장
-            logger.info("3/6: 펀더멘탈 데이터 수집 중...")
-            fund_df = krx_client.get_fundamental(ticker, start_str, end_str)
-            saver.save_fundamentals(ticker, fund_df)
+    engine = BackfillEngine(db, chunk_days=chunk_days)
+    result = engine.run([(ticker, name, market)], start_date, end_date)
+    if result['failed'] == 0 and not result['interrupted']:
+        logger.info(f"✓ {name} ({ticker}) 데이터 수집 완료")
+    return result
 
-            # 5. 투자자별 매매 동향 수집 및 저장
-            logger.info("4/6: 투자자별 매매 동향 수집 중...")
-            trading_df = krx_client.get_trading_by_investor(ticker, start_str, end_str)
-            saver.save_trading_by_investor(ticker, trading_df)
 
-            # 6. 공매도 데이터 수집 및 저장
-            logger.info("5/6: 공매도 데이터 수집 중...")
-            short_df = krx_client.get_short_selling_volume(ticker, start_str, end_str)
-            saver.save_short_selling(ticker, short_df)
+def _parse_date(value: str):
+    return datetime.strptime(value, '%Y%m%d').date()
 
-            # 7. 공매도 잔고 수집 및 저장
-            logger.info("6/6: 공매도 잔고 수집 중...")
-            balance_df = krx_client.get_short_balance(ticker, start_str, end_str)
-            saver.save_short_balance(ticker, balance_df)
-
-            logger.info(f"✓ {name} ({ticker}) 데이터 수집 완료")
-
-        except Exception as e:
-            logger.error(f"✗ 데이터 수집 실패: {e}", exc_info=True)
-            raise
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(
+        description='장기 구간 데이터 백필 (중단 후 다시 실행하면 완료된 구간은 건너뜀)'
+    )
+
+    target_group = parser.add_mutually_exclusive_group()
+    target_group.add_argument(
+        '--tickers',
+        nargs='+',
+        default=None,
+        help='수집할 종목코드 (기본값: HD현대일렉트릭, 현대로템)'
+    )
+    target_group.add_argument(
+        '--all',
+        action='store_true',
+        dest='all_market',
+        help='종료일 기준 KOSPI/KOSDAQ 전 종목 수집'
+    )
+
+    parser.add_argument(
+        '--start',
+        type=_parse_date,
+        default=None,
+        help='시작일 (YYYYMMDD), 생략 시 종료일 기준 --days 이전'
+    )
+    parser.add_argument(
+        '--end',
+        type=_parse_date,
+        default=None,
+        help='종료일 (YYYYMMDD), 생략 시 오늘'
+    )
+    parser.add_argument(
+        '--days',
+        type=int,
+        default=365,
+        help='--start 생략 시 수집 기간 (일, 기본값: 365)'
+    )
+    parser.add_argument(
+        '--chunk-days',
+        type=int,
+        default=CHUNK_DAYS,
+        help=f'한 번에 조회할 구간 길이 (일, 기본값: {CHUNK_DAYS})'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=MAX_WORKERS,
+        help=f'동시에 조회할 구간 수 (기본값: {MAX_WORKERS})'
+    )
+    parser.add_argument(
+        '--reset',
+        action='store_true',
+        help='대상 종목의 체크포인트를 지우고 처음부터 다시 수집'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='KRX 응답 디스크 캐시와 빈 결과 캐시를 사용하지 않음'
+    )
+    parser.add_argument(
+        '--db-profile',
+        choices=list(PROFILES),
+        default=None,
+        help='SQLite 성능 프로필 (대량 백필은 bulk_load 권장)'
+    )
+
+    args = parser.parse_args()
+
+    if args.no_cache:
+        set_cache_enabled(False)
+        set_negative_cache_enabled(False)
+    if args.db_profile:
+        set_default_profile(args.db_profile)
+
+    end_date = args.end or datetime.now().date()
+    start_date = args.start or end_date - timedelta(days=args.days)
+    if start_date > end_date:
+        parser.error(f"시작일이 종료일보다 늦습니다: {start_date} > {end_date}")
+
+    db = Database()
+    db.create_tables()
 
-    # 테스트 종목 정보
-    stocks = [
-        {
-            'ticker': '267260',
-            'name': 'HD현대일렉트릭',
-            'market': 'KOSPI'
-        },
-        {
-            'ticker': '064350',
-            'name': '현대로템',
-            'market': 'KOSPI'
-        }
-    ]
-
-    # 각 종목별 데이터 수집 (최근 1년)
-    for stock_info in stocks:
-        try:
-            collect_stock_data(
-                ticker=stock_info['ticker'],
-                name=stock_info['name'],
-                market=stock_info['market'],
-                days=365  # 1년
-            )
-        except Exception as e:
-            logger.error(f"종목 처리 실패: {stock_info['name']} - {e}")
-            continue
+    if args.all_market:
+        stocks = list_market_stocks(end_date.strftime('%Y%m%d'))
+    elif args.tickers:
+        master = get_ticker_master()
+        master.ensure(end_date.strftime('%Y%m%d'))
+        unknown = [ticker for ticker in args.tickers if master.get_market(ticker) is None]
+        if unknown:
+            parser.error(f"종목 마스터에 없는 종목코드: {', '.join(unknown)}")
+        stocks = [
+            (ticker, master.get_name(ticker), master.get_market(ticker))
+            for ticker in args.tickers
+        ]
+    else:
+        stocks = DEFAULT_STOCKS
+
+    engine = BackfillEngine(db, chunk_days=args.chunk_days, max_workers=args.workers)
+    if args.reset:
+        engine.reset([ticker for ticker, _, _ in stocks])
+
+    try:
+        result = engine.run(stocks, start_date, end_date)
+    finally:
+        dispose_engines()
 
     logger.info("=" * 60)
-    logger.info("전체 데이터 수집 완료")
+    logger.info(f"백필 결과: 전체 {result['total']}구간, 이전 실행 완료 {result['skipped']}구간, "
+                f"이번 저장 {result['completed']}구간, 실패 {result['failed']}구간, {result['rows']}행")
+    for error in result['errors'][:20]:
+        logger.error(f"  ✗ {error}")
     logger.info("=" * 60)
 
+    if result['interrupted']:
+        sys.exit(130)
+    if result['failed']:
+        sys.exit(1)
+
 if __name__ == '__main__':
     main()
@@ -5,6 +5,11 @@ from .fundamental import Fundamental
 from .trading_by_investor import TradingByInvestor
 from .short_selling import ShortSelling
 from .short_balance import ShortBalance
+from .trading_calendar import TradingDay
+from .empty_response import EmptyResponse
+from .backfill_checkpoint import BackfillCheckpoint
+from .schema_version import SchemaVersion
+from .data_coverage import DataCoverage, DATASET_MODELS
 
 __all__ = [
     'Base',
@@ -15,4 +20,10 @@ __all__ = [
     'TradingByInvestor',
     'ShortSelling',
     'ShortBalance',
+    'TradingDay',
+    'EmptyResponse',
+    'BackfillCheckpoint',
+    'SchemaVersion',
+    'DataCoverage',
+    'DATASET_MODELS',
 ]
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Date, Integer, DateTime
+from .stock import Base
+from datetime import datetime
+
+class BackfillCheckpoint(Base):
+    __tablename__ = 'backfill_checkpoints'
+
+    # 컬럼 정의 (저장까지 끝난 백필 구간, 데이터와 같은 트랜잭션으로 기록)
+    ticker = Column(String(10), primary_key=True, comment='종목코드')
+    dataset = Column(String(20), primary_key=True, comment='데이터셋 키')
+    start_date = Column(Date, primary_key=True, comment='구간 시작일')
+    end_date = Column(Date, primary_key=True, comment='구간 종료일')
+    rows = Column(Integer, nullable=False, default=0, comment='조회된 행 수')
+    completed_at = Column(DateTime, nullable=False, default=datetime.now, comment='완료일시')
+
+    def __repr__(self):
+        return (
+            f"<BackfillCheckpoint(ticker='{self.ticker}', dataset='{self.dataset}', "
+            f"{self.start_date}~{self.end_date}, rows={self.rows})>"
+        )
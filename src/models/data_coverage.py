@@ -0,0 +1,43 @@
+from sqlalchemy import Column, String, Integer, DateTime, Index
+from .stock import Base
+from .types import TradeDate
+from .daily_price import DailyPrice
+from .market_cap import MarketCap
+from .fundamental import Fundamental
+from .trading_by_investor import TradingByInvestor
+from .short_selling import ShortSelling
+from .short_balance import ShortBalance
+from datetime import datetime
+
+# 데이터셋 키 -> 저장 테이블 (data_fetcher.DATASETS의 결과 키와 동일)
+DATASET_MODELS = {
+    'daily_price': DailyPrice,
+    'market_cap': MarketCap,
+    'fundamental': Fundamental,
+    'trading': TradingByInvestor,
+    'short_selling': ShortSelling,
+    'short_balance': ShortBalance,
+}
+
+class DataCoverage(Base):
+    __tablename__ = 'data_coverage'
+
+    # 컬럼 정의 (종목/데이터셋별 보유 구간, DataSaver가 저장과 같은 트랜잭션으로 갱신)
+    # 일자는 원본 테이블과 같은 형식으로 저장 (INSERT ... SELECT로 그대로 복사)
+    ticker = Column(String(10), primary_key=True, comment='종목코드')
+    dataset = Column(String(20), primary_key=True, comment='데이터셋 키')
+    min_date = Column(TradeDate, nullable=False, comment='최초 일자')
+    max_date = Column(TradeDate, nullable=False, comment='최근 일자')
+    row_count = Column(Integer, nullable=False, default=0, comment='행 수')
+    checked_from = Column(TradeDate, nullable=True, comment='조회를 마친 시작일 (데이터가 없던 앞쪽 구간 포함)')
+    last_ingested_at = Column(DateTime, nullable=False, default=datetime.now, comment='마지막 저장일시')
+
+    __table_args__ = (
+        Index('idx_data_coverage_dataset_max', 'dataset', 'max_date'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<DataCoverage(ticker='{self.ticker}', dataset='{self.dataset}', "
+            f"{self.min_date}~{self.max_date}, rows={self.row_count})>"
+        )
@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, Date, DateTime, Index
+from .stock import Base
+from datetime import datetime
+
+class EmptyResponse(Base):
+    __tablename__ = 'empty_responses'
+
+    # 컬럼 정의 (빈 결과가 확인된 조회 키, expires_at 이후 다시 조회)
+    endpoint = Column(String(50), primary_key=True, comment='조회 함수 이름')
+    ticker = Column(String(10), primary_key=True, comment='종목코드')
+    start_date = Column(Date, primary_key=True, comment='조회 시작일')
+    end_date = Column(Date, primary_key=True, comment='조회 종료일')
+    checked_at = Column(DateTime, nullable=False, default=datetime.now, comment='확인일시')
+    expires_at = Column(DateTime, nullable=False, comment='만료일시')
+
+    __table_args__ = (
+        Index('idx_empty_responses_expires', 'expires_at'),
+    )
+
+    def __repr__(self):
+        return (
+            f"<EmptyResponse(endpoint='{self.endpoint}', ticker='{self.ticker}', "
+            f"{self.start_date}~{self.end_date}, expires_at='{self.expires_at}')>"
+        )
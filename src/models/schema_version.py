@@ -0,0 +1,14 @@
+from sqlalchemy import Column, String, Integer, DateTime
+from .stock import Base
+from datetime import datetime
+
+class SchemaVersion(Base):
+    __tablename__ = 'schema_version'
+
+    # 컬럼 정의 (적용이 끝난 마이그레이션, database.migrations.MIGRATIONS 참고)
+    version = Column(Integer, primary_key=True, autoincrement=False, comment='마이그레이션 번호')
+    name = Column(String(100), nullable=False, comment='마이그레이션 이름')
+    applied_at = Column(DateTime, nullable=False, default=datetime.now, comment='적용일시')
+
+    def __repr__(self):
+        return f"<SchemaVersion(version={self.version}, name='{self.name}', applied_at='{self.applied_at}')>"
@@ -1,23 +1,18 @@
-from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey
 from .stock import Base
-from datetime import datetime
+from .types import TradeDate
 
 class ShortSelling(Base):
     __tablename__ = 'short_selling'
 
-    # 컬럼 정의
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    ticker = Column(String(10), ForeignKey('stocks.ticker'), nullable=False, comment='종목코드')
-    date = Column(Date, nullable=False, comment='거래일자')
+    # 컬럼 정의 (PK: ticker + date, SQLite는 WITHOUT ROWID로 PK 순서대로 저장)
+    ticker = Column(String(10), ForeignKey('stocks.ticker'), primary_key=True, comment='종목코드')
+    date = Column(TradeDate, primary_key=True, comment='거래일자')
     short_volume = Column(BigInteger, nullable=True, comment='공매도 거래량')
     short_value = Column(BigInteger, nullable=True, comment='공매도 거래대금 (원)')
-    created_at = Column(DateTime, default=datetime.now, comment='등록일시')
+    updated_at = Column(DateTime, nullable=True, comment='수정일시 (값이 바뀐 경우만)')
 
-    # 제약조건 및 인덱스
-    __table_args__ = (
-        UniqueConstraint('ticker', 'date', name='uq_ticker_date_short'),
-        Index('idx_ticker_date_short', 'ticker', 'date'),
-    )
+    __table_args__ = {'sqlite_with_rowid': False}
 
     def __repr__(self):
         return f"<ShortSelling(ticker='{self.ticker}', date='{self.date}', short_volume={self.short_volume})>"
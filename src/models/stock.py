@@ -13,6 +13,7 @@ class Stock(Base):
     market = Column(String(20), nullable=False, comment='시장구분 (KOSPI/KOSDAQ)')
     created_at = Column(DateTime, default=datetime.now, comment='등록일시')
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, comment='수정일시')
+    delisted_at = Column(DateTime, nullable=True, comment='상장폐지 감지일시 (전 종목 목록에서 빠진 시점)')
 
     # 인덱스
     __table_args__ = (
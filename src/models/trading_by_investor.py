@@ -1,14 +1,13 @@
-from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy import Column, String, BigInteger, DateTime, ForeignKey, Index
 from .stock import Base
-from datetime import datetime
+from .types import TradeDate
 
 class TradingByInvestor(Base):
     __tablename__ = 'trading_by_investor'
 
-    # 컬럼 정의
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    ticker = Column(String(10), ForeignKey('stocks.ticker'), nullable=False, comment='종목코드')
-    date = Column(Date, nullable=False, comment='거래일자')
+    # 컬럼 정의 (PK: ticker + date, SQLite는 WITHOUT ROWID로 PK 순서대로 저장)
+    ticker = Column(String(10), ForeignKey('stocks.ticker'), primary_key=True, comment='종목코드')
+    date = Column(TradeDate, primary_key=True, comment='거래일자')
 
     # 매매 주체별 순매수 금액 (단위: 원)
     institution_net = Column(BigInteger, nullable=True, comment='기관 순매수')
@@ -22,13 +21,12 @@ class TradingByInvestor(Base):
     private_equity_net = Column(BigInteger, nullable=True, comment='사모 순매수')
     pension_net = Column(BigInteger, nullable=True, comment='연기금 순매수')
 
-    created_at = Column(DateTime, default=datetime.now, comment='등록일시')
+    updated_at = Column(DateTime, nullable=True, comment='수정일시 (값이 바뀐 경우만)')
 
-    # 제약조건 및 인덱스
+    # 인덱스
     __table_args__ = (
-        UniqueConstraint('ticker', 'date', name='uq_ticker_date_trading'),
-        Index('idx_ticker_date_trading', 'ticker', 'date'),
         Index('idx_foreigner_net', 'foreigner_net'),
+        {'sqlite_with_rowid': False},
     )
 
     def __repr__(self):
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Boolean, Date, DateTime
+from .stock import Base
+from datetime import datetime
+
+class TradingDay(Base):
+    __tablename__ = 'trading_calendar'
+
+    # 컬럼 정의 (확인된 구간의 모든 날짜를 저장, 휴장일은 is_open=False)
+    date = Column(Date, primary_key=True, comment='일자')
+    is_open = Column(Boolean, nullable=False, comment='개장 여부')
+    created_at = Column(DateTime, default=datetime.now, comment='등록일시')
+
+    def __repr__(self):
+        return f"<TradingDay(date='{self.date}', is_open={self.is_open})>"
@@ -0,0 +1,35 @@
+from sqlalchemy import Date, Integer
+from sqlalchemy.types import TypeDecorator
+from datetime import date, datetime
+
+
+class TradeDate(TypeDecorator):
+    """
+    거래일자 컬럼 타입 (파이썬에서는 항상 date)
+
+    저장 형식은 연결된 DB의 레이아웃을 따릅니다.
+    - 기본: DATE ('YYYY-MM-DD' 문자열, SQLite 10바이트)
+    - 정수 일자: YYYYMMDD 정수 (SQLite 4바이트, 비교/정렬이 정수 연산)
+      daily_price.date 컬럼이 INTEGER로 선언된 DB면 엔진 생성 시 dialect.integer_dates가 켜짐
+      (database.migrations.INTEGER_DATES_MIGRATION 참고)
+    """
+
+    impl = Date
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if getattr(dialect, 'integer_dates', False):
+            return dialect.type_descriptor(Integer())
+        return dialect.type_descriptor(Date())
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not getattr(dialect, 'integer_dates', False):
+            return value
+        return value.year * 10000 + value.month * 100 + value.day
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, date):
+            return value
+        if isinstance(value, int):
+            return date(value // 10000, value // 100 % 100, value % 100)
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
@@ -18,7 +18,8 @@ class DailyReport:
 
     def __init__(self):
         self.market_summary = MarketSummary()
-        self.db = Database()
+        # 리포트는 조회만 하므로 쓰기 금지 + 큰 캐시/mmap 프로필 사용
+        self.db = Database(profile='read_only')
 
     def format_number(self, num):
         """숫자 포맷팅 (천 단위 콤마)"""
@@ -121,15 +122,19 @@ class DailyReport:
         date_obj = datetime.strptime(date_str, '%Y%m%d').date()
 
         with self.db.get_session() as session:
-            # 모든 등록된 종목
+            # 모든 등록된 종목 (종목 수와 관계없이 쿼리 4회)
             stocks = StockQueries.get_all_stocks(session)
+            latest_prices = StockQueries.get_latest_prices(session, [stock.ticker for stock in stocks])
+            tickers = [ticker for ticker, latest in latest_prices.items() if latest.date == date_obj]
+            foreign_flows = StockQueries.get_recent_investor_flows(session, tickers, 5, date_obj) if tickers else {}
+            fundamentals = StockQueries.get_latest_fundamentals_as_of(session, tickers, date_obj) if tickers else {}
 
             for stock in stocks:
                 ticker = stock.ticker
                 name = stock.name
 
                 # 최근 주가
-                latest = StockQueries.get_latest_price(session, ticker)
+                latest = latest_prices.get(ticker)
                 if latest and latest.date == date_obj:
                     등락률 = ((latest.close - latest.open) / latest.open * 100)
 
@@ -139,7 +144,7 @@ class DailyReport:
                     report = report + f"거래량: {self.format_number(latest.volume)}\n"
 
                     # 외국인 순매수 (최근 5일)
-                    foreign = StockQueries.get_foreign_net_buying_days(session, ticker, 5)
+                    foreign = foreign_flows.get(ticker)
                     if foreign:
                         report = report + f"  외국인 순매수 (최근 5일):\n"
                         for f in foreign:
@@ -148,18 +153,16 @@ class DailyReport:
                                 report = report + f"    {f.date}: {외국인억:,.1f}억\n"
 
                     # 펀더멘탈
-                    fundamentals = StockQueries.get_fundamentals(session, ticker)
-                    if fundamentals:
-                        latest_fund = fundamentals[-1]
-                        if latest_fund.date == date_obj:
-                            report = report + f"  펀더멘탈: "
-                            if latest_fund.per:
-                                report = report + f"PER {latest_fund.per:.2f}  "
-                            if latest_fund.pbr:
-                                report = report + f"PBR {latest_fund.pbr:.2f}  "
-                            if latest_fund.eps:
-                                report = report + f"EPS {self.format_number(latest_fund.eps)}원"
-                            report = report + "\n"
+                    latest_fund = fundamentals.get(ticker)
+                    if latest_fund and latest_fund.date == date_obj:
+                        report = report + f"  펀더멘탈: "
+                        if latest_fund.per:
+                            report = report + f"PER {latest_fund.per:.2f}  "
+                        if latest_fund.pbr:
+                            report = report + f"PBR {latest_fund.pbr:.2f}  "
+                        if latest_fund.eps:
+                            report = report + f"EPS {self.format_number(latest_fund.eps)}원"
+                        report = report + "\n"
 
                     report = report + "\n"
 
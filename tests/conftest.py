@@ -49,6 +49,21 @@ def test_database():
     db.drop_tables()
 
 
+@pytest.fixture
+def db_url(tmp_path):
+    """임시 파일 DB URL"""
+    return f"sqlite:///{tmp_path / 'test.db'}"
+
+
+@pytest.fixture
+def file_database(db_url):
+    """Database 인스턴스 (파일 DB - 다른 스레드/연결에서도 같은 DB를 봄)"""
+    db = Database(db_url=db_url)
+    db.create_tables()
+    yield db
+    db.dispose()
+
+
 # ============================================================================
 # 샘플 데이터 픽스처
 # ============================================================================
@@ -76,6 +91,24 @@ def sample_ohlcv_df():
     }, index=dates)
 
 
+@pytest.fixture
+def make_prices():
+    """
+    일별 주가(OHLCV) DataFrame 생성 함수
+
+    start부터 매일 days일치 (end를 주면 end까지) 같은 값으로 채웁니다.
+    """
+    def make(start='2024-01-01', days: int = 5, end=None) -> pd.DataFrame:
+        if end is None:
+            index = pd.date_range(start, periods=days, freq='D')
+        else:
+            index = pd.date_range(start, end, freq='D')
+        return pd.DataFrame({
+            '시가': 70000, '고가': 71000, '저가': 69000, '종가': 70500, '거래량': 1000
+        }, index=index)
+    return make
+
+
 @pytest.fixture
 def sample_market_cap_df():
     """샘플 시가총액 DataFrame"""
@@ -174,3 +207,35 @@ def weekend_date():
 def mock_time_sleep(mocker):
     """time.sleep mock (자동 적용 - 테스트 속도 향상)"""
     return mocker.patch('time.sleep', return_value=None)
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_state():
+    """공유 재시도기의 차단기/통계 초기화 (자동 적용 - 테스트 간 실패 누적 방지)"""
+    from krx.client import KRXClient
+    KRXClient.shared_retrier.reset()
+    yield
+    KRXClient.shared_retrier.reset()
+
+
+@pytest.fixture(autouse=True)
+def disable_trading_calendar(mocker):
+    """거래일 달력 DB/KRX 조회 비활성화 (자동 적용 - 주말만 휴장으로 간주)"""
+    from krx.trading_calendar import TradingCalendar
+    calendar = TradingCalendar(enabled=False)
+    mocker.patch('krx.trading_calendar._default_calendar', calendar)
+    return calendar
+
+
+@pytest.fixture(autouse=True)
+def disable_response_cache(mocker):
+    """KRX 응답 디스크 캐시 비활성화 (자동 적용 - mock 응답이 캐시되지 않도록)"""
+    from krx.cache import ResponseCache
+    mocker.patch('krx.cache._default_cache', ResponseCache(enabled=False))
+
+
+@pytest.fixture(autouse=True)
+def disable_negative_cache(mocker):
+    """빈 결과 캐시 비활성화 (자동 적용 - 기본 DB에 기록하지 않도록)"""
+    from krx.negative_cache import NegativeCache
+    mocker.patch('krx.negative_cache._default_negative_cache', NegativeCache(enabled=False))
@@ -0,0 +1,153 @@
+"""
+AsyncKRXClient 클래스 테스트
+"""
+
+import asyncio
+import threading
+import pytest
+import pandas as pd
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.async_client import AsyncKRXClient
+from krx.client import KRXClient
+from krx.rate_limiter import TokenBucket
+from krx.retry import Retrier, RetryPolicy
+from krx.negative_cache import NegativeCache
+
+
+@pytest.fixture
+def mock_stock(mocker):
+    """pykrx stock 모듈 모킹"""
+    return mocker.patch('krx.async_client.stock')
+
+
+@pytest.fixture
+def make_client():
+    """호출 제한/재시도 대기 없는 클라이언트 생성"""
+    clients = []
+
+    def factory(**kwargs):
+        kwargs.setdefault('rate_limiter', TokenBucket(rate=1000.0, capacity=1000.0))
+        kwargs.setdefault('retrier', Retrier(RetryPolicy(base_delay=0, jitter=0)))
+        client = AsyncKRXClient(**kwargs)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+class TestAsyncKRXClient:
+    """AsyncKRXClient 클래스 테스트"""
+
+    def test_same_method_surface(self, mock_stock, make_client, sample_ohlcv_df, weekday_date):
+        """KRXClient와 같은 메서드/인자로 조회"""
+        mock_stock.get_market_ohlcv.return_value = sample_ohlcv_df
+        mock_stock.get_market_ticker_name.return_value = '삼성전자'
+        client = make_client()
+
+        async def run():
+            return (
+                await client.get_ohlcv('005930', weekday_date, weekday_date),
+                await client.get_ticker_name('005930'),
+            )
+
+        df, name = asyncio.run(run())
+
+        assert len(df) == 5
+        assert name == '삼성전자'
+        mock_stock.get_market_ohlcv.assert_called_once_with(weekday_date, weekday_date, '005930')
+
+    def test_concurrency_bounded(self, mock_stock, make_client, sample_ohlcv_df):
+        """동시에 진행 중인 pykrx 호출은 max_concurrency개 이하"""
+        in_flight = {'now': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def slow_call(*args):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight['now'] -= 1
+            return sample_ohlcv_df
+
+        mock_stock.get_market_ohlcv.side_effect = slow_call
+        client = make_client(max_concurrency=3)
+
+        async def run():
+            return await asyncio.gather(*(
+                client.get_ohlcv(f"{i:06d}", '20240101', '20240105') for i in range(20)
+            ))
+
+        results = asyncio.run(run())
+
+        assert len(results) == 20
+        assert 1 < in_flight['max'] <= 3
+
+    def test_retries_transient_error(self, mock_stock, make_client, sample_ohlcv_df):
+        """일시 오류는 재시도 후 성공"""
+        mock_stock.get_market_ohlcv.side_effect = [ConnectionError("끊김"), sample_ohlcv_df]
+        client = make_client()
+
+        df = asyncio.run(client.get_ohlcv('005930', '20240101', '20240105'))
+
+        assert not df.empty
+        assert mock_stock.get_market_ohlcv.call_count == 2
+
+    def test_short_balance_empty_cached(self, mock_stock, make_client, test_database):
+        """공매도 빈 결과는 빈 결과 캐시에 기록되어 다시 조회하지 않음"""
+        mock_stock.get_shorting_balance_by_date.__name__ = 'get_shorting_balance_by_date'
+        mock_stock.get_shorting_balance_by_date.return_value = pd.DataFrame()
+        client = make_client(negative_cache=NegativeCache(test_database))
+
+        async def run():
+            for _ in range(3):
+                assert (await client.get_short_balance('005930', '20240101', '20240105')).empty
+
+        asyncio.run(run())
+
+        assert mock_stock.get_shorting_balance_by_date.call_count == 1
+
+    def test_short_selling_no_data_returns_empty(self, mock_stock, make_client):
+        """공매도 데이터 없음(영구 오류) 시 빈 DataFrame"""
+        mock_stock.get_shorting_volume_by_date.side_effect = KeyError("데이터 없음")
+        client = make_client()
+
+        df = asyncio.run(client.get_short_selling_volume('005930', '20240101', '20240105'))
+
+        assert df.empty
+
+    def test_short_selling_transient_failure_raises(self, mock_stock, make_client):
+        """공매도 일시 오류는 빈 DataFrame이 아니라 예외"""
+        mock_stock.get_shorting_volume_by_date.side_effect = ConnectionError("연결 끊김")
+        client = make_client()
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(client.get_short_selling_volume('005930', '20240101', '20240105'))
+
+    def test_uses_shared_rate_limiter(self):
+        """기본 호출 제한기/재시도기는 동기 클라이언트와 공유"""
+        client = AsyncKRXClient()
+        try:
+            assert client.rate_limiter is KRXClient.shared_rate_limiter
+            assert client.retrier is KRXClient.shared_retrier
+        finally:
+            client.close()
+
+    def test_sync_client_stays_synchronous(self, mocker, make_client, sample_ohlcv_df):
+        """상속하지 않으므로 함께 쓰는 동기 클라이언트의 조회는 코루틴이 아닌 결과를 반환"""
+        mocker.patch('krx.client.stock').get_market_ohlcv.return_value = sample_ohlcv_df
+        client = make_client()
+
+        assert not isinstance(client, KRXClient)
+        assert len(client.sync_client.get_ohlcv('005930', '20240101', '20240105')) == 5
+
+    def test_invalid_concurrency(self):
+        """max_concurrency는 1 이상"""
+        with pytest.raises(ValueError):
+            AsyncKRXClient(max_concurrency=0)
@@ -0,0 +1,234 @@
+"""
+BackfillEngine 테스트
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import backfill
+from backfill import BackfillEngine, BackfillProgress, list_market_stocks, split_range
+from krx.ticker_master import TickerMaster
+from models import BackfillCheckpoint, DailyPrice, Stock
+
+
+STOCKS = [('005930', '삼성전자', 'KOSPI')]
+
+
+@pytest.fixture
+def make_ohlcv(make_prices):
+    """조회 구간의 매일 데이터 (KRXClient.get_ohlcv 대역)"""
+    return lambda ticker, start_str, end_str: make_prices(start_str, end=end_str)
+
+
+@pytest.fixture
+def client(make_ohlcv):
+    client = MagicMock()
+    client.get_ohlcv.side_effect = make_ohlcv
+    return client
+
+
+def make_engine(db, client, **kwargs) -> BackfillEngine:
+    kwargs.setdefault('chunk_days', 10)
+    return BackfillEngine(db, client=client, datasets=['daily_price'], max_workers=1, **kwargs)
+
+
+class TestSplitRange:
+    """split_range 함수 테스트"""
+
+    def test_splits_into_chunks(self):
+        """구간 길이 단위로 나누고 마지막 구간은 종료일까지"""
+        chunks = split_range(date(2024, 1, 1), date(2024, 1, 25), 10)
+
+        assert chunks == [
+            (date(2024, 1, 1), date(2024, 1, 10)),
+            (date(2024, 1, 11), date(2024, 1, 20)),
+            (date(2024, 1, 21), date(2024, 1, 25)),
+        ]
+
+    def test_single_day(self):
+        """시작일 = 종료일이면 구간 하나"""
+        assert split_range(date(2024, 1, 1), date(2024, 1, 1), 10) == [
+            (date(2024, 1, 1), date(2024, 1, 1))
+        ]
+
+    def test_invalid_chunk_days(self):
+        """구간 길이가 1 미만이면 ValueError"""
+        with pytest.raises(ValueError):
+            split_range(date(2024, 1, 1), date(2024, 1, 2), 0)
+
+
+class TestBackfillProgress:
+    """BackfillProgress 클래스 테스트"""
+
+    def test_eta_from_measured_rate(self):
+        """처리량(구간/초)으로 남은 시간 계산"""
+        now = [0.0]
+        progress = BackfillProgress(10, clock=lambda: now[0])
+
+        assert progress.eta_seconds is None
+
+        now[0] = 4.0
+        progress.advance(rows=100)
+        progress.advance(rows=100)
+
+        assert progress.rate == pytest.approx(0.5)
+        assert progress.eta_seconds == pytest.approx(16.0)
+        assert '2/10' in progress.render()
+        assert '16s' in progress.render()
+
+
+class TestBackfillEngine:
+    """BackfillEngine 클래스 테스트"""
+
+    def test_saves_chunks_and_checkpoints(self, file_database, client):
+        """구간별로 조회하여 데이터와 체크포인트 저장"""
+        engine = make_engine(file_database, client)
+
+        result = engine.run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        assert result['total'] == 3
+        assert result['completed'] == 3
+        assert result['rows'] == 25
+        assert client.get_ohlcv.call_count == 3
+        with file_database.get_session() as session:
+            assert session.query(Stock).count() == 1
+            assert session.query(DailyPrice).count() == 25
+            assert session.query(BackfillCheckpoint).count() == 3
+
+    def test_resume_skips_completed_chunks(self, file_database, client):
+        """다시 실행하면 완료된 구간은 조회하지 않음"""
+        make_engine(file_database, client).run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+        client.get_ohlcv.reset_mock()
+
+        result = make_engine(file_database, client).run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        assert result['skipped'] == 3
+        assert result['completed'] == 0
+        client.get_ohlcv.assert_not_called()
+
+    def test_checkpoint_covers_smaller_chunks(self, file_database, client):
+        """구간 길이를 바꿔도 이전 체크포인트가 포함하는 구간은 건너뜀"""
+        make_engine(file_database, client, chunk_days=30).run(STOCKS, date(2024, 1, 1), date(2024, 1, 30))
+
+        chunks = make_engine(file_database, client, chunk_days=10).pending_chunks(
+            ['005930'], date(2024, 1, 1), date(2024, 2, 9)
+        )
+
+        assert [(c.start_date, c.end_date) for c in chunks] == [(date(2024, 1, 31), date(2024, 2, 9))]
+
+    def test_failed_chunk_retried_on_next_run(self, file_database, client, make_ohlcv):
+        """조회에 실패한 구간은 체크포인트가 없어 다음 실행에서 다시 수집"""
+        def flaky(ticker, start_str, end_str):
+            if start_str == '20240111':
+                raise ConnectionError("timeout")
+            return make_ohlcv(ticker, start_str, end_str)
+
+        client.get_ohlcv.side_effect = flaky
+        result = make_engine(file_database, client).run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        assert result['completed'] == 2
+        assert result['failed'] == 1
+        assert len(result['errors']) == 1
+
+        client.get_ohlcv.side_effect = make_ohlcv
+        client.get_ohlcv.reset_mock()
+        result = make_engine(file_database, client).run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        client.get_ohlcv.assert_called_once_with('005930', '20240111', '20240120')
+        assert result['completed'] == 1
+
+    def test_recent_chunk_not_checkpointed(self, file_database, client):
+        """최근 구간은 저장만 하고 체크포인트를 남기지 않음 (늦은 공시 재수집)"""
+        today = date.today()
+        engine = make_engine(file_database, client, chunk_days=1, settle_days=3)
+
+        engine.run(STOCKS, today, today)
+
+        with file_database.get_session() as session:
+            assert session.query(DailyPrice).count() == 1
+            assert session.query(BackfillCheckpoint).count() == 0
+
+    def test_interrupt_keeps_finished_chunks(self, file_database, client, mocker):
+        """Ctrl-C로 중단해도 이미 조회한 구간은 저장하고 체크포인트 기록"""
+        mocker.patch.object(backfill, 'wait', side_effect=KeyboardInterrupt)
+
+        result = make_engine(file_database, client, chunk_days=5).run(
+            STOCKS, date(2024, 1, 1), date(2024, 1, 25)
+        )
+
+        # 작업자 1개 → 최대 2구간 제출 후 중단 (시작 전 구간은 취소)
+        assert result['interrupted'] is True
+        assert 1 <= result['completed'] <= 2
+        with file_database.get_session() as session:
+            assert session.query(BackfillCheckpoint).count() == result['completed']
+
+        completed = result['completed']
+        client.get_ohlcv.reset_mock()
+        mocker.stopall()
+        result = make_engine(file_database, client, chunk_days=5).run(
+            STOCKS, date(2024, 1, 1), date(2024, 1, 25)
+        )
+        assert result['skipped'] == completed
+        assert client.get_ohlcv.call_count == 5 - completed
+
+    def test_reset_clears_checkpoints(self, file_database, client):
+        """reset 후에는 전체 구간을 다시 수집"""
+        engine = make_engine(file_database, client)
+        engine.run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        assert engine.reset(['005930']) == 3
+        assert len(engine.pending_chunks(['005930'], date(2024, 1, 1), date(2024, 1, 25))) == 3
+
+
+class TestDefaultClient:
+    """클라이언트를 주입하지 않은 실행 (기본 KRXClient + pykrx mock)"""
+
+    @pytest.fixture
+    def mock_stock(self, mocker, make_ohlcv):
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_market_ohlcv.side_effect = lambda start, end, ticker: make_ohlcv(ticker, start, end)
+        mock_stock.get_market_ticker_list.side_effect = (
+            lambda date_str, market: ['005930'] if market == 'KOSPI' else ['035720']
+        )
+        mock_stock.get_market_ticker_name.side_effect = {'005930': '삼성전자', '035720': '카카오'}.get
+        return mock_stock
+
+    def test_run_without_client(self, file_database, mock_stock):
+        """BackfillEngine(db)만으로 실행 (main.py와 같은 호출)"""
+        engine = BackfillEngine(file_database, chunk_days=10, datasets=['daily_price'], max_workers=1)
+
+        result = engine.run(STOCKS, date(2024, 1, 1), date(2024, 1, 25))
+
+        assert result['completed'] == 3
+        assert result['errors'] == []
+        assert mock_stock.get_market_ohlcv.call_count == 3
+
+    def test_list_market_stocks_without_client(self, file_database, mock_stock, mocker):
+        """기본 클라이언트로 시장별 전 종목 조회"""
+        mocker.patch.object(backfill, 'get_ticker_master', return_value=TickerMaster(file_database))
+
+        stocks = list_market_stocks('20240105')
+
+        assert stocks == [('005930', '삼성전자', 'KOSPI'), ('035720', '카카오', 'KOSDAQ')]
+
+    def test_transient_optional_failure_not_checkpointed(self, file_database, mock_stock):
+        """공매도 일시 오류는 빈 결과로 완료 처리하지 않고 다음 실행에서 다시 조회"""
+        mock_stock.get_shorting_volume_by_date.side_effect = ConnectionError("연결 끊김")
+        engine = BackfillEngine(file_database, chunk_days=10, datasets=['short_selling'], max_workers=1)
+
+        result = engine.run(STOCKS, date(2024, 1, 1), date(2024, 1, 10))
+
+        assert result['failed'] == 1
+        assert result['completed'] == 0
+        assert len(engine.pending_chunks(['005930'], date(2024, 1, 1), date(2024, 1, 10))) == 1
+
+        mock_stock.get_shorting_volume_by_date.side_effect = KeyError("데이터 없음")
+        result = engine.run(STOCKS, date(2024, 1, 1), date(2024, 1, 10))
+
+        assert result['completed'] == 1
+        assert engine.pending_chunks(['005930'], date(2024, 1, 1), date(2024, 1, 10)) == []
@@ -267,9 +267,9 @@ class TestGenerateWatchlistSection:
 
         mock_queries = mocker.patch('report.daily_report.StockQueries')
         mock_queries.get_all_stocks.return_value = [mock_stock]
-        mock_queries.get_latest_price.return_value = mock_price
-        mock_queries.get_foreign_net_buying_days.return_value = []
-        mock_queries.get_fundamentals.return_value = []
+        mock_queries.get_latest_prices.return_value = {"000001": mock_price}
+        mock_queries.get_recent_investor_flows.return_value = {}
+        mock_queries.get_latest_fundamentals_as_of.return_value = {}
 
         # When
         result = report.generate_watchlist_section("20251204")
@@ -290,7 +290,7 @@ class TestGenerateWatchlistSection:
 
         mock_queries = mocker.patch('report.daily_report.StockQueries')
         mock_queries.get_all_stocks.return_value = [mock_stock]
-        mock_queries.get_latest_price.return_value = None
+        mock_queries.get_latest_prices.return_value = {}
 
         # When
         result = report.generate_watchlist_section("20251204")
@@ -300,6 +300,42 @@ class TestGenerateWatchlistSection:
         # 종목이 표시되지 않음
         assert "테스트종목" not in result
 
+    def test_watchlist_batches_queries(self, report, mocker):
+        """종목 수와 관계없이 조회 함수는 한 번씩만 호출"""
+        # Given
+        stocks = []
+        for ticker in ("000001", "000002", "000003"):
+            stock = Mock()
+            stock.ticker = ticker
+            stock.name = f"종목{ticker}"
+            stocks.append(stock)
+
+        mock_price = Mock()
+        mock_price.date = datetime(2025, 12, 4).date()
+        mock_price.close = 50000
+        mock_price.open = 48000
+        mock_price.volume = 1000000
+        stale_price = Mock()
+        stale_price.date = datetime(2025, 12, 3).date()
+
+        mock_queries = mocker.patch('report.daily_report.StockQueries')
+        mock_queries.get_all_stocks.return_value = stocks
+        mock_queries.get_latest_prices.return_value = {"000001": mock_price, "000002": stale_price}
+        mock_queries.get_recent_investor_flows.return_value = {}
+        mock_queries.get_latest_fundamentals_as_of.return_value = {}
+
+        # When
+        result = report.generate_watchlist_section("20251204")
+
+        # Then: 당일 주가가 있는 종목만 이후 조회 대상
+        assert "종목000001" in result
+        assert "종목000002" not in result
+        mock_queries.get_latest_prices.assert_called_once()
+        assert mock_queries.get_latest_prices.call_args[0][1] == ["000001", "000002", "000003"]
+        date_obj = datetime(2025, 12, 4).date()
+        mock_queries.get_recent_investor_flows.assert_called_once_with(report.db_session, ["000001"], 5, date_obj)
+        mock_queries.get_latest_fundamentals_as_of.assert_called_once_with(report.db_session, ["000001"], date_obj)
+
     def test_foreign_net_buy_calculation(self, report, mocker):
         """외국인 순매수 계산"""
         # Given
@@ -319,9 +355,9 @@ class TestGenerateWatchlistSection:
 
         mock_queries = mocker.patch('report.daily_report.StockQueries')
         mock_queries.get_all_stocks.return_value = [mock_stock]
-        mock_queries.get_latest_price.return_value = mock_price
-        mock_queries.get_foreign_net_buying_days.return_value = [mock_foreign]
-        mock_queries.get_fundamentals.return_value = []
+        mock_queries.get_latest_prices.return_value = {"000001": mock_price}
+        mock_queries.get_recent_investor_flows.return_value = {"000001": [mock_foreign]}
+        mock_queries.get_latest_fundamentals_as_of.return_value = {}
 
         # When
         result = report.generate_watchlist_section("20251204")
@@ -351,9 +387,9 @@ class TestGenerateWatchlistSection:
 
         mock_queries = mocker.patch('report.daily_report.StockQueries')
         mock_queries.get_all_stocks.return_value = [mock_stock]
-        mock_queries.get_latest_price.return_value = mock_price
-        mock_queries.get_foreign_net_buying_days.return_value = []
-        mock_queries.get_fundamentals.return_value = [mock_fund]
+        mock_queries.get_latest_prices.return_value = {"000001": mock_price}
+        mock_queries.get_recent_investor_flows.return_value = {}
+        mock_queries.get_latest_fundamentals_as_of.return_value = {"000001": mock_fund}
 
         # When
         result = report.generate_watchlist_section("20251204")
@@ -385,9 +421,9 @@ class TestGenerateWatchlistSection:
 
         mock_queries = mocker.patch('report.daily_report.StockQueries')
         mock_queries.get_all_stocks.return_value = [mock_stock]
-        mock_queries.get_latest_price.return_value = mock_price
-        mock_queries.get_foreign_net_buying_days.return_value = []
-        mock_queries.get_fundamentals.return_value = [mock_fund]
+        mock_queries.get_latest_prices.return_value = {"000001": mock_price}
+        mock_queries.get_recent_investor_flows.return_value = {}
+        mock_queries.get_latest_fundamentals_as_of.return_value = {"000001": mock_fund}
 
         # When
         result = report.generate_watchlist_section("20251204")
@@ -6,18 +6,31 @@ data_fetcher 모듈 단위 테스트
 - check_data_exists: 데이터 존재 여부 확인
 - fetch_stock_data: 개별 종목 데이터 수집
 - fetch_watchlist_data: 관심 종목 배치 수집
+- fetch_watchlist_data_async: 관심 종목 asyncio 수집
+- fetch_market_snapshot: 날짜별 전체 시장 수집
 """
 
 import pytest
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, Mock, patch
+import asyncio
+import threading
+from datetime import date, datetime, timedelta
+from unittest.mock import ANY, MagicMock, Mock, patch
 import pandas as pd
 
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from data_fetcher import check_data_exists, fetch_stock_data, fetch_watchlist_data
+from data_fetcher import (
+    check_data_exists, fetch_stock_data, fetch_watchlist_data, fetch_watchlist_data_async,
+    fetch_market_snapshot, fetch_market_data
+)
+from fetch_planner import FetchJob
+from krx.async_client import AsyncKRXClient
+from krx.cache import ResponseCache
+from krx.rate_limiter import TokenBucket
+from krx.saver import DataSaver
+from models import DailyPrice
 
 
 class TestCheckDataExists:
@@ -26,12 +39,11 @@ class TestCheckDataExists:
     def test_data_exists_returns_true(self, mocker):
         """데이터가 존재하면 True 반환"""
         # Given: 특정 날짜의 데이터가 존재하는 상황
-        mock_latest_price = Mock()
-        mock_latest_price.date = datetime(2025, 12, 4).date()
-
         mock_session = MagicMock()
         mock_queries = mocker.patch('data_fetcher.StockQueries')
-        mock_queries.get_latest_price.return_value = mock_latest_price
+        mock_queries.get_coverage.return_value = {
+            "000001": (datetime(2025, 1, 2).date(), datetime(2025, 12, 4).date())
+        }
 
         mock_db = mocker.patch('data_fetcher.Database')
         mock_db.return_value.get_session.return_value.__enter__.return_value = mock_session
@@ -41,14 +53,14 @@ class TestCheckDataExists:
 
         # Then: True 반환
         assert result is True
-        mock_queries.get_latest_price.assert_called_once_with(mock_session, "000001")
+        mock_queries.get_coverage.assert_called_once_with(mock_session, DailyPrice, ["000001"])
 
     def test_data_not_exists_returns_false(self, mocker):
         """데이터가 없으면 False 반환"""
         # Given: 데이터가 없는 상황
         mock_session = MagicMock()
         mock_queries = mocker.patch('data_fetcher.StockQueries')
-        mock_queries.get_latest_price.return_value = None
+        mock_queries.get_coverage.return_value = {}
 
         mock_db = mocker.patch('data_fetcher.Database')
         mock_db.return_value.get_session.return_value.__enter__.return_value = mock_session
@@ -62,12 +74,11 @@ class TestCheckDataExists:
     def test_data_exists_different_date_returns_false(self, mocker):
         """다른 날짜의 데이터가 있으면 False 반환"""
         # Given: 다른 날짜의 데이터만 존재
-        mock_latest_price = Mock()
-        mock_latest_price.date = datetime(2025, 12, 3).date()
-
         mock_session = MagicMock()
         mock_queries = mocker.patch('data_fetcher.StockQueries')
-        mock_queries.get_latest_price.return_value = mock_latest_price
+        mock_queries.get_coverage.return_value = {
+            "000001": (datetime(2025, 1, 2).date(), datetime(2025, 12, 3).date())
+        }
 
         mock_db = mocker.patch('data_fetcher.Database')
         mock_db.return_value.get_session.return_value.__enter__.return_value = mock_session
@@ -97,6 +108,10 @@ class TestFetchStockData:
         mock_session = MagicMock()
         mock_client = MagicMock()
         mock_saver = MagicMock()
+        # 조회 시작일 기록은 건너뛰고 데이터셋별 저장 메서드로 위임
+        mock_saver.save_fetched.side_effect = (
+            lambda ticker, dataset, start_date, save_method, df: getattr(mock_saver, save_method)(ticker, df)
+        )
 
         # Database, KRXClient, DataSaver 모킹
         mock_db = mocker.patch('data_fetcher.Database')
@@ -169,6 +184,29 @@ class TestFetchStockData:
         assert result['success'] is True
         client.get_ohlcv.assert_called_once_with("000001", "20251104", "20251204")
 
+    def test_ranges_limit_datasets(self, mock_components):
+        """ranges 지정 시 해당 데이터셋만 각자의 구간으로 수집"""
+        # Given
+        client = mock_components['client']
+        client.get_fundamental.return_value = pd.DataFrame()
+        client.get_short_balance.return_value = pd.DataFrame()
+
+        # When
+        result = fetch_stock_data(
+            "000001", "테스트종목", "KOSPI", "20251204", "today",
+            ranges={
+                'fundamental': ("20251201", "20251204"),
+                'short_balance': ("20251128", "20251204"),
+            }
+        )
+
+        # Then
+        assert result['success'] is True
+        client.get_fundamental.assert_called_once_with("000001", "20251201", "20251204")
+        client.get_short_balance.assert_called_once_with("000001", "20251128", "20251204")
+        client.get_ohlcv.assert_not_called()
+        client.get_market_cap.assert_not_called()
+
     def test_all_data_types_success(self, mock_components):
         """모든 데이터 타입 수집 성공"""
         # Given
@@ -347,10 +385,22 @@ class TestFetchWatchlistData:
             ("000002", "테스트종목2", "KOSDAQ"),
         ])
 
-    def test_skip_when_data_exists(self, mocker, mock_watchlist):
-        """데이터가 이미 있으면 스킵"""
-        # Given: check_data_exists가 True 반환
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=True)
+    @pytest.fixture
+    def mock_planner(self, mocker):
+        """FetchPlanner 모킹 (기본: 수집할 작업 없음)"""
+        mocker.patch('data_fetcher.Database')
+        planner_cls = mocker.patch('data_fetcher.FetchPlanner')
+        planner_cls.return_value.plan.return_value = []
+        return planner_cls.return_value
+
+    @staticmethod
+    def make_jobs(*tickers, dataset='daily_price', day=date(2025, 12, 4)):
+        """지정한 종목들의 수집 작업 생성"""
+        return [FetchJob(ticker, dataset, day, day) for ticker in tickers]
+
+    def test_skip_when_data_exists(self, mocker, mock_watchlist, mock_planner):
+        """빠진 구간이 없으면 스킵"""
+        # Given: 계획된 작업 없음
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
 
         # When
@@ -360,13 +410,13 @@ class TestFetchWatchlistData:
         assert result['skipped'] == 2
         assert result['total_success'] == 0
         assert result['total_failed'] == 0
-        assert mock_check.call_count == 2
+        mock_planner.plan.assert_called_once()
         mock_fetch.assert_not_called()
 
-    def test_fetch_when_data_missing(self, mocker, mock_watchlist):
+    def test_fetch_when_data_missing(self, mocker, mock_watchlist, mock_planner):
         """데이터가 없으면 수집"""
         # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=False)
+        mock_planner.plan.return_value = self.make_jobs("000001", "000002")
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
         mock_fetch.return_value = {'success': True, 'ticker': '000001', 'counts': {}, 'errors': []}
 
@@ -379,33 +429,53 @@ class TestFetchWatchlistData:
         assert result['total_failed'] == 0
         assert mock_fetch.call_count == 2
 
-    def test_force_refetch_overrides_skip(self, mocker, mock_watchlist):
+    def test_only_missing_ranges_requested(self, mocker, mock_watchlist, mock_planner):
+        """계획된 데이터셋/구간만 fetch_stock_data에 전달"""
+        # Given: 000001은 펀더멘탈만 3일치 누락
+        mock_planner.plan.return_value = [
+            FetchJob("000001", "fundamental", date(2025, 12, 2), date(2025, 12, 4)),
+        ]
+        mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
+        mock_fetch.return_value = {'success': True, 'ticker': '000001', 'counts': {}, 'errors': []}
+
+        # When
+        result = fetch_watchlist_data("20251204", "today", force=False)
+
+        # Then
+        assert result['skipped'] == 1
+        mock_fetch.assert_called_once_with(
+            "000001", "테스트종목1", "KOSPI", "20251204", "today",
+            {'fundamental': ("20251202", "20251204")}, writer=ANY, refresh=False
+        )
+
+    def test_force_refetch_overrides_skip(self, mocker, mock_watchlist, mock_planner):
         """force=True면 기존 데이터 무시하고 재수집"""
-        # Given: 데이터가 있어도
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=True)
+        # Given
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
         mock_fetch.return_value = {'success': True, 'ticker': '000001', 'counts': {}, 'errors': []}
 
         # When: force=True
         result = fetch_watchlist_data("20251204", "today", force=True)
 
-        # Then: check 호출되지 않고 바로 수집
-        mock_check.assert_not_called()
+        # Then: 계획 없이 바로 전체 구간 수집
+        mock_planner.plan.assert_not_called()
         assert result['skipped'] == 0
         assert result['total_success'] == 2
         assert mock_fetch.call_count == 2
+        assert mock_fetch.call_args[0][5] is None
 
-    def test_multiple_stocks_success(self, mocker, mock_watchlist):
+    def test_multiple_stocks_success(self, mocker, mock_watchlist, mock_planner):
         """여러 종목 수집 성공"""
         # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=False)
+        mock_planner.plan.return_value = self.make_jobs("000001", "000002")
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
 
-        # 각 종목별 다른 결과
-        mock_fetch.side_effect = [
-            {'success': True, 'ticker': '000001', 'name': '테스트1', 'counts': {'daily_price': 5}, 'errors': []},
-            {'success': True, 'ticker': '000002', 'name': '테스트2', 'counts': {'daily_price': 3}, 'errors': []},
-        ]
+        # 각 종목별 다른 결과 (동시 수집이므로 호출 순서가 아닌 종목코드 기준)
+        stock_results = {
+            '000001': {'success': True, 'ticker': '000001', 'name': '테스트1', 'counts': {'daily_price': 5}, 'errors': []},
+            '000002': {'success': True, 'ticker': '000002', 'name': '테스트2', 'counts': {'daily_price': 3}, 'errors': []},
+        }
+        mock_fetch.side_effect = lambda ticker, *args, **kwargs: stock_results[ticker]
 
         # When
         result = fetch_watchlist_data("20251204", "recent", force=False)
@@ -417,17 +487,18 @@ class TestFetchWatchlistData:
         assert result['stocks'][0]['ticker'] == '000001'
         assert result['stocks'][1]['ticker'] == '000002'
 
-    def test_partial_failure_continues(self, mocker, mock_watchlist):
+    def test_partial_failure_continues(self, mocker, mock_watchlist, mock_planner):
         """일부 실패해도 나머지는 계속 수집"""
         # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=False)
+        mock_planner.plan.return_value = self.make_jobs("000001", "000002")
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
 
         # 첫 번째는 성공, 두 번째는 실패
-        mock_fetch.side_effect = [
-            {'success': True, 'ticker': '000001', 'counts': {}, 'errors': []},
-            {'success': False, 'ticker': '000002', 'counts': {}, 'errors': ['전체 수집 실패']},
-        ]
+        stock_results = {
+            '000001': {'success': True, 'ticker': '000001', 'counts': {}, 'errors': []},
+            '000002': {'success': False, 'ticker': '000002', 'counts': {}, 'errors': ['전체 수집 실패']},
+        }
+        mock_fetch.side_effect = lambda ticker, *args, **kwargs: stock_results[ticker]
 
         # When
         result = fetch_watchlist_data("20251204", "today", force=False)
@@ -437,12 +508,10 @@ class TestFetchWatchlistData:
         assert result['total_failed'] == 1
         assert len(result['stocks']) == 2
 
-    def test_result_statistics_correct(self, mocker, mock_watchlist):
+    def test_result_statistics_correct(self, mocker, mock_watchlist, mock_planner):
         """결과 통계가 정확하게 집계"""
-        # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists')
-        # 첫 번째는 이미 있음, 두 번째는 없음
-        mock_check.side_effect = [True, False]
+        # Given: 첫 번째는 최신, 두 번째만 누락
+        mock_planner.plan.return_value = self.make_jobs("000002")
 
         mock_fetch = mocker.patch('data_fetcher.fetch_stock_data')
         mock_fetch.return_value = {'success': True, 'ticker': '000002', 'counts': {}, 'errors': []}
@@ -457,29 +526,271 @@ class TestFetchWatchlistData:
         assert result['date'] == "20251204"
         assert result['mode'] == "today"
 
-    def test_default_date_uses_today(self, mocker, mock_watchlist):
-        """date_str이 None이면 오늘 날짜 사용"""
-        # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=True)
+    def test_results_keep_watchlist_order(self, mocker, mock_watchlist, mock_planner):
+        """동시 수집이어도 결과는 WATCHLIST 순서 유지"""
+        # Given: 첫 종목이 더 늦게 끝나는 상황
+        mock_planner.plan.return_value = self.make_jobs("000001", "000002")
+        first_started = threading.Event()
+
+        def fake_fetch(ticker, *args, **kwargs):
+            if ticker == '000001':
+                first_started.set()
+            else:
+                first_started.wait(timeout=1)
+            return {'success': True, 'ticker': ticker, 'counts': {}, 'errors': []}
+
+        mocker.patch('data_fetcher.fetch_stock_data', side_effect=fake_fetch)
 
+        # When
+        result = fetch_watchlist_data("20251204", "today", force=False, max_workers=2)
+
+        # Then
+        assert [s['ticker'] for s in result['stocks']] == ['000001', '000002']
+
+    def test_default_date_uses_today(self, mocker, mock_watchlist, mock_planner):
+        """date_str이 None이면 오늘 날짜 사용"""
         # When
         result = fetch_watchlist_data(date_str=None, fetch_mode="today", force=False)
 
         # Then: 오늘 날짜가 설정됨
-        today_str = datetime.now().strftime('%Y%m%d')
-        assert result['date'] == today_str
-        # check 호출 시 오늘 날짜 사용
-        mock_check.assert_called_with("000002", today_str)
-
-    def test_custom_date_string(self, mocker, mock_watchlist):
-        """특정 날짜 문자열 사용"""
-        # Given
-        mock_check = mocker.patch('data_fetcher.check_data_exists', return_value=True)
+        today = datetime.now().date()
+        assert result['date'] == today.strftime('%Y%m%d')
+        # 계획 기준일도 오늘
+        assert mock_planner.plan.call_args.kwargs['end_date'] == today
 
+    def test_custom_date_string(self, mocker, mock_watchlist, mock_planner):
+        """특정 날짜 문자열 사용 (신규 종목은 fetch_mode 구간부터)"""
         # When
         result = fetch_watchlist_data(date_str="20251203", fetch_mode="month", force=False)
 
         # Then
         assert result['date'] == "20251203"
         assert result['mode'] == "month"
-        mock_check.assert_called_with("000002", "20251203")
+        args, kwargs = mock_planner.plan.call_args
+        assert args[0] == ["000001", "000002"]
+        assert kwargs['end_date'] == date(2025, 12, 3)
+        assert kwargs['start_date'] == date(2025, 11, 3)
+
+
+class TestFetchWatchlistDataAsync:
+    """fetch_watchlist_data_async 함수 테스트"""
+
+    @pytest.fixture
+    def file_database(self, file_database, mocker):
+        """writer 스레드에서도 같은 DB를 보도록 파일 DB 사용"""
+        mocker.patch('data_fetcher.Database', return_value=file_database)
+        return file_database
+
+    @pytest.fixture
+    def mock_watchlist(self, mocker):
+        return mocker.patch('data_fetcher.WATCHLIST', [
+            ("000001", "테스트종목1", "KOSPI"),
+            ("000002", "테스트종목2", "KOSDAQ"),
+        ])
+
+    @pytest.fixture
+    def client(self, mocker, sample_ohlcv_df):
+        """일별 주가만 있고 나머지는 빈 결과를 돌려주는 비동기 클라이언트"""
+        mock_stock = mocker.patch('krx.async_client.stock')
+        mock_stock.get_market_ohlcv.return_value = sample_ohlcv_df
+        for name in ('get_market_cap', 'get_market_fundamental', 'get_market_trading_value_by_date',
+                     'get_shorting_volume_by_date', 'get_shorting_balance_by_date'):
+            getattr(mock_stock, name).return_value = pd.DataFrame()
+
+        client = AsyncKRXClient(rate_limiter=TokenBucket(rate=1000.0, capacity=1000.0))
+        client.mock_stock = mock_stock
+        yield client
+        client.close()
+
+    def test_collects_and_saves(self, file_database, mock_watchlist, client):
+        """전 종목 조회 후 단일 writer가 저장"""
+        result = asyncio.run(fetch_watchlist_data_async("20240105", "recent", force=True, client=client))
+
+        assert result['total_success'] == 2
+        assert [s['ticker'] for s in result['stocks']] == ["000001", "000002"]
+        assert result['stocks'][0]['counts'] == {'daily_price': 5}
+        assert 'api_stats' in result
+        with file_database.get_session() as session:
+            assert session.query(DailyPrice).count() == 10
+
+    def test_only_planned_ranges_requested(self, file_database, mocker, mock_watchlist, client):
+        """계획된 종목/데이터셋/구간만 조회"""
+        planner_cls = mocker.patch('data_fetcher.FetchPlanner')
+        planner_cls.return_value.plan.return_value = [
+            FetchJob("000001", "daily_price", date(2024, 1, 3), date(2024, 1, 5)),
+        ]
+
+        result = asyncio.run(fetch_watchlist_data_async("20240105", "today", client=client))
+
+        assert result['skipped'] == 1
+        assert len(result['stocks']) == 1
+        client.mock_stock.get_market_ohlcv.assert_called_once_with("20240103", "20240105", "000001")
+        client.mock_stock.get_market_cap.assert_not_called()
+
+    def test_fetch_error_recorded(self, file_database, mock_watchlist, client):
+        """필수 데이터셋 조회 실패는 결과에 기록"""
+        client.mock_stock.get_market_ohlcv.side_effect = KeyError('종가')
+
+        result = asyncio.run(fetch_watchlist_data_async("20240105", "today", force=True, client=client))
+
+        assert any('일별 주가' in error for error in result['stocks'][0]['errors'])
+        assert result['stocks'][0]['counts'] == {}
+
+    def test_save_error_recorded(self, file_database, mocker, mock_watchlist, client):
+        """저장 실패는 동기 수집과 같이 오류로만 기록하고 나머지는 계속 저장"""
+        original = DataSaver.save_daily_prices
+
+        def failing_save(self, ticker, df):
+            if ticker == "000001":
+                raise RuntimeError("디스크 오류")
+            return original(self, ticker, df)
+
+        mocker.patch.object(DataSaver, 'save_daily_prices', failing_save)
+
+        result = asyncio.run(fetch_watchlist_data_async("20240105", "today", force=True, client=client))
+
+        assert result['total_failed'] == 0
+        assert result['stocks'][0]['errors'] == ["일별 주가 저장: 디스크 오류"]
+        assert result['stocks'][0]['counts'] == {}
+        assert result['stocks'][1]['counts'] == {'daily_price': 5}
+
+
+class TestFetchMarketSnapshot:
+    """fetch_market_snapshot 함수 테스트"""
+
+    @pytest.fixture
+    def market_ohlcv(self):
+        """종목코드 인덱스 전체 시장 OHLCV"""
+        return pd.DataFrame({
+            '시가': [70000, 120000],
+            '고가': [71000, 125000],
+            '저가': [69500, 119000],
+            '종가': [70500, 124000],
+            '거래량': [10000000, 3000000]
+        }, index=['005930', '000660'])
+
+    def test_collects_all_datasets(self, market_ohlcv):
+        """주가/종목/시가총액/펀더멘탈을 날짜 기준으로 일괄 수집"""
+        # Given
+        client = MagicMock()
+        saver = MagicMock()
+        client.get_market_ohlcv_by_ticker.return_value = market_ohlcv
+        client.get_ticker_name.side_effect = lambda t: {'005930': '삼성전자', '000660': 'SK하이닉스'}[t]
+        saver.save_stocks.return_value = 2
+        saver.save_daily_prices_by_date.return_value = 2
+        saver.save_market_caps_by_date.return_value = 2
+        saver.save_fundamentals_by_date.return_value = 2
+
+        # When
+        result = fetch_market_snapshot(client, saver, "20251204", "KOSPI")
+
+        # Then: 종목 수와 무관하게 시장당 3회 조회
+        assert result['success'] is True
+        assert result['holiday'] is False
+        assert result['counts'] == {'stocks': 2, 'daily_price': 2, 'market_cap': 2, 'fundamental': 2}
+        saver.save_stocks.assert_called_once_with([
+            ('005930', '삼성전자', 'KOSPI'),
+            ('000660', 'SK하이닉스', 'KOSPI'),
+        ])
+        client.get_market_cap_by_ticker.assert_called_once_with("20251204", "KOSPI")
+        client.get_market_fundamental_by_ticker.assert_called_once_with("20251204", "KOSPI")
+
+    def test_holiday_skips_remaining_calls(self, market_ohlcv):
+        """거래량이 모두 0이면 휴장일로 보고 나머지 조회 생략"""
+        # Given
+        client = MagicMock()
+        saver = MagicMock()
+        market_ohlcv['거래량'] = 0
+        client.get_market_ohlcv_by_ticker.return_value = market_ohlcv
+
+        # When
+        result = fetch_market_snapshot(client, saver, "20251206", "KOSPI")
+
+        # Then
+        assert result['holiday'] is True
+        assert result['counts'] == {}
+        client.get_market_cap_by_ticker.assert_not_called()
+        saver.save_daily_prices_by_date.assert_not_called()
+
+    def test_ohlcv_failure_marks_market_failed(self):
+        """주가 조회 실패 시 시장 수집 실패"""
+        # Given
+        client = MagicMock()
+        client.get_market_ohlcv_by_ticker.side_effect = Exception("조회 실패")
+
+        # When
+        result = fetch_market_snapshot(client, MagicMock(), "20251204", "KOSDAQ")
+
+        # Then
+        assert result['success'] is False
+        assert any("일별 주가" in err for err in result['errors'])
+
+    def test_save_failure_marks_market_failed(self, db_session, market_ohlcv, mocker):
+        """주가 저장 실패는 0건으로 넘기지 않고 시장 수집 실패로 기록"""
+        # Given
+        client = MagicMock()
+        client.get_market_ohlcv_by_ticker.return_value = market_ohlcv
+        client.get_ticker_name.side_effect = lambda t: t
+        client.get_market_cap_by_ticker.return_value = pd.DataFrame()
+        client.get_market_fundamental_by_ticker.return_value = pd.DataFrame()
+        saver = DataSaver(db_session)
+        mocker.patch.object(saver, '_frame_to_records', side_effect=Exception("database is locked"))
+
+        # When
+        result = fetch_market_snapshot(client, saver, "20251204", "KOSPI")
+
+        # Then
+        assert result['success'] is False
+        assert 'daily_price' not in result['counts']
+        assert result['errors'] == ["일별 주가: database is locked"]
+        assert result['counts']['market_cap'] == 0
+
+
+class TestFetchMarketData:
+    """fetch_market_data 함수 테스트"""
+
+    def test_holiday_skips_api_calls(self, mocker):
+        """거래일 달력상 휴장일이면 KRX 조회 없이 종료"""
+        # Given
+        calendar = mocker.patch('data_fetcher.get_trading_calendar').return_value
+        calendar.is_trading_day.return_value = False
+        mock_db = mocker.patch('data_fetcher.Database')
+        mock_client = mocker.patch('data_fetcher.KRXClient')
+
+        # When
+        result = fetch_market_data("20251006")
+
+        # Then
+        assert [m['holiday'] for m in result['markets']] == [True, True]
+        assert result['total_failed'] == 0
+        mock_db.assert_not_called()
+        mock_client.assert_not_called()
+
+    def test_force_bypasses_response_cache(self, file_database, mocker, tmp_path):
+        """강제 수집은 캐시된 과거 응답 대신 다시 조회해 정정 값을 저장 (캐시는 새 값으로 갱신)"""
+        # Given: 응답 캐시 사용, 두 번째 조회에서 종가 정정
+        cache = ResponseCache(cache_dir=str(tmp_path / 'cache'))
+        mocker.patch('krx.cache._default_cache', cache)
+        mocker.patch('data_fetcher.Database', return_value=file_database)
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_market_ohlcv_by_ticker.__name__ = 'get_market_ohlcv_by_ticker'
+        mock_stock.get_market_ticker_name.return_value = '삼성전자'
+        mock_stock.get_market_cap_by_ticker.return_value = pd.DataFrame()
+        mock_stock.get_market_fundamental_by_ticker.return_value = pd.DataFrame()
+        mock_stock.get_market_ohlcv_by_ticker.side_effect = [
+            pd.DataFrame({'시가': [100], '고가': [110], '저가': [90], '종가': [close], '거래량': [1000]},
+                         index=['005930'])
+            for close in (105, 107)
+        ]
+
+        # When
+        fetch_market_data("20240102", markets=('KOSPI',))
+        fetch_market_data("20240102", markets=('KOSPI',), force=True)
+
+        # Then
+        assert mock_stock.get_market_ohlcv_by_ticker.call_count == 2
+        with file_database.get_session() as session:
+            assert session.query(DailyPrice.close).scalar() == 107
+        key = ResponseCache.make_key(mock_stock.get_market_ohlcv_by_ticker, ("20240102",), {'market': 'KOSPI'})
+        assert cache.get(key)['종가'].iloc[0] == 107
+
@@ -3,14 +3,16 @@ Database 클래스 테스트
 """
 
 import pytest
-from sqlalchemy import inspect
+from datetime import date
+from sqlalchemy import inspect, text
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from database.connection import Database
-from models import Stock
+import database.connection as connection
+from database.connection import Database, dispose_engines, set_default_profile
+from models import Stock, DailyPrice, DataCoverage
 
 
 class TestDatabase:
@@ -159,3 +161,155 @@ class TestDatabase:
             tickers = [s.ticker for s in stocks]
             assert '005930' in tickers
             assert '000660' in tickers
+
+
+class TestEngineRegistry:
+    """URL별 엔진 공유 테스트"""
+
+    @pytest.fixture
+    def db_url(self, tmp_path):
+        """임시 파일 DB URL (테스트 후 공유 엔진 정리)"""
+        yield f"sqlite:///{tmp_path}/stocks.db"
+        dispose_engines()
+
+    def test_same_url_shares_engine(self, db_url):
+        """같은 URL이면 엔진과 세션 팩토리 재사용"""
+        db1 = Database(db_url=db_url)
+        db2 = Database(db_url=db_url)
+
+        assert db1.engine is db2.engine
+        assert db1.SessionLocal is db2.SessionLocal
+
+    def test_memory_url_not_shared(self):
+        """인메모리 DB는 인스턴스마다 별도 엔진"""
+        db1 = Database(db_url='sqlite:///:memory:')
+        db2 = Database(db_url='sqlite:///:memory:')
+
+        assert db1.engine is not db2.engine
+
+    def test_shared_engine_sees_committed_data(self, db_url):
+        """공유 엔진의 다른 인스턴스에서 저장한 데이터 조회"""
+        Database(db_url=db_url).create_tables()
+        with Database(db_url=db_url).get_session() as session:
+            session.add(Stock(ticker='005930', name='삼성전자', market='KOSPI'))
+            session.commit()
+
+        with Database(db_url=db_url).get_session() as session:
+            assert session.query(Stock).count() == 1
+
+    def test_create_tables_builds_coverage_for_existing_data(self, db_url):
+        """data_coverage가 없던 기존 DB는 create_tables 시 기존 데이터로 채움"""
+        db = Database(db_url=db_url)
+        db.create_tables()
+        with db.get_session() as session:
+            session.execute(text("DROP TABLE data_coverage"))
+            session.add(DailyPrice(ticker='005930', date=date(2024, 1, 2),
+                                   open=1, high=1, low=1, close=1, volume=1))
+            session.commit()
+
+        db.create_tables()
+
+        with db.get_session() as session:
+            coverage = session.get(DataCoverage, ('005930', 'daily_price'))
+            assert coverage.max_date == date(2024, 1, 2)
+            assert coverage.row_count == 1
+
+    def test_create_tables_adds_missing_columns(self, db_url):
+        """기존 테이블에 없는 NULL 허용 컬럼은 create_tables 시 추가"""
+        db = Database(db_url=db_url)
+        db.create_tables()
+        with db.get_session() as session:
+            session.execute(text("ALTER TABLE daily_price DROP COLUMN updated_at"))
+            session.commit()
+
+        db.create_tables()
+
+        with db.get_session() as session:
+            columns = [row[1] for row in session.execute(text("PRAGMA table_info(daily_price)"))]
+            assert 'updated_at' in columns
+
+    def test_dispose_creates_new_engine_next_time(self, db_url):
+        """dispose 후에는 새 엔진 생성"""
+        db = Database(db_url=db_url)
+        db.dispose()
+
+        assert Database(db_url=db_url).engine is not db.engine
+
+    def test_dispose_engines_clears_all(self, db_url, tmp_path):
+        """dispose_engines는 모든 공유 엔진 종료"""
+        other_url = f"sqlite:///{tmp_path}/other.db"
+        db1 = Database(db_url=db_url)
+        db2 = Database(db_url=other_url)
+
+        dispose_engines()
+
+        assert Database(db_url=db_url).engine is not db1.engine
+        assert Database(db_url=other_url).engine is not db2.engine
+
+
+class TestProfiles:
+    """SQLite 성능 프로필 테스트"""
+
+    @pytest.fixture
+    def db_url(self, tmp_path, mocker):
+        """임시 파일 DB URL (프로필 설정/공유 엔진 정리)"""
+        mocker.patch.object(connection, '_default_profile', None)
+        mocker.patch.dict(os.environ)
+        os.environ.pop('DB_PROFILE', None)
+        yield f"sqlite:///{tmp_path}/stocks.db"
+        dispose_engines()
+
+    @staticmethod
+    def pragma(db, name):
+        with db.engine.connect() as conn:
+            return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+    def test_default_profile_is_balanced(self, db_url):
+        """기본 프로필은 WAL + synchronous=NORMAL"""
+        db = Database(db_url=db_url)
+
+        assert db.profile == 'balanced'
+        assert self.pragma(db, 'journal_mode') == 'wal'
+        assert self.pragma(db, 'synchronous') == 1  # NORMAL
+        assert self.pragma(db, 'busy_timeout') == 5000
+
+    def test_bulk_load_profile(self, db_url):
+        """bulk_load 프로필은 synchronous=OFF, 큰 캐시"""
+        db = Database(db_url=db_url, profile='bulk_load')
+
+        assert self.pragma(db, 'synchronous') == 0  # OFF
+        assert self.pragma(db, 'cache_size') == -262144
+        assert self.pragma(db, 'temp_store') == 2  # MEMORY
+
+    def test_read_only_profile_rejects_writes(self, db_url):
+        """read_only 프로필은 쓰기 금지"""
+        Database(db_url=db_url).create_tables()
+        db = Database(db_url=db_url, profile='read_only')
+
+        with db.get_session() as session:
+            assert session.query(Stock).count() == 0
+            session.add(Stock(ticker='005930', name='삼성전자', market='KOSPI'))
+            with pytest.raises(Exception):
+                session.commit()
+
+    def test_profiles_use_separate_engines(self, db_url):
+        """같은 URL이라도 프로필이 다르면 별도 엔진"""
+        assert Database(db_url=db_url).engine is not Database(db_url=db_url, profile='read_only').engine
+
+    def test_profile_from_env(self, db_url):
+        """DB_PROFILE 환경 변수로 기본 프로필 지정"""
+        os.environ['DB_PROFILE'] = 'bulk_load'
+
+        assert Database(db_url=db_url).profile == 'bulk_load'
+
+    def test_set_default_profile_overrides_env(self, db_url):
+        """--db-profile 옵션이 환경 변수보다 우선"""
+        os.environ['DB_PROFILE'] = 'bulk_load'
+        set_default_profile('read_only')
+
+        assert Database(db_url=db_url).profile == 'read_only'
+
+    def test_unknown_profile_raises(self, db_url):
+        """알 수 없는 프로필은 ValueError"""
+        with pytest.raises(ValueError):
+            Database(db_url=db_url, profile='turbo')
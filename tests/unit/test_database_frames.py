@@ -0,0 +1,104 @@
+"""
+FrameQueries 클래스 테스트
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from database.connection import Database
+from database.frames import FrameQueries
+from models import Stock, DailyPrice, Fundamental
+
+
+def add_prices(session, ticker: str, days: list):
+    session.add(Stock(ticker=ticker, name=ticker, market='KOSPI'))
+    for i, day in enumerate(days):
+        session.add(DailyPrice(
+            ticker=ticker, date=day,
+            open=70000 + i, high=71000, low=69000, close=70500 + i, volume=10_000_000_000
+        ))
+    session.commit()
+
+
+DAYS = [date(2024, 1, 2), date(2024, 1, 3), date(2024, 1, 4)]
+
+
+class TestFrameQueries:
+    """FrameQueries 클래스 테스트"""
+
+    def test_single_ticker_frame(self, db_session):
+        """종목 하나: date 인덱스, 모델에 맞춘 dtype, 일자 필터"""
+        add_prices(db_session, '005930', DAYS)
+
+        df = FrameQueries.get_daily_prices(db_session, '005930', start_date=date(2024, 1, 3))
+
+        assert list(df.index) == [pd.Timestamp('2024-01-03'), pd.Timestamp('2024-01-04')]
+        assert df.index.name == 'date'
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df['close'].dtype == np.int32
+        assert df['volume'].dtype == np.int64
+        assert df['close'].tolist() == [70501, 70502]
+        assert df['volume'].iloc[0] == 10_000_000_000
+
+    def test_multi_ticker_frame(self, db_session):
+        """여러 종목: (ticker, date) MultiIndex, 종목/일자 순 정렬"""
+        add_prices(db_session, '000660', DAYS[:2])
+        add_prices(db_session, '005930', DAYS)
+        add_prices(db_session, '035420', DAYS)
+
+        df = FrameQueries.get_daily_prices(db_session, ['005930', '000660'])
+
+        assert df.index.names == ['ticker', 'date']
+        assert df.index.get_level_values('ticker').tolist() == ['000660'] * 2 + ['005930'] * 3
+        assert df.loc['005930']['close'].tolist() == [70500, 70501, 70502]
+        assert len(FrameQueries.get_daily_prices(db_session, None)) == 8
+
+    def test_nullable_columns_are_nan(self, db_session):
+        """NULL 허용 컬럼은 NaN (정수는 float64, 실수는 float32)"""
+        db_session.add(Stock(ticker='005930', name='삼성전자', market='KOSPI'))
+        db_session.add(Fundamental(ticker='005930', date=DAYS[0], bps=50000, per=12.5, eps=None))
+        db_session.commit()
+
+        df = FrameQueries.get_fundamentals(db_session, '005930')
+
+        assert df['bps'].dtype == np.float64 and df['bps'].iloc[0] == 50000
+        assert df['per'].dtype == np.float32 and df['per'].iloc[0] == pytest.approx(12.5)
+        assert np.isnan(df['eps'].iloc[0])
+
+    def test_empty_result(self, db_session):
+        """데이터가 없으면 같은 컬럼/dtype의 빈 DataFrame"""
+        df = FrameQueries.get_market_caps(db_session, '005930')
+
+        assert df.empty
+        assert list(df.columns) == ['market_cap', 'trading_volume', 'trading_value', 'outstanding_shares']
+        assert df['market_cap'].dtype == np.int64
+
+    def test_load_arrays(self, db_session):
+        """NumPy 배열 조회 (선택한 컬럼만)"""
+        add_prices(db_session, '005930', DAYS)
+
+        arrays = FrameQueries.load_arrays(db_session, DailyPrice, ['005930'], columns=['close'])
+
+        assert set(arrays) == {'ticker', 'date', 'close'}
+        assert arrays['date'].dtype == np.dtype('datetime64[D]')
+        assert arrays['date'][0] == np.datetime64('2024-01-02')
+        assert arrays['close'].tolist() == [70500, 70501, 70502]
+
+    def test_integer_dates(self, db_url, file_database):
+        """정수 일자 레이아웃에서도 같은 결과"""
+        with file_database.get_session() as session:
+            add_prices(session, '005930', DAYS)
+        file_database.migrate(integer_dates=True)
+
+        db = Database(db_url=db_url)
+        with db.get_session() as session:
+            df = FrameQueries.get_daily_prices(session, '005930', end_date=date(2024, 1, 3))
+
+        assert list(df.index) == [pd.Timestamp('2024-01-02'), pd.Timestamp('2024-01-03')]
+        db.dispose()
@@ -0,0 +1,220 @@
+"""
+스키마 마이그레이션 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import date
+from unittest.mock import MagicMock
+from sqlalchemy import text
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from database.connection import Database
+from database.migrations import (
+    Migration, MigrationRunner, MIGRATIONS, INTEGER_DATES_MIGRATION, create_index, describe_table
+)
+from database.queries import StockQueries
+from krx.saver import DataSaver
+from models import DailyPrice, DataCoverage
+
+
+@pytest.fixture
+def legacy_db(db_url, make_prices) -> Database:
+    """schema_version 없이 기존 레이아웃 daily_price를 가진 DB (마이그레이션 도입 이전)"""
+    db = Database(db_url=db_url)
+    db.create_tables()
+    with db.engine.begin() as conn:
+        conn.execute(text("DELETE FROM schema_version"))
+        conn.execute(text("DROP TABLE daily_price"))
+        conn.execute(text("""
+            CREATE TABLE daily_price (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ticker VARCHAR(10) NOT NULL, date DATE NOT NULL,
+                open INTEGER NOT NULL, high INTEGER NOT NULL, low INTEGER NOT NULL,
+                close INTEGER NOT NULL, volume BIGINT NOT NULL,
+                created_at DATETIME, updated_at DATETIME,
+                CONSTRAINT uq_ticker_date UNIQUE (ticker, date)
+            )
+        """))
+        conn.execute(text("CREATE INDEX idx_ticker_date ON daily_price (ticker, date)"))
+        conn.execute(text("CREATE INDEX idx_date ON daily_price (date)"))
+    with db.get_session() as session:
+        saver = DataSaver(session)
+        saver.save_stock('005930', '삼성전자', 'KOSPI')
+        saver.save_daily_prices('005930', make_prices('2024-01-01', 5))
+    yield db
+    db.dispose()
+
+
+def index_names(db: Database, table_name: str) -> set:
+    with db.engine.connect() as conn:
+        return {row[1] for row in conn.execute(text(f"PRAGMA index_list({table_name})"))}
+
+
+class TestMigrationRunner:
+    """MigrationRunner 클래스 테스트"""
+
+    def test_new_database_is_stamped(self, file_database):
+        """새로 만든 DB는 최신 버전으로 기록되고 남은 마이그레이션 없음"""
+        db = file_database
+
+        runner = MigrationRunner(db)
+        assert runner.current_version() == MIGRATIONS[-1].version
+        assert runner.pending() == []
+        assert db.migrate() == []
+        with db.engine.connect() as conn:
+            assert describe_table(conn, 'daily_price') == {'without_rowid': True, 'integer_dates': False}
+        db.dispose()
+
+    def test_existing_database_warns(self, legacy_db, caplog):
+        """기존 DB에 남은 마이그레이션이 있으면 create_tables가 경고만 하고 실행하지 않음"""
+        db = legacy_db
+
+        db.create_tables()
+
+        assert '스키마 마이그레이션' in caplog.text
+        assert MigrationRunner(db).current_version() == 0
+        with db.engine.connect() as conn:
+            assert describe_table(conn, 'daily_price')['without_rowid'] is False
+        db.dispose()
+
+    def test_upgrade_legacy_database(self, legacy_db):
+        """기존 레이아웃을 배치 단위로 재작성하고 버전 기록"""
+        db = legacy_db
+        progress = []
+
+        applied = db.migrate(batch_size=2, progress=lambda *args: progress.append(args))
+
+        assert [m.version for m in applied] == [1, 2]
+        assert progress == [('daily_price', 2, 5), ('daily_price', 4, 5), ('daily_price', 5, 5)]
+        assert MigrationRunner(db).current_version() == 2
+        with db.engine.connect() as conn:
+            assert describe_table(conn, 'daily_price')['without_rowid'] is True
+            triggers = conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).all()
+            assert triggers == []
+        assert index_names(db, 'daily_price') >= {'idx_date'}
+        assert 'idx_ticker_date' not in index_names(db, 'daily_price')
+        with db.get_session() as session:
+            assert len(StockQueries.get_daily_prices(session, '005930')) == 5
+        db.dispose()
+
+    def test_writes_during_copy_are_kept(self, legacy_db):
+        """배치 사이에 기존 테이블에 쓴 INSERT/UPDATE/DELETE가 새 테이블에 반영"""
+        db = legacy_db
+
+        def write_between_batches(table_name, copied, total):
+            if copied != 2:
+                return
+            with db.engine.begin() as conn:
+                conn.execute(text(
+                    "INSERT INTO daily_price (ticker, date, open, high, low, close, volume) "
+                    "VALUES ('005930', '2024-01-10', 1, 1, 1, 1, 1)"
+                ))
+                conn.execute(text("UPDATE daily_price SET close = 999 WHERE date = '2024-01-01'"))
+                conn.execute(text("DELETE FROM daily_price WHERE date = '2024-01-05'"))
+
+        db.migrate(batch_size=2, progress=write_between_batches)
+
+        with db.get_session() as session:
+            prices = StockQueries.get_daily_prices(session, '005930')
+            assert [p.date.day for p in prices] == [1, 2, 3, 4, 10]
+            assert prices[0].close == 999
+        db.dispose()
+
+    def test_interrupted_rebuild_resumes(self, legacy_db):
+        """복사 중 중단되면 버전을 올리지 않고, 다시 실행하면 이어서 완료"""
+        db = legacy_db
+
+        def interrupt(table_name, copied, total):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            db.migrate(batch_size=2, progress=interrupt)
+
+        assert MigrationRunner(db).current_version() == 1
+        assert db.migrate(batch_size=2)[0].version == 2
+        with db.get_session() as session:
+            assert len(StockQueries.get_daily_prices(session, '005930')) == 5
+        db.dispose()
+
+    def test_integer_dates_step(self, db_url, legacy_db, make_prices):
+        """선택 단계: 기존 레이아웃에서 정수 일자까지 변환하고 복사 중 쓰기도 변환해 반영"""
+        db = legacy_db
+
+        def write_between_batches(table_name, copied, total):
+            if copied == 2 and MigrationRunner(db).current_version() == 2:
+                with db.engine.begin() as conn:
+                    conn.execute(text(
+                        "INSERT INTO daily_price (ticker, date, open, high, low, close, volume) "
+                        "VALUES ('005930', '2024-01-10', 1, 1, 1, 1, 1)"
+                    ))
+                    conn.execute(text("DELETE FROM daily_price WHERE date = '2024-01-05'"))
+
+        with db.get_session() as session:
+            DataSaver(session).save_fetched(
+                '005930', 'daily_price', date(2023, 12, 1), 'save_daily_prices', pd.DataFrame()
+            )
+        applied = db.migrate(batch_size=2, progress=write_between_batches, integer_dates=True)
+
+        assert [m.version for m in applied] == [1, 2, 3]
+        db = Database(db_url=db_url)
+        with db.get_session() as session:
+            stored = session.execute(text("SELECT date FROM daily_price ORDER BY date")).scalars().all()
+            assert stored == [20240101, 20240102, 20240103, 20240104, 20240110]
+
+            DataSaver(session).save_daily_prices('005930', make_prices('2024-01-10', 2))
+            prices = StockQueries.get_daily_prices(session, '005930', start_date=date(2024, 1, 4))
+            assert [p.date for p in prices] == [date(2024, 1, 4), date(2024, 1, 10), date(2024, 1, 11)]
+
+            coverage = session.get(DataCoverage, ('005930', 'daily_price'))
+            assert (coverage.min_date, coverage.max_date) == (date(2024, 1, 1), date(2024, 1, 11))
+            assert coverage.checked_from == date(2023, 12, 1)
+            assert session.execute(text("SELECT checked_from FROM data_coverage")).scalar() == 20231201
+        db.dispose()
+
+    def test_integer_dates_on_current_database(self, db_url, file_database):
+        """최신 버전으로 기록된 DB에도 선택 단계만 적용하고, 기본 목록 기준으로는 남은 단계 없음"""
+        db = file_database
+
+        applied = db.migrate(integer_dates=True)
+
+        assert applied == [INTEGER_DATES_MIGRATION]
+        assert MigrationRunner(db).applied_versions() == {1, 2, 3}
+        db = Database(db_url=db_url)
+        db.create_tables()
+        assert MigrationRunner(db).pending() == []
+        with db.engine.connect() as conn:
+            assert describe_table(conn, 'daily_price')['integer_dates'] is True
+        with db.get_session() as session:
+            assert session.query(DailyPrice).count() == 0
+        db.dispose()
+
+    def test_target_and_custom_steps(self, file_database):
+        """번호 순서로 정렬해 target까지만 실행하고, 나머지는 다음 실행에서 적용"""
+        db = file_database
+        add_index = Migration(3, 'add_stock_name_index',
+                              lambda conn, context: create_index(conn, 'idx_stock_name', 'stocks', ['name']))
+        drop_index = Migration(4, 'drop_stock_name_index',
+                               lambda conn, context: conn.exec_driver_sql('DROP INDEX idx_stock_name'))
+        runner = MigrationRunner(db, migrations=MIGRATIONS + [drop_index, add_index])
+
+        assert [m.version for m in runner.pending()] == [3, 4]
+        assert runner.upgrade(target=3) == [add_index]
+        assert 'idx_stock_name' in index_names(db, 'stocks')
+        assert runner.upgrade() == [drop_index]
+        assert 'idx_stock_name' not in index_names(db, 'stocks')
+        assert runner.current_version() == 4
+        db.dispose()
+
+    def test_requires_sqlite(self):
+        """SQLite가 아니면 NotImplementedError"""
+        db = MagicMock()
+        db.engine.dialect.name = 'postgresql'
+        runner = MigrationRunner(db)
+        runner.current_version = lambda: 0
+
+        with pytest.raises(NotImplementedError):
+            runner.upgrade()
@@ -4,13 +4,15 @@ StockQueries 클래스 테스트
 
 import pytest
 from datetime import date, timedelta
+from sqlalchemy import event
 import sys
 import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from database.queries import StockQueries
-from models import Stock, DailyPrice, MarketCap, Fundamental, TradingByInvestor
+from krx.saver import DataSaver
+from models import Stock, DailyPrice, MarketCap, Fundamental, TradingByInvestor, DataCoverage
 
 
 class TestStockQueries:
@@ -394,3 +396,96 @@ class TestStockQueries:
             ticker=sample_stock_data['ticker']
         ).all()
         assert len(remaining_mcaps) == 2
+
+        # 보유 구간도 삭제 후 기준으로 다시 계산
+        coverage = db_session.get(DataCoverage, (sample_stock_data['ticker'], 'daily_price'))
+        assert (coverage.min_date, coverage.row_count) == (date(2024, 1, 1), 2)
+
+    def test_get_coverage_index(self, db_session, sample_ohlcv_df, sample_market_cap_df):
+        """전체 데이터셋의 종목별 보유 구간을 한 번에 조회"""
+        saver = DataSaver(db_session)
+        saver.save_daily_prices('005930', sample_ohlcv_df)
+        saver.save_market_caps('005930', sample_market_cap_df.iloc[:2])
+        saver.save_daily_prices('000660', sample_ohlcv_df.iloc[:1])
+
+        index = StockQueries.get_coverage_index(db_session)
+
+        assert set(index) == {'daily_price', 'market_cap'}
+        assert index['daily_price']['005930'].max_date == date(2024, 1, 5)
+        assert index['market_cap']['005930'].max_date == date(2024, 1, 2)
+        assert index['daily_price']['000660'].row_count == 1
+
+        filtered = StockQueries.get_coverage_index(db_session, tickers=['000660'], datasets=['daily_price'])
+        assert list(filtered['daily_price']) == ['000660']
+        assert StockQueries.get_coverage(db_session, MarketCap) == {
+            '005930': (date(2024, 1, 1), date(2024, 1, 2))
+        }
+
+    def test_batched_latest_lookups(self, db_session):
+        """여러 종목의 최근 주가/투자자 매매/펀더멘탈을 각각 쿼리 1회로 조회"""
+        for ticker in ('005930', '000660'):
+            db_session.add(Stock(ticker=ticker, name=ticker, market='KOSPI'))
+            for day in range(1, 6):
+                d = date(2024, 1, day)
+                db_session.add(DailyPrice(ticker=ticker, date=d, open=100, high=110, low=90,
+                                          close=100 + day, volume=1000))
+                db_session.add(TradingByInvestor(ticker=ticker, date=d, foreigner_net=day))
+            db_session.add(Fundamental(ticker=ticker, date=date(2024, 1, 2), per=10.0))
+            db_session.add(Fundamental(ticker=ticker, date=date(2024, 1, 5), per=12.0))
+        db_session.add(Stock(ticker='035420', name='NAVER', market='KOSPI'))
+        db_session.commit()
+
+        statements = []
+        event.listen(db_session.bind, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+        tickers = ['005930', '000660', '035420']
+
+        prices = StockQueries.get_latest_prices(db_session, tickers)
+        flows = StockQueries.get_recent_investor_flows(db_session, tickers, 3, end_date=date(2024, 1, 4))
+        fundamentals = StockQueries.get_latest_fundamentals_as_of(db_session, tickers, date(2024, 1, 4))
+
+        assert len(statements) == 3
+        assert set(prices) == {'005930', '000660'}
+        assert prices['005930'].date == date(2024, 1, 5) and prices['005930'].close == 105
+        assert [f.date.day for f in flows['000660']] == [4, 3, 2]
+        assert '035420' not in flows
+        assert fundamentals['005930'].date == date(2024, 1, 2)
+        assert fundamentals['005930'].per == 10.0
+
+    def test_as_of_lookups(self, db_session):
+        """기준일 이전(포함) 최근 행 조회 (종목 하나/여러 종목/최근 N행)"""
+        db_session.add(Stock(ticker='005930', name='삼성전자', market='KOSPI'))
+        db_session.add(Stock(ticker='000660', name='SK하이닉스', market='KOSPI'))
+        for day in (2, 5, 9):
+            db_session.add(Fundamental(ticker='005930', date=date(2024, 1, day), per=float(day)))
+        db_session.add(MarketCap(ticker='000660', date=date(2024, 1, 3), market_cap=1, trading_volume=1,
+                                 trading_value=1, outstanding_shares=1))
+        db_session.commit()
+
+        assert StockQueries.get_as_of(db_session, Fundamental, '005930', date(2024, 1, 8)).per == 5.0
+        assert StockQueries.get_as_of(db_session, Fundamental, '005930').per == 9.0
+        assert StockQueries.get_as_of(db_session, Fundamental, '005930', date(2024, 1, 1)) is None
+
+        many = StockQueries.get_as_of_many(db_session, Fundamental, ['005930', '000660'], date(2024, 1, 5))
+        assert list(many) == ['005930'] and many['005930'].date == date(2024, 1, 5)
+        caps = StockQueries.get_as_of_many(db_session, MarketCap, ['005930', '000660'])
+        assert list(caps) == ['000660']
+
+        recent = StockQueries.get_recent_as_of(db_session, Fundamental, ['005930'], 2, date(2024, 1, 8))
+        assert [f.date.day for f in recent['005930']] == [5, 2]
+        # 행이 N개보다 적으면 있는 만큼
+        recent = StockQueries.get_recent_as_of(db_session, Fundamental, ['005930'], 5)
+        assert [f.date.day for f in recent['005930']] == [9, 5, 2]
+
+    def test_as_of_lookups_use_primary_key(self, db_session):
+        """as-of 조회는 종목별 데이터 테이블을 전체 스캔하지 않고 PK 인덱스로 탐색"""
+        statements = []
+        event.listen(db_session.bind, 'before_cursor_execute',
+                     lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters)))
+
+        StockQueries.get_as_of_many(db_session, Fundamental, ['005930'], date(2024, 1, 5))
+        StockQueries.get_recent_as_of(db_session, TradingByInvestor, ['005930'], 5, date(2024, 1, 5))
+
+        connection = db_session.connection()
+        for statement, parameters in list(statements):
+            plan = [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)]
+            assert not any(step.startswith('SCAN') for step in plan), plan
@@ -0,0 +1,235 @@
+"""
+FetchPlanner 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from fetch_planner import FetchPlanner, FetchJob, group_jobs_by_ticker
+from krx.saver import DataSaver
+
+
+def add_prices(session, ticker, *days):
+    """지정한 날짜들의 일별 주가 저장 (DataSaver 경유 - data_coverage 함께 갱신)"""
+    saver = DataSaver(session)
+    saver.save_stock(ticker, f"종목{ticker}", "KOSPI")
+    saver.save_daily_prices(ticker, pd.DataFrame({
+        '시가': 100, '고가': 110, '저가': 90, '종가': 105, '거래량': 1000
+    }, index=pd.to_datetime(list(days))))
+
+
+class TestFetchPlanner:
+    """FetchPlanner 클래스 테스트"""
+
+    def test_new_ticker_uses_full_window(self, db_session):
+        """데이터가 없으면 start_date부터 전체 구간"""
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 11, 4), datasets=['daily_price']
+        )
+
+        assert jobs == [FetchJob("000001", "daily_price", date(2025, 11, 4), date(2025, 12, 4))]
+
+    def test_existing_ticker_fetches_only_gap(self, db_session):
+        """전일까지 저장되어 있으면 하루만 수집"""
+        add_prices(db_session, "000001", date(2025, 12, 2), date(2025, 12, 3))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 12, 4), datasets=['daily_price']
+        )
+
+        assert jobs == [FetchJob("000001", "daily_price", date(2025, 12, 4), date(2025, 12, 4))]
+
+    def test_long_outage_starts_after_last_saved(self, db_session):
+        """수집 기간보다 긴 공백이 있어도 마지막 저장일 다음 날부터 수집"""
+        add_prices(db_session, "000001", date(2025, 10, 1))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 12, 4), datasets=['daily_price']
+        )
+
+        assert jobs[0].start_date == date(2025, 10, 2)
+
+    def test_up_to_date_ticker_has_no_job(self, db_session):
+        """기준일까지 저장되어 있으면 작업 없음"""
+        add_prices(db_session, "000001", date(2025, 12, 4))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 12, 4), datasets=['daily_price']
+        )
+
+        assert jobs == []
+
+    def test_earlier_start_fetches_head_gap(self, db_session):
+        """start_date가 최초 저장일보다 앞서면 앞쪽 구간도 수집 (중간 누락은 찾지 않음)"""
+        add_prices(db_session, "000001", date(2025, 12, 1), date(2025, 12, 3))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 11, 24), datasets=['daily_price']
+        )
+
+        assert jobs == [
+            FetchJob("000001", "daily_price", date(2025, 11, 24), date(2025, 11, 30)),
+            FetchJob("000001", "daily_price", date(2025, 12, 4), date(2025, 12, 4)),
+        ]
+
+    def test_head_gap_without_trading_day_skipped(self, db_session):
+        """앞쪽 구간이 주말뿐이면 작업을 만들지 않음"""
+        add_prices(db_session, "000001", date(2025, 12, 1), date(2025, 12, 4))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 11, 29), datasets=['daily_price']
+        )
+
+        assert jobs == []
+
+    def test_checked_head_gap_planned_once(self, db_session):
+        """신규 상장 종목처럼 앞쪽 구간을 조회했는데 데이터가 없으면 다음 계획에서 빼기"""
+        add_prices(db_session, "000001", date(2025, 12, 1), date(2025, 12, 3))
+        planner = FetchPlanner(db_session)
+
+        def plan():
+            return planner.plan(
+                ["000001"], end_date=date(2025, 12, 4),
+                start_date=date(2025, 11, 24), datasets=['daily_price']
+            )
+
+        assert plan()[0] == FetchJob("000001", "daily_price", date(2025, 11, 24), date(2025, 11, 30))
+
+        # 앞쪽 구간 조회 결과가 비어 있음 (조회 시작일만 기록)
+        DataSaver(db_session).save_fetched(
+            "000001", "daily_price", date(2025, 11, 24), "save_daily_prices", pd.DataFrame()
+        )
+
+        assert plan() == [FetchJob("000001", "daily_price", date(2025, 12, 4), date(2025, 12, 4))]
+
+    def test_optional_dataset_uses_checked_daily_price(self, db_session):
+        """공매도 데이터가 없는 종목은 일별 주가의 조회 시작일까지 따름"""
+        add_prices(db_session, "000001", date(2025, 12, 1), date(2025, 12, 3))
+        DataSaver(db_session).save_fetched(
+            "000001", "daily_price", date(2025, 11, 24), "save_daily_prices", pd.DataFrame()
+        )
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 11, 24), datasets=['short_selling']
+        )
+
+        assert jobs == [FetchJob("000001", "short_selling", date(2025, 12, 4), date(2025, 12, 4))]
+
+    def test_weekend_only_gap_has_no_job(self, db_session):
+        """남은 구간이 주말뿐이면 작업 없음"""
+        # 금요일까지 저장, 기준일은 일요일
+        add_prices(db_session, "000001", date(2025, 12, 5))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 7),
+            start_date=date(2025, 12, 7), datasets=['daily_price']
+        )
+
+        assert jobs == []
+
+    def test_holiday_only_gap_has_no_job(self, db_session, mocker):
+        """남은 구간이 휴장일뿐이면 작업 없음 (거래일 달력 기준)"""
+        # 10/2(목)까지 저장, 기준일은 추석 연휴 중인 10/8(수)
+        add_prices(db_session, "000001", date(2025, 10, 2))
+        calendar = mocker.Mock()
+        calendar.next_trading_day.return_value = date(2025, 10, 10)
+        planner = FetchPlanner(db_session, calendar=calendar)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 10, 8),
+            start_date=date(2025, 10, 8), datasets=['daily_price']
+        )
+
+        assert jobs == []
+        calendar.next_trading_day.assert_called_once_with(date(2025, 10, 3))
+
+    def test_plans_each_dataset_separately(self, db_session):
+        """데이터셋별 보유 구간을 따로 계산"""
+        add_prices(db_session, "000001", date(2025, 12, 1), date(2025, 12, 4))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 12, 1), datasets=['daily_price', 'fundamental']
+        )
+
+        assert jobs == [FetchJob("000001", "fundamental", date(2025, 12, 1), date(2025, 12, 4))]
+
+    def test_optional_dataset_follows_daily_price(self, db_session):
+        """공매도 데이터가 없는 종목은 일별 주가 저장일 이후만 수집"""
+        add_prices(db_session, "000001", date(2025, 11, 4), date(2025, 12, 3))
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(
+            ["000001"], end_date=date(2025, 12, 4),
+            start_date=date(2025, 11, 4), datasets=['short_selling']
+        )
+
+        assert jobs == [FetchJob("000001", "short_selling", date(2025, 12, 4), date(2025, 12, 4))]
+
+    def test_all_datasets_by_default(self, db_session):
+        """datasets 미지정 시 전체 데이터셋 계획"""
+        planner = FetchPlanner(db_session)
+
+        jobs = planner.plan(["000001"], end_date=date(2025, 12, 4), start_date=date(2025, 12, 4))
+
+        assert {job.dataset for job in jobs} == {
+            'daily_price', 'market_cap', 'fundamental',
+            'trading', 'short_selling', 'short_balance'
+        }
+
+
+class TestGroupJobsByTicker:
+    """group_jobs_by_ticker 함수 테스트"""
+
+    def test_group_by_ticker(self):
+        """종목별 {데이터셋: (시작일, 종료일)}로 묶기"""
+        jobs = [
+            FetchJob("000001", "daily_price", date(2025, 12, 1), date(2025, 12, 4)),
+            FetchJob("000001", "fundamental", date(2025, 12, 4), date(2025, 12, 4)),
+            FetchJob("000002", "daily_price", date(2025, 11, 3), date(2025, 12, 4)),
+        ]
+
+        grouped = group_jobs_by_ticker(jobs)
+
+        assert grouped == {
+            "000001": {
+                "daily_price": ("20251201", "20251204"),
+                "fundamental": ("20251204", "20251204"),
+            },
+            "000002": {"daily_price": ("20251103", "20251204")},
+        }
+
+    def test_merge_head_and_tail(self):
+        """같은 데이터셋의 앞/뒤 구간은 전체를 덮는 한 구간으로 합침"""
+        jobs = [
+            FetchJob("000001", "daily_price", date(2025, 11, 24), date(2025, 11, 28)),
+            FetchJob("000001", "daily_price", date(2025, 12, 4), date(2025, 12, 4)),
+        ]
+
+        assert group_jobs_by_ticker(jobs) == {"000001": {"daily_price": ("20251124", "20251204")}}
+
+    def test_empty_jobs(self):
+        """작업이 없으면 빈 dict"""
+        assert group_jobs_by_ticker([]) == {}
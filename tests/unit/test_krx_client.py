@@ -11,6 +11,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from krx.client import KRXClient
+from krx.retry import CircuitOpenError
 
 
 class TestKRXClient:
@@ -82,6 +83,33 @@ class TestKRXClient:
 
         assert mock_func.call_count == client.MAX_RETRIES  # MAX_RETRIES(3)번 시도
 
+    def test_retry_on_error_permanent_error_not_retried(self, db_session):
+        """데이터 없음 계열 오류는 재시도하지 않음"""
+        client = KRXClient(db_session)
+        mock_func = MagicMock(__name__='test_func', side_effect=KeyError('종가'))
+
+        with pytest.raises(KeyError):
+            client._retry_on_error(mock_func)
+
+        assert mock_func.call_count == 1
+        assert KRXClient.retry_stats()['test_func']['permanent'] == 1
+
+    def test_retry_on_error_circuit_opens(self, db_session):
+        """연속 실패한 엔드포인트는 이후 호출 없이 즉시 실패"""
+        client = KRXClient(db_session)
+        mock_func = MagicMock(__name__='test_func', side_effect=ConnectionError("항상 실패"))
+
+        for _ in range(3):
+            with pytest.raises(Exception):
+                client._retry_on_error(mock_func)
+        calls = mock_func.call_count
+
+        with pytest.raises(CircuitOpenError):
+            client._retry_on_error(mock_func)
+
+        assert calls == client.CIRCUIT_FAILURE_THRESHOLD
+        assert mock_func.call_count == calls
+
     def test_get_ohlcv_success(self, db_session, mocker, sample_ohlcv_df, weekday_date):
         """OHLCV 조회 성공"""
         mock_stock = mocker.patch('krx.client.stock')
@@ -162,16 +190,26 @@ class TestKRXClient:
         assert '거래량' in result.columns
         mock_stock.get_shorting_volume_by_date.assert_called_once()
 
-    def test_get_short_selling_volume_failure_returns_empty(self, db_session, mocker, weekday_date):
-        """공매도 거래량 조회 실패 시 빈 DataFrame 반환"""
+    def test_get_short_selling_volume_no_data_returns_empty(self, db_session, mocker, weekday_date):
+        """공매도 거래량 데이터 없음(영구 오류) 시 빈 DataFrame 반환"""
         mock_stock = mocker.patch('krx.client.stock')
-        mock_stock.get_shorting_volume_by_date.side_effect = Exception("조회 실패")
+        mock_stock.get_shorting_volume_by_date.side_effect = KeyError("데이터 없음")
 
         client = KRXClient(db_session)
         result = client.get_short_selling_volume('005930', weekday_date, weekday_date)
 
         assert result.empty
-        # 예외를 포착하고 빈 DataFrame 반환해야 함
+
+    def test_get_short_selling_volume_transient_failure_raises(self, db_session, mocker, weekday_date):
+        """공매도 거래량 일시 오류는 재시도 후 예외 전파 (데이터 없음과 구분)"""
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_shorting_volume_by_date.side_effect = Exception("조회 실패")
+
+        client = KRXClient(db_session)
+        with pytest.raises(Exception, match="조회 실패"):
+            client.get_short_selling_volume('005930', weekday_date, weekday_date)
+
+        assert mock_stock.get_shorting_volume_by_date.call_count == KRXClient.MAX_RETRIES
 
     def test_get_short_balance_success(self, db_session, mocker, sample_short_balance_df, weekday_date):
         """공매도 잔고 조회 성공"""
@@ -186,13 +224,53 @@ class TestKRXClient:
         assert '잔고비율' in result.columns
         mock_stock.get_shorting_balance_by_date.assert_called_once()
 
-    def test_get_short_balance_failure_returns_empty(self, db_session, mocker, weekday_date):
-        """공매도 잔고 조회 실패 시 빈 DataFrame 반환"""
+    def test_get_short_balance_no_data_returns_empty(self, db_session, mocker, weekday_date):
+        """공매도 잔고 데이터 없음(영구 오류) 시 빈 DataFrame 반환"""
         mock_stock = mocker.patch('krx.client.stock')
-        mock_stock.get_shorting_balance_by_date.side_effect = Exception("조회 실패")
+        mock_stock.get_shorting_balance_by_date.side_effect = KeyError("데이터 없음")
 
         client = KRXClient(db_session)
         result = client.get_short_balance('005930', weekday_date, weekday_date)
 
         assert result.empty
-        # 예외를 포착하고 빈 DataFrame 반환해야 함
+
+    def test_get_short_balance_transient_failure_raises(self, db_session, mocker, weekday_date):
+        """공매도 잔고 일시 오류는 재시도 후 예외 전파 (데이터 없음과 구분)"""
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_shorting_balance_by_date.side_effect = Exception("조회 실패")
+
+        client = KRXClient(db_session)
+        with pytest.raises(Exception, match="조회 실패"):
+            client.get_short_balance('005930', weekday_date, weekday_date)
+
+        assert mock_stock.get_shorting_balance_by_date.call_count == KRXClient.MAX_RETRIES
+
+    def test_get_market_ohlcv_by_ticker(self, db_session, mocker, weekday_date):
+        """전체 시장 OHLCV 조회 (날짜 기준)"""
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_market_ohlcv_by_ticker.return_value = pd.DataFrame(
+            {'종가': [70000]}, index=['005930']
+        )
+
+        client = KRXClient(db_session)
+        result = client.get_market_ohlcv_by_ticker(weekday_date, 'KOSDAQ')
+
+        assert list(result.index) == ['005930']
+        mock_stock.get_market_ohlcv_by_ticker.assert_called_once_with(weekday_date, market='KOSDAQ')
+
+    def test_rate_limiter_shared_between_instances(self, db_session):
+        """모든 인스턴스가 같은 호출 제한기를 공유"""
+        client1 = KRXClient(db_session)
+        client2 = KRXClient(db_session)
+
+        assert client1.rate_limiter is client2.rate_limiter
+        assert client1.rate_limiter is KRXClient.shared_rate_limiter
+
+    def test_custom_rate_limiter(self, db_session):
+        """호출 제한기 주입"""
+        limiter = MagicMock()
+        client = KRXClient(db_session, rate_limiter=limiter)
+
+        client._wait_for_rate_limit()
+
+        limiter.acquire.assert_called_once()
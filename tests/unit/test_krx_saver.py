@@ -12,7 +12,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from krx.saver import DataSaver
-from models import Stock, DailyPrice
+from models import Stock, DailyPrice, DataCoverage, Fundamental
 
 
 class TestDataSaver:
@@ -235,3 +235,256 @@ class TestDataSaver:
         # 총 4개 행 존재 (3 + 1)
         total = db_session.query(DailyPrice).filter_by(ticker=sample_stock_data['ticker']).count()
         assert total == 4
+
+    def test_bulk_save_single_commit(self, db_session, sample_stock_data, sample_ohlcv_df, mocker):
+        """DataFrame 전체를 한 번의 commit으로 저장"""
+        saver = DataSaver(db_session)
+        saver.save_stock(**sample_stock_data)
+
+        commit_spy = mocker.spy(db_session, 'commit')
+        count = saver.save_daily_prices(sample_stock_data['ticker'], sample_ohlcv_df)
+
+        assert count == 5
+        assert commit_spy.call_count == 1
+
+    def test_save_daily_prices_required_null_excluded(self, db_session, sample_stock_data):
+        """필수 컬럼이 NULL인 행은 제외하고 나머지만 저장"""
+        saver = DataSaver(db_session)
+        saver.save_stock(**sample_stock_data)
+
+        dates = pd.date_range('2024-01-01', periods=3, freq='D')
+        df = pd.DataFrame({
+            '시가': [70000, None, 70500],
+            '고가': [71000, 72000, 71500],
+            '저가': [69500, 70500, 70000],
+            '종가': [70500, 71500, 71000],
+            '거래량': [10000000, 12000000, 11000000]
+        }, index=dates)
+
+        count = saver.save_daily_prices(sample_stock_data['ticker'], df)
+
+        assert count == 2
+        saved_dates = [p.date for p in db_session.query(DailyPrice).order_by(DailyPrice.date)]
+        assert saved_dates == [date(2024, 1, 1), date(2024, 1, 3)]
+
+    def test_save_stocks_bulk(self, db_session):
+        """종목 일괄 등록 (기존 종목은 스킵)"""
+        saver = DataSaver(db_session)
+        saver.save_stock('005930', '삼성전자', 'KOSPI')
+
+        count = saver.save_stocks([
+            ('005930', '삼성전자', 'KOSPI'),
+            ('000660', 'SK하이닉스', 'KOSPI'),
+            ('035720', '카카오', 'KOSPI'),
+        ])
+
+        assert count == 2
+        assert db_session.query(Stock).count() == 3
+
+    def test_sync_stocks_diff(self, db_session):
+        """종목 동기화: 신규/종목명 변경/시장 이동/상장폐지를 한 번에 반영"""
+        saver = DataSaver(db_session)
+        saver.sync_stocks([
+            ('005930', '삼성전자', 'KOSPI'),
+            ('000660', '하이닉스', 'KOSPI'),
+            ('247540', '에코프로비엠', 'KOSDAQ'),
+            ('123450', '상장폐지종목', 'KOSDAQ'),
+        ])
+        unchanged_at = db_session.get(Stock, '005930').updated_at
+
+        diff = saver.sync_stocks([
+            ('005930', '삼성전자', 'KOSPI'),
+            ('000660', 'SK하이닉스', 'KOSPI'),
+            ('247540', '에코프로비엠', 'KOSPI'),
+            ('035720', '카카오', 'KOSPI'),
+        ], markets=('KOSPI', 'KOSDAQ'))
+
+        assert diff.new == ['035720']
+        assert diff.renamed == [('000660', '하이닉스', 'SK하이닉스')]
+        assert diff.moved == [('247540', 'KOSDAQ', 'KOSPI')]
+        assert diff.delisted == ['123450']
+        assert diff.changed == 4
+
+        db_session.expire_all()
+        assert db_session.get(Stock, '000660').name == 'SK하이닉스'
+        assert db_session.get(Stock, '247540').market == 'KOSPI'
+        assert db_session.get(Stock, '123450').delisted_at is not None
+        assert db_session.get(Stock, '005930').updated_at == unchanged_at
+
+    def test_sync_stocks_relisted_and_scope(self, db_session):
+        """상장폐지 종목이 다시 나오면 신규로 복구, 지정하지 않은 시장은 상장폐지 판정 안 함"""
+        saver = DataSaver(db_session)
+        saver.sync_stocks([('005930', '삼성전자', 'KOSPI'), ('247540', '에코프로비엠', 'KOSDAQ')])
+        saver.sync_stocks([], markets=('KOSPI',))
+
+        diff = saver.sync_stocks([('005930', '삼성전자', 'KOSPI')], markets=('KOSPI',))
+
+        assert diff.new == ['005930']
+        assert diff.delisted == []
+        db_session.expire_all()
+        assert db_session.get(Stock, '005930').delisted_at is None
+        assert db_session.get(Stock, '247540').delisted_at is None
+
+    def test_save_stock_does_not_override_master(self, db_session):
+        """save_stock/save_stocks는 등록만 하고 동기화된 종목명/시장/상장폐지는 바꾸지 않음"""
+        saver = DataSaver(db_session)
+        saver.sync_stocks([('000660', 'SK하이닉스', 'KOSPI'), ('123450', '상장폐지종목', 'KOSDAQ')])
+        saver.sync_stocks([('000660', 'SK하이닉스', 'KOSPI')], markets=('KOSPI', 'KOSDAQ'))
+
+        saver.save_stock('000660', '하이닉스', 'KOSDAQ')
+        assert saver.save_stocks([('123450', '상장폐지종목', 'KOSDAQ')]) == 0
+
+        db_session.expire_all()
+        hynix = db_session.get(Stock, '000660')
+        assert (hynix.name, hynix.market) == ('SK하이닉스', 'KOSPI')
+        assert db_session.get(Stock, '123450').delisted_at is not None
+
+    def test_save_daily_prices_by_date(self, db_session):
+        """날짜별 전체 시장 주가 저장 (종목코드 인덱스)"""
+        saver = DataSaver(db_session)
+        df = pd.DataFrame({
+            '시가': [70000, 120000],
+            '고가': [71000, 125000],
+            '저가': [69500, 119000],
+            '종가': [70500, 124000],
+            '거래량': [10000000, 3000000]
+        }, index=pd.Index(['005930', '000660'], name='티커'))
+
+        count = saver.save_daily_prices_by_date('20240103', df)
+
+        assert count == 2
+        price = db_session.query(DailyPrice).filter_by(ticker='000660').one()
+        assert price.date == date(2024, 1, 3)
+        assert price.close == 124000
+
+        # 같은 날짜 재저장 시 모두 스킵
+        assert saver.save_daily_prices_by_date('20240103', df) == 0
+
+    def test_batch_single_commit(self, db_session, sample_ohlcv_df, mocker):
+        """batch() 블록 안의 여러 저장은 블록 끝에서 한 번만 commit"""
+        saver = DataSaver(db_session)
+        commit_spy = mocker.spy(db_session, 'commit')
+
+        with saver.batch():
+            saver.save_stock('005930', '삼성전자', 'KOSPI')
+            saver.save_stock('000660', 'SK하이닉스', 'KOSPI')
+            saver.save_daily_prices('005930', sample_ohlcv_df)
+            saver.save_daily_prices('000660', sample_ohlcv_df)
+
+        assert commit_spy.call_count == 1
+        assert db_session.query(DailyPrice).count() == 10
+
+    def test_batch_rolls_back_on_error(self, db_session, sample_ohlcv_df):
+        """batch() 블록에서 저장이 실패하면 0건으로 넘어가지 않고 블록 전체 rollback"""
+        saver = DataSaver(db_session)
+
+        with pytest.raises(KeyError):
+            with saver.batch():
+                saver.save_daily_prices('005930', sample_ohlcv_df)
+                saver.save_daily_prices('000660', sample_ohlcv_df.drop(columns=['종가']))
+
+        assert db_session.query(DailyPrice).count() == 0
+        assert saver.in_batch is False
+
+    def test_save_updates_coverage(self, db_session, sample_ohlcv_df):
+        """저장 시 같은 트랜잭션에서 data_coverage 갱신 (중복 행은 세지 않음)"""
+        saver = DataSaver(db_session)
+
+        saver.save_daily_prices('005930', sample_ohlcv_df.iloc[:3])
+        saver.save_daily_prices('005930', sample_ohlcv_df)  # 3건 중복 + 2건 신규
+
+        coverage = db_session.get(DataCoverage, ('005930', 'daily_price'))
+        assert coverage.min_date == date(2024, 1, 1)
+        assert coverage.max_date == date(2024, 1, 5)
+        assert coverage.row_count == 5
+        assert coverage.last_ingested_at is not None
+
+    def test_save_by_date_updates_coverage_per_ticker(self, db_session):
+        """날짜별 전체 시장 저장은 종목마다 구간 갱신"""
+        saver = DataSaver(db_session)
+        df = pd.DataFrame({
+            '시가': [70000, 120000], '고가': [71000, 125000], '저가': [69500, 119000],
+            '종가': [70500, 124000], '거래량': [10000000, 3000000]
+        }, index=pd.Index(['005930', '000660'], name='티커'))
+
+        saver.save_daily_prices_by_date('20240103', df)
+        saver.save_daily_prices_by_date('20240102', df.iloc[:1])
+
+        samsung = db_session.get(DataCoverage, ('005930', 'daily_price'))
+        hynix = db_session.get(DataCoverage, ('000660', 'daily_price'))
+        assert (samsung.min_date, samsung.max_date, samsung.row_count) == (date(2024, 1, 2), date(2024, 1, 3), 2)
+        assert (hynix.min_date, hynix.max_date, hynix.row_count) == (date(2024, 1, 3), date(2024, 1, 3), 1)
+
+    def test_rollback_discards_coverage(self, db_session, sample_ohlcv_df):
+        """배치가 rollback되면 구간 갱신도 함께 취소"""
+        saver = DataSaver(db_session)
+
+        with pytest.raises(KeyError):
+            with saver.batch():
+                saver.save_daily_prices('005930', sample_ohlcv_df)
+                saver.save_daily_prices('000660', sample_ohlcv_df.drop(columns=['종가']))
+
+        assert db_session.query(DataCoverage).count() == 0
+
+    def test_rebuild_coverage(self, db_session):
+        """직접 넣은 데이터는 rebuild_coverage로 구간 계산"""
+        for day in (date(2024, 1, 2), date(2024, 1, 3)):
+            db_session.add(DailyPrice(ticker='005930', date=day, open=1, high=1, low=1, close=1, volume=1))
+        db_session.commit()
+
+        assert DataSaver(db_session).rebuild_coverage() == 1
+
+        coverage = db_session.get(DataCoverage, ('005930', 'daily_price'))
+        assert (coverage.min_date, coverage.max_date, coverage.row_count) == (date(2024, 1, 2), date(2024, 1, 3), 2)
+
+    def test_upsert_updates_only_changed_rows(self, db_session, sample_ohlcv_df):
+        """upsert 모드는 값이 바뀐 행만 갱신하고 updated_at 기록"""
+        DataSaver(db_session).save_daily_prices('005930', sample_ohlcv_df.iloc[:3])
+
+        corrected = sample_ohlcv_df.copy()
+        corrected.iloc[1, corrected.columns.get_loc('종가')] = 99999
+        saver = DataSaver(db_session, upsert=True)
+        saved = saver.save_daily_prices('005930', corrected)  # 1건 수정 + 2건 동일 + 2건 신규
+
+        assert saved == 3
+        assert saver.counts == {'inserted': 2, 'updated': 1, 'unchanged': 2}
+
+        changed = db_session.query(DailyPrice).filter_by(ticker='005930', date=date(2024, 1, 2)).one()
+        same = db_session.query(DailyPrice).filter_by(ticker='005930', date=date(2024, 1, 1)).one()
+        new = db_session.query(DailyPrice).filter_by(ticker='005930', date=date(2024, 1, 5)).one()
+        assert changed.close == 99999
+        assert changed.updated_at is not None
+        assert same.updated_at is None
+        assert new.updated_at is None
+
+        # 보유 구간 행 수는 신규 행만 반영
+        coverage = db_session.get(DataCoverage, ('005930', 'daily_price'))
+        assert coverage.row_count == 5
+
+    def test_upsert_partial_frame_keeps_missing_columns(self, db_session, sample_fundamental_df):
+        """원본에 없는 컬럼은 upsert로 NULL이 되지 않고, 있는 컬럼 값이 같으면 동일로 집계"""
+        DataSaver(db_session).save_fundamentals('005930', sample_fundamental_df)
+
+        partial = sample_fundamental_df[['PER']].copy()
+        partial.iloc[0, 0] = 20.0
+        saver = DataSaver(db_session, upsert=True)
+        saved = saver.save_fundamentals('005930', partial)
+
+        assert saved == 1
+        assert saver.counts == {'inserted': 0, 'updated': 1, 'unchanged': 4}
+        db_session.expire_all()
+        first = db_session.query(Fundamental).filter_by(ticker='005930', date=date(2024, 1, 1)).one()
+        assert first.per == pytest.approx(20.0)
+        assert (first.bps, first.eps, first.dps) == (45000, 4500, 1500)
+
+    def test_default_mode_keeps_existing_rows(self, db_session, sample_ohlcv_df):
+        """기본 모드는 기존 행을 덮어쓰지 않고 동일로 집계"""
+        saver = DataSaver(db_session)
+        saver.save_daily_prices('005930', sample_ohlcv_df)
+
+        corrected = sample_ohlcv_df.copy()
+        corrected['종가'] = 1
+        assert saver.save_daily_prices('005930', corrected) == 0
+
+        assert saver.counts == {'inserted': 5, 'updated': 0, 'unchanged': 5}
+        assert db_session.query(DailyPrice).filter_by(ticker='005930', date=date(2024, 1, 1)).one().close == 70500
@@ -0,0 +1,91 @@
+"""
+DataFrame -> 모델 변환 규칙(mapping) 테스트
+"""
+
+import pytest
+import pandas as pd
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.mapping import MAPPINGS, ColumnSpec, TableMapping, convert_frame
+from models import DailyPrice, DATASET_MODELS
+
+
+class TestMappings:
+    """MAPPINGS 설정 테스트"""
+
+    def test_every_dataset_has_mapping(self):
+        """수집 데이터셋마다 같은 모델의 변환 규칙 존재"""
+        assert set(MAPPINGS) == set(DATASET_MODELS)
+        for dataset, mapping in MAPPINGS.items():
+            assert mapping.model is DATASET_MODELS[dataset]
+
+    def test_targets_are_model_columns(self):
+        """변환 대상 컬럼은 모두 모델에 존재"""
+        for mapping in MAPPINGS.values():
+            model_columns = set(mapping.model.__table__.columns.keys())
+            assert {spec.target for spec in mapping.columns} <= model_columns
+
+
+class TestConvertFrame:
+    """convert_frame 함수 테스트"""
+
+    def test_converts_types(self):
+        """정수는 소수점 이하 버림, 실수는 그대로, 변환 불가 값은 NULL"""
+        df = pd.DataFrame({
+            'BPS': [45000.9, '-'],
+            'PER': [15.5, None],
+            'PBR': ['1.56', 'N/A'],
+        }, index=pd.date_range('2024-01-01', periods=2))
+
+        result = convert_frame(df, MAPPINGS['fundamental'])
+
+        assert list(result.columns) == ['bps', 'per', 'pbr', 'eps', 'div', 'dps']
+        assert result['bps'].tolist()[0] == 45000
+        assert result['per'].tolist()[0] == 15.5
+        assert result['pbr'].tolist()[0] == 1.56
+        assert result.iloc[1][['bps', 'per', 'pbr']].isna().all()
+
+    def test_missing_nullable_columns_are_null(self):
+        """원본에 없는 NULL 허용 컬럼은 NULL"""
+        df = pd.DataFrame({'외국인합계': [100, -50]}, index=pd.date_range('2024-01-01', periods=2))
+
+        result = convert_frame(df, MAPPINGS['trading'])
+
+        assert result['foreigner_net'].tolist() == [100, -50]
+        assert result['institution_net'].isna().all()
+
+    def test_missing_required_column_raises(self):
+        """필수 컬럼이 없으면 KeyError"""
+        df = pd.DataFrame({'시가': [1], '고가': [1], '저가': [1], '거래량': [1]})
+
+        with pytest.raises(KeyError, match='종가'):
+            convert_frame(df, MAPPINGS['daily_price'])
+
+    def test_rows_missing_required_values_dropped(self):
+        """필수값이 없는 행은 제외"""
+        df = pd.DataFrame({
+            '시가': [100, None], '고가': [110, 120], '저가': [90, 95],
+            '종가': [105, 115], '거래량': [1000, 2000]
+        }, index=pd.date_range('2024-01-01', periods=2))
+
+        result = convert_frame(df, MAPPINGS['daily_price'])
+
+        assert len(result) == 1
+        assert result['close'].tolist() == [105]
+
+    def test_custom_mapping(self):
+        """새 데이터셋은 변환 규칙만 정의하면 같은 변환기로 처리"""
+        mapping = TableMapping(DailyPrice, '테스트', (
+            ColumnSpec('close_price', 'close', 'int', nullable=False),
+            ColumnSpec('vol', 'volume', 'float'),
+        ))
+        df = pd.DataFrame({'close_price': ['100', '200'], 'vol': [1.5, None]})
+
+        result = convert_frame(df, mapping)
+
+        assert result['close'].tolist() == [100, 200]
+        assert result['volume'].tolist()[0] == 1.5
+        assert pd.isna(result['volume'].tolist()[1])
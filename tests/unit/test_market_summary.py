@@ -0,0 +1,298 @@
+"""
+MarketSummary 클래스 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import date
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from analysis.market_summary import MarketSummary, MarketSnapshot
+
+
+@pytest.fixture
+def market_ohlcv_df():
+    """전 종목 OHLCV (get_market_ohlcv_by_ticker 형식)"""
+    return pd.DataFrame({
+        '시가': [10000, 20000, 5000],
+        '고가': [11000, 21000, 5200],
+        '저가': [9900, 19000, 4800],
+        '종가': [11000, 19000, 5100],
+        '거래량': [1000, 2000, 500000],
+    }, index=pd.Index(['000001', '000002', '000003'], name='티커'))
+
+
+@pytest.fixture
+def market_cap_df():
+    """전 종목 시가총액 (get_market_cap_by_ticker 형식)"""
+    return pd.DataFrame({
+        '종가': [11000, 19000, 5100],
+        '시가총액': [1100000000, 3800000000, 510000000],
+        '거래량': [1000, 2000, 500000],
+        '거래대금': [11000000, 38000000, 2550000000],
+        '상장주식수': [100000, 200000, 100000],
+    }, index=pd.Index(['000001', '000002', '000003'], name='티커'))
+
+
+@pytest.fixture(autouse=True)
+def mock_ticker_master(mocker):
+    """종목 마스터 모킹 (DB/네트워크 없음)"""
+    master = mocker.Mock()
+    master.get_name.side_effect = lambda ticker: f"종목{ticker}"
+    mocker.patch('analysis.market_summary.get_ticker_master', return_value=master)
+    return master
+
+
+@pytest.fixture
+def mock_stock(mocker, market_ohlcv_df, market_cap_df):
+    """pykrx stock 모듈 모킹"""
+    mock = mocker.patch('analysis.market_summary.stock')
+    mock.get_market_ohlcv_by_ticker.return_value = market_ohlcv_df
+    mock.get_market_cap_by_ticker.return_value = market_cap_df
+    return mock
+
+
+class TestMarketSnapshot:
+    """MarketSnapshot 클래스 테스트"""
+
+    def test_derived_columns(self, market_ohlcv_df):
+        """등락률/거래대금을 한 번에 계산"""
+        snapshot = MarketSnapshot("20251204", "KOSPI", market_ohlcv_df, lambda: pd.DataFrame())
+
+        assert snapshot.prices.loc['000001', '등락률'] == 10.0
+        assert snapshot.prices.loc['000002', '등락률'] == -5.0
+        assert snapshot.prices.loc['000003', '거래대금'] == 5100 * 500000
+        # 원본 DataFrame은 변경하지 않음
+        assert '등락률' not in market_ohlcv_df.columns
+
+    def test_empty_prices(self):
+        """빈 결과는 빈 DataFrame"""
+        snapshot = MarketSnapshot("20251206", "KOSPI", pd.DataFrame(), lambda: pd.DataFrame())
+
+        assert snapshot.prices.empty
+
+    def test_market_caps_fetched_once(self, mocker, market_ohlcv_df, market_cap_df):
+        """시가총액 표는 처음 접근할 때 한 번만 조회"""
+        fetch = mocker.Mock(return_value=market_cap_df)
+        snapshot = MarketSnapshot("20251204", "KOSPI", market_ohlcv_df, fetch)
+
+        fetch.assert_not_called()
+        snapshot.market_caps
+        snapshot.market_caps
+
+        fetch.assert_called_once()
+
+
+class TestMarketSummaryRankings:
+    """순위 조회 테스트"""
+
+    def test_rankings_share_one_snapshot(self, mock_stock):
+        """급등/급락/거래대금 조회가 같은 스냅샷 재사용"""
+        summary = MarketSummary()
+
+        summary.get_top_gainers("20251204", "KOSPI", 5)
+        summary.get_top_losers("20251204", "KOSPI", 5)
+        summary.get_top_volume("20251204", "KOSPI", 5)
+
+        mock_stock.get_market_ohlcv_by_ticker.assert_called_once_with("20251204", market="KOSPI")
+        mock_stock.get_market_cap_by_ticker.assert_called_once_with("20251204", market="KOSPI")
+        mock_stock.get_market_ticker_list.assert_not_called()
+
+    def test_snapshot_per_date_and_market(self, mock_stock):
+        """(날짜, 시장)별로 따로 조회"""
+        summary = MarketSummary()
+
+        summary.get_top_gainers("20251204", "KOSPI")
+        summary.get_top_gainers("20251204", "KOSDAQ")
+        summary.get_top_gainers("20251203", "KOSPI")
+        summary.get_top_losers("20251204", "KOSDAQ")
+
+        assert mock_stock.get_market_ohlcv_by_ticker.call_count == 3
+
+    def test_top_gainers(self, mock_stock):
+        """등락률 상위 종목 + 종목명"""
+        top = MarketSummary().get_top_gainers("20251204", "KOSPI", 2)
+
+        assert list(top.index) == ['000001', '000003']
+        assert list(top.columns) == ['종목명', '종가', '등락률', '거래량', '거래대금']
+        assert top.loc['000001', '종목명'] == '종목000001'
+
+    def test_names_from_ticker_master(self, mock_stock, mock_ticker_master):
+        """종목명은 종목 마스터에서 조회 (종목별 pykrx 호출 없음)"""
+        summary = MarketSummary()
+
+        summary.get_top_gainers("20251204", "KOSPI", 3)
+        summary.get_top_volume("20251204", "KOSPI", 3)
+
+        mock_ticker_master.ensure.assert_called_with("20251204")
+        mock_stock.get_market_ticker_name.assert_not_called()
+
+    def test_top_losers(self, mock_stock):
+        """등락률 하위 종목"""
+        bottom = MarketSummary().get_top_losers("20251204", "KOSPI", 1)
+
+        assert list(bottom.index) == ['000002']
+        assert bottom.loc['000002', '등락률'] == -5.0
+
+    def test_top_volume(self, mock_stock):
+        """거래대금 상위 종목 + 스냅샷 등락률"""
+        top = MarketSummary().get_top_volume("20251204", "KOSPI", 2)
+
+        assert list(top.index) == ['000003', '000002']
+        assert top.loc['000002', '시가총액'] == 3800000000
+        assert top.loc['000002', '등락률'] == -5.0
+
+    def test_empty_market(self, mock_stock):
+        """휴장일 등 빈 결과면 빈 DataFrame"""
+        mock_stock.get_market_ohlcv_by_ticker.return_value = pd.DataFrame()
+        mock_stock.get_market_cap_by_ticker.return_value = pd.DataFrame()
+        summary = MarketSummary()
+
+        assert summary.get_top_gainers("20251206").empty
+        assert summary.get_top_losers("20251206").empty
+        assert summary.get_top_volume("20251206").empty
+
+    def test_fetch_error_not_memoized(self, mock_stock, market_ohlcv_df):
+        """조회 실패는 저장하지 않고 다음 호출에서 재조회"""
+        mock_stock.get_market_ohlcv_by_ticker.side_effect = [Exception("KRX 오류"), market_ohlcv_df]
+        summary = MarketSummary()
+
+        assert summary.get_top_gainers("20251204").empty
+        assert not summary.get_top_gainers("20251204").empty
+
+    def test_snapshot_limit(self, mock_stock):
+        """보관 스냅샷 수 제한 (가장 오래된 것부터 제거)"""
+        summary = MarketSummary()
+        summary.MAX_SNAPSHOTS = 2
+
+        summary.get_snapshot("20251201")
+        summary.get_snapshot("20251202")
+        summary.get_snapshot("20251201")  # 최근 사용으로 갱신
+        summary.get_snapshot("20251203")  # 20251202 제거
+
+        assert list(summary._snapshots) == [("20251201", "KOSPI"), ("20251203", "KOSPI")]
+        assert mock_stock.get_market_ohlcv_by_ticker.call_count == 3
+
+
+@pytest.fixture
+def net_purchases_df():
+    """투자자 순매수 표 (get_market_net_purchases_of_equities 형식)"""
+    return pd.DataFrame({
+        '종목명': ['종목3', '종목1', '종목2'],
+        '매도거래량': [100, 200, 900],
+        '매수거래량': [500, 300, 100],
+        '순매수거래량': [400, 100, -800],
+        '매도거래대금': [510000, 2200000, 17100000],
+        '매수거래대금': [2550000, 3300000, 1900000],
+        '순매수거래대금': [2040000, 1100000, -15200000],
+    }, index=pd.Index(['000003', '000001', '000002'], name='티커'))
+
+
+class TestNetBuyTop:
+    """투자자별 순매수 상위 테스트"""
+
+    def test_one_call_per_investor(self, mock_stock, net_purchases_df):
+        """투자자당 시장 전체 조회 1회 (종목별 조회 없음)"""
+        mock_stock.get_market_net_purchases_of_equities.return_value = net_purchases_df
+
+        result = MarketSummary().get_net_buy_top("20251204", "KOSPI", ['외국인', '기관합계', '연기금'])
+
+        assert list(result) == ['외국인', '기관합계', '연기금']
+        assert mock_stock.get_market_net_purchases_of_equities.call_count == 3
+        mock_stock.get_market_net_purchases_of_equities.assert_any_call(
+            "20251204", "20251204", "KOSPI", "연기금"
+        )
+        mock_stock.get_market_ohlcv_by_ticker.assert_called_once()
+        mock_stock.get_market_trading_value_by_date.assert_not_called()
+        mock_stock.get_market_ohlcv.assert_not_called()
+
+    def test_ranks_net_buyers_with_close(self, mock_stock, net_purchases_df):
+        """순매수거래대금 순 정렬, 순매도 종목 제외, 스냅샷 종가 결합"""
+        mock_stock.get_market_net_purchases_of_equities.return_value = net_purchases_df
+
+        top = MarketSummary().get_net_buy_top("20251204", "KOSPI", ['기관합계'], n=5)['기관합계']
+
+        assert list(top.index) == ['000003', '000001']
+        assert top.loc['000003', '종가'] == 5100
+        assert top.loc['000001', '순매수거래량'] == 100
+
+    def test_failed_investor_returns_empty(self, mock_stock, net_purchases_df):
+        """한 투자자 조회 실패해도 나머지는 반환"""
+        mock_stock.get_market_net_purchases_of_equities.side_effect = [
+            Exception("KRX 오류"), net_purchases_df
+        ]
+
+        result = MarketSummary().get_net_buy_top("20251204", "KOSPI", ['외국인', '연기금'])
+
+        assert result['외국인'].empty
+        assert not result['연기금'].empty
+
+    def test_foreign_net_buy_top(self, mock_stock, net_purchases_df):
+        """외국인 순매수 상위 (기존 컬럼 형식 유지)"""
+        mock_stock.get_market_net_purchases_of_equities.return_value = net_purchases_df
+
+        top = MarketSummary().get_foreign_net_buy_top("20251204", "KOSPI", n=1)
+
+        assert list(top.columns) == ['종목명', '외국인순매수', '종가']
+        assert top.index.name == '종목코드'
+        assert top.loc['000003', '외국인순매수'] == 2040000
+        mock_stock.get_market_net_purchases_of_equities.assert_called_once_with(
+            "20251204", "20251204", "KOSPI", "외국인"
+        )
+
+    def test_foreign_net_buy_top_empty(self, mock_stock):
+        """데이터가 없으면 빈 DataFrame"""
+        mock_stock.get_market_net_purchases_of_equities.return_value = pd.DataFrame()
+
+        assert MarketSummary().get_foreign_net_buy_top("20251206").empty
+
+
+class TestIndexInfo:
+    """지수 정보 조회 테스트"""
+
+    @pytest.fixture
+    def calendar(self, mocker):
+        """거래일 달력 모킹 (10/10의 직전 거래일은 추석 연휴 전 10/2)"""
+        calendar = mocker.Mock()
+        calendar.is_trading_day.return_value = True
+        calendar.previous_trading_day.return_value = date(2025, 10, 2)
+        return calendar
+
+    def test_one_call_per_index(self, mock_stock, calendar):
+        """전 거래일 ~ 당일을 지수당 한 번에 조회"""
+        mock_stock.get_index_ohlcv.return_value = pd.DataFrame(
+            {'종가': [2500.0, 2550.0], '거래량': [100, 200]},
+            index=pd.to_datetime(['2025-10-02', '2025-10-10'])
+        )
+
+        info = MarketSummary(calendar=calendar).get_index_info("20251010")
+
+        assert info['kospi']['close'] == 2550.0
+        assert info['kospi']['change'] == 50.0
+        assert info['kospi']['change_pct'] == pytest.approx(2.0)
+        assert info['kosdaq']['volume'] == 200
+        assert mock_stock.get_index_ohlcv.call_count == 2
+        mock_stock.get_index_ohlcv.assert_any_call("20251002", "20251010", "1001")
+
+    def test_holiday_raises_without_call(self, mock_stock, calendar):
+        """휴장일은 조회 없이 데이터 없음"""
+        calendar.is_trading_day.return_value = False
+
+        with pytest.raises(ValueError, match="데이터 없음"):
+            MarketSummary(calendar=calendar).get_index_info("20251006")
+
+        mock_stock.get_index_ohlcv.assert_not_called()
+
+    def test_missing_day_raises(self, mock_stock, calendar):
+        """당일 시세가 없으면 데이터 없음 (장 마감 전 등)"""
+        mock_stock.get_index_ohlcv.return_value = pd.DataFrame(
+            {'종가': [2500.0], '거래량': [100]},
+            index=pd.to_datetime(['2025-10-02'])
+        )
+
+        with pytest.raises(ValueError, match="데이터 없음"):
+            MarketSummary(calendar=calendar).get_index_info("20251010")
+
@@ -0,0 +1,145 @@
+"""
+NegativeCache 클래스 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.client import KRXClient
+from krx.negative_cache import NegativeCache
+from models import EmptyResponse
+
+
+NOW = datetime(2025, 12, 5, 18, 0)
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self, now: datetime = NOW):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def negative_cache(test_database, clock):
+    return NegativeCache(test_database, clock=clock)
+
+
+class TestNegativeCache:
+    """NegativeCache 클래스 테스트"""
+
+    @pytest.mark.parametrize("end_date,ttl", [
+        ("20251205", timedelta(hours=6)),
+        ("20251202", timedelta(hours=6)),
+        ("20251125", timedelta(days=1)),
+        ("20251001", timedelta(days=7)),
+        ("20240101", timedelta(days=90)),
+    ])
+    def test_ttl_grows_with_age(self, end_date, ttl):
+        """종료일이 오래될수록 보관 시간이 길어짐"""
+        assert NegativeCache(enabled=False).ttl_for(end_date, NOW) == ttl
+
+    def test_record_and_expire(self, negative_cache, clock):
+        """기록 후 만료 전까지만 빈 결과로 판단"""
+        key = ('get_shorting_balance_by_date', '005930', '20251201', '20251205')
+        assert negative_cache.is_empty(*key) is False
+
+        negative_cache.record(*key)
+        assert negative_cache.is_empty(*key) is True
+
+        clock.now += timedelta(hours=6, seconds=1)
+        assert negative_cache.is_empty(*key) is False
+
+    def test_persisted_across_instances(self, test_database, negative_cache, clock):
+        """기록은 DB에 저장되어 다음 실행에서도 사용"""
+        key = ('get_shorting_volume_by_date', '005930', '20240101', '20240131')
+        negative_cache.record(*key)
+
+        reloaded = NegativeCache(test_database, clock=clock)
+
+        assert reloaded.is_empty(*key) is True
+
+    def test_expired_rows_purged_on_load(self, test_database, negative_cache, clock):
+        """만료된 기록은 로드 시 삭제"""
+        negative_cache.record('get_shorting_balance_by_date', '005930', '20251205', '20251205')
+        negative_cache.record('get_shorting_balance_by_date', '000660', '20240101', '20240131')
+
+        clock.now += timedelta(days=1)
+        NegativeCache(test_database, clock=clock).is_empty('x', 'x', '20251205', '20251205')
+
+        with test_database.get_session() as session:
+            assert [row.ticker for row in session.query(EmptyResponse)] == ['000660']
+
+    def test_disabled(self, negative_cache):
+        """비활성화 시 기록/조회하지 않음"""
+        negative_cache.enabled = False
+        key = ('get_shorting_balance_by_date', '005930', '20251201', '20251205')
+
+        assert negative_cache.record(*key) is None
+        assert negative_cache.is_empty(*key) is False
+
+
+class TestKRXClientNegativeCache:
+    """KRXClient 빈 결과 캐시 연동 테스트"""
+
+    @pytest.fixture
+    def mock_stock(self, mocker):
+        mock = mocker.patch('krx.client.stock')
+        mock.get_shorting_balance_by_date.__name__ = 'get_shorting_balance_by_date'
+        return mock
+
+    def test_empty_result_not_refetched(self, db_session, mock_stock, negative_cache):
+        """빈 결과는 만료 전까지 다시 조회하지 않음"""
+        mock_stock.get_shorting_balance_by_date.return_value = pd.DataFrame()
+        client = KRXClient(db_session, negative_cache=negative_cache)
+
+        for _ in range(3):
+            assert client.get_short_balance('005930', '20251201', '20251205').empty
+
+        assert mock_stock.get_shorting_balance_by_date.call_count == 1
+
+    def test_refetched_after_expiry(self, db_session, mock_stock, negative_cache, clock, sample_short_balance_df):
+        """만료 후에는 다시 조회하여 늦게 공시된 데이터 반영"""
+        mock_stock.get_shorting_balance_by_date.side_effect = [pd.DataFrame(), sample_short_balance_df]
+        client = KRXClient(db_session, negative_cache=negative_cache)
+
+        client.get_short_balance('005930', '20251201', '20251205')
+        clock.now += timedelta(days=1)
+        result = client.get_short_balance('005930', '20251201', '20251205')
+
+        assert not result.empty
+        assert mock_stock.get_shorting_balance_by_date.call_count == 2
+
+    def test_permanent_error_recorded(self, db_session, mock_stock, negative_cache):
+        """데이터 없음 오류도 빈 결과로 기록"""
+        mock_stock.get_shorting_balance_by_date.side_effect = KeyError('잔고')
+        client = KRXClient(db_session, negative_cache=negative_cache)
+
+        client.get_short_balance('005930', '20251201', '20251205')
+        client.get_short_balance('005930', '20251201', '20251205')
+
+        assert mock_stock.get_shorting_balance_by_date.call_count == 1
+
+    def test_transient_error_not_recorded(self, db_session, mock_stock, negative_cache):
+        """일시 오류는 기록하지 않고 다음 호출에서 다시 조회"""
+        mock_stock.get_shorting_balance_by_date.side_effect = ConnectionError("연결 끊김")
+        client = KRXClient(db_session, negative_cache=negative_cache)
+
+        with pytest.raises(ConnectionError):
+            client.get_short_balance('005930', '20251201', '20251205')
+
+        assert len(negative_cache) == 0
@@ -0,0 +1,89 @@
+"""
+TokenBucket 클래스 테스트
+"""
+
+import pytest
+import asyncio
+import threading
+from unittest.mock import AsyncMock
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """TokenBucket 클래스 테스트"""
+
+    @pytest.fixture
+    def clock(self, mocker):
+        """time.monotonic을 수동으로 제어하는 가짜 시계"""
+        now = {'t': 1000.0}
+        mocker.patch('krx.rate_limiter.time.monotonic', side_effect=lambda: now['t'])
+        return now
+
+    def test_invalid_rate(self):
+        """rate가 0 이하이면 ValueError"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_first_call_no_wait(self, clock, mock_time_sleep):
+        """첫 호출은 대기 없음"""
+        bucket = TokenBucket(rate=1.0)
+
+        assert bucket.acquire() == 0.0
+        mock_time_sleep.assert_not_called()
+
+    def test_consecutive_calls_wait(self, clock, mock_time_sleep):
+        """연속 호출 시 rate에 맞춰 대기 시간이 누적"""
+        bucket = TokenBucket(rate=2.0)  # 초당 2회
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(0.5)
+        assert bucket.acquire() == pytest.approx(1.0)
+        assert mock_time_sleep.call_count == 2
+
+    def test_refill_after_idle(self, clock, mock_time_sleep):
+        """충분히 쉬면 토큰이 다시 채워짐 (capacity까지만)"""
+        bucket = TokenBucket(rate=1.0, capacity=2.0)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock['t'] += 100  # 오래 쉼
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_shared_across_threads(self, clock, mock_time_sleep):
+        """여러 스레드가 공유해도 예약된 대기 시간이 겹치지 않음"""
+        bucket = TokenBucket(rate=1.0)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = bucket.acquire()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(waits) == pytest.approx([0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_acquire_async_shares_budget(self, clock, mocker):
+        """코루틴 대기도 같은 토큰 버킷 예약을 사용 (동기 호출과 합산)"""
+        mock_sleep = mocker.patch('krx.rate_limiter.asyncio.sleep', new_callable=AsyncMock)
+        bucket = TokenBucket(rate=1.0)
+
+        async def run():
+            return [await bucket.acquire_async() for _ in range(2)]
+
+        assert bucket.acquire() == 0.0
+        assert asyncio.run(run()) == pytest.approx([1.0, 2.0])
+        assert mock_sleep.await_count == 2
@@ -0,0 +1,144 @@
+"""
+ResponseCache 클래스 테스트
+"""
+
+import pytest
+import os
+import time
+import pandas as pd
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.cache import ResponseCache
+from krx.client import KRXClient
+
+
+def get_market_ohlcv(*args, **kwargs):
+    """키 생성용 더미 함수"""
+
+
+class TestResponseCache:
+    """ResponseCache 클래스 테스트"""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """임시 디렉토리 캐시"""
+        return ResponseCache(cache_dir=str(tmp_path))
+
+    def test_set_and_get_roundtrip(self, cache, sample_ohlcv_df):
+        """DataFrame 저장 후 동일하게 조회"""
+        cache.set('key', sample_ohlcv_df, ttl=None)
+
+        result = cache.get('key')
+
+        pd.testing.assert_frame_equal(result, sample_ohlcv_df)
+
+    def test_get_missing_returns_none(self, cache):
+        """없는 키는 None"""
+        assert cache.get('missing') is None
+
+    def test_expired_entry_removed(self, cache, sample_ohlcv_df):
+        """만료된 항목은 None 반환 후 삭제"""
+        cache.set('key', sample_ohlcv_df, ttl=-1)
+
+        assert cache.get('key') is None
+        assert not os.path.exists(cache._path('key'))
+
+    def test_ttl_past_dates_permanent(self, cache):
+        """지난 날짜만 포함하면 영구 보관"""
+        assert cache.ttl_for(('20240101', '20240131', '005930'), {}) is None
+
+    def test_ttl_today_short(self, cache):
+        """오늘 날짜가 포함되면 짧은 TTL"""
+        today = datetime.now().strftime('%Y%m%d')
+        assert cache.ttl_for(('20240101', today, '005930'), {}) == cache.TODAY_TTL
+        assert cache.ttl_for((), {'date': today}) == cache.TODAY_TTL
+
+    def test_call_uses_cache_on_second_call(self, cache, sample_ohlcv_df):
+        """두 번째 호출은 fetch 없이 캐시에서 반환"""
+        fetch = MagicMock(return_value=sample_ohlcv_df)
+
+        first = cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+        second = cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+
+        assert fetch.call_count == 1
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_call_different_args_different_keys(self, cache, sample_ohlcv_df):
+        """인자가 다르면 별도로 조회"""
+        fetch = MagicMock(return_value=sample_ohlcv_df)
+
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '000660')
+
+        assert fetch.call_count == 2
+
+    def test_call_does_not_cache_empty(self, cache):
+        """빈 결과는 저장하지 않음"""
+        fetch = MagicMock(return_value=pd.DataFrame())
+
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+
+        assert fetch.call_count == 2
+
+    def test_disabled_always_fetches(self, tmp_path, sample_ohlcv_df):
+        """비활성화 시 항상 fetch, 파일 생성 없음"""
+        cache = ResponseCache(cache_dir=str(tmp_path), enabled=False)
+        fetch = MagicMock(return_value=sample_ohlcv_df)
+
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+        cache.call(get_market_ohlcv, fetch, '20240101', '20240105', '005930')
+
+        assert fetch.call_count == 2
+        assert os.listdir(tmp_path) == []
+
+    def test_eviction_removes_least_recently_used(self, tmp_path, sample_ohlcv_df):
+        """최대 크기 초과 시 오래 사용하지 않은 항목부터 삭제"""
+        cache = ResponseCache(cache_dir=str(tmp_path))
+        cache.set('old', sample_ohlcv_df, ttl=None)
+        entry_size = os.path.getsize(cache._path('old'))
+
+        # 'old'를 과거에 사용한 것으로 설정
+        past = time.time() - 3600
+        os.utime(cache._path('old'), (past, past))
+
+        cache.max_bytes = int(entry_size * 1.5)
+        cache.set('new', sample_ohlcv_df, ttl=None)
+
+        assert cache.get('old') is None
+        assert cache.get('new') is not None
+
+
+class TestKRXClientCache:
+    """KRXClient 캐시 연동 테스트"""
+
+    def test_client_reuses_cached_response(self, db_session, mocker, tmp_path, sample_ohlcv_df):
+        """같은 과거 구간 재조회 시 API 호출 생략"""
+        mock_stock = mocker.patch('krx.client.stock')
+        mock_stock.get_market_ohlcv.return_value = sample_ohlcv_df
+
+        client = KRXClient(db_session, cache=ResponseCache(cache_dir=str(tmp_path)))
+        client.get_ohlcv('005930', '20240101', '20240105')
+        result = client.get_ohlcv('005930', '20240101', '20240105')
+
+        assert len(result) == 5
+        assert mock_stock.get_market_ohlcv.call_count == 1
+
+    def test_refresh_skips_read_and_rewrites(self, db_session, mocker, tmp_path, sample_ohlcv_df):
+        """refresh_cache면 캐시를 읽지 않고 다시 조회한 결과로 캐시 갱신"""
+        mock_stock = mocker.patch('krx.client.stock')
+        corrected = sample_ohlcv_df.assign(종가=1)
+        mock_stock.get_market_ohlcv.side_effect = [sample_ohlcv_df, corrected]
+        cache = ResponseCache(cache_dir=str(tmp_path))
+
+        KRXClient(db_session, cache=cache).get_ohlcv('005930', '20240101', '20240105')
+        result = KRXClient(db_session, cache=cache, refresh_cache=True).get_ohlcv('005930', '20240101', '20240105')
+        cached = KRXClient(db_session, cache=cache).get_ohlcv('005930', '20240101', '20240105')
+
+        assert mock_stock.get_market_ohlcv.call_count == 2
+        assert result['종가'].tolist() == [1] * 5
+        assert cached['종가'].tolist() == [1] * 5
@@ -0,0 +1,186 @@
+"""
+재시도 정책 / 차단기 테스트
+"""
+
+import json
+import asyncio
+import random
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.retry import RetryPolicy, CircuitBreaker, CircuitOpenError, Retrier
+
+
+class TestRetryPolicy:
+    """RetryPolicy 클래스 테스트"""
+
+    def test_classifies_errors(self):
+        """데이터 없음 계열은 영구 오류, 그 외는 재시도"""
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(ConnectionError("연결 끊김")) is True
+        assert policy.is_retryable(Exception("알 수 없음")) is True
+        assert policy.is_retryable(KeyError('종가')) is False
+        assert policy.is_retryable(IndexError()) is False
+
+    def test_json_decode_error_is_retryable(self):
+        """차단/점검 페이지 응답(JSONDecodeError)은 ValueError지만 재시도"""
+        error = json.JSONDecodeError("Expecting value", "<html>", 0)
+
+        assert RetryPolicy().is_retryable(error) is True
+
+    def test_backoff_grows_exponentially_with_cap(self):
+        """지터 없으면 1, 2, 4 ... 상한에서 멈춤"""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0)
+
+        assert [policy.backoff(n) for n in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+    def test_backoff_jitter_within_bounds(self):
+        """지터는 대기 시간을 최대 jitter 비율만큼 줄임"""
+        policy = RetryPolicy(base_delay=2.0, jitter=0.5, rng=random.Random(42))
+
+        delays = [policy.backoff(1) for _ in range(50)]
+
+        assert all(1.0 <= d <= 2.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_invalid_max_attempts(self):
+        """max_attempts는 1 이상"""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker 클래스 테스트"""
+
+    def test_opens_after_threshold(self):
+        """연속 실패가 임계값에 도달하면 열림"""
+        breaker = CircuitBreaker(failure_threshold=3)
+
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is False
+        assert breaker.record_failure() is True
+        assert breaker.allow() is False
+
+    def test_success_resets_count(self):
+        """성공하면 연속 실패 횟수 초기화"""
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.allow() is True
+
+    def test_half_open_after_timeout(self, mocker):
+        """reset_timeout 경과 후 시험 호출 1회 허용"""
+        now = [100.0]
+        mocker.patch('krx.retry.time.monotonic', side_effect=lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+
+        breaker.record_failure()
+        assert breaker.allow() is False
+
+        now[0] += 60
+        assert breaker.allow() is True
+        # 시험 호출도 실패하면 바로 다시 열림
+        assert breaker.record_failure() is True
+        assert breaker.allow() is False
+
+
+class TestRetrier:
+    """Retrier 클래스 테스트"""
+
+    @pytest.fixture
+    def retrier(self):
+        return Retrier(RetryPolicy(max_attempts=3, base_delay=1.0, jitter=0), failure_threshold=4)
+
+    def test_retries_transient_error(self, retrier, mock_time_sleep):
+        """일시 오류는 백오프 후 재시도"""
+        attempt = MagicMock(side_effect=[ConnectionError("끊김"), ConnectionError("끊김"), "성공"])
+
+        assert retrier.call('ep', attempt) == "성공"
+        assert attempt.call_count == 3
+        assert [c.args[0] for c in mock_time_sleep.call_args_list] == [1.0, 2.0]
+
+    def test_permanent_error_not_retried(self, retrier, mock_time_sleep):
+        """영구 오류는 한 번만 호출하고 대기 없음"""
+        attempt = MagicMock(side_effect=KeyError('데이터 없음'))
+
+        with pytest.raises(KeyError):
+            retrier.call('ep', attempt)
+
+        assert attempt.call_count == 1
+        mock_time_sleep.assert_not_called()
+        assert retrier.breaker('ep').is_open is False
+
+    def test_circuit_opens_and_fails_fast(self, retrier):
+        """연속 실패 후에는 호출 없이 즉시 실패"""
+        attempt = MagicMock(side_effect=ConnectionError("끊김"))
+
+        with pytest.raises(ConnectionError):
+            retrier.call('ep', attempt)
+        with pytest.raises(CircuitOpenError):
+            retrier.call('ep', attempt)  # 4번째 실패에서 열림
+        calls = attempt.call_count
+
+        with pytest.raises(CircuitOpenError):
+            retrier.call('ep', attempt)
+
+        assert attempt.call_count == calls == 4
+
+    def test_breakers_are_per_endpoint(self, retrier):
+        """한 엔드포인트가 차단되어도 다른 엔드포인트는 호출"""
+        failing = MagicMock(side_effect=ConnectionError("끊김"))
+        for _ in range(2):
+            with pytest.raises(Exception):
+                retrier.call('shorting', failing)
+
+        assert retrier.call('ohlcv', lambda: "성공") == "성공"
+
+    def test_stats(self, retrier):
+        """엔드포인트별 호출/재시도/실패 통계"""
+        retrier.call('ep', MagicMock(side_effect=[ConnectionError(), "성공"]))
+        with pytest.raises(KeyError):
+            retrier.call('ep', MagicMock(side_effect=KeyError()))
+
+        stats = retrier.stats.snapshot()['ep']
+
+        assert stats == {
+            'calls': 2, 'success': 1, 'retries': 1,
+            'failures': 0, 'permanent': 1, 'short_circuited': 0
+        }
+
+    def test_reset(self, retrier):
+        """reset은 차단기와 통계 초기화"""
+        for _ in range(2):
+            with pytest.raises(Exception):
+                retrier.call('ep', MagicMock(side_effect=ConnectionError()))
+
+        retrier.reset()
+
+        assert retrier.stats.snapshot() == {}
+        assert retrier.call('ep', lambda: "성공") == "성공"
+
+    def test_call_async(self, retrier, mocker):
+        """코루틴 버전도 같은 정책/통계 사용, 대기는 asyncio.sleep"""
+        mock_sleep = mocker.patch('krx.retry.asyncio.sleep', new_callable=AsyncMock)
+        attempt = AsyncMock(side_effect=[ConnectionError("끊김"), "성공"])
+
+        assert asyncio.run(retrier.call_async('ep', attempt)) == "성공"
+        assert attempt.await_count == 2
+        mock_sleep.assert_awaited_once_with(1.0)
+        assert retrier.stats.snapshot()['ep']['retries'] == 1
+
+    def test_call_async_permanent_error(self, retrier):
+        """코루틴 버전도 영구 오류는 재시도하지 않음"""
+        attempt = AsyncMock(side_effect=KeyError('데이터 없음'))
+
+        with pytest.raises(KeyError):
+            asyncio.run(retrier.call_async('ep', attempt))
+
+        assert attempt.await_count == 1
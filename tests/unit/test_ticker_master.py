@@ -0,0 +1,165 @@
+"""
+TickerMaster 클래스 테스트
+"""
+
+import pytest
+from datetime import datetime
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.ticker_master import TickerMaster
+from models import Stock
+
+
+LISTINGS = {
+    'KOSPI': ['005930', '000660'],
+    'KOSDAQ': ['247540'],
+}
+
+NAMES = {
+    '005930': '삼성전자',
+    '000660': 'SK하이닉스',
+    '247540': '에코프로비엠',
+}
+
+
+@pytest.fixture
+def mock_stock(mocker):
+    """pykrx stock 모듈 모킹"""
+    mock = mocker.patch('krx.client.stock')
+    mock.get_market_ticker_list.side_effect = lambda date_str, market: LISTINGS[market]
+    mock.get_market_ticker_name.side_effect = lambda ticker: NAMES[ticker]
+    return mock
+
+
+@pytest.fixture(autouse=True)
+def today(mocker):
+    """오늘 = 2025-12-04 (테스트 기준일까지는 stocks 테이블에 반영)"""
+    mock_datetime = mocker.patch('krx.ticker_master.datetime')
+    mock_datetime.now.return_value = datetime(2025, 12, 4, 18, 0)
+    return mock_datetime
+
+
+class TestTickerMaster:
+    """TickerMaster 클래스 테스트"""
+
+    def test_refresh_saves_all_tickers(self, test_database, mock_stock):
+        """전 종목을 stocks 테이블에 저장하고 메모리에 로드"""
+        master = TickerMaster(test_database)
+
+        count = master.refresh("20251204")
+
+        assert count == 3
+        assert master.version == "20251204"
+        assert master.get_name('005930') == '삼성전자'
+        assert master.get_market('247540') == 'KOSDAQ'
+        with test_database.get_session() as session:
+            assert session.query(Stock).count() == 3
+
+    def test_lookup_is_local(self, test_database, mock_stock):
+        """로드 이후 조회는 네트워크 호출 없음"""
+        master = TickerMaster(test_database)
+        master.ensure("20251204")
+        list_calls = mock_stock.get_market_ticker_list.call_count
+
+        for _ in range(10):
+            master.get_name('000660')
+        master.ensure("20251204")
+        master.ensure("20251203")  # 이전 기준일은 재조회하지 않음
+
+        assert mock_stock.get_market_ticker_list.call_count == list_calls
+
+    def test_newer_date_refreshes(self, test_database, mock_stock):
+        """더 최근 기준일이 요청되면 다시 받아 신규 상장 반영"""
+        master = TickerMaster(test_database)
+        master.ensure("20251203")
+
+        NEW_LISTING = {**LISTINGS, 'KOSDAQ': ['247540', '999990']}
+        mock_stock.get_market_ticker_list.side_effect = lambda date_str, market: NEW_LISTING[market]
+        mock_stock.get_market_ticker_name.side_effect = lambda ticker: NAMES.get(ticker, '신규상장')
+        master.ensure("20251204")
+
+        assert master.version == "20251204"
+        assert master.get_name('999990') == '신규상장'
+        assert len(master) == 4
+
+    def test_refresh_records_listing_changes(self, test_database, mock_stock, today):
+        """갱신 시 종목명 변경/상장폐지를 stocks 테이블에 반영"""
+        today.now.return_value = datetime(2025, 12, 3, 18, 0)
+        master = TickerMaster(test_database)
+        master.ensure("20251203")
+        today.now.return_value = datetime(2025, 12, 4, 18, 0)
+
+        mock_stock.get_market_ticker_list.side_effect = lambda date_str, market: {
+            'KOSPI': ['005930'], 'KOSDAQ': ['247540']
+        }[market]
+        mock_stock.get_market_ticker_name.side_effect = lambda ticker: {
+            **NAMES, '005930': '삼성전자우'
+        }[ticker]
+        master.ensure("20251204")
+
+        assert master.last_diff.renamed == [('005930', '삼성전자', '삼성전자우')]
+        assert master.last_diff.delisted == ['000660']
+        assert master.get_name('005930') == '삼성전자우'
+        with test_database.get_session() as session:
+            assert session.get(Stock, '000660').delisted_at is not None
+
+    def test_past_date_does_not_sync(self, test_database, mock_stock, today):
+        """과거 기준일 목록은 stocks 테이블에 반영하지 않고 메모리에 없는 종목만 채움"""
+        master = TickerMaster(test_database)
+        master.ensure("20251204")
+
+        today.now.return_value = datetime(2025, 12, 5, 9, 0)
+        mock_stock.get_market_ticker_list.side_effect = lambda date_str, market: {
+            'KOSPI': ['005930', '000010'], 'KOSDAQ': []
+        }[market]
+        mock_stock.get_market_ticker_name.side_effect = lambda ticker: {
+            '005930': '삼성전자(옛이름)', '000010': '과거종목'
+        }[ticker]
+        past = TickerMaster(test_database)
+        past.ensure("20200102")
+
+        assert past.last_diff is None
+        assert past.get_name('005930') == '삼성전자'
+        assert past.get_name('000010') == '과거종목'
+        assert past.get_market('247540') == 'KOSDAQ'
+        with test_database.get_session() as session:
+            assert session.query(Stock).filter(Stock.delisted_at.isnot(None)).count() == 0
+            assert session.get(Stock, '005930').name == '삼성전자'
+            assert session.get(Stock, '000010') is None
+
+    def test_loads_existing_stocks_from_db(self, test_database, mock_stock):
+        """DB에 있는 종목(상장폐지 포함)도 조회 가능"""
+        with test_database.get_session() as session:
+            session.add(Stock(ticker='123450', name='상장폐지종목', market='KOSPI'))
+            session.commit()
+
+        master = TickerMaster(test_database)
+        master.ensure("20251204")
+
+        assert master.get_name('123450') == '상장폐지종목'
+        assert '123450' in master
+
+    def test_fetch_failure_falls_back_to_db(self, test_database, mock_stock):
+        """KRX 조회 실패 시 예외 없이 DB 종목 사용"""
+        with test_database.get_session() as session:
+            session.add(Stock(ticker='005930', name='삼성전자', market='KOSPI'))
+            session.commit()
+        mock_stock.get_market_ticker_list.side_effect = KeyError('KRX 오류')
+
+        master = TickerMaster(test_database)
+        master.ensure("20251204")
+
+        assert master.get_name('005930') == '삼성전자'
+        assert master.version == "20251204"
+
+    def test_unknown_ticker_returns_code(self, test_database, mock_stock):
+        """없는 종목은 종목코드 (또는 default) 반환"""
+        master = TickerMaster(test_database)
+        master.ensure("20251204")
+
+        assert master.get_name('000000') == '000000'
+        assert master.get_name('000000', default='N/A') == 'N/A'
+        assert master.get_market('000000') is None
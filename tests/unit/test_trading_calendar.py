@@ -0,0 +1,114 @@
+"""
+TradingCalendar 클래스 테스트
+"""
+
+import pytest
+import pandas as pd
+from datetime import date, timedelta
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.trading_calendar import TradingCalendar
+from models import TradingDay
+
+# 2025년 추석 연휴 (10/3 개천절 ~ 10/9 한글날)
+CHUSEOK_2025 = pd.date_range('2025-10-03', '2025-10-09')
+
+
+def index_ohlcv(start: str, end: str) -> pd.DataFrame:
+    """평일 중 추석 연휴를 뺀 날짜의 지수 시세"""
+    days = pd.bdate_range(start, end).difference(CHUSEOK_2025)
+    return pd.DataFrame({'종가': 2500.0, '거래량': 1000}, index=days)
+
+
+@pytest.fixture
+def mock_stock(mocker):
+    """pykrx 지수 조회 모킹"""
+    mock = mocker.patch('krx.client.stock')
+    mock.get_index_ohlcv.side_effect = lambda start, end, code: index_ohlcv(start, end)
+    return mock
+
+
+class TestTradingCalendar:
+    """TradingCalendar 클래스 테스트"""
+
+    def test_trading_day_lookup(self, test_database, mock_stock):
+        """지수 시세가 있는 날만 개장일"""
+        calendar = TradingCalendar(test_database)
+
+        assert calendar.is_trading_day('20251002') is True
+        assert calendar.is_trading_day('20251006') is False  # 추석 (월요일)
+        assert calendar.is_trading_day(date(2025, 10, 11)) is False  # 토요일
+
+    def test_previous_trading_day_skips_long_holiday(self, test_database, mock_stock):
+        """연휴 전체를 건너뛴 직전 거래일"""
+        calendar = TradingCalendar(test_database)
+
+        assert calendar.previous_trading_day('20251010') == date(2025, 10, 2)
+        assert calendar.previous_trading_day('20251013') == date(2025, 10, 10)
+
+    def test_next_trading_day(self, test_database, mock_stock):
+        """당일 포함 다음 거래일"""
+        calendar = TradingCalendar(test_database)
+
+        assert calendar.next_trading_day('20251003') == date(2025, 10, 10)
+        assert calendar.next_trading_day('20251010') == date(2025, 10, 10)
+
+    def test_trading_days_between(self, test_database, mock_stock):
+        """구간 내 거래일 목록"""
+        calendar = TradingCalendar(test_database)
+
+        days = calendar.trading_days_between('20251001', '20251013')
+
+        assert days == [date(2025, 10, 1), date(2025, 10, 2), date(2025, 10, 10), date(2025, 10, 13)]
+
+    def test_built_once_and_persisted(self, test_database, mock_stock):
+        """한 번 만든 달력은 DB에 저장되어 다음 인스턴스는 조회 없이 사용"""
+        TradingCalendar(test_database).is_trading_day('20251002')
+        assert mock_stock.get_index_ohlcv.call_count == 1
+        with test_database.get_session() as session:
+            assert session.get(TradingDay, date(2025, 10, 6)).is_open is False
+
+        calendar = TradingCalendar(test_database)
+        assert calendar.previous_trading_day('20251010') == date(2025, 10, 2)
+        assert mock_stock.get_index_ohlcv.call_count == 1
+
+    def test_extends_incrementally(self, test_database, mock_stock):
+        """저장된 마지막 날짜 다음 날부터만 조회"""
+        last_saved = date.today() - timedelta(days=10)
+        with test_database.get_session() as session:
+            session.add(TradingDay(date=last_saved, is_open=True))
+            session.commit()
+
+        TradingCalendar(test_database).ensure(date.today())
+
+        start, end, _ = mock_stock.get_index_ohlcv.call_args[0]
+        assert start == (last_saved + timedelta(days=1)).strftime('%Y%m%d')
+        assert end == date.today().strftime('%Y%m%d')
+
+    def test_fetch_failure_falls_back_to_weekdays(self, test_database, mock_stock):
+        """조회 실패 시 예외 없이 주말만 휴장으로 간주"""
+        mock_stock.get_index_ohlcv.side_effect = KeyError('KRX 오류')
+        calendar = TradingCalendar(test_database)
+
+        assert calendar.is_trading_day('20251006') is True
+        assert calendar.is_trading_day('20251004') is False
+
+    def test_empty_response_not_saved(self, test_database, mock_stock):
+        """긴 구간 전체가 비어 있으면 휴장으로 저장하지 않음"""
+        mock_stock.get_index_ohlcv.side_effect = lambda start, end, code: pd.DataFrame()
+
+        TradingCalendar(test_database).ensure('20251010')
+
+        with test_database.get_session() as session:
+            assert session.query(TradingDay).count() == 0
+
+    def test_disabled_calendar_uses_weekdays(self, mock_stock):
+        """enabled=False면 DB/KRX 조회 없음"""
+        calendar = TradingCalendar(enabled=False)
+
+        assert calendar.is_trading_day('20251006') is True
+        assert calendar.previous_trading_day('20251013') == date(2025, 10, 10)
+        mock_stock.get_index_ohlcv.assert_not_called()
@@ -0,0 +1,128 @@
+"""
+WriteBehindWriter 클래스 테스트
+"""
+
+import threading
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from krx.saver import DataSaver
+from krx.writer import WriteBehindWriter
+from models import Stock, DailyPrice
+
+
+class TestWriteBehindWriter:
+    """WriteBehindWriter 클래스 테스트"""
+
+    def test_saves_and_resolves_futures(self, file_database, make_prices):
+        """저장 결과를 Future로 돌려주고 close 시 남은 요청을 모두 저장"""
+        with WriteBehindWriter(lambda: DataSaver(file_database.get_new_session())) as writer:
+            writer.submit('save_stock', '005930', '삼성전자', 'KOSPI')
+            future = writer.submit('save_daily_prices', '005930', make_prices())
+
+        assert future.result() == 5
+        with file_database.get_session() as session:
+            assert session.query(Stock).count() == 1
+            assert session.query(DailyPrice).count() == 5
+
+    def test_stats_include_row_counts(self, file_database, make_prices):
+        """stats()에 신규/수정/동일 행 수 포함"""
+        with WriteBehindWriter(lambda: DataSaver(file_database.get_new_session())) as writer:
+            writer.submit('save_daily_prices', '005930', make_prices(days=3))
+        with WriteBehindWriter(lambda: DataSaver(file_database.get_new_session(), upsert=True)) as writer:
+            writer.submit('save_daily_prices', '005930', make_prices(days=5))
+
+        stats = writer.stats()
+        assert (stats['inserted'], stats['updated'], stats['unchanged']) == (2, 0, 3)
+
+    def test_coalesces_queued_requests(self, file_database, make_prices):
+        """쌓여 있는 여러 종목의 요청을 한 배치로 저장"""
+        release = threading.Event()
+
+        def factory():
+            release.wait(timeout=5)  # 요청이 모두 쌓인 뒤 시작
+            return DataSaver(file_database.get_new_session())
+
+        writer = WriteBehindWriter(factory)
+        futures = [writer.submit('save_daily_prices', f"{i:06d}", make_prices()) for i in range(10)]
+        release.set()
+        writer.close()
+
+        stats = writer.stats()
+        assert [f.result() for f in futures] == [5] * 10
+        assert stats['batches'] == 1
+        assert stats['items'] == 10
+        assert stats['rows'] == 50
+        assert stats['max_ms'] >= stats['avg_ms'] > 0
+
+    def test_batch_limits(self, file_database, make_prices):
+        """batch_rows를 넘으면 배치를 나눔"""
+        release = threading.Event()
+
+        def factory():
+            release.wait(timeout=5)
+            return DataSaver(file_database.get_new_session())
+
+        writer = WriteBehindWriter(factory, batch_rows=10)
+        for i in range(4):
+            writer.submit('save_daily_prices', f"{i:06d}", make_prices())
+        release.set()
+        writer.close()
+
+        assert writer.stats()['batches'] == 2
+
+    def test_failed_request_isolated(self, file_database, make_prices):
+        """배치 중 한 요청이 실패하면 그 요청만 실패하고 나머지는 저장"""
+        release = threading.Event()
+
+        def factory():
+            release.wait(timeout=5)
+            return DataSaver(file_database.get_new_session())
+
+        writer = WriteBehindWriter(factory)
+        ok = writer.submit('save_daily_prices', '005930', make_prices())
+        bad = writer.submit('save_daily_prices', '000660', make_prices().drop(columns=['종가']))
+        release.set()
+        writer.close()
+
+        assert ok.result() == 5
+        with pytest.raises(KeyError):
+            bad.result()
+        assert writer.stats()['failed'] == 1
+        # rollback된 첫 배치 시도의 행은 집계하지 않음
+        assert writer.stats()['inserted'] == 5
+
+    def test_backpressure(self, file_database, make_prices):
+        """큐가 가득 차면 submit이 대기"""
+        release = threading.Event()
+
+        def factory():
+            release.wait(timeout=5)
+            return DataSaver(file_database.get_new_session())
+
+        writer = WriteBehindWriter(factory, max_queue=2)
+        writer.submit('save_daily_prices', '000001', make_prices())
+        writer.submit('save_daily_prices', '000002', make_prices())
+
+        submitted = threading.Event()
+        thread = threading.Thread(
+            target=lambda: (writer.submit('save_daily_prices', '000003', make_prices()), submitted.set())
+        )
+        thread.start()
+
+        assert not submitted.wait(timeout=0.1)
+        release.set()
+        assert submitted.wait(timeout=5)
+        thread.join()
+        writer.close()
+
+    def test_submit_after_close(self, file_database):
+        """종료 후 submit은 RuntimeError"""
+        writer = WriteBehindWriter(lambda: DataSaver(file_database.get_new_session()))
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.submit('save_stock', '005930', '삼성전자', 'KOSPI')